@@ -1,91 +1,290 @@
 #!/usr/bin/env python3
 """
-Benchmark Script - Run performance benchmarks.
+Benchmark Script - Measure import and run cost of agents and skills.
+
+Every measurement runs in a fresh interpreter so imports are cold. For each
+agent/skill the probe records the module import time, optionally the
+``main()`` wall time, the net memory blocks each phase allocated, the process
+peak RSS and the wall time of the whole subprocess. Each entry is measured
+``--repeat`` times and summarised as min/median/p95.
+
+Results can be written as JSON and compared against a previous run, failing
+with exit code 1 when a median regresses past ``--threshold``.
 
 Usage:
     python scripts/benchmark.py [--skills] [--agents] [--all]
+    python scripts/benchmark.py --skills --filter 'data-science/*' --repeat 7 --main
+    python scripts/benchmark.py --all --output bench.json
+    python scripts/benchmark.py --all --baseline bench.json --threshold 0.25
 """
 
 import argparse
+import fnmatch
+import json
+import math
+import statistics
+import subprocess
+import sys
 import time
 from pathlib import Path
-from typing import Callable
+from typing import Any, Dict, List, Optional, Tuple
 
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "src"))
 
-def benchmark_function(func: Callable, *args, **kwargs) -> tuple:
-    """Run a function and measure time."""
-    start = time.perf_counter()
-    result = func(*args, **kwargs)
-    elapsed = time.perf_counter() - start
-    return result, elapsed
+import cli  # noqa: E402
+
+RESULT_MARKER = "@@BENCHMARK@@"
+FORMAT_VERSION = 1
+METRICS = ("import_ms", "main_ms", "process_ms", "import_blocks", "main_blocks", "peak_rss_kb")
+# Metrics compared against a baseline, with the absolute change below which
+# a relative regression is treated as noise.
+GATED_METRICS = {"import_ms": "min_delta_ms", "main_ms": "min_delta_ms", "peak_rss_kb": "min_delta_kb"}
 
+# Runs inside a fresh interpreter. Keep its own imports minimal so they do not
+# pre-load modules the measured entry would otherwise import cold.
+_PROBE = r"""
+import os, sys, time
+import importlib.util
 
-def benchmark_skill_import(skill: str) -> float:
-    """Benchmark skill import time."""
+script, run_main, marker = sys.argv[1], sys.argv[2] == "1", sys.argv[3]
+result = {"import_ms": None, "main_ms": None, "import_blocks": None, "main_blocks": None, "error": None}
+real_stdout, real_stderr = sys.stdout, sys.stderr
+sys.stdout = sys.stderr = open(os.devnull, "w")
+try:
+    spec = importlib.util.spec_from_file_location("benchmark_target", script)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    blocks = sys.getallocatedblocks()
     start = time.perf_counter()
-    try:
-        __import__(f"skills.{skill}.resources.{skill.replace('-', '_')}")
-    except ImportError:
-        pass
-    return time.perf_counter() - start
+    spec.loader.exec_module(module)
+    result["import_ms"] = (time.perf_counter() - start) * 1000
+    result["import_blocks"] = sys.getallocatedblocks() - blocks
+    main = getattr(module, "main", None)
+    if run_main and callable(main):
+        sys.argv = [script]
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            main()
+        except SystemExit:
+            pass
+        result["main_ms"] = (time.perf_counter() - start) * 1000
+        result["main_blocks"] = sys.getallocatedblocks() - blocks
+except BaseException as exc:
+    result["error"] = f"{type(exc).__name__}: {exc}"
+sys.stdout, sys.stderr = real_stdout, real_stderr
+try:
+    import resource
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    result["peak_rss_kb"] = rss // 1024 if sys.platform == "darwin" else rss
+except ImportError:
+    result["peak_rss_kb"] = None
+import json
+print()
+print(marker + json.dumps(result))
+"""
 
 
-def benchmark_agent_import(agent: str) -> float:
-    """Benchmark agent import time."""
+def probe_once(script: Path, run_main: bool, timeout: float) -> Dict[str, Any]:
+    """Measure one cold import (and optionally ``main()``) of *script* in a subprocess."""
+    command = [sys.executable, "-c", _PROBE, str(script), "1" if run_main else "0", RESULT_MARKER]
     start = time.perf_counter()
     try:
-        __import__(f"agents.{agent}.agent")
-    except ImportError:
-        pass
-    return time.perf_counter() - start
-
-
-def run_benchmarks(scope: str) -> None:
-    """Run benchmarks."""
-    project_root = Path(__file__).parent.parent
-    
-    if scope in ("all", "skills"):
-        skills_path = project_root / "skills"
-        skills = [s.name for s in skills_path.iterdir() if s.is_dir()]
-        print(f"\n📊 Benchmarking {len(skills)} skills...")
-        total = 0
-        for skill in skills[:10]:  # Sample first 10
-            t = benchmark_skill_import(skill)
-            total += t
-            print(f"  {skill}: {t*1000:.2f}ms")
-        print(f"  Average: {total/10*1000:.2f}ms")
-    
-    if scope in ("all", "agents"):
-        agents_path = project_root / "agents"
-        agents = [a.name for a in agents_path.iterdir() if a.is_dir()]
-        print(f"\n📊 Benchmarking {len(agents)} agents...")
-        total = 0
-        for agent in agents[:10]:  # Sample first 10
-            t = benchmark_agent_import(agent)
-            total += t
-            print(f"  {agent}: {t*1000:.2f}ms")
-        print(f"  Average: {total/10*1000:.2f}ms")
+        completed = subprocess.run(
+            command,
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return {"error": f"timed out after {timeout:g}s"}
+    process_ms = (time.perf_counter() - start) * 1000
+
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            result["process_ms"] = process_ms
+            return result
+    tail = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+    return {"error": f"probe exited with {completed.returncode}: {tail}"}
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the nearest-rank *pct* percentile of *values*."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Reduce repeated probe *samples* to min/median/p95 per metric."""
+    summary: Dict[str, Any] = {"samples": len(samples), "error": None}
+    errors = [s["error"] for s in samples if s.get("error")]
+    if errors:
+        summary["error"] = errors[0]
+    for metric in METRICS:
+        values = [s[metric] for s in samples if s.get(metric) is not None]
+        if values:
+            summary[metric] = {
+                "min": round(min(values), 3),
+                "median": round(statistics.median(values), 3),
+                "p95": round(percentile(values, 95), 3),
+            }
+    return summary
+
+
+def select_entries(scopes: List[str], pattern: Optional[str], limit: Optional[int]) -> List[Tuple[str, str]]:
+    """Return ``(kind, name)`` pairs for the requested scopes, filtered by *pattern*."""
+    entries: List[Tuple[str, str]] = []
+    if "agents" in scopes:
+        entries += [("agent", name) for name in cli.list_agents()]
+    if "skills" in scopes:
+        entries += [("skill", name) for name in cli.list_skills()]
+    if pattern:
+        entries = [e for e in entries if fnmatch.fnmatch(e[1], pattern)]
+    return entries[:limit] if limit else entries
+
+
+def run_benchmarks(
+    entries: List[Tuple[str, str]],
+    repeat: int,
+    run_main: bool,
+    timeout: float,
+) -> Dict[str, Any]:
+    """Benchmark *entries* serially (parallel runs would skew timings)."""
+    results: Dict[str, Any] = {}
+    for kind, name in entries:
+        resolved = cli.resolve_entry(name)
+        if resolved is None:
+            continue
+        script = resolved[1]
+        samples = []
+        for _ in range(repeat):
+            sample = probe_once(script, run_main, timeout)
+            samples.append(sample)
+            if sample.get("error") and sample.get("import_ms") is None:
+                break  # Import fails deterministically; don't repeat it.
+        summary = summarize(samples)
+        summary.update({"kind": kind, "name": name, "script": script.relative_to(PROJECT_ROOT).as_posix()})
+        results[f"{kind}:{name}"] = summary
+        print_entry(summary)
+    return {
+        "version": FORMAT_VERSION,
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "repeat": repeat,
+        "run_main": run_main,
+        "entries": results,
+    }
+
+
+def _fmt(stats: Optional[Dict[str, float]], key: str = "median") -> str:
+    """Format one statistic for the console table."""
+    return f"{stats[key]:9.1f}" if stats else f"{'-':>9}"
+
+
+def print_entry(summary: Dict[str, Any]) -> None:
+    """Print one benchmark row."""
+    status = "⚠️ " if summary["error"] else "  "
+    print(
+        f"{status}{summary['kind']:5} {summary['name']:<50} "
+        f"import {_fmt(summary.get('import_ms'))} / p95 {_fmt(summary.get('import_ms'), 'p95')} ms  "
+        f"main {_fmt(summary.get('main_ms'))} ms  rss {_fmt(summary.get('peak_rss_kb'))} KB"
+    )
+    if summary["error"]:
+        print(f"        {summary['error']}")
+
+
+def compare_to_baseline(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float,
+    min_delta_ms: float,
+    min_delta_kb: float,
+) -> List[str]:
+    """Return human-readable regressions of *current* against *baseline*.
+
+    A metric regresses when its median grew by more than *threshold* (a
+    fraction) and by more than the metric's absolute noise floor. An entry
+    that imported cleanly in the baseline but errors now is also reported.
+    """
+    floors = {"min_delta_ms": min_delta_ms, "min_delta_kb": min_delta_kb}
+    regressions: List[str] = []
+    for key, entry in current["entries"].items():
+        base = baseline.get("entries", {}).get(key)
+        if base is None:
+            continue
+        if entry.get("error") and not base.get("error"):
+            regressions.append(f"{key}: now fails ({entry['error']})")
+            continue
+        for metric, floor_name in GATED_METRICS.items():
+            now, before = entry.get(metric), base.get(metric)
+            if not now or not before:
+                continue
+            delta = now["median"] - before["median"]
+            if delta > floors[floor_name] and now["median"] > before["median"] * (1 + threshold):
+                change = delta / before["median"] * 100 if before["median"] else float("inf")
+                regressions.append(
+                    f"{key}: {metric} median {before['median']:.1f} -> {now['median']:.1f} (+{change:.0f}%)"
+                )
+    return regressions
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Run benchmarks")
+    parser = argparse.ArgumentParser(description="Benchmark agent and skill import/run cost")
     parser.add_argument("--skills", action="store_true", help="Benchmark skills")
     parser.add_argument("--agents", action="store_true", help="Benchmark agents")
     parser.add_argument("--all", action="store_true", help="Benchmark all")
-    
+    parser.add_argument("--filter", type=str, help="Only names matching this glob (e.g. 'data-science/*')")
+    parser.add_argument("--limit", type=int, help="Benchmark at most this many entries")
+    parser.add_argument("--repeat", type=int, default=5, help="Cold runs per entry (default: 5)")
+    parser.add_argument("--main", action="store_true", help="Also time each entry's main()")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-run timeout in seconds")
+    parser.add_argument("--output", type=Path, help="Write results as JSON to this path")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --output file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="Relative median increase counted as a regression (default: 0.2 = 20%%)",
+    )
+    parser.add_argument("--min-delta-ms", type=float, default=2.0, help="Ignore time regressions below this")
+    parser.add_argument("--min-delta-kb", type=float, default=1024.0, help="Ignore RSS regressions below this")
+
     args = parser.parse_args()
-    
+
     scopes = []
     if args.skills:
         scopes.append("skills")
     if args.agents:
         scopes.append("agents")
     if args.all or not scopes:
-        scopes.append("all")
-    
-    for scope in scopes:
-        run_benchmarks(scope)
-    
+        scopes = ["agents", "skills"]
+
+    entries = select_entries(scopes, args.filter, args.limit)
+    print(f"\n📊 Benchmarking {len(entries)} entries x {args.repeat} cold runs...\n")
+    results = run_benchmarks(entries, max(1, args.repeat), args.main, args.timeout)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+        print(f"\n💾 Results written to {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(
+            results, baseline, args.threshold, args.min_delta_ms, args.min_delta_kb
+        )
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) against {args.baseline}:")
+            for line in regressions:
+                print(f"  {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions against {args.baseline}")
+
     print("\n✅ Benchmarks complete!")
 
 
@@ -9,14 +9,19 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import multiprocessing
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from statistics import NormalDist
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +82,8 @@ class MCMCConfig:
     max_treedepth: int = 10
     thin: int = 1
     seed: Optional[int] = None
+    adapt_proposal: bool = False
+    n_jobs: int = 1
 
 
 @dataclass
@@ -155,6 +162,56 @@ class MonteCarloResult:
                 float(np.percentile(self.samples, upper)))
 
 
+@dataclass
+class StreamingMonteCarloResult:
+    """Monte Carlo summary built from running moments and a quantile sketch.
+
+    Mirrors ``MonteCarloResult``'s statistics without keeping the samples:
+    ``mean``/``std`` are exact, while percentiles, probabilities and CVaR
+    are read from the sketch (rank error of order ``1 / sketch_size``).
+    """
+    moments: "RunningMoments"
+    sketch: "QuantileSketch"
+    n_simulations: int
+    n_failed: int
+    n_blocks: int
+    method: SamplingMethod
+    variance_reduced: bool
+    seed: int
+    execution_time_ms: float
+    converged: Optional[bool] = None
+
+    def mean(self) -> float:
+        """Mean of the valid draws; NaN when every draw failed."""
+        return self.moments.mean if self.moments.count else float("nan")
+
+    def std(self) -> float:
+        return self.moments.std()
+
+    def percentile(self, q: float) -> float:
+        return self.sketch.quantile(q / 100)
+
+    def probability_below(self, threshold: float) -> float:
+        return self.sketch.fraction_below(threshold)
+
+    def probability_above(self, threshold: float) -> float:
+        return self.sketch.fraction_above(threshold)
+
+    def cvar(self, alpha: float) -> float:
+        """Conditional Value at Risk (Expected Shortfall)."""
+        cutoff = self.sketch.quantile(1 - alpha)
+        return self.sketch.mean_at_or_below(cutoff)
+
+    def confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        return (self.sketch.quantile((1 - confidence) / 2),
+                self.sketch.quantile((1 + confidence) / 2))
+
+    def mean_confidence_interval(self, confidence: float = 0.95) -> Tuple[float, float]:
+        """Normal-approximation interval for the mean itself."""
+        half = self.moments.mean_half_width(confidence)
+        return (self.mean() - half, self.mean() + half)
+
+
 @dataclass
 class CausalResult:
     """Results from causal inference analysis."""
@@ -225,6 +282,25 @@ class FactorAnalysisResult:
 # Bayesian Inference Engine
 # ---------------------------------------------------------------------------
 
+def _merge_moments(count: int, mean: NDArray, m2: NDArray, batch: NDArray) -> Tuple[int, NDArray, NDArray]:
+    """Chan et al. merge of running mean/scatter matrix with a batch of rows."""
+    n_b = len(batch)
+    mean_b = batch.mean(axis=0)
+    centred = batch - mean_b
+    delta = mean_b - mean
+    total = count + n_b
+    mean = mean + delta * (n_b / total)
+    m2 = m2 + centred.T @ centred + np.outer(delta, delta) * (count * n_b / total)
+    return total, mean, m2
+
+
+def _sample_chain_group(task: Tuple[Any, ...]) -> Tuple[NDArray, NDArray]:
+    X, y, priors, config, seed, model_type, n_chains = task
+    return BayesianInferenceEngine()._sample_chains(
+        X, y, priors, config, np.random.default_rng(seed), model_type, n_chains
+    )
+
+
 class BayesianInferenceEngine:
     """Bayesian inference engine with MCMC sampling and convergence diagnostics."""
 
@@ -330,112 +406,185 @@ class BayesianInferenceEngine:
         rng: np.random.Generator,
         model_type: ModelType,
     ) -> List[NDArray]:
-        """Run Metropolis-Hastings MCMC for parameter estimation."""
+        """Run Metropolis-Hastings MCMC for parameter estimation.
+
+        All chains advance together as one ``(n_chains, n_params)`` array.
+        With ``config.n_jobs > 1`` the chains are split into that many groups,
+        each sampled in a forked worker from its own child seed, so results
+        are reproducible for a given seed and ``n_jobs``.
+        """
+        n_jobs = min(config.n_jobs, config.n_chains)
+        if n_jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            samples, accepted = self._sample_chains(X, y, priors, config, rng, model_type, config.n_chains)
+        else:
+            group_sizes = [len(g) for g in np.array_split(np.arange(config.n_chains), n_jobs)]
+            seeds = np.random.SeedSequence(int(rng.integers(2 ** 63))).spawn(n_jobs)
+            tasks = [(X, y, priors, config, seed, model_type, size) for seed, size in zip(seeds, group_sizes)]
+            with ProcessPoolExecutor(n_jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+                groups = list(pool.map(_sample_chain_group, tasks))
+            samples = np.concatenate([g[0] for g in groups])
+            accepted = np.concatenate([g[1] for g in groups])
+
+        if self.verbose:
+            total_steps = config.n_warmup + config.n_samples * config.thin
+            for chain_idx, count in enumerate(accepted):
+                logger.info("Chain %d acceptance rate: %.3f", chain_idx, count / total_steps)
+
+        return list(samples)
+
+    def _sample_chains(
+        self,
+        X: NDArray,
+        y: NDArray,
+        priors: PriorSpec,
+        config: MCMCConfig,
+        rng: np.random.Generator,
+        model_type: ModelType,
+        n_chains: int,
+    ) -> Tuple[NDArray, NDArray]:
+        """Advance ``n_chains`` chains in lockstep; returns samples and accept counts.
+
+        Each chain's current log-density is cached and only recomputed for
+        the proposal. With ``config.adapt_proposal`` the proposal covariance
+        is learned from the pooled states of the second half of warmup
+        (Haario et al. 2001) and frozen when sampling starts; otherwise the isotropic, shrinking
+        random-walk scale is used.
+        """
         n_obs, n_features = X.shape
         n_params = n_features + 2  # coefficients + intercept + noise
+        sigma_idx = n_features + 1
         total_samples = config.n_warmup + config.n_samples * config.thin
+        stats = self._linear_sufficient_stats(X, y) if model_type == ModelType.LINEAR_REGRESSION else None
 
-        chains = []
-        for chain_idx in range(config.n_chains):
-            # Initialize parameters
-            current = np.zeros(n_params)
-            current[:n_features] = rng.normal(0, 1, n_features)
-            current[n_features] = rng.normal(0, 1)  # intercept
-            current[n_features + 1] = rng.uniform(0.1, 2.0)  # sigma
+        def log_density(params: NDArray) -> NDArray:
+            log_prior = self._log_prior(params, priors, n_features, model_type)
+            if model_type == ModelType.LINEAR_REGRESSION:
+                log_lik = self._log_likelihood_linear(X, y, params, n_features, stats)
+            else:
+                log_lik = self._log_likelihood_logistic_single(X, y, params, n_features)
+            return log_prior + log_lik
 
-            chain_samples = np.zeros((config.n_samples, n_params))
-            accepted = 0
+        # Initialize parameters
+        current = np.zeros((n_chains, n_params))
+        current[:, :n_features] = rng.normal(0, 1, (n_chains, n_features))
+        current[:, n_features] = rng.normal(0, 1, n_chains)  # intercept
+        current[:, sigma_idx] = rng.uniform(0.1, 2.0, n_chains)  # sigma
+        current_log_p = log_density(current)
 
-            for step in range(total_samples):
-                # Propose new state
-                proposal_scale = 0.1 * (1 - step / total_samples) + 0.01
-                proposal = current + rng.normal(0, proposal_scale, n_params)
+        samples = np.zeros((n_chains, config.n_samples, n_params))
+        accepted = np.zeros(n_chains, dtype=int)
 
-                # Ensure sigma is positive
-                proposal[n_features + 1] = abs(proposal[n_features + 1])
+        # Pooled running mean/covariance of warmup states for adaptation.
+        adapt_count, adapt_mean, adapt_m2 = 0, np.zeros(n_params), np.zeros((n_params, n_params))
+        adapt_start = 10 * n_params
+        chol: Optional[NDArray] = None
 
-                # Compute log acceptance ratio
-                log_prior_current = self._log_prior(current, priors, n_features, model_type)
-                log_prior_proposal = self._log_prior(proposal, priors, n_features, model_type)
-
-                if model_type == ModelType.LINEAR_REGRESSION:
-                    log_lik_current = self._log_likelihood_linear(X, y, current, n_features)
-                    log_lik_proposal = self._log_likelihood_linear(X, y, proposal, n_features)
+        with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+            for step in range(total_samples):
+                # Propose new states
+                noise = rng.standard_normal((n_chains, n_params))
+                if chol is not None:
+                    proposal = current + noise @ chol.T
                 else:
-                    log_lik_current = self._log_likelihood_logistic_single(X, y, current, n_features)
-                    log_lik_proposal = self._log_likelihood_logistic_single(X, y, proposal, n_features)
-
-                log_alpha = (log_prior_proposal + log_lik_proposal) - (log_prior_current + log_lik_current)
+                    proposal_scale = 0.1 * (1 - step / total_samples) + 0.01
+                    proposal = current + proposal_scale * noise
 
-                if np.log(rng.uniform()) < log_alpha:
-                    current = proposal
-                    accepted += 1
-
-                # Store sample (after warmup, with thinning)
-                if step >= config.n_warmup and (step - config.n_warmup) % config.thin == 0:
+                # Ensure sigma is positive
+                proposal[:, sigma_idx] = np.abs(proposal[:, sigma_idx])
+
+                proposal_log_p = log_density(proposal)
+                accept = np.log(rng.uniform(size=n_chains)) < proposal_log_p - current_log_p
+                current[accept] = proposal[accept]
+                current_log_p[accept] = proposal_log_p[accept]
+                accepted += accept
+
+                if step < config.n_warmup:
+                    # Skip the first half of warmup so the initial transient
+                    # does not inflate the learned covariance.
+                    if config.adapt_proposal and step >= config.n_warmup // 2:
+                        adapt_count, adapt_mean, adapt_m2 = _merge_moments(
+                            adapt_count, adapt_mean, adapt_m2, current
+                        )
+                        if adapt_count >= adapt_start and (step + 1) % 50 == 0:
+                            cov = adapt_m2 / (adapt_count - 1)
+                            scaled = 2.38 ** 2 / n_params * cov + 1e-10 * np.eye(n_params)
+                            try:
+                                chol = np.linalg.cholesky(scaled)
+                            except np.linalg.LinAlgError:
+                                pass
+                # Store samples (after warmup, with thinning)
+                elif (step - config.n_warmup) % config.thin == 0:
                     sample_idx = (step - config.n_warmup) // config.thin
                     if sample_idx < config.n_samples:
-                        chain_samples[sample_idx] = current
-
-            acceptance_rate = accepted / total_samples
-            if self.verbose:
-                logger.info("Chain %d acceptance rate: %.3f", chain_idx, acceptance_rate)
-
-            chains.append(chain_samples)
+                        samples[:, sample_idx] = current
 
-        return chains
+        return samples, accepted
 
     def _log_prior(
         self, params: NDArray, priors: PriorSpec, n_features: int, model_type: ModelType
-    ) -> float:
-        """Compute log prior probability."""
-        log_p = 0.0
-
+    ) -> NDArray:
+        """Compute log prior probability (one value per row of ``params``)."""
         # Coefficient priors (normal)
-        for i in range(n_features):
-            mean = priors.coefficient_prior["mean"]
-            std = priors.coefficient_prior["std"]
-            log_p += -0.5 * ((params[i] - mean) / std) ** 2 - np.log(std * np.sqrt(2 * np.pi))
+        mean = priors.coefficient_prior["mean"]
+        std = priors.coefficient_prior["std"]
+        log_p = np.sum(-0.5 * ((params[..., :n_features] - mean) / std) ** 2, axis=-1)
+        log_p = log_p - n_features * np.log(std * np.sqrt(2 * np.pi))
 
         # Intercept prior
         mean = priors.intercept_prior["mean"]
         std = priors.intercept_prior["std"]
-        log_p += -0.5 * ((params[n_features] - mean) / std) ** 2 - np.log(std * np.sqrt(2 * np.pi))
+        log_p = log_p - 0.5 * ((params[..., n_features] - mean) / std) ** 2 - np.log(std * np.sqrt(2 * np.pi))
 
         # Noise prior (only for linear regression)
         if model_type == ModelType.LINEAR_REGRESSION:
             alpha = priors.noise_prior["alpha"]
             beta = priors.noise_prior["beta"]
-            sigma = params[n_features + 1]
-            if sigma > 0:
-                log_p += (alpha - 1) * np.log(sigma) - beta / sigma
-            else:
-                log_p = -np.inf
+            sigma = params[..., n_features + 1]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                noise = (alpha - 1) * np.log(sigma) - beta / sigma
+            log_p = np.where(sigma > 0, log_p + noise, -np.inf)
 
         return log_p
 
-    def _log_likelihood_linear(
-        self, X: NDArray, y: NDArray, params: NDArray, n_features: int
-    ) -> float:
-        beta = params[:n_features]
-        intercept = params[n_features]
-        sigma = params[n_features + 1]
+    @staticmethod
+    def _linear_sufficient_stats(X: NDArray, y: NDArray) -> Dict[str, Any]:
+        """Centred cross-products, so the linear likelihood costs O(p^2) per evaluation."""
+        x_mean, y_mean = X.mean(axis=0), float(np.mean(y))
+        Xc, yc = X - x_mean, y - y_mean
+        return {
+            "n": len(y), "x_mean": x_mean, "y_mean": y_mean,
+            "xtx": Xc.T @ Xc, "xty": Xc.T @ yc, "yty": float(yc @ yc),
+        }
 
-        mu = X @ beta + intercept
-        residuals = y - mu
-        n = len(y)
+    def _log_likelihood_linear(
+        self, X: NDArray, y: NDArray, params: NDArray, n_features: int,
+        stats: Optional[Dict[str, Any]] = None,
+    ) -> NDArray:
+        if stats is None:
+            stats = self._linear_sufficient_stats(X, y)
+        beta = params[..., :n_features]
+        intercept = params[..., n_features]
+        sigma = params[..., n_features + 1]
+        n = stats["n"]
+
+        # ||y - X b - c||^2 split into the centred part and the mean offset.
+        centred_rss = (
+            stats["yty"] - 2 * (beta @ stats["xty"]) + np.sum((beta @ stats["xtx"]) * beta, axis=-1)
+        )
+        offset = stats["y_mean"] - beta @ stats["x_mean"] - intercept
+        rss = np.maximum(centred_rss, 0.0) + n * offset ** 2
 
-        log_lik = -n / 2 * np.log(2 * np.pi * sigma ** 2) - np.sum(residuals ** 2) / (2 * sigma ** 2)
+        log_lik = -n / 2 * np.log(2 * np.pi * sigma ** 2) - rss / (2 * sigma ** 2)
         return log_lik
 
     def _log_likelihood_logistic_single(
         self, X: NDArray, y: NDArray, params: NDArray, n_features: int
-    ) -> float:
-        beta = params[:n_features]
-        intercept = params[n_features]
-        logits = X @ beta + intercept
+    ) -> NDArray:
+        beta = params[..., :n_features]
+        intercept = params[..., n_features]
+        logits = beta @ X.T + np.asarray(intercept)[..., None]
         probs = 1 / (1 + np.exp(-np.clip(logits, -500, 500)))
-        log_lik = np.sum(y * np.log(probs + 1e-10) + (1 - y) * np.log(1 - probs + 1e-10))
+        log_lik = np.sum(y * np.log(probs + 1e-10) + (1 - y) * np.log(1 - probs + 1e-10), axis=-1)
         return log_lik
 
     def _compute_log_likelihood(
@@ -496,9 +645,9 @@ class BayesianInferenceEngine:
             var_val = np.var(all_samples, ddof=1)
 
             if var_val > 0:
-                autocorr_vals = np.correlate(
-                    all_samples - mean_val, all_samples - mean_val, mode="full"
-                )[n_total - 1:]
+                size = 1 << (2 * n_total - 1).bit_length()
+                spectrum = np.fft.rfft(all_samples - mean_val, size)
+                autocorr_vals = np.fft.irfft(spectrum * spectrum.conj(), size)[:n_total]
                 autocorr_vals = autocorr_vals / (var_val * n_total)
                 # Sum until first negative
                 tau = 1.0
@@ -509,6 +658,7 @@ class BayesianInferenceEngine:
                 ess[param_name] = float(n_total / tau)
             else:
                 ess[param_name] = float(n_total)
+                autocorr_vals = np.zeros(1)
 
             autocorr[param_name] = autocorr_vals[:min(50, len(autocorr_vals))]
 
@@ -542,6 +692,155 @@ class BayesianInferenceEngine:
 # Monte Carlo Simulation
 # ---------------------------------------------------------------------------
 
+class RunningMoments:
+    """Count, mean and sum of squared deviations, mergeable across blocks."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values: NDArray) -> "RunningMoments":
+        block = RunningMoments()
+        block.count = len(values)
+        if block.count:
+            block.mean = float(np.mean(values))
+            block.m2 = float(np.sum((values - block.mean) ** 2))
+        return self.merge(block)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        total = self.count + other.count
+        if other.count:
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self.m2 += other.m2 + delta * delta * self.count * other.count / total
+            self.count = total
+        return self
+
+    def variance(self, ddof: int = 0) -> float:
+        return self.m2 / (self.count - ddof) if self.count > ddof else float("nan")
+
+    def std(self, ddof: int = 0) -> float:
+        return float(np.sqrt(self.variance(ddof)))
+
+    def mean_half_width(self, confidence: float = 0.95) -> float:
+        """Half-width of the normal-approximation confidence interval of the mean."""
+        if self.count < 2:
+            return float("inf")
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        return z * self.std(ddof=1) / np.sqrt(self.count)
+
+
+class QuantileSketch:
+    """Mergeable KLL quantile sketch (Karnin, Lang & Liberty 2016).
+
+    Level ``i`` holds items that each stand for ``2**i`` samples. A level
+    over its capacity is sorted and every other item (random offset) moves
+    up one level, so memory stays ``O(k log(n / k))`` for ``n`` samples.
+    Until the first compaction the sketch is exact.
+    """
+
+    def __init__(self, k: int = 2048, seed: Optional[int] = None):
+        self.k = k
+        self.levels: List[NDArray] = [np.empty(0)]
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+
+    def update(self, values: NDArray) -> "QuantileSketch":
+        values = np.asarray(values, dtype=float).ravel()
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _capacity(self, level: int) -> int:
+        return max(2, int(self.k * (2 / 3) ** (len(self.levels) - 1 - level)))
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                items = np.sort(items)
+                # An odd item out stays behind at this level.
+                keep = items[len(items) - len(items) % 2:]
+                promoted = items[int(self.rng.integers(2)):len(items) - len(keep):2]
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def _weighted(self) -> Tuple[NDArray, NDArray]:
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** i) for i, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        return values[order], weights[order]
+
+    def quantile(self, q: float) -> float:
+        values, weights = self._weighted()
+        if len(values) == 0:
+            return float("nan")
+        if len(self.levels) == 1:
+            return float(np.quantile(values, q))
+        positions = (np.cumsum(weights) - weights / 2) / weights.sum()
+        return float(np.interp(q, positions, values))
+
+    def fraction_below(self, threshold: float) -> float:
+        values, weights = self._weighted()
+        return float(weights[values < threshold].sum() / weights.sum()) if len(values) else float("nan")
+
+    def fraction_above(self, threshold: float) -> float:
+        values, weights = self._weighted()
+        return float(weights[values > threshold].sum() / weights.sum()) if len(values) else float("nan")
+
+    def mean_at_or_below(self, cutoff: float) -> float:
+        values, weights = self._weighted()
+        tail = values <= cutoff
+        return float(np.average(values[tail], weights=weights[tail])) if tail.any() else float(cutoff)
+
+
+# Job of a pool worker process, set once by its initializer. Each pool forks
+# its own workers, so concurrent simulations never share this.
+_WORKER_JOB: Dict[str, Any] = {}
+
+
+def _init_simulation_worker(job: Dict[str, Any]) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+
+
+def _simulation_worker(task: Tuple[int, np.random.SeedSequence, int]) -> Tuple[int, RunningMoments, QuantileSketch, int]:
+    return _simulate_block(_WORKER_JOB, task)
+
+
+def _simulate_block(
+    job: Dict[str, Any], task: Tuple[int, np.random.SeedSequence, int]
+) -> Tuple[int, RunningMoments, QuantileSketch, int]:
+    index, seed, size = task
+    simulator: MonteCarloSimulator = job["simulator"]
+    sample_rng, sketch_seed = np.random.default_rng(seed), int(seed.generate_state(1)[0])
+    param_samples = simulator._generate_samples(
+        job["distributions"], size, sample_rng, job["sampling"], job["variance_reduction"]
+    )
+    if job["vectorized"]:
+        results = np.asarray(job["model"](**param_samples, **job["fixed_params"]), dtype=float).reshape(size)
+    else:
+        results = simulator._evaluate(job["model"], param_samples, job["fixed_params"], size)
+    valid = results[~np.isnan(results)]
+    sketch = QuantileSketch(job["sketch_size"], seed=sketch_seed).update(valid)
+    return index, RunningMoments().update(valid), sketch, size - len(valid)
+
+
 class MonteCarloSimulator:
     """Monte Carlo simulation engine with variance reduction and convergence monitoring."""
 
@@ -568,20 +867,7 @@ class MonteCarloSimulator:
         )
 
         # Evaluate model across all samples
-        results = np.zeros(self.n_simulations)
-        for i in range(self.n_simulations):
-            kwargs = {key: param_samples[key][i] for key in param_samples}
-            if fixed_params:
-                kwargs.update(fixed_params)
-            try:
-                output = model(**kwargs)
-                if isinstance(output, tuple):
-                    results[i] = output[0]
-                else:
-                    results[i] = output
-            except Exception as e:
-                logger.warning("Simulation %d failed: %s", i, e)
-                results[i] = np.nan
+        results = self._evaluate(model, param_samples, fixed_params or {}, self.n_simulations)
 
         # Remove NaN results
         valid_mask = ~np.isnan(results)
@@ -605,6 +891,118 @@ class MonteCarloSimulator:
             execution_time_ms=elapsed_ms,
         )
 
+    def run_streaming(
+        self,
+        model: Callable[..., Any],
+        parameter_distributions: Dict[str, Dict[str, Any]],
+        fixed_params: Optional[Dict[str, Any]] = None,
+        sampling: SamplingMethod = SamplingMethod.RANDOM,
+        variance_reduction: bool = False,
+        seed: Optional[int] = None,
+        block_size: int = 100_000,
+        target_ci_width: Optional[float] = None,
+        confidence: float = 0.95,
+        vectorized: bool = False,
+        n_jobs: int = 1,
+        sketch_size: int = 2048,
+    ) -> StreamingMonteCarloResult:
+        """Simulate up to ``n_simulations`` draws in blocks without storing them.
+
+        Each block of ``block_size`` draws has its own child seed and is
+        folded into running moments and a ``QuantileSketch``, so memory is
+        bounded by the block size. Blocks are merged in order, and when
+        ``target_ci_width`` is set the run stops at the first block after
+        which the ``confidence`` interval of the mean is that narrow; the
+        result therefore does not depend on ``n_jobs``, which runs blocks in
+        forked worker processes. With ``vectorized=True`` the model is
+        called once per block with arrays of parameters and must return one
+        value per draw. Sampling schemes such as Latin hypercube apply
+        within each block.
+        """
+        root = np.random.SeedSequence(seed)
+        start_time = datetime.now(timezone.utc)
+        n_blocks = -(-self.n_simulations // block_size)
+        sizes = [min(block_size, self.n_simulations - i * block_size) for i in range(n_blocks)]
+        seeds = root.spawn(n_blocks + 1)
+        moments, sketch = RunningMoments(), QuantileSketch(sketch_size, seed=int(seeds[-1].generate_state(1)[0]))
+        n_failed, n_merged, converged = 0, 0, None if target_ci_width is None else False
+
+        job = {
+            "simulator": self, "model": model, "distributions": parameter_distributions,
+            "fixed_params": fixed_params or {}, "sampling": sampling, "variance_reduction": variance_reduction,
+            "vectorized": vectorized, "sketch_size": sketch_size,
+        }
+        n_jobs = min(n_jobs, n_blocks)
+        pool = None
+        if n_jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the job through the initializer, so the
+            # model may be any callable and only seeds are pickled.
+            pool = ProcessPoolExecutor(
+                n_jobs, mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_simulation_worker, initargs=(job,),
+            )
+        try:
+            # Dispatch a round of blocks at a time so an early stop wastes at most one round.
+            for first in range(0, n_blocks, max(n_jobs, 1)):
+                tasks = [(i, seeds[i], sizes[i]) for i in range(first, min(first + max(n_jobs, 1), n_blocks))]
+                if pool is not None:
+                    partials = pool.map(_simulation_worker, tasks)
+                else:
+                    partials = (_simulate_block(job, task) for task in tasks)
+                for _, block_moments, block_sketch, block_failed in partials:
+                    moments.merge(block_moments)
+                    sketch.merge(block_sketch)
+                    n_failed += block_failed
+                    n_merged += 1
+                    if target_ci_width is not None and 2 * moments.mean_half_width(confidence) <= target_ci_width:
+                        converged = True
+                        break
+                if converged:
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        elapsed_ms = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+        if self.verbose:
+            logger.info(
+                "Streaming simulation: %d valid draws in %d blocks in %.1fms",
+                moments.count, n_merged, elapsed_ms,
+            )
+
+        return StreamingMonteCarloResult(
+            moments=moments,
+            sketch=sketch,
+            n_simulations=moments.count,
+            n_failed=n_failed,
+            n_blocks=n_merged,
+            method=sampling,
+            variance_reduced=variance_reduction,
+            seed=seed or 0,
+            execution_time_ms=elapsed_ms,
+            converged=converged,
+        )
+
+    def _evaluate(
+        self, model: Callable[..., Any], param_samples: Dict[str, NDArray],
+        fixed_params: Dict[str, Any], n: int,
+    ) -> NDArray:
+        """Call ``model`` once per draw; failed draws become NaN."""
+        results = np.zeros(n)
+        for i in range(n):
+            kwargs = {key: param_samples[key][i] for key in param_samples}
+            kwargs.update(fixed_params)
+            try:
+                output = model(**kwargs)
+                if isinstance(output, tuple):
+                    results[i] = output[0]
+                else:
+                    results[i] = output
+            except Exception as e:
+                logger.warning("Simulation %d failed: %s", i, e)
+                results[i] = np.nan
+        return results
+
     def _generate_samples(
         self,
         distributions: Dict[str, Dict[str, Any]],
@@ -637,16 +1035,18 @@ class MonteCarloSimulator:
         self, dist_spec: Dict[str, Any], n: int, rng: np.random.Generator
     ) -> NDArray:
         dist_type = dist_spec["type"]
+        # Array-valued parameters give one row of draws per simulation.
+        shape = lambda *params: (n,) + np.broadcast(*params).shape  # noqa: E731
         if dist_type == "normal":
-            return rng.normal(dist_spec["mean"], dist_spec["std"], n)
+            return rng.normal(dist_spec["mean"], dist_spec["std"], shape(dist_spec["mean"], dist_spec["std"]))
         elif dist_type == "uniform":
-            return rng.uniform(dist_spec["low"], dist_spec["high"], n)
+            return rng.uniform(dist_spec["low"], dist_spec["high"], shape(dist_spec["low"], dist_spec["high"]))
         elif dist_type == "lognormal":
-            return rng.lognormal(dist_spec["mean"], dist_spec["std"], n)
+            return rng.lognormal(dist_spec["mean"], dist_spec["std"], shape(dist_spec["mean"], dist_spec["std"]))
         elif dist_type == "beta":
-            return rng.beta(dist_spec["alpha"], dist_spec["beta"], n)
+            return rng.beta(dist_spec["alpha"], dist_spec["beta"], shape(dist_spec["alpha"], dist_spec["beta"]))
         elif dist_type == "poisson":
-            return rng.poisson(dist_spec["lam"], n).astype(float)
+            return rng.poisson(dist_spec["lam"], shape(dist_spec["lam"])).astype(float)
         elif dist_type == "wishart":
             scale = np.array(dist_spec["scale"])
             df = dist_spec["df"]
@@ -1094,7 +1494,7 @@ def main() -> None:
     result = engine.linear_regression(
         X=X, y=y,
         priors=PriorSpec(),
-        config=MCMCConfig(n_samples=2000, n_warmup=500, n_chains=2, seed=42),
+        config=MCMCConfig(n_samples=2000, n_warmup=500, n_chains=4, seed=42, adapt_proposal=True),
     )
     print(f"  Posterior mean weights: {result.coefficient_means}")
     print(f"  True weights:          {true_weights}")
@@ -1129,6 +1529,23 @@ def main() -> None:
     ci95 = mc_result.confidence_interval(0.95)
     print(f"  95% CI:                [{ci95[0]:.4f}, {ci95[1]:.4f}]")
 
+    # Streaming: blocks of draws folded into moments and a quantile sketch
+    def portfolio_returns(weights: NDArray, returns: NDArray) -> NDArray:
+        return returns @ weights
+
+    streaming = MonteCarloSimulator(n_simulations=10_000_000).run_streaming(
+        model=portfolio_returns,
+        parameter_distributions={
+            "returns": {"type": "normal", "mean": np.array([0.08, 0.12, 0.06]), "std": np.array([0.15, 0.20, 0.10])},
+        },
+        fixed_params={"weights": np.array([0.4, 0.35, 0.25])},
+        seed=42,
+        vectorized=True,
+        target_ci_width=1e-3,
+    )
+    print(f"  Streaming draws used:  {streaming.n_simulations} (converged={streaming.converged})")
+    print(f"  Streaming VaR (95%):   {streaming.percentile(5):.4f}")
+
     # --- 3. Multivariate Analysis ---
     print("\n--- Principal Component Analysis ---")
     data = rng.standard_normal((150, 6))
@@ -11,14 +11,18 @@ from __future__ import annotations
 import hashlib
 import json
 import logging
+import os
 import warnings
+from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
@@ -211,6 +215,148 @@ class PipelineResult:
         }
 
 
+# ---------------------------------------------------------------------------
+# Streaming Statistics
+# ---------------------------------------------------------------------------
+
+class RunningStats:
+    """Mergeable per-column count, mean, variance, min and max (NaN-aware).
+
+    Chunks are folded in with Chan et al.'s parallel form of Welford's
+    update, so fitting on chunks (or merging stats fitted on shards) gives
+    the same result as one pass over the concatenated data.
+    """
+
+    def __init__(self, n_features: int):
+        self.count = np.zeros(n_features)
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+        self.min = np.full(n_features, np.inf)
+        self.max = np.full(n_features, -np.inf)
+
+    def update(self, X: NDArray) -> "RunningStats":
+        X = np.asarray(X, dtype=float)
+        valid = ~np.isnan(X)
+        count = valid.sum(axis=0).astype(float)
+        filled = np.where(valid, X, 0.0)
+        mean = filled.sum(axis=0) / np.maximum(count, 1)
+        m2 = (np.where(valid, X - mean, 0.0) ** 2).sum(axis=0)
+        other = RunningStats(X.shape[1])
+        other.count, other.mean, other.m2 = count, mean, m2
+        if len(X):
+            other.min = np.where(count > 0, np.min(np.where(valid, X, np.inf), axis=0), np.inf)
+            other.max = np.where(count > 0, np.max(np.where(valid, X, -np.inf), axis=0), -np.inf)
+        return self.merge(other)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        share = np.divide(other.count, total, out=np.zeros_like(total), where=total > 0)
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * share
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def variance(self, ddof: int = 0) -> NDArray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+
+class QuantileSketch:
+    """Mergeable streaming quantile sketch (KLL) for one feature.
+
+    Values are kept in levels of compactors; level ``h`` items each stand
+    for ``2**h`` inputs. When a level outgrows its capacity it is sorted and
+    every other item (random offset) is promoted, so memory stays
+    ``O(k log(n / k))`` with rank error around ``1 / k``. Streams shorter
+    than ``k`` are kept exactly and ``quantiles`` then matches
+    ``np.percentile``.
+    """
+
+    def __init__(self, k: int = 512, seed: Optional[int] = None):
+        self.k = k
+        self.levels: List[NDArray] = [np.empty(0)]
+        self.count = 0
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: NDArray) -> "QuantileSketch":
+        values = np.asarray(values, dtype=float).ravel()
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self.count += len(values)
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantiles(self, percentiles: Union[float, Sequence[float]]) -> NDArray:
+        """Approximate ``np.percentile(stream, percentiles)`` (linear interpolation)."""
+        q = np.asarray(percentiles, dtype=float) / 100
+        if self.count == 0:
+            return np.full(q.shape, np.nan)
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(items), 2.0 ** h) for h, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values, weights = values[order], weights[order]
+        # Each item sits at the middle of the ranks it stands for.
+        positions = np.cumsum(weights) - weights + (weights - 1) / 2
+        total = weights.sum()
+        return np.interp(q * max(total - 1, 0), positions, values)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self) -> None:
+        while True:
+            level = next((h for h, items in enumerate(self.levels) if len(items) > self._capacity(h)), None)
+            if level is None:
+                return
+            if level + 1 == len(self.levels):
+                self.levels.append(np.empty(0))
+            items = np.sort(self.levels[level])
+            # An odd item out stays behind so the promoted half is exact.
+            keep = items[:len(items) % 2]
+            paired = items[len(keep):]
+            promoted = paired[self._rng.integers(2)::2]
+            self.levels[level] = keep
+            self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+
+
+def iter_chunks(
+    source: Union[str, "os.PathLike[str]", NDArray, Iterable[NDArray]],
+    chunk_size: int = 65536,
+) -> Iterator[NDArray]:
+    """Yield row chunks from an array, a ``.npy`` path (memory-mapped) or an iterable of arrays."""
+    if isinstance(source, (str, os.PathLike)):
+        source = np.load(source, mmap_mode="r")
+    if isinstance(source, np.ndarray):
+        for start in range(0, len(source), chunk_size):
+            yield np.asarray(source[start:start + chunk_size])
+        return
+    for chunk in source:
+        yield np.asarray(chunk)
+
+
+def _stream_feature_names(transformer: Any, X: NDArray, feature_names: Optional[List[str]]) -> List[str]:
+    """Resolve feature names for ``partial_fit`` and check chunks keep the same features."""
+    names = list(feature_names or [f"feature_{i}" for i in range(X.shape[1])])
+    if transformer._stream_names is None:
+        transformer._stream_names = names
+    elif transformer._stream_names != names:
+        raise ValueError("partial_fit chunks must have the same features in the same order.")
+    return names
+
+
 # ---------------------------------------------------------------------------
 # Missing Value Imputation
 # ---------------------------------------------------------------------------
@@ -224,9 +370,19 @@ class Imputer:
         self.k = kwargs.get("k", 5)
         self.max_iter = kwargs.get("max_iter", 10)
         self.constant_value = kwargs.get("constant_value", 0)
+        self.sketch_size = kwargs.get("sketch_size", 512)
+        self.random_state = kwargs.get("random_state")
         self._is_fitted = False
+        self._reset_stream()
+
+    def _reset_stream(self) -> None:
+        self._stream_names: Optional[List[str]] = None
+        self._moments: Optional[RunningStats] = None
+        self._sketches: List[QuantileSketch] = []
+        self._value_counts: List[Dict[float, int]] = []
 
     def fit(self, X: NDArray, feature_names: Optional[List[str]] = None) -> "Imputer":
+        self._reset_stream()
         n_features = X.shape[1]
         names = feature_names or [f"feature_{i}" for i in range(n_features)]
 
@@ -257,6 +413,49 @@ class Imputer:
         self._is_fitted = True
         return self
 
+    def partial_fit(self, X: NDArray, feature_names: Optional[List[str]] = None) -> "Imputer":
+        """Update fill values with one chunk of rows.
+
+        Means come from running moments, medians from a quantile sketch and
+        modes from running value counts, so memory does not grow with the
+        number of rows. Unlike ``fit``, a fill value is learnt for every
+        feature, whether or not its chunks so far had missing values.
+        """
+        names = _stream_feature_names(self, X, feature_names)
+        if self._moments is None:
+            self._moments = RunningStats(len(names))
+            self._sketches = [QuantileSketch(self.sketch_size, self.random_state) for _ in names]
+            self._value_counts = [{} for _ in names]
+        X = np.asarray(X, dtype=float)
+
+        if self.method == ImputationMethod.MEDIAN:
+            for i, sketch in enumerate(self._sketches):
+                sketch.update(X[:, i])
+        elif self.method == ImputationMethod.MODE:
+            for i, counts in enumerate(self._value_counts):
+                col = X[:, i]
+                unique, chunk_counts = np.unique(col[~np.isnan(col)], return_counts=True)
+                for value, count in zip(unique.tolist(), chunk_counts.tolist()):
+                    counts[value] = counts.get(value, 0) + count
+        else:
+            self._moments.update(X)
+
+        for i, name in enumerate(names):
+            if self.method == ImputationMethod.CONSTANT:
+                self.fill_values[name] = self.constant_value
+            elif self.method == ImputationMethod.MEDIAN:
+                self.fill_values[name] = float(self._sketches[i].quantiles(50))
+            elif self.method == ImputationMethod.MODE:
+                counts = self._value_counts[i]
+                # Ties resolve to the smallest value, as np.unique/argmax does in fit.
+                self.fill_values[name] = float(min(counts, key=lambda v: (-counts[v], v))) if counts else np.nan
+            else:
+                count = self._moments.count[i]
+                self.fill_values[name] = float(self._moments.mean[i]) if count else np.nan
+
+        self._is_fitted = True
+        return self
+
     def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
         if not self._is_fitted:
             raise RuntimeError("Imputer must be fitted before transforming.")
@@ -310,6 +509,15 @@ class CategoricalEncoder:
         self.encoding_maps: Dict[str, EncodingMap] = {}
         self.global_mean: float = 0.0
         self._is_fitted = False
+        self._reset_stream()
+
+    def _reset_stream(self) -> None:
+        self._stream_names: Optional[List[str]] = None
+        self._category_counts: List[Dict[str, int]] = []
+        self._target_sums: List[Dict[str, float]] = []
+        self._n_seen = 0
+        self._y_sum = 0.0
+        self._y_seen = False
 
     def fit(
         self,
@@ -317,6 +525,7 @@ class CategoricalEncoder:
         y: Optional[NDArray] = None,
         feature_names: Optional[List[str]] = None,
     ) -> "CategoricalEncoder":
+        self._reset_stream()
         n_features = X.shape[1]
         names = feature_names or [f"feature_{i}" for i in range(n_features)]
 
@@ -377,22 +586,84 @@ class CategoricalEncoder:
         self._is_fitted = True
         return self
 
+    def partial_fit(
+        self,
+        X: NDArray,
+        y: Optional[NDArray] = None,
+        feature_names: Optional[List[str]] = None,
+    ) -> "CategoricalEncoder":
+        """Update category counts (and per-category target sums) with one chunk.
+
+        Encoding maps are rebuilt from the running counts after every chunk
+        and match what ``fit`` produces on the concatenated chunks.
+        """
+        names = _stream_feature_names(self, X, feature_names)
+        if not self._category_counts:
+            self._category_counts = [{} for _ in names]
+            self._target_sums = [{} for _ in names]
+        if y is not None:
+            y = np.asarray(y, dtype=float)
+            self._y_sum += float(y.sum())
+            self._y_seen = True
+        self._n_seen += X.shape[0]
+
+        for i, name in enumerate(names):
+            unique, inverse, counts = np.unique(X[:, i].astype(str), return_inverse=True, return_counts=True)
+            sums = np.bincount(inverse, weights=y, minlength=len(unique)) if y is not None else None
+            category_counts, target_sums = self._category_counts[i], self._target_sums[i]
+            for j, value in enumerate(unique.tolist()):
+                category_counts[value] = category_counts.get(value, 0) + int(counts[j])
+                if sums is not None:
+                    target_sums[value] = target_sums.get(value, 0.0) + float(sums[j])
+
+        use_target = self.method == EncodingMethod.TARGET and self._y_seen
+        if use_target:
+            self.global_mean = self._y_sum / self._n_seen
+        for i, name in enumerate(names):
+            counts = self._category_counts[i]
+            categories = sorted(counts)
+            if self.method == EncodingMethod.ONE_HOT:
+                mapping: Dict[str, float] = {v: j for j, v in enumerate(categories)}
+            elif use_target:
+                mapping = {}
+                for v in categories:
+                    n_val = counts[v]
+                    if n_val >= self.min_samples_leaf:
+                        smooth = 1 / (1 + np.exp(-(n_val - self.min_samples_leaf) / self.smoothing))
+                        mapping[v] = smooth * self._target_sums[i][v] / n_val + (1 - smooth) * self.global_mean
+                    else:
+                        mapping[v] = self.global_mean
+            elif self.method == EncodingMethod.FREQUENCY:
+                mapping = {v: counts[v] / self._n_seen for v in categories}
+            else:
+                mapping = {v: float(j) for j, v in enumerate(categories)}
+            self.encoding_maps[name] = EncodingMap(
+                feature_name=name, method=self.method,
+                mapping=mapping, categories=categories,
+            )
+
+        self._is_fitted = True
+        return self
+
     def transform(
         self, X: NDArray, feature_names: Optional[List[str]] = None
     ) -> NDArray:
         if not self._is_fitted:
             raise RuntimeError("Encoder must be fitted before transforming.")
 
-        result = X.copy().astype(float)
+        result = np.empty(X.shape, dtype=float)
         n_features = X.shape[1]
         names = feature_names or [f"feature_{i}" for i in range(n_features)]
 
         for i, name in enumerate(names):
             if name in self.encoding_maps:
                 enc_map = self.encoding_maps[name]
-                col = X[:, i].astype(str)
-                encoded = np.array([enc_map.encode(v) for v in col], dtype=float)
-                result[:, i] = encoded
+                # Encode each distinct value once and scatter back.
+                unique, inverse = np.unique(X[:, i].astype(str), return_inverse=True)
+                encoded = np.array([enc_map.encode(v) for v in unique.tolist()], dtype=float)
+                result[:, i] = encoded[inverse]
+            else:
+                result[:, i] = X[:, i].astype(float)
 
         return result
 
@@ -416,10 +687,19 @@ class FeatureScaler:
         self.method = method
         self.quantile_range = kwargs.get("quantile_range", (25, 75))
         self.n_quantiles = kwargs.get("n_quantiles", 1000)
+        self.sketch_size = kwargs.get("sketch_size", 512)
+        self.random_state = kwargs.get("random_state")
         self.scaling_params: Dict[str, ScalingParams] = {}
         self._is_fitted = False
+        self._reset_stream()
+
+    def _reset_stream(self) -> None:
+        self._stream_names: Optional[List[str]] = None
+        self._moments: Optional[RunningStats] = None
+        self._sketches: List[QuantileSketch] = []
 
     def fit(self, X: NDArray, feature_names: Optional[List[str]] = None) -> "FeatureScaler":
+        self._reset_stream()
         n_features = X.shape[1]
         names = feature_names or [f"feature_{i}" for i in range(n_features)]
 
@@ -468,6 +748,54 @@ class FeatureScaler:
         self._is_fitted = True
         return self
 
+    def partial_fit(self, X: NDArray, feature_names: Optional[List[str]] = None) -> "FeatureScaler":
+        """Update scaling parameters with one chunk of rows.
+
+        Standard, min-max and max-abs scaling use exact running moments and
+        extremes; robust and quantile scaling read their quantiles from a
+        per-feature ``QuantileSketch`` (exact until ``sketch_size`` values).
+        """
+        names = _stream_feature_names(self, X, feature_names)
+        if self._moments is None:
+            self._moments = RunningStats(len(names))
+            self._sketches = [QuantileSketch(self.sketch_size, self.random_state) for _ in names]
+        X = np.asarray(X, dtype=float)
+        moments = self._moments.update(X)
+        if self.method in (ScalingMethod.ROBUST, ScalingMethod.QUANTILE):
+            for i, sketch in enumerate(self._sketches):
+                sketch.update(X[:, i])
+
+        std = np.sqrt(moments.variance(ddof=1))
+        for i, name in enumerate(names):
+            if not moments.count[i]:
+                continue
+            if self.method == ScalingMethod.STANDARD:
+                self.scaling_params[name] = ScalingParams(
+                    feature_name=name, method=self.method,
+                    mean=float(moments.mean[i]), std=float(std[i]) if std[i] > 0 else 1.0,
+                )
+            elif self.method in (ScalingMethod.MINMAX, ScalingMethod.MAXABS):
+                self.scaling_params[name] = ScalingParams(
+                    feature_name=name, method=self.method,
+                    min_val=float(moments.min[i]), max_val=float(moments.max[i]),
+                )
+            elif self.method == ScalingMethod.ROBUST:
+                median, q1, q3 = self._sketches[i].quantiles([50, *self.quantile_range])
+                iqr = float(q3 - q1)
+                self.scaling_params[name] = ScalingParams(
+                    feature_name=name, method=self.method,
+                    median=float(median), iqr=iqr if iqr > 0 else 1.0,
+                )
+            elif self.method == ScalingMethod.QUANTILE:
+                quantiles = np.linspace(0, 1, int(min(self.n_quantiles, moments.count[i])))
+                self.scaling_params[name] = ScalingParams(
+                    feature_name=name, method=self.method,
+                    quantiles=(quantiles, self._sketches[i].quantiles(quantiles * 100)),
+                )
+
+        self._is_fitted = True
+        return self
+
     def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
         if not self._is_fitted:
             raise RuntimeError("Scaler must be fitted before transforming.")
@@ -507,6 +835,208 @@ class FeatureScaler:
 # Feature Constructor
 # ---------------------------------------------------------------------------
 
+def _sliding_extreme(values: NDArray, window: int, reducer: Callable) -> NDArray:
+    """Min/max of every length-``window`` run along axis 0 in O(n) (van Herk/Gil-Werman).
+
+    ``values`` is ``(n, c)`` with ``n >= window``; returns ``(n - window + 1, c)``
+    where row ``j`` reduces ``values[j:j + window]``. ``reducer`` is
+    ``np.minimum`` or ``np.maximum``.
+    """
+    n, n_cols = values.shape
+    n_blocks = -(-n // window)
+    fill = np.inf if reducer is np.minimum else -np.inf
+    padded = np.full((n_blocks * window, n_cols), fill)
+    padded[:n] = values
+    blocks = padded.reshape(n_blocks, window, n_cols)
+    prefix = reducer.accumulate(blocks, axis=1).reshape(-1, n_cols)
+    suffix = reducer.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].reshape(-1, n_cols)
+    starts = np.arange(n - window + 1)
+    return reducer(suffix[starts], prefix[starts + window - 1])
+
+
+def _rolling_moments(
+    values: NDArray, nan_mask: NDArray, window: int, with_skew: bool
+) -> Tuple[NDArray, NDArray, Optional[NDArray], NDArray]:
+    """Sums of powers over every trailing ``window``-row slice in O(n).
+
+    The rows are cut into blocks of ``window`` rows, each centred on its own
+    mean, and summed with per-block prefix sums; a window spans the tail of
+    one block and the head of the next, whose sums are shifted onto the first
+    block's centre. Local centring keeps trending series (random walks,
+    prices) well conditioned. Returns ``(mean, sq_dev, m3, unstable)`` for the
+    windows starting at rows ``0..n - window - 1``: the mean, the sum of
+    squared deviations, the third central moment (``None`` unless
+    ``with_skew``) and a mask of windows whose spread is so small next to
+    their blocks' that the sums cancel badly.
+    """
+    n, n_cols = values.shape
+    n_blocks = -(-n // window) + 1
+    padded = np.zeros((n_blocks * window, n_cols))
+    padded[:n] = np.where(nan_mask, 0.0, values)
+    blocks = padded.reshape(n_blocks, window, n_cols)
+    present = np.zeros((n_blocks * window, n_cols), dtype=bool)
+    present[:n] = ~nan_mask
+    present = present.reshape(blocks.shape)
+    counts = present.sum(axis=1)
+    centers = blocks.sum(axis=1) / np.maximum(counts, 1)
+    centred = np.where(present, blocks - centers[:, None], 0.0)
+
+    # Window j covers rows j..j+window-1: the tail of block j // window from
+    # row j on, plus the first j % window rows of the next block.
+    count = n - window
+    per_row_centers = np.repeat(centers, window, axis=0)
+    base = per_row_centers[:count]
+    shift = per_row_centers[window:window + count] - base
+    rows = np.tile(np.arange(window, dtype=float), n_blocks)[:count, None]
+
+    def split_sums(power: NDArray) -> Tuple[NDArray, NDArray]:
+        running = np.cumsum(power, axis=1)
+        totals = np.repeat(running[:, -1], window, axis=0)[:count]
+        local = np.zeros((n_blocks * window + 1, n_cols))
+        local[1:] = running.reshape(-1, n_cols)
+        local[::window] = 0.0
+        return totals - local[:count], local[window:window + count]
+
+    squares = centred * centred
+    tail1, head1 = split_sums(centred)
+    tail2, head2 = split_sums(squares)
+    shifted = rows * shift
+    s1 = tail1 + head1 + shifted
+    s2 = tail2 + head2 + shift * (2 * head1 + shifted)
+    mean_c = s1 / window
+    sq_dev = np.maximum(s2 - s1 * mean_c, 0.0)
+    # Largest magnitude the sums passed through; rounding error scales with it.
+    magnitude = tail2 + head2 + shift * shifted
+    unstable = magnitude > (1e3 if with_skew else 1e6) * sq_dev
+    m3 = None
+    if with_skew:
+        tail3, head3 = split_sums(squares * centred)
+        s3 = tail3 + head3 + shift * (3 * head2 + shift * (3 * head1 + shifted))
+        m3 = s3 / window - mean_c * (3 * s2 / window - 2 * mean_c * mean_c)
+    return mean_c + base, sq_dev, m3, unstable
+
+
+class RollingFeatureEngine:
+    """Vectorised trailing-window statistics for many columns and windows at once.
+
+    Row ``i`` of each feature summarises the ``window`` rows *before* it
+    (``data[i - window:i]``); rows with less history are 0. Mean, std and skew
+    come from block-local prefix sums of powers, min and max from a block
+    prefix/suffix scan, so every feature costs O(n) vectorised work
+    regardless of the window length. A window containing NaN yields NaN.
+
+    ``update`` accepts successive chunks of a stream and returns exactly the
+    rows ``transform`` would produce for the concatenated series, keeping only
+    the last ``max(windows)`` rows as state.
+    """
+
+    SUPPORTED_FUNCTIONS = ("mean", "std", "min", "max", "skew")
+
+    def __init__(self, windows: Sequence[int] = (7, 14, 30), functions: Sequence[str] = ("mean", "std", "min", "max")):
+        unknown = [f for f in functions if f not in self.SUPPORTED_FUNCTIONS]
+        if unknown:
+            raise ValueError(f"Unsupported rolling functions: {unknown}")
+        if not windows or min(windows) < 1:
+            raise ValueError("Rolling windows must be positive integers.")
+        self.windows = [int(w) for w in windows]
+        self.functions = list(functions)
+        self.max_window = max(self.windows)
+        self._history: Optional[NDArray] = None
+        self._n_seen = 0
+
+    def feature_names(self, column_names: Optional[Sequence[str]] = None) -> List[str]:
+        """Names of the output columns: column-major, then window, then function."""
+        if column_names is None:
+            return [f"rolling_{w}_{f}" for w in self.windows for f in self.functions]
+        return [f"{c}_rolling_{w}_{f}" for c in column_names for w in self.windows for f in self.functions]
+
+    def transform(self, data: NDArray) -> NDArray:
+        """Compute all features for a ``(n,)`` or ``(n, c)`` array in one pass."""
+        return self._compute(self._as_2d(data))
+
+    def update(self, rows: NDArray) -> NDArray:
+        """Append ``rows`` to the stream and return their features."""
+        rows = self._as_2d(rows)
+        if self._history is not None and self._history.shape[1] != rows.shape[1]:
+            raise ValueError("Streamed chunks must keep the same number of columns.")
+        history = self._history if self._history is not None else rows[:0]
+        combined = np.vstack([history, rows])
+        features = self._compute(combined)[len(history):]
+        self._history = combined[-self.max_window:].copy()
+        self._n_seen += len(rows)
+        return features
+
+    def reset(self) -> None:
+        """Forget streamed history."""
+        self._history = None
+        self._n_seen = 0
+
+    @staticmethod
+    def _as_2d(data: NDArray) -> NDArray:
+        data = np.asarray(data, dtype=float)
+        return data.reshape(-1, 1) if data.ndim == 1 else data
+
+    def _compute(self, data: NDArray) -> NDArray:
+        n, n_cols = data.shape
+        n_funcs = len(self.functions)
+        out = np.zeros((n, n_cols, len(self.windows), n_funcs))
+
+        nan_mask = np.isnan(data)
+        has_nan = bool(nan_mask.any())
+        need_moments = any(f in ("mean", "std", "skew") for f in self.functions)
+        if has_nan:
+            nan_prefix = np.concatenate([np.zeros((1, n_cols)), np.cumsum(nan_mask, axis=0)])
+
+        for w_idx, window in enumerate(self.windows):
+            if window >= n:
+                continue
+            # Windows ending before rows window..n-1 start at rows 0..n-window-1.
+            lo, hi = slice(0, n - window), slice(window, n)
+            stats: Dict[str, NDArray] = {}
+            if need_moments:
+                mean, sq_dev, m3, unstable = _rolling_moments(data, nan_mask, window, "skew" in self.functions)
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    std = np.sqrt(sq_dev / (window - 1)) if window > 1 else np.full_like(sq_dev, np.nan)
+                    stats["mean"] = mean
+                    stats["std"] = std
+                    if m3 is not None:
+                        stats["skew"] = np.where(std > 0, m3 / std ** 3, 0.0)
+                # Near-constant windows lose most digits to cancellation;
+                # recompute those few directly.
+                if window > 1 and unstable.any():
+                    self._exact_moments(np.where(nan_mask, 0.0, data), window, unstable, stats)
+            if "min" in self.functions:
+                stats["min"] = _sliding_extreme(np.where(nan_mask, np.inf, data), window, np.minimum)[:-1]
+            if "max" in self.functions:
+                stats["max"] = _sliding_extreme(np.where(nan_mask, -np.inf, data), window, np.maximum)[:-1]
+            if has_nan:
+                window_has_nan = (nan_prefix[hi] - nan_prefix[lo]) > 0
+            for f_idx, func in enumerate(self.functions):
+                values = stats[func]
+                if has_nan:
+                    values = np.where(window_has_nan, np.nan, values)
+                out[window:, :, w_idx, f_idx] = values
+
+        return out.reshape(n, -1)
+
+    @staticmethod
+    def _exact_moments(values: NDArray, window: int, mask: NDArray, stats: Dict[str, NDArray]) -> None:
+        """Overwrite std/skew in ``stats`` for the windows flagged in ``mask`` with direct sums."""
+        starts, cols = np.nonzero(mask)
+        offsets = np.arange(window)
+        batch = max(1, (1 << 20) // window)
+        for begin in range(0, len(starts), batch):
+            rows, col = starts[begin:begin + batch], cols[begin:begin + batch]
+            block = values[rows[:, None] + offsets, col[:, None]]
+            mean = block.mean(axis=1, keepdims=True)
+            std = block.std(axis=1, ddof=1)
+            stats["std"][rows, col] = std
+            if "skew" in stats:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    skew = np.mean(((block - mean) / std[:, None]) ** 3, axis=1)
+                stats["skew"][rows, col] = np.where(std > 0, skew, 0.0)
+
+
 class FeatureConstructor:
     """Automated feature construction from raw data."""
 
@@ -575,42 +1105,26 @@ class FeatureConstructor:
     def create_rolling_features(
         self,
         data: NDArray,
-        column_idx: int = 0,
+        column_idx: Union[int, Sequence[int]] = 0,
         windows: List[int] = None,
         functions: List[str] = None,
     ) -> Tuple[NDArray, List[str]]:
-        """Create rolling window statistics."""
+        """Create rolling window statistics.
+
+        ``column_idx`` may list several columns; their features are computed
+        together and named ``f{idx}_rolling_{window}_{func}``. See
+        ``RollingFeatureEngine`` for the exact window semantics.
+        """
         if windows is None:
             windows = [7, 14, 30]
         if functions is None:
             functions = ["mean", "std", "min", "max"]
 
-        n_samples = data.shape[0]
-        n_features = len(windows) * len(functions)
-        features = np.zeros((n_samples, n_features))
-        names = []
-        col_idx = 0
-
-        for window in windows:
-            for func in functions:
-                for i in range(window, n_samples):
-                    window_data = data[i - window:i, column_idx]
-                    if func == "mean":
-                        features[i, col_idx] = np.mean(window_data)
-                    elif func == "std":
-                        features[i, col_idx] = np.std(window_data, ddof=1)
-                    elif func == "min":
-                        features[i, col_idx] = np.min(window_data)
-                    elif func == "max":
-                        features[i, col_idx] = np.max(window_data)
-                    elif func == "skew":
-                        m = np.mean(window_data)
-                        s = np.std(window_data, ddof=1)
-                        features[i, col_idx] = float(np.mean(((window_data - m) / s) ** 3)) if s > 0 else 0
-                names.append(f"rolling_{window}_{func}")
-                col_idx += 1
-
-        return features, names
+        engine = RollingFeatureEngine(windows, functions)
+        if isinstance(column_idx, (int, np.integer)):
+            return engine.transform(data[:, column_idx]), engine.feature_names()
+        columns = list(column_idx)
+        return engine.transform(data[:, columns]), engine.feature_names([f"f{i}" for i in columns])
 
     def create_interactions(
         self,
@@ -921,12 +1435,43 @@ class FeaturePipeline:
         self.name = name
         self.steps: List[PipelineStep] = []
         self._fitted_transformers: Dict[str, Any] = {}
+        self._stream_stats: Dict[str, RunningStats] = {}
         self._is_fitted = False
+        self.content_hash: Optional[str] = None
 
     def add_step(self, step: PipelineStep) -> "FeaturePipeline":
         self.steps.append(step)
         return self
 
+    _IMPUTERS = {
+        "mean_imputer": ImputationMethod.MEAN,
+        "median_imputer": ImputationMethod.MEDIAN,
+        "knn_imputer": ImputationMethod.KNN,
+        "iterative_imputer": ImputationMethod.ITERATIVE,
+    }
+    _ENCODERS = {
+        "target_encoder": EncodingMethod.TARGET,
+        "one_hot_encoder": EncodingMethod.ONE_HOT,
+        "frequency_encoder": EncodingMethod.FREQUENCY,
+        "label_encoder": EncodingMethod.LABEL,
+    }
+    _SCALERS = {
+        "standard_scaler": ScalingMethod.STANDARD,
+        "minmax_scaler": ScalingMethod.MINMAX,
+        "robust_scaler": ScalingMethod.ROBUST,
+        "quantile_scaler": ScalingMethod.QUANTILE,
+    }
+
+    def _new_transformer(self, step: PipelineStep) -> Any:
+        """Create the unfitted imputer, encoder or scaler for ``step`` (``None`` otherwise)."""
+        if step.transformer in self._IMPUTERS:
+            return Imputer(method=self._IMPUTERS[step.transformer], **step.params)
+        if step.transformer in self._ENCODERS:
+            return CategoricalEncoder(method=self._ENCODERS[step.transformer], **step.params)
+        if step.transformer in self._SCALERS:
+            return FeatureScaler(method=self._SCALERS[step.transformer], **step.params)
+        return None
+
     def fit(
         self, X: NDArray, y: Optional[NDArray] = None,
         feature_names: Optional[List[str]] = None,
@@ -938,38 +1483,16 @@ class FeaturePipeline:
             if not step.enabled:
                 continue
 
-            if step.transformer in ("mean_imputer", "median_imputer", "knn_imputer", "iterative_imputer"):
-                method_map = {
-                    "mean_imputer": ImputationMethod.MEAN,
-                    "median_imputer": ImputationMethod.MEDIAN,
-                    "knn_imputer": ImputationMethod.KNN,
-                    "iterative_imputer": ImputationMethod.ITERATIVE,
-                }
-                imputer = Imputer(method=method_map[step.transformer], **step.params)
-                imputer.fit(current_X, current_names)
-                self._fitted_transformers[step.name] = imputer
-
-            elif step.transformer in ("target_encoder", "one_hot_encoder", "frequency_encoder", "label_encoder"):
-                method_map = {
-                    "target_encoder": EncodingMethod.TARGET,
-                    "one_hot_encoder": EncodingMethod.ONE_HOT,
-                    "frequency_encoder": EncodingMethod.FREQUENCY,
-                    "label_encoder": EncodingMethod.LABEL,
-                }
-                encoder = CategoricalEncoder(method=method_map[step.transformer], **step.params)
-                encoder.fit(current_X, y, current_names)
-                self._fitted_transformers[step.name] = encoder
-
-            elif step.transformer in ("standard_scaler", "minmax_scaler", "robust_scaler", "quantile_scaler"):
-                method_map = {
-                    "standard_scaler": ScalingMethod.STANDARD,
-                    "minmax_scaler": ScalingMethod.MINMAX,
-                    "robust_scaler": ScalingMethod.ROBUST,
-                    "quantile_scaler": ScalingMethod.QUANTILE,
-                }
-                scaler = FeatureScaler(method=method_map[step.transformer], **step.params)
-                scaler.fit(current_X, current_names)
-                self._fitted_transformers[step.name] = scaler
+            transformer = self._new_transformer(step)
+            if isinstance(transformer, CategoricalEncoder):
+                transformer.fit(current_X, y, current_names)
+            elif transformer is not None:
+                transformer.fit(current_X, current_names)
+
+            if transformer is not None:
+                self._fitted_transformers[step.name] = transformer
+                # Later steps are fitted on what they will see in transform().
+                current_X = transformer.transform(current_X, current_names)
 
             elif step.transformer == "polynomial_features":
                 constructor = FeatureConstructor()
@@ -1000,6 +1523,71 @@ class FeaturePipeline:
         self._is_fitted = True
         return self
 
+    def partial_fit(
+        self, X: NDArray, y: Optional[NDArray] = None,
+        feature_names: Optional[List[str]] = None,
+    ) -> "FeaturePipeline":
+        """Fit the pipeline incrementally on one chunk of rows.
+
+        Each step updates its running statistics with the chunk as transformed
+        by the steps before it (as fitted so far), so memory is bounded by the
+        chunk size. Feed chunks from ``iter_chunks`` to fit on data larger
+        than RAM. ``variance_threshold`` selects from running variances (later
+        steps keep fitting on all columns, since the selection can change);
+        ``mutual_information_selector`` needs all rows at once and is rejected.
+        """
+        current_X = np.asarray(X)
+        current_names = list(feature_names) if feature_names else [f"f{i}" for i in range(current_X.shape[1])]
+
+        for step in self.steps:
+            if not step.enabled:
+                continue
+
+            transformer = self._fitted_transformers.get(step.name)
+            if isinstance(transformer, FrozenTransformer):
+                raise RuntimeError("A pipeline loaded from an artifact is transform-only; use fit() to refit it.")
+            if transformer is None:
+                transformer = self._new_transformer(step)
+                if transformer is not None:
+                    self._fitted_transformers[step.name] = transformer
+
+            if isinstance(transformer, CategoricalEncoder):
+                transformer.partial_fit(current_X, y, current_names)
+                current_X = transformer.transform(current_X, current_names)
+            elif isinstance(transformer, (Imputer, FeatureScaler)):
+                transformer.partial_fit(current_X, current_names)
+                current_X = transformer.transform(current_X, current_names)
+
+            elif step.transformer == "polynomial_features":
+                constructor = FeatureConstructor()
+                current_X, current_names = constructor.create_polynomial_features(
+                    current_X, feature_names=current_names, **step.params
+                )
+                self._fitted_transformers[step.name] = ("polynomial", current_names)
+
+            elif step.transformer == "variance_threshold":
+                stats = self._stream_stats.setdefault(step.name, RunningStats(current_X.shape[1]))
+                if len(stats.count) != current_X.shape[1]:
+                    raise ValueError("partial_fit chunks must have the same features in the same order.")
+                variances = stats.update(current_X).variance()
+                threshold = step.params.get("threshold", 0.01)
+                result = SelectionResult(
+                    selected_features=[n for n, v in zip(current_names, variances) if v >= threshold],
+                    removed_features=[n for n, v in zip(current_names, variances) if not v >= threshold],
+                    scores={n: float(v) for n, v in zip(current_names, variances)},
+                    method=SelectionMethod.VARIANCE,
+                    threshold=threshold,
+                )
+                # The selection may still change with later chunks, so keep
+                # every column; steps below match columns by name in transform().
+                self._fitted_transformers[step.name] = result
+
+            else:
+                raise ValueError(f"Step '{step.name}' ({step.transformer}) does not support partial_fit.")
+
+        self._is_fitted = True
+        return self
+
     def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
         if not self._is_fitted:
             raise RuntimeError("Pipeline must be fitted before transforming.")
@@ -1019,10 +1607,12 @@ class FeaturePipeline:
                 current_X = transformer.transform(current_X, current_names)
             elif isinstance(transformer, FeatureScaler):
                 current_X = transformer.transform(current_X, current_names)
+            elif isinstance(transformer, FrozenTransformer):
+                current_X = transformer.transform(current_X, current_names)
             elif isinstance(transformer, tuple) and transformer[0] == "polynomial":
                 constructor = FeatureConstructor()
                 current_X, current_names = constructor.create_polynomial_features(
-                    current_X, feature_names=current_names
+                    current_X, feature_names=current_names, **step.params
                 )
             elif isinstance(transformer, SelectionResult):
                 selected_idx = [current_names.index(f) for f in transformer.selected_features if f in current_names]
@@ -1031,6 +1621,21 @@ class FeaturePipeline:
 
         return current_X
 
+    def transform_iter(
+        self,
+        source: Union[str, "os.PathLike[str]", NDArray, Iterable[NDArray]],
+        feature_names: Optional[List[str]] = None,
+        chunk_size: int = 65536,
+    ) -> Iterator[NDArray]:
+        """Transform ``source`` chunk by chunk (see ``iter_chunks``), yielding each result.
+
+        A ``.npy`` path is memory-mapped, so only one chunk is resident at a time.
+        """
+        if not self._is_fitted:
+            raise RuntimeError("Pipeline must be fitted before transforming.")
+        for chunk in iter_chunks(source, chunk_size):
+            yield self.transform(chunk, feature_names)
+
     def fit_transform(
         self, X: NDArray, y: Optional[NDArray] = None,
         feature_names: Optional[List[str]] = None,
@@ -1068,6 +1673,315 @@ class FeaturePipeline:
                 params.update(transformer.scaling_params)
         return params
 
+    def save(self, path: Union[str, "os.PathLike[str]"]) -> str:
+        """Write the fitted pipeline as a single artifact file; returns its content hash.
+
+        See ``ARTIFACT_MAGIC`` for the layout. ``FeaturePipeline.load`` maps the
+        parameter arrays straight from the file.
+        """
+        if not self._is_fitted:
+            raise RuntimeError("Pipeline must be fitted before saving.")
+        return _write_artifact(self, path)
+
+    @classmethod
+    def load(cls, path: Union[str, "os.PathLike[str]"], verify: bool = True) -> "FeaturePipeline":
+        """Load a transform-only pipeline saved with ``save``.
+
+        Parameter arrays are read-only views of a memory map of the file, so
+        loading is O(header) and processes serving the same artifact share
+        its pages. ``verify`` re-hashes the file against its content hash.
+        """
+        return _read_artifact(path, verify)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline Artifacts
+# ---------------------------------------------------------------------------
+
+# File layout: ARTIFACT_MAGIC, the header length as little-endian uint64, the
+# UTF-8 JSON header, then the raw parameter arrays, each starting on an
+# ARTIFACT_ALIGNMENT boundary. The header records the pipeline steps, each
+# fitted step's feature names and array keys, every array's offset (from the
+# start of the data section), dtype and shape, and a SHA-256 over the header
+# (without the hash) and the data section.
+ARTIFACT_MAGIC = b"FEPIPE\x00\x00"
+ARTIFACT_VERSION = 1
+ARTIFACT_ALIGNMENT = 64
+
+
+class FrozenTransformer(ABC):
+    """A fitted step restored from an artifact; transform-only, parameters in arrays."""
+
+    kind = ""
+
+    def __init__(self, names: List[str], arrays: Dict[str, NDArray]):
+        self.names = list(names)
+        self.arrays = arrays
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    def _matched(self, feature_names: List[str]) -> List[Tuple[int, int]]:
+        """Pairs of (input column, parameter row) for the features this step knows."""
+        return [(i, self._index[name]) for i, name in enumerate(feature_names) if name in self._index]
+
+    @abstractmethod
+    def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
+        """Apply the stored parameters to the columns of *X* this step was fitted on."""
+
+
+class FrozenImputer(FrozenTransformer):
+    """Fill NaNs with per-feature values (``arrays["fill"]``)."""
+
+    kind = "imputer"
+
+    def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
+        names = feature_names or [f"feature_{i}" for i in range(X.shape[1])]
+        result = X.copy()
+        fill = self.arrays["fill"]
+        for col, row in self._matched(names):
+            missing = np.isnan(result[:, col])
+            result[missing, col] = fill[row]
+        return result
+
+
+class FrozenScaler(FrozenTransformer):
+    """``(x - offset) / scale`` per feature, or quantile interpolation."""
+
+    kind = "scaler"
+
+    def __init__(self, names: List[str], arrays: Dict[str, NDArray], method: ScalingMethod):
+        super().__init__(names, arrays)
+        self.method = method
+
+    def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
+        names = feature_names or [f"feature_{i}" for i in range(X.shape[1])]
+        result = X.copy().astype(float)
+        matched = self._matched(names)
+        if not matched:
+            return result
+        cols, rows = map(list, zip(*matched))
+        if self.method == ScalingMethod.QUANTILE:
+            levels, values, lengths = self.arrays["levels"], self.arrays["values"], self.arrays["lengths"]
+            for col, row in matched:
+                n = int(lengths[row])
+                result[:, col] = np.interp(result[:, col], values[row, :n], levels[row, :n] * 100) / 100
+            return result
+        offset, scale = self.arrays["offset"][rows], self.arrays["scale"][rows]
+        block = result[:, cols]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result[:, cols] = np.where(scale > 0, (block - offset) / scale, block * 0)
+        return result
+
+
+class FrozenEncoder(FrozenTransformer):
+    """Map categories to values by binary search over each feature's sorted categories."""
+
+    kind = "encoder"
+
+    def transform(self, X: NDArray, feature_names: Optional[List[str]] = None) -> NDArray:
+        names = feature_names or [f"feature_{i}" for i in range(X.shape[1])]
+        result = np.empty(X.shape, dtype=float)
+        encoded = dict(self._matched(names))
+        for col in range(X.shape[1]):
+            if col not in encoded:
+                result[:, col] = X[:, col].astype(float)
+                continue
+            row = encoded[col]
+            categories = self.arrays[f"categories_{row}"]
+            values = self.arrays[f"values_{row}"]
+            keys = X[:, col].astype(str)
+            if not len(categories):
+                result[:, col] = self.arrays["unknown"][row]
+                continue
+            pos = np.minimum(np.searchsorted(categories, keys), len(categories) - 1)
+            result[:, col] = np.where(categories[pos] == keys, values[pos], self.arrays["unknown"][row])
+        return result
+
+
+def _export_step(transformer: Any) -> Tuple[Dict[str, Any], Dict[str, NDArray]]:
+    """Describe one fitted step as (JSON-able header entry, named arrays)."""
+    if isinstance(transformer, Imputer):
+        names = list(transformer.fill_values)
+        fill = np.array([float(transformer.fill_values[n]) for n in names])
+        return {"kind": "imputer", "names": names}, {"fill": fill}
+    if isinstance(transformer, FeatureScaler):
+        names = list(transformer.scaling_params)
+        params = [transformer.scaling_params[n] for n in names]
+        entry = {"kind": "scaler", "names": names, "method": transformer.method.value}
+        if transformer.method == ScalingMethod.QUANTILE:
+            pairs = [p.quantiles for p in params]
+            width = max((len(q[0]) for q in pairs), default=0)
+            levels, values = np.zeros((len(names), width)), np.zeros((len(names), width))
+            for i, (q_levels, q_values) in enumerate(pairs):
+                levels[i, :len(q_levels)], values[i, :len(q_values)] = q_levels, q_values
+            lengths = np.array([len(q[0]) for q in pairs], dtype=np.int64)
+            return entry, {"levels": levels, "values": values, "lengths": lengths}
+        if transformer.method == ScalingMethod.STANDARD:
+            offset, scale = [p.mean for p in params], [p.std for p in params]
+        elif transformer.method == ScalingMethod.MINMAX:
+            offset, scale = [p.min_val for p in params], [p.max_val - p.min_val for p in params]
+        elif transformer.method == ScalingMethod.ROBUST:
+            offset, scale = [p.median for p in params], [p.iqr for p in params]
+        else:
+            offset = [0.0] * len(params)
+            scale = [max(abs(p.min_val), abs(p.max_val)) for p in params]
+        return entry, {"offset": np.array(offset, dtype=float), "scale": np.array(scale, dtype=float)}
+    if isinstance(transformer, CategoricalEncoder):
+        names = list(transformer.encoding_maps)
+        arrays: Dict[str, NDArray] = {}
+        unknown = []
+        for i, name in enumerate(names):
+            enc_map = transformer.encoding_maps[name]
+            categories = sorted(str(c) for c in enc_map.mapping)
+            arrays[f"categories_{i}"] = np.array(categories, dtype=str) if categories else np.array([], dtype="<U1")
+            arrays[f"values_{i}"] = np.array([float(enc_map.mapping[c]) for c in categories])
+            unknown.append(float(enc_map.unknown_value))
+        arrays["unknown"] = np.array(unknown)
+        return {"kind": "encoder", "names": names, "method": transformer.method.value}, arrays
+    if isinstance(transformer, tuple) and transformer[0] == "polynomial":
+        return {"kind": "polynomial", "names": list(transformer[1])}, {}
+    if isinstance(transformer, SelectionResult):
+        return {
+            "kind": "selection",
+            "method": transformer.method.value,
+            "selected_features": list(transformer.selected_features),
+            "removed_features": list(transformer.removed_features),
+            "threshold": transformer.threshold,
+            "k": transformer.k,
+        }, {}
+    if isinstance(transformer, FrozenTransformer):
+        entry = {"kind": transformer.kind, "names": transformer.names}
+        if hasattr(transformer, "method"):
+            entry["method"] = transformer.method.value
+        return entry, dict(transformer.arrays)
+    raise TypeError(f"Cannot save fitted step of type {type(transformer).__name__}.")
+
+
+def _import_step(entry: Dict[str, Any], arrays: Dict[str, NDArray]) -> Any:
+    """Inverse of ``_export_step`` over arrays mapped from the artifact."""
+    kind = entry["kind"]
+    if kind == "imputer":
+        return FrozenImputer(entry["names"], arrays)
+    if kind == "scaler":
+        return FrozenScaler(entry["names"], arrays, ScalingMethod(entry["method"]))
+    if kind == "encoder":
+        return FrozenEncoder(entry["names"], arrays)
+    if kind == "polynomial":
+        return ("polynomial", entry["names"])
+    if kind == "selection":
+        return SelectionResult(
+            selected_features=entry["selected_features"],
+            removed_features=entry["removed_features"],
+            scores={},
+            method=SelectionMethod(entry["method"]),
+            threshold=entry["threshold"],
+            k=entry["k"],
+        )
+    raise ValueError(f"Unknown step kind in artifact: {kind!r}")
+
+
+def _artifact_hash(header: Dict[str, Any], data: Any) -> str:
+    digest = hashlib.sha256(json.dumps(header, sort_keys=True).encode())
+    digest.update(data)
+    return "sha256:" + digest.hexdigest()
+
+
+def _write_artifact(pipeline: "FeaturePipeline", path: Union[str, "os.PathLike[str]"]) -> str:
+    fitted: Dict[str, Any] = {}
+    layout: Dict[str, Any] = {}
+    chunks: List[bytes] = []
+    offset = 0
+    for step_name, transformer in pipeline._fitted_transformers.items():
+        entry, arrays = _export_step(transformer)
+        entry["arrays"] = {}
+        for key, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            array_id = f"{step_name}/{key}"
+            padding = -offset % ARTIFACT_ALIGNMENT
+            chunks.append(b"\x00" * padding)
+            offset += padding
+            layout[array_id] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+            chunks.append(array.tobytes())
+            offset += array.nbytes
+            entry["arrays"][key] = array_id
+        fitted[step_name] = entry
+
+    header: Dict[str, Any] = {
+        "format": "feature-pipeline",
+        "format_version": ARTIFACT_VERSION,
+        "name": pipeline.name,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "steps": [
+            {
+                "name": step.name,
+                "transformer": step.transformer,
+                "params": step.params,
+                "columns": step.columns,
+                "exclude_columns": step.exclude_columns,
+                "step_type": step.step_type.value,
+                "enabled": step.enabled,
+            }
+            for step in pipeline.steps
+        ],
+        "fitted": fitted,
+        "arrays": layout,
+    }
+    data = b"".join(chunks)
+    header["content_hash"] = _artifact_hash(header, data)
+    header_bytes = json.dumps(header).encode()
+    prefix = ARTIFACT_MAGIC + len(header_bytes).to_bytes(8, "little") + header_bytes
+    prefix += b"\x00" * (-len(prefix) % ARTIFACT_ALIGNMENT)
+
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as handle:
+        handle.write(prefix)
+        handle.write(data)
+    os.replace(tmp_path, path)
+    return header["content_hash"]
+
+
+def _read_artifact(path: Union[str, "os.PathLike[str]"], verify: bool = True) -> "FeaturePipeline":
+    with open(path, "rb") as handle:
+        magic = handle.read(len(ARTIFACT_MAGIC))
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a feature pipeline artifact.")
+        header_len = int.from_bytes(handle.read(8), "little")
+        header = json.loads(handle.read(header_len))
+    if header.get("format_version") != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported artifact version: {header.get('format_version')}")
+    data_start = len(ARTIFACT_MAGIC) + 8 + header_len
+    data_start += -data_start % ARTIFACT_ALIGNMENT
+
+    if os.path.getsize(path) > data_start:
+        data = np.memmap(path, dtype=np.uint8, mode="r", offset=data_start)
+    else:
+        data = np.zeros(0, dtype=np.uint8)
+    if verify:
+        expected = header.pop("content_hash")
+        if _artifact_hash(header, memoryview(data)) != expected:
+            raise ValueError(f"Content hash mismatch for {os.fspath(path)}; the artifact is corrupt.")
+        header["content_hash"] = expected
+
+    def mapped(array_id: str) -> NDArray:
+        spec = header["arrays"][array_id]
+        dtype = np.dtype(spec["dtype"])
+        count = int(np.prod(spec["shape"], dtype=np.int64))
+        raw = data[spec["offset"]:spec["offset"] + count * dtype.itemsize]
+        return raw.view(dtype).reshape(spec["shape"])
+
+    pipeline = FeaturePipeline(name=header["name"])
+    for spec in header["steps"]:
+        pipeline.add_step(PipelineStep(
+            name=spec["name"], transformer=spec["transformer"], params=spec["params"],
+            columns=spec["columns"], exclude_columns=spec["exclude_columns"],
+            step_type=PipelineStepType(spec["step_type"]), enabled=spec["enabled"],
+        ))
+    for step_name, entry in header["fitted"].items():
+        arrays = {key: mapped(array_id) for key, array_id in entry.pop("arrays").items()}
+        pipeline._fitted_transformers[step_name] = _import_step(entry, arrays)
+    pipeline.content_hash = header["content_hash"]
+    pipeline._is_fitted = True
+    return pipeline
+
 
 # ---------------------------------------------------------------------------
 # Main Demo
@@ -1176,6 +2090,30 @@ def main() -> None:
     print(f"  Features after:  {X_transformed.shape[1]}")
     print(f"  Pipeline summary: {json.dumps(pipeline.summary(), indent=2)}")
 
+    # --- 7. Streaming Pipeline ---
+    print("\n--- Streaming Pipeline ---")
+    streaming = FeaturePipeline(name="churn_pipeline_streaming")
+    streaming.add_step(PipelineStep(name="impute", transformer="median_imputer"))
+    streaming.add_step(PipelineStep(name="scale", transformer="robust_scaler"))
+    for chunk, y_chunk in zip(np.array_split(X_with_missing, 5), np.array_split(y, 5)):
+        streaming.partial_fit(chunk, y_chunk, feature_names)
+    chunks = list(streaming.transform_iter(X_with_missing, feature_names, chunk_size=128))
+    print(f"  Fitted on 5 chunks, transformed {len(chunks)} chunks of <= 128 rows")
+    print(f"  Streaming 'age' median/iqr: {streaming.get_scaling_params()['age'].median:.2f}/"
+          f"{streaming.get_scaling_params()['age'].iqr:.2f}")
+
+    # --- 8. Pipeline Artifact ---
+    print("\n--- Pipeline Artifact ---")
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        artifact = os.path.join(tmp_dir, "churn_pipeline.fpa")
+        content_hash = pipeline.save(artifact)
+        served = FeaturePipeline.load(artifact)
+        same = np.allclose(served.transform(X_with_missing, feature_names), X_transformed)
+        print(f"  Saved {os.path.getsize(artifact)} bytes, {content_hash[:19]}...")
+        print(f"  Loaded transform-only pipeline matches: {same}")
+
     print("\n" + "=" * 70)
     print("Demo complete.")
     print("=" * 70)
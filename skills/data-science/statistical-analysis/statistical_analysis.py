@@ -9,15 +9,20 @@ empirical research and data-driven decision making.
 from __future__ import annotations
 
 import logging
+import math
+import multiprocessing
 import warnings
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
@@ -321,6 +326,223 @@ class EffectSizeCalculator:
         return float((a * d) / (b * c)) if (b * c) > 0 else float("inf")
 
 
+# ---------------------------------------------------------------------------
+# Resampling Engine
+# ---------------------------------------------------------------------------
+
+class VectorizedStatistic:
+    """A statistic that can also be evaluated over a whole block of resamples.
+
+    ``func`` takes one sample (or two, for two-sample statistics) and returns
+    a float; ``batched`` takes the same arguments with a leading resample axis
+    and returns one value per row. ``leave_one_out``, when given, returns all
+    n jackknife values of a one-sample statistic in one call.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., float],
+        batched: Callable[..., NDArray],
+        leave_one_out: Optional[Callable[[NDArray], NDArray]] = None,
+        name: str = "",
+    ):
+        self.func = func
+        self.batched = batched
+        self.leave_one_out = leave_one_out
+        self.name = name or getattr(func, "__name__", "statistic")
+
+    def __call__(self, *samples: NDArray) -> float:
+        return self.func(*samples)
+
+    def __repr__(self) -> str:
+        return f"VectorizedStatistic({self.name})"
+
+    @classmethod
+    def mean(cls) -> "VectorizedStatistic":
+        return cls(np.mean, lambda x: x.mean(axis=-1), _loo_mean, "mean")
+
+    @classmethod
+    def median(cls) -> "VectorizedStatistic":
+        return cls(np.median, lambda x: np.median(x, axis=-1), lambda x: _loo_quantile(x, 0.5), "median")
+
+    @classmethod
+    def quantile(cls, q: float) -> "VectorizedStatistic":
+        """Linear-interpolation quantile, as ``np.quantile``."""
+        if not 0 <= q <= 1:
+            raise ValueError("q must be in [0, 1].")
+        return cls(
+            lambda x: np.quantile(x, q),
+            lambda x: np.quantile(x, q, axis=-1),
+            lambda x: _loo_quantile(x, q),
+            f"quantile({q:g})",
+        )
+
+    @classmethod
+    def variance(cls, ddof: int = 0) -> "VectorizedStatistic":
+        return cls(
+            lambda x: np.var(x, ddof=ddof),
+            lambda x: np.var(x, axis=-1, ddof=ddof),
+            lambda x: _loo_variance(x, ddof),
+            f"variance(ddof={ddof})",
+        )
+
+    @classmethod
+    def difference_of_means(cls) -> "VectorizedStatistic":
+        """``mean(a) - mean(b)`` for two samples."""
+        return cls(
+            lambda a, b: np.mean(a) - np.mean(b),
+            lambda a, b: a.mean(axis=-1) - b.mean(axis=-1),
+            name="difference_of_means",
+        )
+
+
+def _loo_mean(x: NDArray) -> NDArray:
+    return (x.sum() - x) / (len(x) - 1)
+
+
+def _loo_variance(x: NDArray, ddof: int) -> NDArray:
+    centred = x - x.mean()  # variance is shift invariant; centring keeps it stable
+    m = len(x) - 1
+    s1 = centred.sum() - centred
+    s2 = (centred ** 2).sum() - centred ** 2
+    return (s2 - s1 * s1 / m) / (m - ddof)
+
+
+def _loo_quantile(x: NDArray, q: float) -> NDArray:
+    """``np.quantile(np.delete(x, i), q)`` for every i, in O(n log n)."""
+    order = np.argsort(x, kind="stable")
+    ranked = x[order]
+    m = len(x) - 1
+    position = (m - 1) * q
+    low = int(np.floor(position))
+    frac = position - low
+    high = min(low + 1, m - 1)
+    # With rank r removed, position p of the remainder is ranked[p + (p >= r)].
+    removed = np.arange(len(x))
+    low_value = ranked[low + (low >= removed)]
+    high_value = ranked[high + (high >= removed)]
+    values = np.empty(len(x))
+    values[order] = low_value + frac * (high_value - low_value)
+    return values
+
+
+# Plain NumPy reductions that have an equivalent vectorized statistic.
+_NUMPY_STATISTICS: Dict[Callable, Callable[[], VectorizedStatistic]] = {
+    np.mean: VectorizedStatistic.mean,
+    np.median: VectorizedStatistic.median,
+    np.var: VectorizedStatistic.variance,
+}
+
+# Job of a pool worker process, set once by its initializer. Each pool forks
+# its own workers, so concurrent engines never share this.
+_WORKER_JOB: Dict[str, Any] = {}
+
+
+def _init_resample_worker(job: Dict[str, Any]) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+
+
+def _resample_worker(task: Tuple[np.random.SeedSequence, int]) -> NDArray:
+    return _resample_block(_WORKER_JOB, task)
+
+
+def _resample_block(job: Dict[str, Any], task: Tuple[np.random.SeedSequence, int]) -> NDArray:
+    seed, size = task
+    rng = np.random.default_rng(seed)
+    statistic = job["statistic"]
+    if job["kind"] == "bootstrap":
+        data = job["data"]
+        block = data[rng.integers(0, len(data), size=(size, len(data)))]
+        if isinstance(statistic, VectorizedStatistic):
+            return np.asarray(statistic.batched(block), dtype=float)
+        return np.array([statistic(row) for row in block], dtype=float)
+    combined, n1 = job["data"], job["n1"]
+    block = rng.permuted(np.broadcast_to(combined, (size, len(combined))), axis=1)
+    if isinstance(statistic, VectorizedStatistic):
+        return np.asarray(statistic.batched(block[:, :n1], block[:, n1:]), dtype=float)
+    return np.array([statistic(row[:n1], row[n1:]) for row in block], dtype=float)
+
+
+class ResamplingEngine:
+    """Bootstrap and permutation resampling in memory-bounded blocks.
+
+    Each block draws its index (or permutation) matrix at once, at most
+    ``block_bytes`` of it, and evaluates a ``VectorizedStatistic`` over the
+    whole block; other callables are applied row by row. Every block has its
+    own child ``SeedSequence``, so results depend only on the generator and
+    not on ``n_jobs``; with ``n_jobs > 1`` blocks run in forked processes.
+    """
+
+    def __init__(
+        self,
+        rng: Optional[np.random.Generator] = None,
+        block_bytes: int = 64 * 2 ** 20,
+        n_jobs: int = 1,
+    ):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.block_bytes = block_bytes
+        self.n_jobs = n_jobs
+
+    @staticmethod
+    def vectorize(statistic: Optional[Callable]) -> Callable:
+        """Return the vectorized form of ``statistic`` when one is known."""
+        if statistic is None:
+            return VectorizedStatistic.mean()
+        if isinstance(statistic, VectorizedStatistic):
+            return statistic
+        factory = _NUMPY_STATISTICS.get(statistic)
+        return factory() if factory is not None else statistic
+
+    def bootstrap(self, data: NDArray, statistic: Callable, n_resamples: int) -> NDArray:
+        """Statistic of ``n_resamples`` with-replacement resamples of ``data``."""
+        data = np.asarray(data)
+        return self._run("bootstrap", data, self.vectorize(statistic), n_resamples, len(data))
+
+    def permutation(self, group1: NDArray, group2: NDArray, statistic: Callable, n_permutations: int) -> NDArray:
+        """Statistic of the two groups under ``n_permutations`` random relabellings."""
+        combined = np.concatenate([group1, group2])
+        return self._run(
+            "permutation", combined, self.vectorize(statistic), n_permutations, len(combined), n1=len(group1)
+        )
+
+    def jackknife(self, data: NDArray, statistic: Callable) -> NDArray:
+        """Leave-one-out values of ``statistic``, by formula when one exists."""
+        data = np.asarray(data)
+        statistic = self.vectorize(statistic)
+        if isinstance(statistic, VectorizedStatistic) and statistic.leave_one_out is not None and len(data) > 1:
+            return np.asarray(statistic.leave_one_out(data), dtype=float)
+        keep = np.ones(len(data), dtype=bool)
+        values = np.zeros(len(data))
+        for j in range(len(data)):
+            keep[j] = False
+            values[j] = statistic(data[keep])
+            keep[j] = True
+        return values
+
+    def _run(self, kind: str, data: NDArray, statistic: Callable, n_resamples: int, width: int, n1: int = 0) -> NDArray:
+        per_block = max(1, min(n_resamples, self.block_bytes // max(8 * width, 1)))
+        sizes = [per_block] * (n_resamples // per_block)
+        if n_resamples % per_block:
+            sizes.append(n_resamples % per_block)
+        root = np.random.SeedSequence(int(self.rng.integers(2 ** 63)))
+        tasks = list(zip(root.spawn(len(sizes)), sizes))
+
+        job = {"kind": kind, "data": data, "statistic": statistic, "n1": n1}
+        n_jobs = min(self.n_jobs, len(tasks))
+        if n_jobs > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the job through the initializer, so only
+            # seeds are pickled and the statistic may be any callable.
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(
+                n_jobs, mp_context=context, initializer=_init_resample_worker, initargs=(job,)
+            ) as pool:
+                blocks = list(pool.map(_resample_worker, tasks))
+        else:
+            blocks = [_resample_block(job, task) for task in tasks]
+        return np.concatenate(blocks) if blocks else np.zeros(0)
+
+
 # ---------------------------------------------------------------------------
 # Hypothesis Testing
 # ---------------------------------------------------------------------------
@@ -582,18 +804,20 @@ class HypothesisTesting:
         self,
         group1: NDArray,
         group2: NDArray,
-        statistic: Callable[[NDArray, NDArray], float] = lambda a, b: np.mean(a) - np.mean(b),
+        statistic: Callable[[NDArray, NDArray], float] = VectorizedStatistic.difference_of_means(),
         n_permutations: int = 10000,
+        n_jobs: int = 1,
     ) -> PermutationTestResult:
-        """Non-parametric permutation test."""
-        observed = statistic(group1, group2)
-        combined = np.concatenate([group1, group2])
-        n1 = len(group1)
+        """Non-parametric permutation test.
 
-        perm_stats = np.zeros(n_permutations)
-        for i in range(n_permutations):
-            perm = self.rng.permutation(combined)
-            perm_stats[i] = statistic(perm[:n1], perm[n1:])
+        Permutations are drawn in blocks by ``ResamplingEngine``; pass a
+        ``VectorizedStatistic`` (the default is the difference of means) to
+        evaluate each block at once, and ``n_jobs`` to spread blocks over
+        processes.
+        """
+        observed = statistic(group1, group2)
+        engine = ResamplingEngine(self.rng, n_jobs=n_jobs)
+        perm_stats = engine.permutation(group1, group2, statistic, n_permutations)
 
         p_value = float(np.mean(np.abs(perm_stats) >= np.abs(observed)))
 
@@ -686,7 +910,7 @@ class HypothesisTesting:
         return z + (z ** 3 + z) / (4 * df)
 
     def _normal_cdf(self, z: float) -> float:
-        return 0.5 * (1 + np.math.erf(z / np.sqrt(2)))
+        return 0.5 * (1 + math.erf(z / math.sqrt(2)))
 
     def _normal_ppf(self, p: float) -> float:
         """Rational approximation to inverse normal CDF."""
@@ -868,28 +1092,42 @@ class HypothesisTesting:
 # ---------------------------------------------------------------------------
 
 class Bootstrap:
-    """Bootstrap confidence interval estimation."""
+    """Bootstrap confidence interval estimation.
+
+    Resamples are drawn and evaluated in blocks of at most ``block_bytes``
+    by ``ResamplingEngine``; ``n_jobs > 1`` spreads the blocks over
+    processes without changing the result.
+    """
 
-    def __init__(self, n_resamples: int = 10000, random_state: Optional[int] = None):
+    def __init__(
+        self,
+        n_resamples: int = 10000,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
+        block_bytes: int = 64 * 2 ** 20,
+    ):
         self.n_resamples = n_resamples
         self.rng = np.random.default_rng(random_state)
+        self.engine = ResamplingEngine(self.rng, block_bytes=block_bytes, n_jobs=n_jobs)
 
     def confidence_interval(
         self,
         data: NDArray,
-        statistic: Callable[[NDArray], float] = np.mean,
+        statistic: Optional[Callable[[NDArray], float]] = None,
         level: ConfidenceLevel = ConfidenceLevel.PERCENTILE,
         alpha: float = 0.05,
     ) -> BootstrapResult:
-        """Compute bootstrap confidence interval."""
+        """Compute bootstrap confidence interval (``statistic`` defaults to the mean).
+
+        ``np.mean``, ``np.median``, ``np.var`` and any ``VectorizedStatistic``
+        are evaluated a block of resamples at a time.
+        """
+        data = np.asarray(data)
+        statistic = self.engine.vectorize(statistic)
         point_estimate = statistic(data)
-        n = len(data)
 
         # Bootstrap resamples
-        boot_stats = np.zeros(self.n_resamples)
-        for i in range(self.n_resamples):
-            sample = data[self.rng.choice(n, n, replace=True)]
-            boot_stats[i] = statistic(sample)
+        boot_stats = self.engine.bootstrap(data, statistic, self.n_resamples)
 
         std_error = float(np.std(boot_stats, ddof=1))
         bias = float(np.mean(boot_stats) - point_estimate)
@@ -902,10 +1140,7 @@ class Bootstrap:
             # Bias-corrected and accelerated
             z0 = self._normal_ppf_inner(np.mean(boot_stats < point_estimate))
             # Acceleration via jackknife
-            jack_stats = np.zeros(n)
-            for j in range(n):
-                jack_sample = np.delete(data, j)
-                jack_stats[j] = statistic(jack_sample)
+            jack_stats = self.engine.jackknife(data, statistic)
             jack_mean = np.mean(jack_stats)
             num = np.sum((jack_mean - jack_stats) ** 3)
             den = 6 * (np.sum((jack_mean - jack_stats) ** 2)) ** 1.5
@@ -947,7 +1182,7 @@ class Bootstrap:
         return t - (c0 + c1 * t + c2 * t ** 2) / (1 + d1 * t + d2 * t ** 2 + d3 * t ** 3)
 
     def _normal_cdf_inner(self, z: float) -> float:
-        return 0.5 * (1 + np.math.erf(z / np.sqrt(2)))
+        return 0.5 * (1 + math.erf(z / math.sqrt(2)))
 
 
 # ---------------------------------------------------------------------------
@@ -1047,7 +1282,7 @@ class SurvivalAnalysis:
         variance = total_events * (n_a / total_n) * (n_b / total_n) * (total_n - total_events) / (total_n - 1) if total_n > 1 else 1
 
         chi2 = (observed_minus_expected ** 2 / variance) if variance > 0 else 0
-        p_value = 1 - 0.5 * (1 + np.math.erf(np.sqrt(chi2 / 2)))
+        p_value = 1 - 0.5 * (1 + math.erf(math.sqrt(chi2 / 2)))
 
         return TestResult(
             test_name="Log-rank test",
@@ -1150,7 +1385,7 @@ class SurvivalAnalysis:
         se = np.sqrt(np.diag(var_beta))
         hr = np.exp(beta)
         z = beta / se
-        p_values = 2 * (1 - 0.5 * (1 + np.math.erf(np.abs(z) / np.sqrt(2))))
+        p_values = 2 * (1 - 0.5 * (1 + np.array([math.erf(v) for v in (np.abs(z) / math.sqrt(2)).tolist()])))
         ci_lower = np.exp(beta - 1.96 * se)
         ci_upper = np.exp(beta + 1.96 * se)
 
@@ -1243,6 +1478,9 @@ def main() -> None:
     print(f"  Bootstrap SE:    {boot_result.std_error:.4f}")
     print(f"  Bias:            {boot_result.bias:.4f}")
 
+    perm_result = ht.permutation_test(treatment, control, n_permutations=5000)
+    print(f"  Permutation p (mean diff): {perm_result.p_value:.4f}")
+
     # --- 5. Survival Analysis ---
     print("\n--- Survival Analysis ---")
     sa = SurvivalAnalysis(random_state=42)
@@ -9,14 +9,17 @@ modeling for rigorous temporal data science workflows.
 from __future__ import annotations
 
 import logging
+import math
 import warnings
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum, auto
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
-from numpy.typing import NDArray
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
 
 logger = logging.getLogger(__name__)
 
@@ -189,6 +192,7 @@ class ChangePoint:
     confidence: float = 1.0
     segment_before: Optional[NDArray] = None
     segment_after: Optional[NDArray] = None
+    method: Optional[str] = None
 
 
 @dataclass
@@ -272,6 +276,8 @@ class KalmanResult:
     log_likelihood: float = 0.0
     innovations: Optional[NDArray] = None
     innovation_variances: Optional[NDArray] = None
+    series_log_likelihood: Optional[NDArray] = None
+    steady_state_index: Optional[int] = None
 
 
 # ---------------------------------------------------------------------------
@@ -475,9 +481,132 @@ class TimeSeriesDecomposer:
 # ARIMA Forecaster
 # ---------------------------------------------------------------------------
 
+# Memo key of one scored candidate: (order, seasonal_order, window).
+_CandidateKey = Tuple[Tuple[int, int, int], Tuple[int, int, int, int], Optional[int]]
+
+
+class _DifferencedSeriesCache:
+    """Differenced copies of one series, shared by every candidate order.
+
+    Each ``(d, D, m)`` series is built from the next-lower one and kept, and
+    its autocovariances and candidate information criteria are memoized, so
+    an order search does each piece of work once.
+    """
+
+    def __init__(self, data: NDArray):
+        self.data = np.asarray(data, dtype=float)
+        self._series: Dict[Tuple[int, int, int], NDArray] = {(0, 0, 0): self.data}
+        self._autocovariance: Dict[Tuple[int, int, int], NDArray] = {}
+        self._criteria: Dict[_CandidateKey, Tuple[float, float, float]] = {}
+
+    def series(self, d: int = 0, D: int = 0, m: int = 0) -> NDArray:
+        """``data`` differenced ``d`` times, then seasonally ``D`` times at lag ``m``."""
+        if D == 0 or m <= 0:
+            D, m = 0, 0
+        key = (d, D, m)
+        if key not in self._series:
+            if D > 0:
+                base = self.series(d, D - 1, m)
+                # Matches ARIMAModel.fit: too-short series are left as they are.
+                self._series[key] = base[m:] - base[:-m] if len(base) > m else base
+            else:
+                self._series[key] = np.diff(self.series(d - 1))
+        return self._series[key]
+
+    def autocovariance(self, max_lag: int, d: int = 0, D: int = 0, m: int = 0) -> NDArray:
+        """Biased autocovariances at lags ``0..max_lag`` of the centred series."""
+        key = (d, D, m) if D and m > 0 else (d, 0, 0)
+        cached = self._autocovariance.get(key)
+        if cached is None or len(cached) <= max_lag:
+            self._autocovariance[key] = _autocovariance(self.series(*key), max_lag)
+        return self._autocovariance[key][:max_lag + 1]
+
+    def criteria(
+        self, order: Tuple[int, int, int], seasonal_order: Tuple[int, int, int, int],
+        window: Optional[int] = None,
+    ) -> Tuple[float, float, float]:
+        """(aic, bic, aicc) that ``ARIMAModel(order, seasonal_order).fit(data, window=window)`` reports.
+
+        Each candidate is fitted once, sharing this cache's differenced
+        series and autocovariances, and its criteria are memoized.
+        """
+        return self.criteria_many([(order, seasonal_order)], window)[0]
+
+    def criteria_many(
+        self, candidates: Sequence[Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]],
+        window: Optional[int] = None, n_jobs: int = 1,
+    ) -> List[Tuple[float, float, float]]:
+        """``criteria`` of every ``(order, seasonal_order)`` candidate, in order.
+
+        Candidates not scored yet are fitted in ``n_jobs`` forked processes
+        (serially with ``n_jobs=1`` or without ``fork``); a fit is
+        deterministic, so the scores do not depend on ``n_jobs``.
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        keys = [(tuple(order), tuple(seasonal_order), window) for order, seasonal_order in candidates]
+        missing = [key for key in dict.fromkeys(keys) if key not in self._criteria]
+        if n_jobs > 1 and len(missing) > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit this cache through the initializer; only keys are pickled.
+            with ProcessPoolExecutor(min(n_jobs, len(missing)), mp_context=multiprocessing.get_context("fork"),
+                                     initializer=_init_candidate_worker, initargs=(self,)) as pool:
+                scores = list(pool.map(_candidate_worker, missing))
+        else:
+            scores = [_fit_criteria(self, key) for key in missing]
+        self._criteria.update(zip(missing, scores))
+        return [self._criteria[key] for key in keys]
+
+
+# Cache whose candidates a pool worker process fits, set once by its
+# initializer. Each pool forks its own workers, so concurrent searches never
+# share this.
+_WORKER_CACHE: Optional[_DifferencedSeriesCache] = None
+
+
+def _init_candidate_worker(cache: _DifferencedSeriesCache) -> None:
+    global _WORKER_CACHE
+    _WORKER_CACHE = cache
+
+
+def _candidate_worker(key: _CandidateKey) -> Tuple[float, float, float]:
+    return _fit_criteria(_WORKER_CACHE, key)
+
+
+def _fit_criteria(cache: _DifferencedSeriesCache, key: _CandidateKey) -> Tuple[float, float, float]:
+    order, seasonal_order, window = key
+    model = ARIMAModel(order=order, seasonal_order=seasonal_order).fit(cache.data, cache=cache, window=window)
+    return model.aic, model.bic, model.aicc
+
+
+def _autocovariance(series: NDArray, max_lag: int) -> NDArray:
+    """Biased autocovariances ``sum(c[:n-k] * c[k:]) / n`` for ``k = 0..max_lag``."""
+    n = len(series)
+    centred = series - series.mean() if n else series
+    acov = np.zeros(max_lag + 1)
+    lags = min(max_lag, n - 1) + 1
+    if lags <= 0:
+        return acov
+    if lags > 32:
+        size = 1 << (2 * n - 1).bit_length()
+        spectrum = np.fft.rfft(centred, size)
+        acov[:lags] = np.fft.irfft(spectrum * spectrum.conj(), size)[:lags] / n
+    else:
+        acov[:lags] = [centred[:n - k] @ centred[k:] / n for k in range(lags)]
+    return acov
+
+
+def _auto_arima_worker(task: Tuple[NDArray, Dict[str, Any]]) -> "ARIMAModel":
+    data, options = task
+    return ARIMAForecaster().auto_arima(data, **options)
+
+
 class ARIMAForecaster:
     """ARIMA/SARIMA family forecasting models."""
 
+    # Position of each criterion in _DifferencedSeriesCache.criteria().
+    _CRITERIA = {"aic": 0, "bic": 1, "aicc": 2}
+
     def auto_arima(
         self,
         data: NDArray,
@@ -492,33 +621,37 @@ class ARIMAForecaster:
         information_criterion: str = "aic",
         stepwise: bool = True,
         trace: bool = False,
+        n_jobs: int = 1,
     ) -> "ARIMAModel":
-        """Automatic ARIMA order selection."""
-        n = len(data)
+        """Automatic ARIMA order selection.
+
+        Every candidate is scored on the same trailing window of the
+        differenced series, so seasonal candidates, which lose ``m`` points
+        to their extra difference, are comparable with the rest. Candidate
+        fits within a search round run in ``n_jobs`` forked processes.
+        """
+        data = np.asarray(data, dtype=float)
+        if information_criterion not in self._CRITERIA:
+            raise ValueError(f"Unknown information criterion: {information_criterion!r}")
+        cache = _DifferencedSeriesCache(data)
 
         # Determine differencing order
         if d is None:
-            d = self._determine_d(data, max_d=2)
+            d = self._determine_d(data, max_d=2, cache=cache)
         if seasonal and D is None:
-            D = self._determine_seasonal_d(data, m, max_D=1)
+            D = self._determine_seasonal_d(data, m, max_D=1, cache=cache)
 
-        # Differencing
-        differenced = data.copy()
-        for _ in range(d):
-            differenced = np.diff(differenced)
-        if seasonal and D > 0:
-            for _ in range(D):
-                differenced = differenced[m:] - differenced[:-m]
+        # Candidates are scored on the differenced series; its own seasonal
+        # differences are shared through a second cache.
+        differenced = cache.series(d, D if seasonal else 0, m)
+        search_cache = _DifferencedSeriesCache(differenced)
 
         # Grid search or stepwise
-        if stepwise:
-            order, seasonal_order = self._stepwise_search(
-                differenced, max_p, max_q, max_P, max_Q, m, seasonal, information_criterion
-            )
-        else:
-            order, seasonal_order = self._grid_search(
-                differenced, max_p, max_q, max_P, max_Q, m, seasonal, information_criterion
-            )
+        search = self._stepwise_search if stepwise else self._grid_search
+        order, seasonal_order = search(
+            differenced, max_p, max_q, max_P, max_Q, m, seasonal, information_criterion,
+            cache=search_cache, n_jobs=n_jobs,
+        )
 
         # Fit final model
         model = ARIMAModel(order=order, seasonal_order=seasonal_order if seasonal else (0, 0, 0, 0))
@@ -530,35 +663,66 @@ class ARIMAForecaster:
 
         return model
 
-    def _determine_d(self, data: NDArray, max_d: int = 2) -> int:
+    def auto_arima_many(
+        self,
+        series: Sequence[NDArray],
+        n_jobs: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        **options: Any,
+    ) -> List["ARIMAModel"]:
+        """Run ``auto_arima`` on every series, spread over a process pool.
+
+        ``options`` are passed to ``auto_arima`` unchanged; models come back
+        in input order. ``n_jobs`` defaults to the CPU count, and ``n_jobs=1``
+        (or a platform without ``fork``) runs in this process.
+        """
+        import multiprocessing
+        import os
+        from concurrent.futures import ProcessPoolExecutor
+
+        tasks = [(np.asarray(values, dtype=float), options) for values in series]
+        n_jobs = min(n_jobs or os.cpu_count() or 1, len(tasks))
+        if n_jobs <= 1 or "fork" not in multiprocessing.get_all_start_methods():
+            return [_auto_arima_worker(task) for task in tasks]
+        # Workers are forked so they inherit this module even when it was
+        # loaded from a file path rather than imported by name.
+        if chunksize is None:
+            chunksize = max(1, len(tasks) // (4 * n_jobs))
+        with ProcessPoolExecutor(n_jobs, mp_context=multiprocessing.get_context("fork")) as pool:
+            return list(pool.map(_auto_arima_worker, tasks, chunksize=chunksize))
+
+    def _determine_d(
+        self, data: NDArray, max_d: int = 2, cache: Optional[_DifferencedSeriesCache] = None,
+    ) -> int:
         """Determine differencing order using ADF-like heuristic."""
-        for d in range(max_d + 1):
-            series = data.copy()
-            for _ in range(d):
-                series = np.diff(series)
+        cache = cache or _DifferencedSeriesCache(data)
+        for d in range(1, max_d + 1):
             # Check stationarity via variance of differences
-            if d > 0:
-                var_ratio = np.var(np.diff(series)) / np.var(series) if np.var(series) > 0 else 0
-                if var_ratio > 0.9:
-                    return d - 1
+            variance = np.var(cache.series(d))
+            var_ratio = np.var(cache.series(d + 1)) / variance if variance > 0 else 0
+            if var_ratio > 0.9:
+                return d - 1
         return 1
 
-    def _determine_seasonal_d(self, data: NDArray, m: int, max_D: int = 1) -> int:
-        for D in range(max_D + 1):
-            series = data.copy()
-            for _ in range(D):
-                series = series[m:] - series[:-m]
-            if D > 0:
-                autocorr_m = np.corrcoef(series[m:], series[:-m])[0, 1]
-                if abs(autocorr_m) < 0.1:
-                    return D - 1
+    def _determine_seasonal_d(
+        self, data: NDArray, m: int, max_D: int = 1, cache: Optional[_DifferencedSeriesCache] = None,
+    ) -> int:
+        cache = cache or _DifferencedSeriesCache(data)
+        for D in range(1, max_D + 1):
+            series = cache.series(0, D, m)
+            autocorr_m = np.corrcoef(series[m:], series[:-m])[0, 1]
+            if abs(autocorr_m) < 0.1:
+                return D - 1
         return 1
 
     def _stepwise_search(
         self, data: NDArray, max_p: int, max_q: int,
         max_P: int, max_Q: int, m: int, seasonal: bool, criterion: str,
+        cache: Optional[_DifferencedSeriesCache] = None, n_jobs: int = 1,
     ) -> Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]:
         """Simplified stepwise ARIMA order selection."""
+        cache = cache or _DifferencedSeriesCache(data)
+        window = self._common_window(cache, m, seasonal)
         best_aic = float("inf")
         best_order = (1, 0, 0)
         best_seasonal = (0, 0, 0, 0)
@@ -568,78 +732,85 @@ class ARIMAForecaster:
             for q in range(max_q + 1):
                 if p == 0 and q == 0:
                     continue
-                candidates.append((p, 0, q))
+                candidates.append(((p, 0, q), (0, 0, 0, 0)))
 
-        for order in candidates:
-            try:
-                aic = self._compute_aic(data, order, (0, 0, 0, 0))
-                if aic < best_aic:
-                    best_aic = aic
-                    best_order = order
-            except Exception:
-                continue
+        for (order, _), aic in zip(candidates, self._compute_aics(candidates, criterion, cache, window, n_jobs)):
+            if aic < best_aic:
+                best_aic = aic
+                best_order = order
 
         if seasonal:
+            candidates = []
             for P in range(max_P + 1):
                 for Q in range(max_Q + 1):
                     if P == 0 and Q == 0:
                         continue
-                    seasonal_order = (P, 1, Q, m)
-                    try:
-                        aic = self._compute_aic(data, best_order, seasonal_order)
-                        if aic < best_aic:
-                            best_aic = aic
-                            best_seasonal = seasonal_order
-                    except Exception:
-                        continue
+                    candidates.append((best_order, (P, 1, Q, m)))
+            for (_, seasonal_order), aic in zip(
+                candidates, self._compute_aics(candidates, criterion, cache, window, n_jobs)
+            ):
+                if aic < best_aic:
+                    best_aic = aic
+                    best_seasonal = seasonal_order
 
         return best_order, best_seasonal
 
     def _grid_search(
         self, data: NDArray, max_p: int, max_q: int,
         max_P: int, max_Q: int, m: int, seasonal: bool, criterion: str,
+        cache: Optional[_DifferencedSeriesCache] = None, n_jobs: int = 1,
     ) -> Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]:
+        cache = cache or _DifferencedSeriesCache(data)
+        window = self._common_window(cache, m, seasonal)
         best_aic = float("inf")
         best_order = (1, 0, 0)
         best_seasonal = (0, 0, 0, 0)
 
+        seasonal_orders = [(0, 0, 0, 0)]
+        if seasonal:
+            for P in range(max_P + 1):
+                for Q in range(max_Q + 1):
+                    seasonal_orders.append((P, 1, Q, m))
+
+        candidates = []
         for p in range(max_p + 1):
             for q in range(max_q + 1):
                 if p == 0 and q == 0:
                     continue
-                order = (p, 0, q)
-                seasonal_orders = [(0, 0, 0, 0)]
-                if seasonal:
-                    for P in range(max_P + 1):
-                        for Q in range(max_Q + 1):
-                            seasonal_orders.append((P, 1, Q, m))
-
                 for s_order in seasonal_orders:
-                    try:
-                        aic = self._compute_aic(data, order, s_order)
-                        if aic < best_aic:
-                            best_aic = aic
-                            best_order = order
-                            best_seasonal = s_order
-                    except Exception:
-                        continue
+                    candidates.append(((p, 0, q), s_order))
+
+        for (order, s_order), aic in zip(candidates, self._compute_aics(candidates, criterion, cache, window, n_jobs)):
+            if aic < best_aic:
+                best_aic = aic
+                best_order = order
+                best_seasonal = s_order
 
         return best_order, best_seasonal
 
+    @staticmethod
+    def _common_window(cache: _DifferencedSeriesCache, m: int, seasonal: bool) -> int:
+        """Length of the most-differenced candidate series; every candidate is scored on that many trailing points."""
+        return len(cache.series(0, 1, m) if seasonal else cache.data)
+
     def _compute_aic(
         self, data: NDArray, order: Tuple[int, int, int],
         seasonal_order: Tuple[int, int, int, int],
+        criterion: str = "aic",
+        cache: Optional[_DifferencedSeriesCache] = None,
+        window: Optional[int] = None,
     ) -> float:
-        """Compute AIC for a given ARIMA specification."""
-        p, d, q = order
-        n = len(data)
-        k = p + q + 1
+        """Information criterion for a given ARIMA specification (memoized per cache)."""
+        cache = cache or _DifferencedSeriesCache(data)
+        return cache.criteria(order, seasonal_order, window)[self._CRITERIA[criterion]]
 
-        # Simple approximation using residual variance
-        # In production, use proper MLE
-        model = ARIMAModel(order=order, seasonal_order=seasonal_order)
-        model.fit(data)
-        return model.aic
+    def _compute_aics(
+        self, candidates: Sequence[Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]],
+        criterion: str, cache: _DifferencedSeriesCache, window: Optional[int], n_jobs: int,
+    ) -> List[float]:
+        """``_compute_aic`` of every candidate, fitting them across ``n_jobs`` processes."""
+        column = self._CRITERIA[criterion]
+        return [scores[column] for scores in cache.criteria_many(candidates, window, n_jobs)]
 
 
 class ARIMAModel:
@@ -665,26 +836,30 @@ class ARIMAModel:
         self.log_likelihood: float = 0.0
         self._is_fitted = False
 
-    def fit(self, data: NDArray) -> "ARIMAModel":
-        """Fit ARIMA model to data."""
+    def fit(
+        self, data: NDArray, cache: Optional[_DifferencedSeriesCache] = None, window: Optional[int] = None,
+    ) -> "ARIMAModel":
+        """Fit ARIMA model to data.
+
+        ``sigma2`` and the likelihood come from the one-step residuals of the
+        fitted ARMA on the differenced series (conditional sum of squares,
+        zero pre-sample), so the criteria reflect the fitted parameters.
+        With ``window`` only the last ``window`` residuals are scored, so
+        models differenced by different amounts can be compared on the same
+        observations. ``cache`` may pass differenced copies of ``data``
+        already built.
+        """
         self._data = data.copy()
-        n = len(data)
         p, d, q = self.order
 
-        # Apply differencing
-        diff_data = data.copy()
-        for _ in range(d):
-            diff_data = np.diff(diff_data)
-
-        # Seasonal differencing
+        # Apply regular then seasonal differencing
         sP, sD, sQ, m = self.seasonal_order
-        for _ in range(sD):
-            if m > 0 and len(diff_data) > m:
-                diff_data = diff_data[m:] - diff_data[:-m]
+        cache = cache if cache is not None else _DifferencedSeriesCache(data)
+        diff_data = cache.series(d, sD, m)
 
         # Estimate AR parameters via Yule-Walker
         if p > 0:
-            self.ar_params = self._yule_walker(diff_data, p)
+            self.ar_params = self._yule_walker(diff_data, p, acov=cache.autocovariance(p, d, sD, m))
         else:
             self.ar_params = np.array([])
 
@@ -705,33 +880,60 @@ class ARIMAModel:
             self.ma_params = np.array([])
 
         self.intercept = float(np.mean(diff_data))
-        self.sigma2 = float(np.var(diff_data, ddof=1))
+        innovations = self._innovations(diff_data)
+        if window is not None:
+            innovations = innovations[max(len(innovations) - window, 0):]
+        with np.errstate(over="ignore", invalid="ignore"):
+            sigma2 = float(np.mean(innovations ** 2)) if len(innovations) else float("nan")
+        if not np.isfinite(sigma2) or sigma2 <= 0:
+            sigma2 = float(np.var(diff_data, ddof=1)) if len(diff_data) > 1 else 1.0
+        self.sigma2 = sigma2
 
         # Compute fitted values and residuals
         self._fitted_values = self._compute_fitted_values(data)
         self._residuals = data - self._fitted_values
 
         # Information criteria
-        n_params = p + q + 1
-        self.log_likelihood = -n / 2 * (np.log(2 * np.pi * self.sigma2) + 1)
-        self.aic = -2 * self.log_likelihood + 2 * n_params
-        self.bic = -2 * self.log_likelihood + n_params * np.log(n)
-        self.aicc = self.aic + 2 * n_params * (n_params + 1) / max(n - n_params - 1, 1)
+        self.log_likelihood, self.aic, self.bic, self.aicc = self.information_criteria(
+            max(len(innovations), 1), self.sigma2, p + q + 1
+        )
 
         self._is_fitted = True
         return self
 
-    def _yule_walker(self, data: NDArray, p: int) -> NDArray:
+    @staticmethod
+    def information_criteria(n: int, sigma2: float, n_params: int) -> Tuple[float, float, float, float]:
+        """(log_likelihood, aic, bic, aicc) of a Gaussian fit with residual variance ``sigma2``."""
+        log_likelihood = -n / 2 * (np.log(2 * np.pi * sigma2) + 1)
+        aic = -2 * log_likelihood + 2 * n_params
+        bic = -2 * log_likelihood + n_params * np.log(n)
+        aicc = aic + 2 * n_params * (n_params + 1) / max(n - n_params - 1, 1)
+        return log_likelihood, aic, bic, aicc
+
+    def _innovations(self, series: NDArray) -> NDArray:
+        """One-step prediction errors of the fitted ARMA, with zero pre-sample values."""
+        z = series - self.intercept
+        errors = z.copy()
+        if len(self.ar_params) and len(z) > 1:
+            errors[1:] -= np.convolve(z, self.ar_params)[:len(z) - 1]
+        theta = self.ma_params.tolist()
+        if theta:
+            values = errors.tolist()
+            for t in range(1, len(values)):
+                k = min(len(theta), t)
+                values[t] -= sum(theta[j] * values[t - 1 - j] for j in range(k))
+                if not math.isfinite(values[t]):
+                    return np.full(len(values), np.inf)
+            errors = np.array(values)
+        return errors
+
+    def _yule_walker(self, data: NDArray, p: int, acov: Optional[NDArray] = None) -> NDArray:
         """Yule-Walker estimation for AR parameters."""
-        n = len(data)
-        mean = np.mean(data)
-        centered = data - mean
-
-        # Autocorrelation
-        acf = np.array([np.sum(centered[:n-k] * centered[k:]) / n for k in range(p + 1)])
+        acf = _autocovariance(data, p) if acov is None else acov
 
         # Build Toeplitz matrix
-        R = np.array([[acf[abs(i - j)] for j in range(p)] for i in range(p)])
+        lags = np.arange(p)
+        R = acf[np.abs(lags[:, None] - lags[None, :])]
         r = acf[1:p + 1]
 
         try:
@@ -748,14 +950,15 @@ class ARIMAModel:
 
         # Simple fitted values based on AR parameters
         if p > 0 and self.ar_params is not None:
-            for t in range(p, n):
-                ar_sum = sum(self.ar_params[j] * data[t - j - 1] for j in range(min(p, t)))
-                fitted[t] = self.intercept + ar_sum
+            # fitted[t] = intercept + sum_j ar[j] * data[t - j - 1], for t >= p
+            if n > p:
+                fitted[p:] = self.intercept + np.convolve(data, self.ar_params)[p - 1:n - 1]
         else:
             fitted[:] = self.intercept
 
         # Fill initial NaN with mean
-        first_valid = next((i for i in range(n) if not np.isnan(fitted[i])), 0)
+        valid = np.flatnonzero(~np.isnan(fitted))
+        first_valid = int(valid[0]) if len(valid) else 0
         fitted[:first_valid] = fitted[first_valid]
 
         return fitted
@@ -1147,6 +1350,205 @@ class AnomalyDetector:
 # Change Point Detector
 # ---------------------------------------------------------------------------
 
+class SegmentCost:
+    """O(1) segment costs from prefix sums, vectorised over segment starts.
+
+    ``cost(starts, end)`` returns the cost of every segment ``data[s:end]``
+    for ``s`` in ``starts``. All models are twice a negative log-likelihood
+    (up to constants), so a BIC-style penalty of ``(n_params + 1) * log(n)``
+    per change point is on the right scale:
+
+    * ``"l2"`` (alias ``"mean"``): Gaussian mean shift, squared error over a
+      robust noise variance estimated from first differences.
+    * ``"variance"``: Gaussian variance change around the global mean.
+    * ``"normal"`` (alias ``"meanvar"``): Gaussian mean and variance change.
+    * ``"poisson"``: Poisson rate change for non-negative counts.
+    """
+
+    MODELS = {"l2": 1, "variance": 1, "normal": 2, "poisson": 1}
+    ALIASES = {"mean": "l2", "meanvar": "normal", "rbf": "l2"}
+
+    def __init__(self, data: NDArray, model: str = "l2"):
+        model = self.ALIASES.get(model, model)
+        if model not in self.MODELS:
+            raise ValueError(f"Unknown cost model: {model!r}. Choose from {sorted(self.MODELS)}.")
+        x = np.asarray(data, dtype=float).ravel()
+        if model == "poisson" and np.any(x < 0):
+            raise ValueError("The poisson cost needs non-negative counts.")
+        self.model = model
+        self.n_params = self.MODELS[model]
+        # Centring keeps the prefix sums of squares well conditioned.
+        centred = x - x.mean() if model != "poisson" and len(x) else x
+        self._s1 = np.concatenate([[0.0], np.cumsum(centred)])
+        self._s2 = np.concatenate([[0.0], np.cumsum(centred ** 2)])
+        self._noise_var = 1.0
+        if model == "l2" and len(x) > 2:
+            mad = np.median(np.abs(np.diff(x) - np.median(np.diff(x))))
+            noise = (1.4826 * mad) ** 2 / 2
+            self._noise_var = noise if noise > 0 else max(float(np.var(x)), 1.0)
+
+    def prefix(self, starts: NDArray) -> Tuple[NDArray, NDArray]:
+        """Prefix sums at ``starts``; callers that reuse the same starts can cache them."""
+        return self._s1[starts], self._s2[starts]
+
+    def cost(self, starts: NDArray, end: int, prefix: Optional[Tuple[NDArray, NDArray]] = None) -> NDArray:
+        p1, p2 = prefix if prefix is not None else self.prefix(starts)
+        length = end - starts
+        s1 = self._s1[end] - p1
+        if self.model == "poisson":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                rate_term = np.where(s1 > 0, s1 * np.log(s1 / length), 0.0)
+            return 2 * (s1 - rate_term)
+        s2 = self._s2[end] - p2
+        if self.model == "variance":
+            return length * np.log(np.maximum(s2 / length, 1e-300))
+        sq_dev = np.maximum(s2 - s1 * s1 / length, 0.0)
+        if self.model == "l2":
+            return sq_dev / self._noise_var
+        return length * np.log(np.maximum(sq_dev / length, 1e-300))
+
+
+class OnlineChangePointDetector:
+    """Streaming Bayesian online change point detection (Adams & MacKay 2007).
+
+    Observations are Gaussian with unknown mean and variance under a
+    Normal-Gamma prior ``(mu0, kappa0, alpha0, beta0)``, so each run length
+    keeps four conjugate sufficient statistics and predicts with a Student-t.
+    The state is the current run-length posterior only; ``update`` costs
+    O(R) vectorised work for the R run lengths kept, and run lengths whose
+    posterior probability falls below ``truncation`` are dropped (as are
+    run lengths beyond ``max_run_length``, if given).
+
+    A change point is reported once runs of at least ``min_run_length``
+    points that started after the current segment began have held more
+    than ``threshold`` of the posterior mass for ``confirm_steps``
+    consecutive updates. Its index is the start of the most probable such
+    run. A candidate closer than ``min_run_length`` to the previous change
+    moves the segment start without being reported again.
+    """
+
+    def __init__(
+        self,
+        hazard_rate: float = 1 / 200,
+        mu0: float = 0.0,
+        kappa0: float = 1.0,
+        alpha0: float = 1.0,
+        beta0: float = 1.0,
+        truncation: float = 1e-8,
+        max_run_length: Optional[int] = None,
+        min_run_length: int = 5,
+        threshold: float = 0.99,
+        confirm_steps: int = 3,
+    ):
+        if not 0 < hazard_rate < 1:
+            raise ValueError("hazard_rate must be in (0, 1).")
+        if not 0 < threshold < 1:
+            raise ValueError("threshold must be in (0, 1).")
+        self.hazard_rate = hazard_rate
+        self.prior = (float(mu0), float(kappa0), float(alpha0), float(beta0))
+        self.log_truncation = np.log(truncation) if truncation > 0 else -np.inf
+        self.max_run_length = max_run_length
+        self.min_run_length = max(int(min_run_length), 1)
+        self.threshold = threshold
+        self.confirm_steps = max(int(confirm_steps), 1)
+        self._log_hazard = np.log(hazard_rate)
+        self._log_survival = np.log1p(-hazard_rate)
+        # lgamma(alpha + 1/2) - lgamma(alpha) for alpha = alpha0 + r / 2.
+        self._gamma_ratio = np.zeros(0)
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all observations."""
+        mu0, kappa0, alpha0, beta0 = self.prior
+        self.t = 0
+        self.run_lengths = np.zeros(1, dtype=np.int64)
+        self.log_probs = np.zeros(1)
+        self._mu = np.array([mu0])
+        self._kappa = np.array([kappa0])
+        self._beta = np.array([beta0])
+        self.map_run_length = 0
+        self.log_evidence = 0.0
+        self._segment_start = 0
+        self._streak = 0
+
+    def update(self, x: float) -> Optional[ChangePoint]:
+        """Absorb one observation; return a ``ChangePoint`` if one is detected."""
+        x = float(x)
+        r = self.run_lengths
+        alpha = self.prior[2] + r / 2
+        nu = 2 * alpha
+        scale2 = self._beta * (self._kappa + 1) / (alpha * self._kappa)
+        log_pred = (
+            self._lgamma_ratio(r)
+            - 0.5 * np.log(nu * np.pi * scale2)
+            - (alpha + 0.5) * np.log1p((x - self._mu) ** 2 / (nu * scale2))
+        )
+
+        joint = self.log_probs + log_pred
+        top = joint.max()
+        log_cp = top + np.log(np.exp(joint - top).sum()) + self._log_hazard
+        log_probs = np.concatenate([[log_cp], joint + self._log_survival])
+        evidence = log_cp - self._log_hazard  # log p(x_t | x_1..t-1)
+        log_probs -= evidence
+
+        mu0, kappa0, _, beta0 = self.prior
+        kappa = self._kappa + 1
+        self._beta = np.concatenate([[beta0], self._beta + self._kappa * (x - self._mu) ** 2 / (2 * kappa)])
+        self._mu = np.concatenate([[mu0], (self._kappa * self._mu + x) / kappa])
+        self._kappa = np.concatenate([[kappa0], kappa])
+        run_lengths = np.concatenate([[0], r + 1])
+
+        keep = log_probs >= self.log_truncation
+        if self.max_run_length is not None:
+            keep &= run_lengths <= self.max_run_length
+        keep[0] = True
+        if not keep.all():
+            run_lengths, log_probs = run_lengths[keep], log_probs[keep]
+            self._mu, self._kappa, self._beta = self._mu[keep], self._kappa[keep], self._beta[keep]
+            top = log_probs.max()
+            log_probs -= top + np.log(np.exp(log_probs - top).sum())
+        self.run_lengths, self.log_probs = run_lengths, log_probs
+
+        self.t += 1
+        self.log_evidence = float(evidence)
+        # P(r = 0) is always the hazard rate, so it only carries information
+        # through the longer run lengths; leave it out of the MAP.
+        best = int(np.argmax(log_probs[1:])) + 1 if len(log_probs) > 1 else 0
+        self.map_run_length = int(run_lengths[best])
+
+        # Runs shorter than the current segment began after its start; once
+        # they hold most of the mass the segment has ended.
+        # A single surprising point briefly shifts mass to short runs, so the
+        # evidence has to persist before a change is reported.
+        newer = (run_lengths < self.t - self._segment_start) & (run_lengths >= self.min_run_length)
+        mass = float(np.exp(log_probs[newer]).sum()) if self.t > 1 and newer.any() else 0.0
+        self._streak = self._streak + 1 if mass > self.threshold else 0
+        if self._streak < self.confirm_steps:
+            return None
+        self._streak = 0
+        candidates = np.flatnonzero(newer)
+        best = candidates[np.argmax(log_probs[candidates])]
+        start = self.t - int(run_lengths[best])
+        previous, self._segment_start = self._segment_start, start
+        if start - previous < self.min_run_length:
+            return None
+        return ChangePoint(index=start, confidence=mass, method="bayesian_online")
+
+    def run_length_distribution(self) -> Tuple[NDArray, NDArray]:
+        """Run lengths kept and their posterior probabilities."""
+        return self.run_lengths.copy(), np.exp(self.log_probs)
+
+    def _lgamma_ratio(self, run_lengths: NDArray) -> NDArray:
+        needed = int(run_lengths.max()) + 1
+        if needed > len(self._gamma_ratio):
+            size = max(needed, 2 * len(self._gamma_ratio), 64)
+            alpha0 = self.prior[2]
+            self._gamma_ratio = np.array([
+                math.lgamma(alpha0 + r / 2 + 0.5) - math.lgamma(alpha0 + r / 2) for r in range(size)
+            ])
+        return self._gamma_ratio[run_lengths]
+
+
 class ChangePointDetector:
     """Detect change points in time series data."""
 
@@ -1190,58 +1592,43 @@ class ChangePointDetector:
         data: NDArray,
         hazard_rate: float = 1 / 200,
         observation_likelihood: str = "student_t",
+        truncation: float = 1e-8,
+        max_run_length: Optional[int] = None,
     ) -> CPDResult:
-        """Bayesian Online Change Point Detection (Adams & MacKay 2007)."""
+        """Bayesian Online Change Point Detection (Adams & MacKay 2007).
+
+        Runs ``OnlineChangePointDetector`` over ``data`` with a weak
+        Normal-Gamma prior centred on the series' median and noise level.
+        ``run_lengths`` holds the most probable run length after each point
+        and ``log_probabilities`` the log predictive density of each point.
+        """
+        if observation_likelihood not in ("student_t", "normal_gamma"):
+            raise ValueError(f"Unsupported observation likelihood: {observation_likelihood!r}")
+        data = np.asarray(data, dtype=float).ravel()
         n = len(data)
+        center, noise_var = 0.0, 1.0
+        if n:
+            center = float(np.median(data))
+            diffs = np.diff(data)
+            if len(diffs):
+                mad = np.median(np.abs(diffs - np.median(diffs)))
+                noise_var = (1.4826 * mad) ** 2 / 2
+            if noise_var <= 0:
+                noise_var = float(np.var(data)) or 1.0
+        detector = OnlineChangePointDetector(
+            hazard_rate=hazard_rate, mu0=center, kappa0=0.1, alpha0=1.0, beta0=noise_var,
+            truncation=truncation, max_run_length=max_run_length,
+        )
+
         run_lengths = np.zeros(n, dtype=int)
         log_probs = np.zeros(n)
         change_points = []
-
-        # Run length distribution
-        max_run = min(n, 500)
-        log_R = np.zeros((n, max_run + 1))
-        log_R[0, 0] = 0  # R_0 = 1
-
-        for t in range(1, n):
-            # Predictive probabilities for each run length
-            predictive = np.zeros(max_run + 1)
-            for r in range(min(t, max_run)):
-                # Student-t predictive (simplified)
-                window = data[t - r:t]
-                mu = np.mean(window)
-                var = np.var(window, ddof=1) if len(window) > 1 else 1.0
-                nu = max(len(window) - 1, 1)
-                scale = var * (1 + 1 / len(window))
-                x = data[t]
-                # Student-t PDF approximation
-                z = (x - mu) / np.sqrt(scale) if scale > 0 else 0
-                predictive[r] = -0.5 * (nu + 1) * np.log(1 + z ** 2 / nu)
-
-            # Growth probabilities
-            log_growth = log_R[t - 1, :max_run] + predictive[:max_run]
-
-            # Change point probability
-            H = hazard_rate
-            log_cp = np.log(H) + self._log_sum_exp(log_R[t - 1, :max_run])
-
-            # Update run length distribution
-            log_R[t, 1:max_run + 1] = log_growth
-            log_R[t, 0] = log_cp
-
-            # Normalize
-            max_log = np.max(log_R[t, :max_run + 1])
-            log_R[t, :max_run + 1] -= max_log
-
-            # Detect change point
-            if log_R[t, 0] > np.max(log_R[t, 1:max_run + 1]):
-                change_points.append(ChangePoint(
-                    index=t,
-                    confidence=float(np.exp(log_R[t, 0])),
-                    method="bayesian_online",
-                ))
-
-            run_lengths[t] = np.argmax(log_R[t, :max_run + 1])
-            log_probs[t] = max_log
+        for t, x in enumerate(data.tolist()):
+            change_point = detector.update(x)
+            if change_point is not None and (not change_points or change_point.index != change_points[-1].index):
+                change_points.append(change_point)
+            run_lengths[t] = detector.map_run_length
+            log_probs[t] = detector.log_evidence
 
         return CPDResult(
             change_points=change_points,
@@ -1254,37 +1641,107 @@ class ChangePointDetector:
     def pelt(
         self,
         data: NDArray,
-        cost_function: str = "rbf",
+        cost_function: str = "l2",
         penalty: Union[str, float] = "auto",
+        min_size: int = 2,
+        jump: int = 1,
     ) -> CPDResult:
-        """PELT (Pruned Exact Linear Time) change point detection."""
+        """PELT (Pruned Exact Linear Time) change point detection (Killick et al. 2012).
+
+        Minimises the total ``SegmentCost`` plus ``penalty`` per change point
+        exactly, pruning candidate last-change positions that can never be
+        optimal again. Pruning only discards positions before the latest
+        change, so the work is linear in ``len(data)`` when segment lengths
+        stay bounded and grows with the longest segment otherwise. Segments
+        are at least ``min_size`` long and change points are restricted to
+        multiples of ``jump``, which cuts the work by about ``jump**2``.
+        ``penalty="auto"`` uses ``(n_params + 1) * log(n)``.
+        """
+        data = np.asarray(data, dtype=float).ravel()
         n = len(data)
-
+        min_size, jump = max(1, int(min_size)), max(1, int(jump))
+        cost = SegmentCost(data, cost_function)
         if isinstance(penalty, str) and penalty == "auto":
-            penalty = 2 * np.log(n)
+            penalty = (cost.n_params + 1) * np.log(max(n, 2))
+        if cost.model in ("variance", "normal"):
+            min_size = max(min_size, 2)  # One point has no spread.
 
-        # Cost function: RBF kernel cost
-        def segment_cost(start: int, end: int) -> float:
-            segment = data[start:end]
-            if len(segment) < 2:
-                return 0
-            return float(np.var(segment, ddof=1) * len(segment))
-
-        # Dynamic programming with pruning
+        # Candidate change points: multiples of ``jump``, then the end.
+        ends = np.arange(min_size, n + 1)
+        ends = ends[(ends % jump == 0) | (ends == n)]
         F = np.full(n + 1, np.inf)
         F[0] = -penalty
-        cp_list = [[] for _ in range(n + 1)]
-
-        for t in range(1, n + 1):
-            candidates = list(range(max(0, t - 200), t))  # Limit search window
-            costs = [F[s] + segment_cost(s, t) + penalty for s in candidates]
-            best_idx = np.argmin(costs)
-            F[t] = costs[best_idx]
-            s = candidates[best_idx]
-            cp_list[t] = cp_list[s] + [s] if s > 0 else []
-
-        # Extract change points
-        change_point_indices = [cp for cp in cp_list[n] if cp > 0]
+        last = np.zeros(n + 1, dtype=np.int64)
+
+        # Surviving candidate starts with their F values, prefix sums and the
+        # first end from which they are pruned (n + 1 while still live).
+        starts = np.zeros(1, dtype=np.int64)
+        start_f = F[:1].copy()
+        start_p1, start_p2 = cost.prefix(starts)
+        expires = np.full(1, n + 1, dtype=np.int64)
+
+        # Ends are processed in blocks: costs against the candidates known at
+        # the block start form one (block, candidates) matrix, and only the
+        # recursion over starts inside the block runs per end.
+        block = 64
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i0 in range(0, len(ends), block):
+                T = ends[i0:i0 + block]
+                size = len(T)
+                gaps = T[:, None] - starts[None, :]
+                totals = start_f + cost.cost(starts[None, :], T[:, None], (start_p1, start_p2))
+                totals[gaps < min_size] = np.inf
+                old_arg = np.argmin(totals, axis=1)
+                old_best = totals[np.arange(size), old_arg]
+
+                inner_p1, inner_p2 = cost.prefix(T)
+                inner = cost.cost(T[None, :], T[:, None], (inner_p1, inner_p2))  # [k, j]: T[j] -> T[k]
+                inner_valid = (T[:, None] - T[None, :]) >= min_size
+                inner[~inner_valid] = np.inf
+
+                block_f = np.empty(size)
+                sources = starts[old_arg].tolist()
+                # Starts T[:reach[k]] are at least ``min_size`` before T[k].
+                reach = np.searchsorted(T, T - min_size, side="right").tolist()
+                for k, best in enumerate(old_best.tolist()):
+                    if reach[k]:
+                        row = block_f[:reach[k]] + inner[k, :reach[k]]
+                        j = row.argmin()
+                        if row[j] < best:
+                            best, sources[k] = row[j], int(T[j])
+                    block_f[k] = best + penalty
+                F[T] = block_f
+                last[T] = sources
+
+                # A start that cannot beat ``t`` now never will once a segment
+                # can follow ``t`` (costs here satisfy C(s, u) >= C(s, t) +
+                # C(t, u), so the pruning constant is 0).
+                prune_at = T[:, None] + min_size
+                dominated = (totals > block_f[:, None]) & (gaps >= min_size)
+                expires = np.minimum(expires, np.where(dominated, prune_at, n + 1).min(axis=0))
+                dominated = (block_f[None, :] + inner > block_f[:, None]) & inner_valid
+                starts = np.concatenate([starts, T])
+                start_f = np.concatenate([start_f, block_f])
+                start_p1 = np.concatenate([start_p1, inner_p1])
+                start_p2 = np.concatenate([start_p2, inner_p2])
+                expires = np.concatenate([expires, np.where(dominated, prune_at, n + 1).min(axis=0)])
+
+                next_end = ends[i0 + block] if i0 + block < len(ends) else n + 1
+                alive = expires > next_end
+                if not alive.all():
+                    starts, start_f, expires = starts[alive], start_f[alive], expires[alive]
+                    start_p1, start_p2 = start_p1[alive], start_p2[alive]
+
+        if not np.isfinite(F[n]):
+            return CPDResult(change_points=[], method=CPDMethod.PELT, n_segments=1 if n else 0)
+
+        change_point_indices = []
+        t = n
+        while t > 0:
+            t = int(last[t])
+            if t > 0:
+                change_point_indices.append(t)
+        change_point_indices.reverse()
         change_points = [ChangePoint(index=cp, method="pelt") for cp in change_point_indices]
 
         return CPDResult(
@@ -1462,7 +1919,7 @@ class SpectralAnalyzer:
 # ---------------------------------------------------------------------------
 
 class KalmanFilter:
-    """Kalman filter for linear Gaussian state-space models."""
+    """Kalman filter and RTS smoother for linear Gaussian state-space models."""
 
     def __init__(
         self,
@@ -1480,72 +1937,152 @@ class KalmanFilter:
         self.x0 = initial_state  # Initial state mean
         self.P0 = initial_covariance  # Initial state covariance
 
-    def filter(self, observations: NDArray) -> KalmanResult:
-        """Run Kalman filter on observations."""
-        n_obs = len(observations)
-        dim_state = len(self.x0) if self.x0 is not None else 1
-        dim_obs = 1
-
-        # Initialize
-        x = self.x0.copy() if self.x0 is not None else np.zeros(dim_state)
-        P = self.P0.copy() if self.P0 is not None else np.eye(dim_state)
-
-        filtered = np.zeros((n_obs, dim_state))
-        predicted = np.zeros((n_obs, dim_state))
-        innovations = np.zeros(n_obs)
-        innovation_vars = np.zeros(n_obs)
+    def filter(self, observations: NDArray, steady_state_tol: float = 1e-10) -> KalmanResult:
+        """Run the Kalman filter and RTS smoother on one series.
+
+        ``observations`` is ``(n_obs,)`` or ``(n_obs, dim_obs)``; see
+        ``filter_batch`` for the result layout.
+        """
+        observations = np.asarray(observations, dtype=float)
+        result = self.filter_batch(observations[np.newaxis], steady_state_tol=steady_state_tol)
+        result.filtered_state = result.filtered_state[0]
+        result.predicted_state = result.predicted_state[0]
+        result.smoothed_state = result.smoothed_state[0]
+        result.innovations = result.innovations[0]
+        return result
 
+    def filter_batch(self, observations: NDArray, steady_state_tol: float = 1e-10) -> KalmanResult:
+        """Filter and smooth many series that share this model in one pass.
+
+        ``observations`` is ``(n_series, n_obs)`` or, for vector
+        observations, ``(n_series, n_obs, dim_obs)``. The covariance
+        recursion does not depend on the data, so it runs once for the whole
+        batch, and once the predicted covariance stops changing (within
+        ``steady_state_tol``) the steady-state gain is reused for the
+        remaining steps. Only the state means are propagated per series.
+
+        States come back as ``(n_series, n_obs, dim_state)``, innovations as
+        ``(n_series, n_obs)`` (or ``(..., dim_obs)``) and the shared
+        innovation variances as ``(n_obs,)`` (or ``(n_obs, dim_obs, dim_obs)``).
+        ``log_likelihood`` is the batch total; ``series_log_likelihood``
+        holds one value per series.
+        """
+        y = np.asarray(observations, dtype=float)
+        if y.ndim == 2:
+            y = y[:, :, np.newaxis]
+        if y.ndim != 3:
+            raise ValueError("observations must be (n_series, n_obs) or (n_series, n_obs, dim_obs).")
+        n_series, n_obs, dim_obs = y.shape
+        F, H, Q, R, x0, P0 = self._matrices(dim_obs)
+        if H.shape[0] != dim_obs:
+            raise ValueError(f"observation_matrix expects {H.shape[0]} values per step, got {dim_obs}.")
+        if R.shape != (dim_obs, dim_obs):
+            raise ValueError(f"observation_noise must be {dim_obs}x{dim_obs}, got {R.shape[0]}x{R.shape[1]}.")
+        if np.linalg.eigvalsh((R + R.T) / 2).min() < 0:
+            raise ValueError("observation_noise must be positive semi-definite.")
+        dim_state = F.shape[0]
+
+        gains, S, P_pred, P_filt, steady = self._covariance_recursion(n_obs, F, H, Q, R, P0, steady_state_tol)
+
+        predicted = np.empty((n_series, n_obs, dim_state))
+        filtered = np.empty((n_series, n_obs, dim_state))
+        innovations = np.empty((n_series, n_obs, dim_obs))
+        x = np.broadcast_to(x0, (n_series, dim_state))
         for t in range(n_obs):
-            # Predict
-            if self.F is not None:
-                x_pred = self.F @ x
-                P_pred = self.F @ P @ self.F.T + self.Q
-            else:
-                x_pred = x
-                P_pred = P + self.Q
-
-            predicted[t] = x_pred
-
-            # Update
-            if self.H is not None:
-                y_pred = self.H @ x_pred
-                innovation = observations[t] - y_pred
-                S = self.H @ P_pred @ self.H.T + self.R
-                K = P_pred @ self.H.T @ np.linalg.inv(S) if isinstance(S, np.ndarray) and S.ndim > 0 else P_pred @ self.H.T / (S if np.isscalar(S) else S[0, 0])
-
-                x = x_pred + K * innovation
-                P = (np.eye(dim_state) - K @ self.H) @ P_pred
-            else:
-                innovation = observations[t] - x_pred[0]
-                S = P_pred[0, 0] + self.R[0, 0] if self.R is not None else P_pred[0, 0]
-                K = P_pred[:, 0] / S
-
-                x = x_pred + K * innovation
-                P = P_pred - np.outer(K, K) * S
-
-            filtered[t] = x
-            innovations[t] = float(innovation)
-            innovation_vars[t] = float(S) if np.isscalar(S) else float(S[0, 0])
+            x_pred = x @ F.T
+            innovation = y[:, t] - x_pred @ H.T
+            x = x_pred + innovation @ gains[t].T
+            predicted[:, t], filtered[:, t], innovations[:, t] = x_pred, x, innovation
 
-        # Smoothed states (simplified: just use filtered)
-        smoothed = filtered.copy()
+        smoothed = self._rts_smooth(F, filtered, predicted, P_filt, P_pred)
 
-        # Log likelihood
-        log_lik = -0.5 * n_obs * np.log(2 * np.pi) - 0.5 * np.sum(
-            np.log(innovation_vars + 1e-10) + innovations ** 2 / (innovation_vars + 1e-10)
-        )
+        S_inv = np.linalg.inv(S)
+        _, log_det = np.linalg.slogdet(S)
+        mahalanobis = np.einsum("sti,tij,stj->s", innovations, S_inv, innovations)
+        series_log_lik = -0.5 * (n_obs * dim_obs * np.log(2 * np.pi) + log_det.sum() + mahalanobis)
 
+        scalar_obs = dim_obs == 1
         return KalmanResult(
             filtered_state=filtered,
             predicted_state=predicted,
             smoothed_state=smoothed,
-            filtered_covariance=P,
-            predicted_covariance=P_pred if 'P_pred' in dir() else P,
-            log_likelihood=float(log_lik),
-            innovations=innovations,
-            innovation_variances=innovation_vars,
+            filtered_covariance=P_filt[-1] if n_obs else P0,
+            predicted_covariance=P_pred[-1] if n_obs else P0,
+            log_likelihood=float(series_log_lik.sum()),
+            innovations=innovations[..., 0] if scalar_obs else innovations,
+            innovation_variances=S[:, 0, 0].copy() if scalar_obs else S,
+            series_log_likelihood=series_log_lik,
+            steady_state_index=steady,
         )
 
+    def _matrices(self, dim_obs: int) -> Tuple[NDArray, NDArray, NDArray, NDArray, NDArray, NDArray]:
+        """Model matrices, with the first state component observed when ``H`` is unset."""
+        if self.x0 is not None:
+            dim_state = len(self.x0)
+        else:
+            dim_state = len(self.F) if self.F is not None else 1
+        F = np.eye(dim_state) if self.F is None else np.atleast_2d(np.asarray(self.F, dtype=float))
+        H = np.eye(dim_obs, dim_state) if self.H is None else np.atleast_2d(np.asarray(self.H, dtype=float))
+        Q = np.zeros((dim_state, dim_state)) if self.Q is None else np.atleast_2d(np.asarray(self.Q, dtype=float))
+        R = np.zeros((len(H), len(H))) if self.R is None else np.atleast_2d(np.asarray(self.R, dtype=float))
+        x0 = np.zeros(dim_state) if self.x0 is None else np.asarray(self.x0, dtype=float).ravel()
+        P0 = np.eye(dim_state) if self.P0 is None else np.atleast_2d(np.asarray(self.P0, dtype=float))
+        return F, H, Q, R, x0, P0
+
+    @staticmethod
+    def _covariance_recursion(
+        n_obs: int, F: NDArray, H: NDArray, Q: NDArray, R: NDArray, P0: NDArray, tol: float,
+    ) -> Tuple[NDArray, NDArray, NDArray, NDArray, Optional[int]]:
+        """Gains, innovation and state covariances for every step.
+
+        The Riccati recursion maps each predicted covariance to the next, so
+        once two consecutive ones agree every later step repeats them.
+        Raises ``ValueError`` when an innovation covariance is singular,
+        e.g. with no observation noise and no process noise.
+        """
+        dim_state, dim_obs = F.shape[0], H.shape[0]
+        gains = np.empty((n_obs, dim_state, dim_obs))
+        S_all = np.empty((n_obs, dim_obs, dim_obs))
+        P_pred = np.empty((n_obs, dim_state, dim_state))
+        P_filt = np.empty((n_obs, dim_state, dim_state))
+        P = P0
+        for t in range(n_obs):
+            Pp = F @ P @ F.T + Q
+            S = H @ Pp @ H.T + R
+            try:
+                np.linalg.cholesky(S)
+            except np.linalg.LinAlgError:
+                raise ValueError(
+                    f"Innovation covariance is singular at step {t}; give observation_noise (R) "
+                    "positive variance or add process_noise (Q)."
+                ) from None
+            K = np.linalg.solve(S, H @ Pp).T  # P_pred H' S^-1, both symmetric
+            P = Pp - K @ S @ K.T
+            P = (P + P.T) / 2
+            gains[t], S_all[t], P_pred[t], P_filt[t] = K, S, Pp, P
+            if t and np.abs(Pp - P_pred[t - 1]).max() <= tol * max(1.0, np.abs(Pp).max()):
+                gains[t + 1:], S_all[t + 1:] = K, S
+                P_pred[t + 1:], P_filt[t + 1:] = Pp, P
+                return gains, S_all, P_pred, P_filt, t
+        return gains, S_all, P_pred, P_filt, None
+
+    @staticmethod
+    def _rts_smooth(F: NDArray, filtered: NDArray, predicted: NDArray, P_filt: NDArray, P_pred: NDArray) -> NDArray:
+        """Rauch-Tung-Striebel backward pass over every series at once."""
+        smoothed = filtered.copy()
+        n_obs = filtered.shape[1]
+        if n_obs < 2:
+            return smoothed
+        # J_t = P_filt[t] F' P_pred[t+1]^-1, solved for all steps in one call.
+        cross = F @ P_filt[:-1]
+        try:
+            gains = np.swapaxes(np.linalg.solve(P_pred[1:], cross), 1, 2)
+        except np.linalg.LinAlgError:
+            gains = np.swapaxes(np.linalg.pinv(P_pred[1:]) @ cross, 1, 2)
+        for t in range(n_obs - 2, -1, -1):
+            smoothed[:, t] += (smoothed[:, t + 1] - predicted[:, t + 1]) @ gains[t].T
+        return smoothed
+
 
 # ---------------------------------------------------------------------------
 # Main Demo
@@ -1602,6 +2139,11 @@ def main() -> None:
     print(f"  Residual mean:   {diag.residuals_mean:.6f}")
     print(f"  Ljung-Box p:     {diag.ljung_box_pvalue:.4f}")
 
+    # Bulk order selection, one series per worker task
+    catalogue = [train + rng.normal(0, 1, len(train)) for _ in range(8)]
+    models = forecaster.auto_arima_many(catalogue, n_jobs=2, max_p=3, max_q=3)
+    print(f"  Bulk orders:     {sorted({mdl.order for mdl in models})}")
+
     # --- 3. Anomaly Detection ---
     print("\n--- Anomaly Detection ---")
     detector = AnomalyDetector()
@@ -1631,6 +2173,10 @@ def main() -> None:
     print(f"  PELT change points:  {pelt_result.change_point_indices}")
     print(f"  PELT segments:       {pelt_result.n_segments}")
 
+    # BOCPD
+    bocpd_result = cpd.bayesian_online(data, hazard_rate=1 / 100)
+    print(f"  BOCPD change points: {bocpd_result.change_point_indices}")
+
     # --- 5. Spectral Analysis ---
     print("\n--- Spectral Analysis ---")
     analyzer = SpectralAnalyzer()
@@ -1672,6 +2218,13 @@ def main() -> None:
     print(f"  Filtered state range: [{kalman_result.filtered_state.min():.2f}, {kalman_result.filtered_state.max():.2f}]")
     print(f"  Log-likelihood:       {kalman_result.log_likelihood:.2f}")
     print(f"  Innovation std:       {np.std(kalman_result.innovations):.4f}")
+    print(f"  Smoothed vs filtered: {np.abs(kalman_result.smoothed_state - kalman_result.filtered_state).mean():.4f} mean abs diff")
+    print(f"  Steady-state gain at: step {kalman_result.steady_state_index}")
+
+    # Batched: many channels sharing one model in a single pass
+    channels = data + rng.normal(0, 1, (500, n))
+    batch_result = kf.filter_batch(channels)
+    print(f"  Batch smoothed shape: {batch_result.smoothed_state.shape}")
 
     print("\n" + "=" * 70)
     print("Demo complete.")
@@ -4,18 +4,26 @@ Graph Algorithms Toolkit
 Implementations of fundamental graph algorithms: PageRank, Louvain community
 detection, shortest path (Dijkstra, Bellman-Ford, Floyd-Warshall), centrality
 measures, graph coloring, BFS/DFS, and minimum spanning tree.
+
+Large graphs can be frozen into a ``CSRGraph`` (compressed sparse row, int32
+node ids, float32 weights) on which PageRank and Dijkstra run as numpy kernels.
 """
 
 from __future__ import annotations
 
 import math
 import heapq
+import multiprocessing
 import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Iterable, Optional, Union
 from collections import defaultdict, deque
 
+import numpy as np
+
 logger = __import__("logging").getLogger(__name__)
 
 
@@ -101,11 +109,27 @@ class CommunityResult:
     communities: dict[str, int]
     modularity: float
     num_communities: int
+    levels: int = 1
 
     def get_community_members(self, community_id: int) -> set[str]:
         return {node for node, cid in self.communities.items() if cid == community_id}
 
 
+@dataclass
+class CentralityEstimate:
+    """Pivot-sampled centrality with an additive error bound.
+
+    With probability at least ``1 - delta`` every score is within ``epsilon``
+    of its exact value (betweenness), or every average distance is within
+    ``epsilon`` times the diameter of its exact value (closeness).
+    """
+    scores: dict[str, float]
+    pivots: int
+    epsilon: float
+    delta: float
+    exact: bool = False
+
+
 @dataclass
 class ColoringResult:
     colors: dict[str, int]
@@ -141,6 +165,12 @@ class AdjacencyListGraph:
         self._adjacency: dict[str, list[tuple[str, float]]] = defaultdict(list)
         self._nodes: set[str] = set()
         self._edges: list[GraphEdge] = []
+        self._in_degree: dict[str, int] = defaultdict(int)
+        self._csr: Optional[CSRGraph] = None
+
+    @property
+    def directed(self) -> bool:
+        return self._directed
 
     @property
     def nodes(self) -> list[str]:
@@ -156,12 +186,16 @@ class AdjacencyListGraph:
 
     def add_node(self, node: str) -> None:
         self._nodes.add(node)
+        self._csr = None
 
     def add_edge(self, source: str, target: str, weight: float = 1.0) -> None:
+        self._csr = None
         self._nodes.add(source)
         self._nodes.add(target)
         self._adjacency[source].append((target, weight))
-        if not self._directed:
+        if self._directed:
+            self._in_degree[target] += 1
+        else:
             self._adjacency[target].append((source, weight))
         self._edges.append(GraphEdge(source, target, weight, self._directed))
 
@@ -173,7 +207,7 @@ class AdjacencyListGraph:
 
     def get_in_degree(self, node: str) -> int:
         if self._directed:
-            return sum(1 for adj in self._adjacency.values() for target, _ in adj if target == node)
+            return self._in_degree.get(node, 0)
         return self.get_out_degree(node)
 
     def get_all_edges(self) -> list[GraphEdge]:
@@ -188,13 +222,204 @@ class AdjacencyListGraph:
                 sub.add_edge(edge.source, edge.target, edge.weight)
         return sub
 
+    def to_csr(self) -> CSRGraph:
+        """Frozen snapshot of the graph, cached until the next ``add_node``/``add_edge``."""
+        if self._csr is None:
+            self._csr = CSRGraph.from_adjacency(self)
+        return self._csr
+
+
+# ---------------------------------------------------------------------------
+# Compact Graph (CSR)
+# ---------------------------------------------------------------------------
+
+class CSRGraph:
+    """Frozen compressed-sparse-row graph with forward and reverse adjacency.
+
+    Node labels are interned to int32 ids (``labels[i]`` is the label of id
+    ``i``). Out-edges of ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` with
+    matching float32 ``weights``; the ``rev_*`` arrays hold in-edges the same
+    way. Undirected graphs store each edge in both directions and share the
+    forward arrays as their reverse. All arrays are read-only.
+    """
+
+    def __init__(self, labels: list[str], indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray, rev_indptr: np.ndarray, rev_indices: np.ndarray,
+                 rev_weights: np.ndarray, directed: bool = True) -> None:
+        self._labels = labels
+        self._index = {label: i for i, label in enumerate(labels)}
+        self._directed = directed
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+        self.rev_indptr = rev_indptr
+        self.rev_indices = rev_indices
+        self.rev_weights = rev_weights
+        for arr in (indptr, indices, weights, rev_indptr, rev_indices, rev_weights):
+            arr.flags.writeable = False
+        self._has_negative_weights = bool(weights.size and weights.min() < 0)
+
+    @classmethod
+    def from_adjacency(cls, graph: AdjacencyListGraph) -> CSRGraph:
+        labels = sorted(graph.nodes)
+        index = {label: i for i, label in enumerate(labels)}
+        n_arcs = sum(graph.get_out_degree(node) for node in labels)
+        src = np.empty(n_arcs, dtype=np.int32)
+        dst = np.empty(n_arcs, dtype=np.int32)
+        wts = np.empty(n_arcs, dtype=np.float32)
+        pos = 0
+        for node in labels:
+            neighbors = graph.get_neighbors(node)
+            end = pos + len(neighbors)
+            src[pos:end] = index[node]
+            dst[pos:end] = [index[t] for t, _ in neighbors]
+            wts[pos:end] = [w for _, w in neighbors]
+            pos = end
+        return cls._from_arcs(labels, src, dst, wts, graph.directed)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[tuple], directed: bool = True,
+                   nodes: Iterable[str] = ()) -> CSRGraph:
+        """Build from ``(source, target[, weight])`` tuples without an adjacency list.
+
+        Edges are streamed into packed int32/float32 buffers, so peak memory is
+        a small multiple of the final CSR size. Ids follow first appearance in
+        ``nodes`` and then in ``edges``.
+        """
+        index: dict[str, int] = {}
+        for node in nodes:
+            index.setdefault(node, len(index))
+        src, dst, wts = array("i"), array("i"), array("f")
+        for edge in edges:
+            s = index.setdefault(edge[0], len(index))
+            t = index.setdefault(edge[1], len(index))
+            w = edge[2] if len(edge) > 2 else 1.0
+            src.append(s)
+            dst.append(t)
+            wts.append(w)
+            if not directed:
+                src.append(t)
+                dst.append(s)
+                wts.append(w)
+        return cls._from_arcs(
+            list(index),
+            np.frombuffer(src, dtype=np.intc).astype(np.int32, copy=False),
+            np.frombuffer(dst, dtype=np.intc).astype(np.int32, copy=False),
+            np.frombuffer(wts, dtype=np.float32),
+            directed,
+        )
+
+    @classmethod
+    def _from_arcs(cls, labels: list[str], src: np.ndarray, dst: np.ndarray,
+                   wts: np.ndarray, directed: bool) -> CSRGraph:
+        n = len(labels)
+        indptr, indices, weights = cls._compress(n, src, dst, wts)
+        if directed:
+            rev_indptr, rev_indices, rev_weights = cls._compress(n, dst, src, wts)
+        else:
+            rev_indptr, rev_indices, rev_weights = indptr, indices, weights
+        return cls(labels, indptr, indices, weights,
+                   rev_indptr, rev_indices, rev_weights, directed)
+
+    @staticmethod
+    def _compress(n: int, rows: np.ndarray, cols: np.ndarray,
+                  wts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+        order = np.argsort(rows, kind="stable")
+        return indptr, cols[order].astype(np.int32, copy=False), wts[order].astype(np.float32, copy=False)
+
+    @property
+    def directed(self) -> bool:
+        return self._directed
+
+    @property
+    def labels(self) -> list[str]:
+        return self._labels
+
+    @property
+    def node_count(self) -> int:
+        return len(self._labels)
+
+    @property
+    def edge_count(self) -> int:
+        arcs = int(self.indices.size)
+        return arcs if self._directed else arcs // 2
+
+    @property
+    def has_negative_weights(self) -> bool:
+        return self._has_negative_weights
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self.indptr, self.indices, self.weights]
+        if self._directed:
+            arrays += [self.rev_indptr, self.rev_indices, self.rev_weights]
+        return sum(arr.nbytes for arr in arrays)
+
+    def __contains__(self, label: object) -> bool:
+        return label in self._index
+
+    def node_id(self, label: str) -> int:
+        return self._index[label]
+
+    def label(self, node_id: int) -> str:
+        return self._labels[node_id]
+
+    def out_degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        return np.diff(self.rev_indptr)
+
+    def out_neighbors(self, node_id: int) -> tuple[np.ndarray, np.ndarray]:
+        lo, hi = self.indptr[node_id], self.indptr[node_id + 1]
+        return self.indices[lo:hi], self.weights[lo:hi]
+
+    def in_neighbors(self, node_id: int) -> tuple[np.ndarray, np.ndarray]:
+        lo, hi = self.rev_indptr[node_id], self.rev_indptr[node_id + 1]
+        return self.rev_indices[lo:hi], self.rev_weights[lo:hi]
+
+    def reverse(self) -> CSRGraph:
+        """Return the transpose graph; it shares this graph's arrays."""
+        if not self._directed:
+            return self
+        return CSRGraph(self._labels, self.rev_indptr, self.rev_indices, self.rev_weights,
+                        self.indptr, self.indices, self.weights, directed=True)
+
+    def out_edges(self, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(tails, heads, weights)`` of every out-edge of ``nodes``."""
+        starts = self.indptr[nodes]
+        counts = self.indptr[nodes + 1] - starts
+        total = int(counts.sum())
+        offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.repeat(nodes, counts), self.indices[offsets], self.weights[offsets]
+
+    def pull(self, values: np.ndarray) -> np.ndarray:
+        """Return ``out[v] = sum(values[u] for u -> v)`` over the reverse CSR."""
+        out = np.zeros(self.node_count, dtype=np.float64)
+        if self.rev_indices.size == 0:
+            return out
+        rows = np.flatnonzero(np.diff(self.rev_indptr))
+        out[rows] = np.add.reduceat(values[self.rev_indices], self.rev_indptr[rows])
+        return out
+
+    def to_dict(self, values: np.ndarray) -> dict[str, float]:
+        return dict(zip(self._labels, values.tolist()))
+
 
 # ---------------------------------------------------------------------------
 # PageRank
 # ---------------------------------------------------------------------------
 
 class PageRank:
-    """PageRank implementation with configurable damping factor."""
+    """PageRank implementation with configurable damping factor.
+
+    Both entry points accept an ``AdjacencyListGraph`` (frozen to a
+    ``CSRGraph`` on entry) or a ``CSRGraph``, and iterate over in-links with
+    numpy. Rank held by dangling nodes is redistributed along the teleport
+    vector.
+    """
 
     def __init__(self, damping: float = 0.85, tolerance: float = 1e-6,
                  max_iterations: int = 100) -> None:
@@ -202,163 +427,272 @@ class PageRank:
         self._tolerance = tolerance
         self._max_iterations = max_iterations
 
-    def compute(self, graph: AdjacencyListGraph) -> PageRankResult:
-        nodes = graph.node_count
-        if nodes == 0:
+    def compute(self, graph: Union[AdjacencyListGraph, CSRGraph]) -> PageRankResult:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        n = csr.node_count
+        if n == 0:
             return PageRankResult({}, 0, True)
 
-        scores = {node: 1.0 / nodes for node in graph.nodes}
-        converged = False
-        iteration = 0
-
-        for iteration in range(1, self._max_iterations + 1):
-            new_scores: dict[str, float] = {}
-            dangling_sum = sum(
-                scores[node] for node in graph.nodes
-                if graph.get_out_degree(node) == 0
-            )
-
-            for node in graph.nodes:
-                link_contribution = 0.0
-                for neighbor, _ in graph.get_neighbors(node):
-                    out_degree = graph.get_out_degree(neighbor)
-                    if out_degree > 0:
-                        link_contribution += scores[neighbor] / out_degree
-
-                new_scores[node] = (
-                    (1 - self._damping) / nodes
-                    + self._damping * (link_contribution + dangling_sum / nodes)
-                )
-
-            diff = sum(abs(new_scores[n] - scores[n]) for n in graph.nodes)
-            scores = new_scores
+        teleport = np.full(n, 1.0 / n)
+        scores, iterations, converged = self._iterate(csr, teleport, self._max_iterations)
+        return PageRankResult(scores=csr.to_dict(scores), iterations=iterations, converged=converged)
 
-            if diff < self._tolerance:
-                converged = True
-                break
-
-        return PageRankResult(scores=scores, iterations=iteration, converged=converged)
-
-    def personalized_pr(self, graph: AdjacencyListGraph, seeds: dict[str, float],
+    def personalized_pr(self, graph: Union[AdjacencyListGraph, CSRGraph], seeds: dict[str, float],
                         max_iterations: int = 50) -> PageRankResult:
-        nodes = graph.node_count
-        if nodes == 0:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        n = csr.node_count
+        if n == 0:
             return PageRankResult({}, 0, True)
 
-        scores = {node: seeds.get(node, 0.0) for node in graph.nodes}
-        total = sum(scores.values())
-        if total > 0:
-            scores = {k: v / total for k, v in scores.items()}
-
+        teleport = np.zeros(n)
+        for node, weight in seeds.items():
+            if node in csr:
+                teleport[csr.node_id(node)] = weight
+        total = teleport.sum()
+        if total <= 0:
+            raise ValueError("personalized PageRank needs seeds with positive total weight")
+        teleport /= total
+        scores, iterations, converged = self._iterate(csr, teleport, max_iterations)
+        return PageRankResult(scores=csr.to_dict(scores), iterations=iterations, converged=converged)
+
+    def _iterate(self, csr: CSRGraph, teleport: np.ndarray,
+                 max_iterations: int) -> tuple[np.ndarray, int, bool]:
+        out_degree = csr.out_degree()
+        dangling = out_degree == 0
+        inv_out = np.divide(1.0, out_degree, out=np.zeros(csr.node_count), where=~dangling)
+
+        scores = teleport.copy()
+        iteration = 0
         for iteration in range(1, max_iterations + 1):
-            new_scores: dict[str, float] = {}
-            for node in graph.nodes:
-                link_contribution = 0.0
-                for neighbor, _ in graph.get_neighbors(node):
-                    out_degree = graph.get_out_degree(neighbor)
-                    if out_degree > 0:
-                        link_contribution += scores[neighbor] / out_degree
-                teleport = seeds.get(node, 0.0)
-                new_scores[node] = (1 - self._damping) * teleport + self._damping * link_contribution
-            diff = sum(abs(new_scores[n] - scores[n]) for n in graph.nodes)
+            new_scores = csr.pull(scores * inv_out)
+            new_scores += scores[dangling].sum() * teleport
+            new_scores *= self._damping
+            new_scores += (1 - self._damping) * teleport
+
+            diff = np.abs(new_scores - scores).sum()
             scores = new_scores
             if diff < self._tolerance:
-                return PageRankResult(scores=scores, iterations=iteration, converged=True)
-
-        return PageRankResult(scores=scores, iterations=max_iterations, converged=False)
+                return scores, iteration, True
+        return scores, iteration, False
 
 
 # ---------------------------------------------------------------------------
 # Louvain Community Detection
 # ---------------------------------------------------------------------------
 
-class LouvainCommunity:
-    """Louvain modularity optimization for community detection."""
+@dataclass
+class _LevelGraph:
+    """Symmetric weighted CSR used by one Louvain level; self-loops carry twice their weight."""
+    indptr: np.ndarray
+    indices: np.ndarray
+    weights: np.ndarray
+
+    @classmethod
+    def from_arcs(cls, rows: np.ndarray, cols: np.ndarray, weights: np.ndarray,
+                  part: np.ndarray, n_part: int) -> _LevelGraph:
+        """Collapse arcs onto the blocks of ``part``, summing parallel arcs."""
+        keys = part[rows].astype(np.int64) * n_part + part[cols]
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        indptr = np.zeros(n_part + 1, dtype=np.int64)
+        np.cumsum(np.bincount(unique_keys // n_part, minlength=n_part), out=indptr[1:])
+        return cls(indptr, (unique_keys % n_part).astype(np.int32),
+                   np.bincount(inverse, weights=weights))
 
-    def __init__(self, resolution: float = 1.0) -> None:
-        self._resolution = resolution
+    @property
+    def node_count(self) -> int:
+        return len(self.indptr) - 1
 
-    def detect(self, graph: AdjacencyListGraph) -> CommunityResult:
-        node_to_community = {node: i for i, node in enumerate(graph.nodes)}
-        total_weight = sum(e.weight for e in graph.get_all_edges())
-        if total_weight == 0:
-            return CommunityResult(node_to_community, 0.0, graph.node_count)
+    @property
+    def rows(self) -> np.ndarray:
+        return np.repeat(np.arange(self.node_count, dtype=np.int32), np.diff(self.indptr))
 
-        degree_sum = defaultdict(float)
-        for edge in graph.get_all_edges():
-            degree_sum[edge.source] += edge.weight
-            degree_sum[edge.target] += edge.weight
+    def aggregate(self, part: np.ndarray, n_part: int) -> _LevelGraph:
+        return _LevelGraph.from_arcs(self.rows, self.indices, self.weights, part, n_part)
 
-        internal_weights = defaultdict(float)
-        for edge in graph.get_all_edges():
-            if node_to_community[edge.source] == node_to_community[edge.target]:
-                internal_weights[node_to_community[edge.source]] += edge.weight
-
-        community_total = defaultdict(float)
-        for node in graph.nodes:
-            cid = node_to_community[node]
-            community_total[cid] += degree_sum[node]
-
-        improved = True
-        while improved:
-            improved = False
-            for node in graph.nodes:
-                current_community = node_to_community[node]
-                best_community = current_community
-                best_gain = 0.0
-
-                neighbor_communities: dict[int, float] = defaultdict(float)
-                for neighbor, weight in graph.get_neighbors(node):
-                    nc = node_to_community[neighbor]
-                    neighbor_communities[nc] += weight
-
-                node_degree = degree_sum[node]
-
-                for neighbor_comm, edge_weight_to_comm in neighbor_communities.items():
-                    if neighbor_comm == current_community:
-                        continue
-
-                    gain = (
-                        edge_weight_to_comm / total_weight
-                        - self._resolution * node_degree * community_total[neighbor_comm] / (2 * total_weight * total_weight)
-                    )
-                    if gain > best_gain:
-                        best_gain = gain
-                        best_community = neighbor_comm
-
-                if best_community != current_community:
-                    internal_weights[current_community] -= (
-                        internal_weights.get(current_community, 0) * node_degree / community_total[current_community]
-                    )
-                    community_total[current_community] -= node_degree
-                    node_to_community[node] = best_community
-                    community_total[best_community] += node_degree
-                    improved = True
-
-        unique_communities = {v: i for i, v in enumerate(set(node_to_community.values()))}
-        node_to_community = {k: unique_communities[v] for k, v in node_to_community.items()}
-
-        modularity = self._compute_modularity(graph, node_to_community, total_weight)
+
+class LouvainCommunity:
+    """Multi-level Louvain modularity optimization, with optional Leiden refinement.
+
+    Each level moves nodes between communities until no move gains more
+    than ``tolerance`` modularity, then collapses every community into a
+    super-node and repeats on the smaller graph. Community totals and
+    internal weights are updated per move, so modularity is never rescanned.
+    Nodes are visited in a random order drawn from ``seed``. With
+    ``refine=True`` each community is split into well-connected
+    sub-communities before aggregation (Traag et al., 2019), which
+    guarantees connected communities. Merges pick the best gain rather than
+    sampling, so the result is still fixed by ``seed``. Directed graphs are
+    treated as undirected.
+    """
+
+    def __init__(self, resolution: float = 1.0, seed: Optional[int] = None,
+                 refine: bool = False, tolerance: float = 1e-9, max_levels: int = 100) -> None:
+        self._resolution = resolution
+        self._seed = seed
+        self._refine = refine
+        self._tolerance = tolerance
+        self._max_levels = max_levels
+
+    def detect(self, graph: Union[AdjacencyListGraph, CSRGraph]) -> CommunityResult:
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        n = csr.node_count
+        level = self._symmetrize(csr)
+        two_m = float(level.weights.sum())
+        if two_m == 0:
+            return CommunityResult({label: i for i, label in enumerate(csr.labels)}, 0.0, n)
+
+        rng = random.Random(self._seed)
+        membership = np.arange(n)
+        communities = np.arange(n)
+        modularity = 0.0
+        levels = 0
+        while levels < self._max_levels:
+            communities, modularity = self._move_nodes(level, communities, two_m, rng)
+            levels += 1
+            if self._refine:
+                part = self._refine_partition(level, communities, two_m, rng)
+            else:
+                part = communities
+            part, n_part = self._relabel(part)
+            if n_part == level.node_count:
+                break
+            membership = part[membership]
+            parent = np.empty(n_part, dtype=np.int64)
+            parent[part] = communities
+            level = level.aggregate(part, n_part)
+            communities = self._relabel(parent)[0]
+
+        final, n_communities = self._relabel(communities[membership])
         return CommunityResult(
-            communities=node_to_community,
+            communities=dict(zip(csr.labels, final.tolist())),
             modularity=modularity,
-            num_communities=len(unique_communities),
+            num_communities=n_communities,
+            levels=levels,
         )
 
-    def _compute_modularity(self, graph: AdjacencyListGraph,
-                            communities: dict[str, int], total_weight: float) -> float:
-        if total_weight == 0:
+    def modularity(self, graph: Union[AdjacencyListGraph, CSRGraph], communities: dict[str, int]) -> float:
+        """Modularity of an arbitrary partition, in one vectorized pass over the edges."""
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_adjacency(graph)
+        level = self._symmetrize(csr)
+        two_m = float(level.weights.sum())
+        if two_m == 0:
             return 0.0
-        q = 0.0
-        for edge in graph.get_all_edges():
-            if communities[edge.source] == communities[edge.target]:
-                q += edge.weight
-        q = q / total_weight
-        q -= self._resolution * sum(
-            (sum(e.weight for e in graph.get_all_edges() if e.source == n or e.target == n) / (2 * total_weight)) ** 2
-            for n in graph.nodes
-        )
-        return q
+        part, n_part = self._relabel(np.array([communities[label] for label in csr.labels]))
+        rows = level.rows
+        same = part[rows] == part[level.indices]
+        internal = level.weights[same].sum()
+        totals = np.bincount(part[rows], weights=level.weights, minlength=n_part)
+        return float(internal / two_m - self._resolution * ((totals / two_m) ** 2).sum())
+
+    @staticmethod
+    def _symmetrize(csr: CSRGraph) -> _LevelGraph:
+        rows = np.repeat(np.arange(csr.node_count, dtype=np.int32), csr.out_degree())
+        cols, weights = csr.indices, csr.weights.astype(np.float64)
+        if csr.directed:
+            rows, cols = np.concatenate([rows, cols]), np.concatenate([cols, rows])
+            weights = np.concatenate([weights, weights])
+        return _LevelGraph.from_arcs(rows, cols, weights, np.arange(csr.node_count), csr.node_count)
+
+    @staticmethod
+    def _relabel(labels: np.ndarray) -> tuple[np.ndarray, int]:
+        unique, dense = np.unique(labels, return_inverse=True)
+        return dense, len(unique)
+
+    def _move_nodes(self, level: _LevelGraph, communities: np.ndarray, two_m: float,
+                    rng: random.Random) -> tuple[np.ndarray, float]:
+        """Local-move phase; returns the new assignment and its modularity."""
+        n = level.node_count
+        gamma = self._resolution
+        min_gain = self._tolerance * two_m / 2
+        indptr, indices, weights = level.indptr.tolist(), level.indices.tolist(), level.weights.tolist()
+        rows = level.rows
+        degree = np.bincount(rows, weights=level.weights, minlength=n)
+        loops = np.bincount(rows, weights=np.where(rows == level.indices, level.weights, 0.0), minlength=n)
+        same = communities[rows] == communities[level.indices]
+        internal = np.bincount(communities[rows][same], weights=level.weights[same], minlength=n).tolist()
+        totals = np.bincount(communities, weights=degree, minlength=n).tolist()
+        degree, loops, comm = degree.tolist(), loops.tolist(), communities.tolist()
+
+        order = list(range(n))
+        moved = True
+        while moved:
+            moved = False
+            rng.shuffle(order)
+            for node in order:
+                current = comm[node]
+                k = degree[node]
+                links: dict[int, float] = {}
+                for p in range(indptr[node], indptr[node + 1]):
+                    neighbor = indices[p]
+                    if neighbor != node:
+                        c = comm[neighbor]
+                        links[c] = links.get(c, 0.0) + weights[p]
+
+                totals[current] -= k
+                stay = links.get(current, 0.0) - gamma * totals[current] * k / two_m
+                best, best_score = current, stay
+                for c, k_in in links.items():
+                    score = k_in - gamma * totals[c] * k / two_m
+                    if score > best_score:
+                        best, best_score = c, score
+                if best != current and best_score - stay > min_gain:
+                    internal[current] -= 2 * links.get(current, 0.0) + loops[node]
+                    internal[best] += 2 * links[best] + loops[node]
+                    comm[node] = best
+                    moved = True
+                else:
+                    best = current
+                totals[best] += k
+
+        q = sum(internal) / two_m - gamma * sum((t / two_m) ** 2 for t in totals)
+        return np.array(comm), q
+
+    def _refine_partition(self, level: _LevelGraph, communities: np.ndarray, two_m: float,
+                          rng: random.Random) -> np.ndarray:
+        """Leiden refinement: merge singletons into well-connected parts of their community."""
+        n = level.node_count
+        gamma = self._resolution
+        indptr, indices, weights = level.indptr.tolist(), level.indices.tolist(), level.weights.tolist()
+        rows = level.rows
+        degree = np.bincount(rows, weights=level.weights, minlength=n)
+        community_totals = np.bincount(communities, weights=degree, minlength=n)
+        inside = (communities[rows] == communities[level.indices]) & (rows != level.indices)
+        # external[r]: weight from refined part r to the rest of its community.
+        external = np.bincount(rows[inside], weights=level.weights[inside], minlength=n).tolist()
+        degree, community_totals, comm = degree.tolist(), community_totals.tolist(), communities.tolist()
+        refined = list(range(n))
+        part_totals = list(degree)
+        singleton = [True] * n
+
+        order = list(range(n))
+        rng.shuffle(order)
+        for node in order:
+            if not singleton[node]:
+                continue
+            k = degree[node]
+            s_total = community_totals[comm[node]]
+            if external[node] < gamma * k * (s_total - k) / two_m:
+                continue
+            links: dict[int, float] = {}
+            for p in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[p]
+                if neighbor != node and comm[neighbor] == comm[node]:
+                    r = refined[neighbor]
+                    links[r] = links.get(r, 0.0) + weights[p]
+
+            best, best_gain = node, 0.0
+            for r, k_in in links.items():
+                if external[r] < gamma * part_totals[r] * (s_total - part_totals[r]) / two_m:
+                    continue
+                gain = k_in - gamma * part_totals[r] * k / two_m
+                if gain >= best_gain:
+                    best, best_gain = r, gain
+            if best != node:
+                refined[node] = best
+                singleton[node] = singleton[best] = False
+                external[best] += external[node] - 2 * links[best]
+                part_totals[best] += k
+        return np.array(refined)
 
 
 # ---------------------------------------------------------------------------
@@ -368,7 +702,9 @@ class LouvainCommunity:
 class Dijkstra:
     """Single-source shortest paths with non-negative weights."""
 
-    def compute(self, graph: AdjacencyListGraph, source: str) -> ShortestPathResult:
+    def compute(self, graph: Union[AdjacencyListGraph, CSRGraph], source: str) -> ShortestPathResult:
+        if isinstance(graph, CSRGraph):
+            return self.compute_csr(graph, source)
         distances = {node: float("inf") for node in graph.nodes}
         predecessors: dict[str, Optional[str]] = {node: None for node in graph.nodes}
         distances[source] = 0
@@ -391,6 +727,51 @@ class Dijkstra:
 
         return ShortestPathResult(source=source, distances=distances, predecessors=predecessors)
 
+    def compute_csr(self, graph: CSRGraph, source: str) -> ShortestPathResult:
+        dist, pred = self.compute_arrays(graph, source)
+        labels = graph.labels
+        return ShortestPathResult(
+            source=source,
+            distances=graph.to_dict(dist),
+            predecessors={label: labels[p] if p >= 0 else None
+                          for label, p in zip(labels, pred.tolist())},
+        )
+
+    def compute_arrays(self, graph: CSRGraph, source: str) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(distances, predecessors)`` indexed by node id (-1 = no predecessor)."""
+        if graph.has_negative_weights:
+            raise ValueError("Dijkstra does not support negative weights")
+        n = graph.node_count
+        indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+        dist = np.full(n, np.inf)
+        pred = np.full(n, -1, dtype=np.int32)
+        settled = np.zeros(n, dtype=bool)
+        origin = graph.node_id(source)
+        dist[origin] = 0.0
+        heap: list[tuple[float, int]] = [(0.0, origin)]
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if settled[u]:
+                continue
+            settled[u] = True
+            lo, hi = indptr[u], indptr[u + 1]
+            if lo == hi:
+                continue
+            targets = indices[lo:hi]
+            candidate = weights[lo:hi].astype(np.float64) + d
+            improved = candidate < dist[targets]
+            if not improved.any():
+                continue
+            targets, candidate = targets[improved], candidate[improved]
+            np.minimum.at(dist, targets, candidate)
+            won = dist[targets] == candidate
+            pred[targets[won]] = u
+            for item in zip(candidate[won].tolist(), targets[won].tolist()):
+                heapq.heappush(heap, item)
+
+        return dist, pred
+
 
 class BellmanFord:
     """Single-source shortest paths handling negative weights."""
@@ -469,72 +850,245 @@ class FloydWarshall:
 # Centrality Measures
 # ---------------------------------------------------------------------------
 
+# Graph and mode of a pool worker process, set once by its initializer. Each
+# pool forks its own workers, so concurrent calculators never share this.
+_WORKER_JOB: dict[str, Any] = {}
+
+
+def _init_centrality_worker(job: dict[str, Any]) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+
+
+def _centrality_worker(task: tuple[Any, np.ndarray]) -> np.ndarray:
+    worker, sources = task
+    return worker(_WORKER_JOB, sources)
+
+
+# _settle, _dependencies, _betweenness_partial, _distance_sums and _pivot_count
+# are copied in social-network-analysis/social_network_analysis.py, since each
+# skill is loaded as a standalone module. Change both copies together.
+
+def _settle(csr: CSRGraph, source: int, weighted: bool, dist: np.ndarray) -> np.ndarray:
+    """Write shortest distances from ``source`` into ``dist`` (all ``inf`` on entry).
+
+    Returns the reached nodes in non-decreasing distance order. Unweighted
+    search expands one BFS frontier per numpy step; weighted search is
+    Dijkstra with vectorized relaxation.
+    """
+    dist[source] = 0.0
+    if not weighted:
+        frontier = np.array([source], dtype=np.int32)
+        order = [frontier]
+        level = 0.0
+        while True:
+            level += 1.0
+            _, heads, _ = csr.out_edges(frontier)
+            frontier = np.unique(heads[dist[heads] == np.inf])
+            if frontier.size == 0:
+                return np.concatenate(order)
+            dist[frontier] = level
+            order.append(frontier)
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    settled: list[int] = []
+    heap: list[tuple[float, int]] = [(0.0, source)]
+    done: set[int] = set()
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        settled.append(u)
+        lo, hi = indptr[u], indptr[u + 1]
+        if lo == hi:
+            continue
+        heads = indices[lo:hi]
+        candidate = weights[lo:hi].astype(np.float64) + d
+        improved = candidate < dist[heads]
+        if improved.any():
+            heads, candidate = heads[improved], candidate[improved]
+            np.minimum.at(dist, heads, candidate)
+            for item in zip(candidate.tolist(), heads.tolist()):
+                heapq.heappush(heap, item)
+    return np.array(settled, dtype=np.int32)
+
+
+def _dependencies(csr: CSRGraph, order: np.ndarray, weighted: bool, dist: np.ndarray,
+                  sigma: np.ndarray, delta: np.ndarray) -> None:
+    """Brandes' path counting and dependency accumulation, one distance level at a time.
+
+    ``order`` comes from ``_settle``. Nodes at equal distance form a level;
+    shortest-path DAG edges run from one level to a later one, so each level
+    is a single vectorized update in either direction.
+    """
+    sigma[order[0]] = 1.0
+    cuts = np.flatnonzero(np.diff(dist[order])) + 1
+    dag: list[tuple[np.ndarray, np.ndarray]] = []
+    for level in np.split(order, cuts):
+        tails, heads, w = csr.out_edges(level)
+        step = w.astype(np.float64) if weighted else 1.0
+        on_dag = dist[tails] + step == dist[heads]
+        tails, heads = tails[on_dag], heads[on_dag]
+        np.add.at(sigma, heads, sigma[tails])
+        dag.append((tails, heads))
+    for tails, heads in reversed(dag):
+        np.add.at(delta, tails, sigma[tails] / sigma[heads] * (1.0 + delta[heads]))
+
+
+def _betweenness_partial(job: dict[str, Any], sources: np.ndarray) -> np.ndarray:
+    """Sum of dependencies over ``sources``; buffers are reset per source, not reallocated."""
+    csr: CSRGraph = job["graph"]
+    weighted: bool = job["weighted"]
+    n = csr.node_count
+    dist, sigma, delta = np.full(n, np.inf), np.zeros(n), np.zeros(n)
+    total = np.zeros(n)
+    for source in sources.tolist():
+        order = _settle(csr, source, weighted, dist)
+        _dependencies(csr, order, weighted, dist, sigma, delta)
+        delta[source] = 0.0
+        total[order] += delta[order]
+        dist[order], sigma[order], delta[order] = np.inf, 0.0, 0.0
+    return total
+
+
+def _distance_totals(job: dict[str, Any], sources: np.ndarray) -> np.ndarray:
+    """Per-node array holding, at each source, the sum of its finite distances."""
+    csr: CSRGraph = job["graph"]
+    weighted: bool = job["weighted"]
+    dist = np.full(csr.node_count, np.inf)
+    totals = np.zeros(csr.node_count)
+    for source in sources.tolist():
+        order = _settle(csr, source, weighted, dist)
+        totals[source] = dist[order].sum()
+        dist[order] = np.inf
+    return totals
+
+
+def _distance_sums(job: dict[str, Any], sources: np.ndarray) -> np.ndarray:
+    """Per-node sum of finite distances from every source."""
+    csr: CSRGraph = job["graph"]
+    weighted: bool = job["weighted"]
+    dist = np.full(csr.node_count, np.inf)
+    sums = np.zeros(csr.node_count)
+    for source in sources.tolist():
+        order = _settle(csr, source, weighted, dist)
+        sums[order] += dist[order]
+        dist[order] = np.inf
+    return sums
+
+
+def _pivot_count(n: int, epsilon: float, delta: float) -> int:
+    """Pivots for a Hoeffding plus union bound over ``n`` nodes (Brandes & Pich, 2007)."""
+    return math.ceil(math.log(2 * n / delta) / (2 * epsilon * epsilon))
+
+
 class CentralityCalculator:
-    """Degree, betweenness, closeness, and eigenvector centrality."""
+    """Degree, betweenness, closeness, and eigenvector centrality.
+
+    Betweenness and closeness run over the graph's cached ``CSRGraph``
+    snapshot, which is rebuilt after the graph changes. Sources can be split across ``n_jobs`` forked processes,
+    whose partial sums are added up. ``weighted=True`` treats edge weights as
+    lengths, using Dijkstra instead of BFS.
+    """
 
     def __init__(self, graph: AdjacencyListGraph) -> None:
         self._graph = graph
 
+    @property
+    def csr(self) -> CSRGraph:
+        return self._graph.to_csr()
+
     def degree_centrality(self) -> dict[str, float]:
         n = self._graph.node_count - 1
         if n == 0:
             return {}
         return {node: self._graph.get_out_degree(node) / n for node in self._graph.nodes}
 
-    def betweenness_centrality(self, sample_size: int = 0) -> dict[str, float]:
-        betweenness = defaultdict(float)
-        nodes = self._graph.nodes
-        sample = nodes
-        if 0 < sample_size < len(nodes):
-            sample = random.sample(nodes, sample_size)
-
-        for source in sample:
-            stack: list[str] = []
-            predecessors: dict[str, list[str]] = defaultdict(list)
-            sigma = {n: 0.0 for n in nodes}
-            sigma[source] = 1.0
-            distance = {n: -1 for n in nodes}
-            distance[source] = 0
-            queue = deque([source])
-
-            while queue:
-                v = queue.popleft()
-                stack.append(v)
-                for w, _ in self._graph.get_neighbors(v):
-                    if distance[w] < 0:
-                        distance[w] = distance[v] + 1
-                        queue.append(w)
-                    if distance[w] == distance[v] + 1:
-                        sigma[w] += sigma[v]
-                        predecessors[w].append(v)
-
-            delta = {n: 0.0 for n in nodes}
-            while stack:
-                w = stack.pop()
-                for v in predecessors[w]:
-                    delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
-                if w != source:
-                    betweenness[w] += delta[w]
-
-        n = self._graph.node_count
+    def betweenness_centrality(self, sample_size: int = 0, weighted: bool = False,
+                               n_jobs: int = 1, seed: Optional[int] = None) -> dict[str, float]:
+        """Brandes betweenness, normalized by ``(n - 1)(n - 2)``.
+
+        With ``0 < sample_size < n`` only that many distinct source pivots are
+        expanded and the sums are scaled by ``n / sample_size``.
+        """
+        csr = self.csr
+        n = csr.node_count
+        if 0 < sample_size < n:
+            pivots = np.random.default_rng(seed).choice(n, size=sample_size, replace=False)
+            return csr.to_dict(self._betweenness(pivots, weighted, n_jobs) * (n / sample_size))
+        return csr.to_dict(self._betweenness(np.arange(n), weighted, n_jobs))
+
+    def approximate_betweenness(self, epsilon: float = 0.05, delta: float = 0.1,
+                                weighted: bool = False, n_jobs: int = 1,
+                                seed: Optional[int] = None) -> CentralityEstimate:
+        """Betweenness from uniformly drawn pivots, within ``epsilon`` w.p. ``1 - delta``.
+
+        Each pivot gives an unbiased estimate bounded by ``n / (n - 1)``, so
+        ``ln(2n / delta) / (2 epsilon^2)`` pivots bound every node at once.
+        Falls back to the exact computation when that is no more work.
+        """
+        csr = self.csr
+        n = csr.node_count
+        k = _pivot_count(max(n, 1), epsilon, delta)
+        if k >= n:
+            scores = csr.to_dict(self._betweenness(np.arange(n), weighted, n_jobs))
+            return CentralityEstimate(scores, n, 0.0, 0.0, exact=True)
+        pivots = np.random.default_rng(seed).integers(n, size=k)
+        scores = self._betweenness(pivots, weighted, n_jobs) * (n / k)
+        return CentralityEstimate(csr.to_dict(scores), k, epsilon, delta)
+
+    def closeness_centrality(self, weighted: bool = False, n_jobs: int = 1) -> dict[str, float]:
+        """``(n - 1) / sum of distances`` to the nodes reachable from each node."""
+        csr = self.csr
+        n = csr.node_count
+        totals = sum(self._map_sources(_distance_totals, np.arange(n), weighted, n_jobs), np.zeros(n))
+        scores = np.divide(n - 1, totals, out=np.zeros(n), where=totals > 0)
+        return csr.to_dict(scores)
+
+    def approximate_closeness(self, epsilon: float = 0.05, delta: float = 0.1,
+                              weighted: bool = False, n_jobs: int = 1,
+                              seed: Optional[int] = None) -> CentralityEstimate:
+        """Closeness from distances to sampled pivots (Eppstein & Wang, 2004).
+
+        Pivot searches run on the reverse graph, so one search per pivot
+        yields the distance from every node to that pivot. Average distances
+        are then within ``epsilon`` times the diameter w.p. ``1 - delta``.
+        """
+        csr = self.csr
+        n = csr.node_count
+        k = _pivot_count(max(n, 1), epsilon, delta)
+        if k >= n:
+            return CentralityEstimate(self.closeness_centrality(weighted, n_jobs), n, 0.0, 0.0, exact=True)
+        pivots = np.random.default_rng(seed).integers(n, size=k)
+        sums = sum(self._map_sources(_distance_sums, pivots, weighted, n_jobs, graph=csr.reverse()), np.zeros(n))
+        totals = sums * (n / k)
+        scores = np.divide(n - 1, totals, out=np.zeros(n), where=totals > 0)
+        return CentralityEstimate(csr.to_dict(scores), k, epsilon, delta)
+
+    def _betweenness(self, sources: np.ndarray, weighted: bool, n_jobs: int) -> np.ndarray:
+        n = self.csr.node_count
+        total = sum(self._map_sources(_betweenness_partial, sources, weighted, n_jobs), np.zeros(n))
         norm = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
-        return {k: v * norm for k, v in betweenness.items()}
-
-    def closeness_centrality(self) -> dict[str, float]:
-        result: dict[str, float] = {}
-        for source in self._graph.nodes:
-            dist: dict[str, int] = {source: 0}
-            queue = deque([source])
-            while queue:
-                current = queue.popleft()
-                for neighbor, _ in self._graph.get_neighbors(current):
-                    if neighbor not in dist:
-                        dist[neighbor] = dist[current] + 1
-                        queue.append(neighbor)
-            total_dist = sum(dist.values())
-            n = self._graph.node_count - 1
-            result[source] = n / total_dist if total_dist > 0 else 0.0
-        return result
+        return total * norm
+
+    @staticmethod
+    def _chunks(sources: np.ndarray, n_jobs: int) -> list[np.ndarray]:
+        # Interleaved so that each chunk gets a similar mix of cheap and expensive sources.
+        n_chunks = min(len(sources), 1 if n_jobs <= 1 else 4 * n_jobs)
+        return [sources[i::n_chunks] for i in range(n_chunks)]
+
+    def _map_sources(self, worker: Any, sources: np.ndarray, weighted: bool, n_jobs: int,
+                     graph: Optional[CSRGraph] = None) -> list[np.ndarray]:
+        chunks = self._chunks(sources, n_jobs)
+        job = {"graph": graph or self.csr, "weighted": weighted}
+        if n_jobs > 1 and len(chunks) > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the graph through the initializer; only chunks are pickled.
+            context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(min(n_jobs, len(chunks)), mp_context=context,
+                                     initializer=_init_centrality_worker, initargs=(job,)) as pool:
+                return list(pool.map(_centrality_worker, [(worker, chunk) for chunk in chunks]))
+        return [worker(job, chunk) for chunk in chunks]
 
     def eigenvector_centrality(self, iterations: int = 100, tolerance: float = 1e-6) -> dict[str, float]:
         nodes = self._graph.nodes
@@ -765,14 +1319,24 @@ def main() -> None:
     for node, score in pr_result.top_nodes(5):
         print(f"    {node}: {score:.4f}")
 
+    # Compact CSR graph
+    print("\n--- CSR Graph ---")
+    csr = graph.to_csr()
+    print(f"  Nodes: {csr.node_count}, Edges: {csr.edge_count}, Arrays: {csr.nbytes} bytes")
+    print(f"  In-degree: {csr.to_dict(csr.in_degree())}")
+    ppr = pr.personalized_pr(csr, {"A": 1.0})
+    print(f"  Personalized PageRank from A: {[(n, round(s, 4)) for n, s in ppr.top_nodes(3)]}")
+
     # Louvain Community Detection
     print("\n--- Louvain Community Detection ---")
     undirected = AdjacencyListGraph(directed=False)
     for edge in graph.get_all_edges():
         undirected.add_edge(edge.source, edge.target, edge.weight)
-    louvain = LouvainCommunity(resolution=1.0)
+    louvain = LouvainCommunity(resolution=1.0, seed=42)
     comm_result = louvain.detect(undirected)
-    print(f"  Communities: {comm_result.num_communities}, Modularity: {comm_result.modularity:.4f}")
+    print(f"  Communities: {comm_result.num_communities}, Modularity: {comm_result.modularity:.4f}, Levels: {comm_result.levels}")
+    leiden_result = LouvainCommunity(resolution=1.0, seed=42, refine=True).detect(undirected)
+    print(f"  With Leiden refinement: {leiden_result.num_communities} communities, Modularity: {leiden_result.modularity:.4f}")
     for cid in range(comm_result.num_communities):
         members = comm_result.get_community_members(cid)
         print(f"    Community {cid}: {members}")
@@ -793,6 +1357,9 @@ def main() -> None:
 
     fw = FloydWarshall()
     fw_results = fw.compute(graph)
+    csr_result = dijkstra.compute(csr, "A")
+    print(f"  Dijkstra over CSR A->G: dist={csr_result.distance_to('G')}, path={' -> '.join(csr_result.path_to('G'))}")
+
     print(f"  Floyd-Warshall A->G: {fw_results['A'].distance_to('G')}")
 
     # Centrality
@@ -808,6 +1375,9 @@ def main() -> None:
     for node, score in sorted(betweenness.items(), key=lambda x: x[1], reverse=True)[:5]:
         print(f"    {node}: {score:.4f}")
 
+    weighted_betweenness = cent.betweenness_centrality(weighted=True)
+    print(f"  Weighted betweenness (top 3): {[(n, round(s, 4)) for n, s in sorted(weighted_betweenness.items(), key=lambda x: x[1], reverse=True)[:3]]}")
+
     closeness = cent.closeness_centrality()
     print("  Closeness centrality:")
     for node, score in sorted(closeness.items(), key=lambda x: x[1], reverse=True)[:5]:
@@ -9,14 +9,19 @@ from __future__ import annotations
 
 import math
 import hashlib
+import multiprocessing
 import random
 from enum import Enum, auto
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from collections import defaultdict
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
 import json as json
 
+import numpy as np
+
 logger = __import__("logging").getLogger(__name__)
 
 
@@ -150,6 +155,7 @@ class EmbeddingConfig:
     p: float = 1.0       # Node2Vec return parameter
     q: float = float("inf")  # Node2Vec in-out parameter
     epochs: int = 10
+    negative_samples: int = 5  # Noise contexts per skip-gram pair
 
 
 @dataclass
@@ -380,116 +386,325 @@ class EntityLinker:
 # Graph Embedder
 # ---------------------------------------------------------------------------
 
+class NodeEmbeddings(Mapping):
+    """Read-only mapping from node to its row of an ``(n_nodes, dim)`` float32 matrix."""
+
+    def __init__(self, labels: list[str], matrix: np.ndarray) -> None:
+        self.labels = labels
+        self.matrix = matrix
+        self._index = {label: i for i, label in enumerate(labels)}
+
+    def __getitem__(self, node: str) -> np.ndarray:
+        return self.matrix[self._index[node]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.labels)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._index
+
+    def index(self, node: str) -> int:
+        return self._index[node]
+
+
+# Walk graph and settings of a pool worker process, set once by its initializer.
+# Each pool forks its own workers, so concurrent embedders never share this.
+_WORKER_JOB: dict[str, Any] = {}
+
+# Walks per worker task; fixed so that the walks do not depend on the number of processes.
+_WALK_CHUNK = 4096
+
+# Skip-gram pairs per vectorized SGD step.
+_SGNS_BATCH = 4096
+
+# Rejected second-order proposals are redrawn at most this many times; walkers
+# still pending then sample their row exactly.
+_MAX_REJECTIONS = 64
+
+
+def _alias_tables(indptr: np.ndarray, weights: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Per-row alias tables (Vose) over the arcs of a CSR graph.
+
+    Returns ``(prob, alias)`` indexed by arc: pick a uniform slot ``j`` of
+    the row, keep it with probability ``prob``, otherwise take slot
+    ``alias``. Rows with equal weights, the usual unweighted case, need no
+    table and keep every slot.
+    """
+    prob = np.ones(len(weights))
+    alias = np.zeros(len(weights), dtype=np.int32)
+    starts, degree = indptr[:-1], np.diff(indptr)
+    rows = np.flatnonzero(degree > 1)
+    if rows.size == 0:
+        return prob, alias
+    uneven = rows[np.maximum.reduceat(weights, starts[rows]) != np.minimum.reduceat(weights, starts[rows])]
+    for row in uneven.tolist():
+        lo, hi = int(indptr[row]), int(indptr[row + 1])
+        scaled = weights[lo:hi] * ((hi - lo) / weights[lo:hi].sum())
+        small = [j for j, x in enumerate(scaled) if x < 1.0]
+        large = [j for j, x in enumerate(scaled) if x >= 1.0]
+        while small and large:
+            j, k = small.pop(), large[-1]
+            prob[lo + j] = scaled[j]
+            alias[lo + j] = k
+            scaled[k] -= 1.0 - scaled[j]
+            if scaled[k] < 1.0:
+                small.append(large.pop())
+    return prob, alias
+
+
+def _init_walk_worker(job: dict[str, Any]) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+
+
+def _walk_worker(task: tuple[np.ndarray, np.random.SeedSequence]) -> np.ndarray:
+    return _walk_chunk(_WORKER_JOB, task)
+
+
+def _walk_chunk(job: dict[str, Any], task: tuple[np.ndarray, np.random.SeedSequence]) -> np.ndarray:
+    """Advance every walk in the chunk one step at a time; dead ends pad with -1.
+
+    A second-order step draws a first-order proposal from the alias table
+    and accepts it with probability alpha / max(alpha). Alpha is 1/p to
+    return, 1 to stay next to the previous node and 1/q to move away
+    (rejection sampling as in KnightKing, Yang et al., 2019). This is exact
+    and needs only O(E) memory, where per-edge second-order tables need
+    O(sum of squared degrees). "Is x a neighbour of prev" is a binary
+    search over the sorted ``row * n + col`` arc keys. Walkers still
+    rejected after ``_MAX_REJECTIONS`` draws, typically because most of
+    their row has alpha 0, sample the alpha-weighted row directly; a row
+    with no weight left ends the walk.
+    """
+    starts, seed = task
+    indptr, indices, weights = job["indptr"], job["indices"], job["weights"]
+    prob, alias, keys = job["prob"], job["alias"], job["keys"]
+    n, length, second_order = job["n"], job["length"], job["second_order"]
+    alpha_return, alpha_out = job["alpha_return"], job["alpha_out"]
+    alpha_max = max(alpha_return, 1.0, alpha_out)
+    rng = np.random.default_rng(seed)
+
+    def propose(current: np.ndarray) -> np.ndarray:
+        lo = indptr[current]
+        arc = lo + (rng.random(len(current)) * (indptr[current + 1] - lo)).astype(np.int64)
+        keep = rng.random(len(current)) < prob[arc]
+        return indices[np.where(keep, arc, lo + alias[arc])]
+
+    def adjacent(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        wanted = a.astype(np.int64) * n + b
+        pos = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+        return keys[pos] == wanted
+
+    def bias(back: np.ndarray, candidate: np.ndarray) -> np.ndarray:
+        return np.where(candidate == back, alpha_return,
+                        np.where(adjacent(back, candidate), 1.0, alpha_out))
+
+    def exact(node: int, back: int) -> int:
+        lo, hi = indptr[node], indptr[node + 1]
+        heads = indices[lo:hi]
+        cumulative = np.cumsum(weights[lo:hi] * bias(np.full(hi - lo, back), heads))
+        if cumulative[-1] <= 0:
+            return -1
+        pick = np.searchsorted(cumulative, rng.random() * cumulative[-1], side="right")
+        return int(heads[min(pick, len(heads) - 1)])
+
+    walks = np.full((len(starts), length), -1, dtype=np.int32)
+    walks[:, 0] = starts
+    live = np.flatnonzero(indptr[starts + 1] > indptr[starts])
+    current = starts[live].astype(np.int64)
+    previous = np.full(len(live), -1, dtype=np.int64)
+    for step in range(1, length):
+        if live.size == 0:
+            break
+        chosen = propose(current)
+        if second_order and step > 1:
+            pending = np.arange(len(live))
+            for _ in range(_MAX_REJECTIONS):
+                alpha = bias(previous[pending], chosen[pending])
+                pending = pending[rng.random(len(pending)) * alpha_max >= alpha]
+                if pending.size == 0:
+                    break
+                chosen[pending] = propose(current[pending])
+            else:
+                for i in pending.tolist():
+                    chosen[i] = exact(current[i], previous[i])
+        walks[live, step] = chosen
+        moving = chosen >= 0
+        live, previous, current = live[moving], current[moving], chosen[moving].astype(np.int64)
+    return walks
+
+
 class GraphEmbedder:
-    """Learns vector embeddings for graph nodes."""
+    """Learns vector embeddings for graph nodes.
+
+    ``fit`` freezes the graph into a CSR with alias tables and generates
+    walks with many walkers advancing at once, optionally across processes.
+    It then trains skip-gram with negative sampling on numpy minibatches.
+    Embeddings live in one ``(n_nodes, dim)`` float32 matrix.
+    """
 
     def __init__(self, config: Optional[EmbeddingConfig] = None) -> None:
         self._config = config or EmbeddingConfig(method=EmbeddingMethod.NODE2VEC)
-        self._embeddings: dict[str, list[float]] = {}
+        self._embeddings = NodeEmbeddings([], np.zeros((0, self._config.dimensions), dtype=np.float32))
+        self._norms = np.zeros(0, dtype=np.float32)
         self._adjacency: dict[str, list[str]] = defaultdict(list)
+        self._weights: dict[str, list[float]] = defaultdict(list)
 
-    def add_edge(self, source: str, target: str) -> None:
+    def add_edge(self, source: str, target: str, weight: float = 1.0) -> None:
         self._adjacency[source].append(target)
         self._adjacency[target].append(source)
-
-    def _random_walk(self, start: str, length: int) -> list[str]:
-        walk = [start]
-        current = start
-        for _ in range(length - 1):
-            neighbors = self._adjacency.get(current, [])
-            if not neighbors:
-                break
-            current = random.choice(neighbors)
-            walk.append(current)
-        return walk
-
-    def _node2vec_walk(self, start: str, length: int) -> list[str]:
-        walk = [start]
-        prev = None
-        current = start
-        for _ in range(length - 1):
-            neighbors = self._adjacency.get(current, [])
-            if not neighbors:
-                break
-            if prev is None:
-                next_node = random.choice(neighbors)
-            else:
-                probs: list[tuple[str, float]] = []
-                for neighbor in neighbors:
-                    if neighbor == prev:
-                        weight = 1.0 / self._config.p
-                    elif neighbor in self._adjacency.get(prev, []):
-                        weight = 1.0
-                    else:
-                        weight = 1.0 / self._config.q
-                    probs.append((neighbor, weight))
-                total = sum(w for _, w in probs)
-                r = random.random() * total
-                cumulative = 0.0
-                next_node = neighbors[0]
-                for neighbor, weight in probs:
-                    cumulative += weight
-                    if cumulative >= r:
-                        next_node = neighbor
-                        break
-            prev = current
-            current = next_node
-            walk.append(current)
-        return walk
-
-    def fit(self, nodes: list[str]) -> dict[str, list[float]]:
-        all_walks: list[list[str]] = []
-        for _ in range(self._config.num_walks):
-            for node in nodes:
-                if self._config.method == EmbeddingMethod.NODE2VEC:
-                    walk = self._node2vec_walk(node, self._config.walk_length)
-                else:
-                    walk = self._random_walk(node, self._config.walk_length)
-                all_walks.append(walk)
-
-        vocab = {node: i for i, node in enumerate(nodes)}
-        dim = self._config.dimensions
-        vectors = {node: [random.gauss(0, 0.1) for _ in range(dim)] for node in nodes}
-
-        for epoch in range(self._config.epochs):
-            for walk in all_walks:
-                for i, center in enumerate(walk):
-                    window = walk[max(0, i - self._config.window_size):i + self._config.window_size + 1]
-                    for context in window:
-                        if context != center:
-                            ci = vocab.get(center)
-                            cj = vocab.get(context)
-                            if ci is not None and cj is not None:
-                                error = [vectors[context][d] - vectors[center][d] for d in range(dim)]
-                                for d in range(dim):
-                                    vectors[center][d] -= self._config.learning_rate * error[d]
-                                    vectors[context][d] -= self._config.learning_rate * error[d]
-
-        self._embeddings = vectors
-        return vectors
+        self._weights[source].append(weight)
+        self._weights[target].append(weight)
+
+    def fit(self, nodes: list[str], n_jobs: int = 1, seed: Optional[int] = None) -> NodeEmbeddings:
+        """Embed ``nodes`` from ``num_walks`` walks started at each of them.
+
+        Walks may pass through other nodes; those positions are skipped in
+        training. Walk chunks run in ``n_jobs`` forked processes, and each
+        chunk has its own child seed, so results do not depend on ``n_jobs``.
+        """
+        vocab = list(dict.fromkeys(nodes))
+        known = set(vocab)
+        labels = vocab + [node for node in self._adjacency if node not in known]
+        walk_seed, train_seed = np.random.SeedSequence(seed).spawn(2)
+        walks = self._generate_walks(labels, len(vocab), n_jobs, walk_seed)
+        matrix = self._train_skipgram(walks, len(vocab), np.random.default_rng(train_seed))
+        self._embeddings = NodeEmbeddings(vocab, matrix)
+        self._norms = np.linalg.norm(matrix, axis=1)
+        return self._embeddings
+
+    def _generate_walks(self, labels: list[str], n_starts: int, n_jobs: int,
+                        seed: np.random.SeedSequence) -> np.ndarray:
+        index = {label: i for i, label in enumerate(labels)}
+        n = len(labels)
+        src = np.fromiter((index[u] for u in labels if u in self._adjacency
+                           for _ in self._adjacency[u]), dtype=np.int64)
+        dst = np.fromiter((index[v] for u in labels if u in self._adjacency
+                           for v in self._adjacency[u]), dtype=np.int64)
+        wts = np.fromiter((w for u in labels if u in self._adjacency
+                           for w in self._weights[u]), dtype=np.float64)
+        order = np.lexsort((dst, src))
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+        indices = dst[order].astype(np.int32)
+        prob, alias = _alias_tables(indptr, wts[order])
+
+        config = self._config
+        starts = np.tile(np.arange(n_starts, dtype=np.int32), config.num_walks)
+        chunks = [starts[i:i + _WALK_CHUNK] for i in range(0, len(starts), _WALK_CHUNK)]
+        tasks = list(zip(chunks, seed.spawn(len(chunks))))
+        job = {
+            "indptr": indptr, "indices": indices, "weights": wts[order], "prob": prob, "alias": alias,
+            "keys": src[order] * n + dst[order], "n": n, "length": config.walk_length,
+            "second_order": config.method == EmbeddingMethod.NODE2VEC,
+            "alpha_return": 1.0 / config.p, "alpha_out": 1.0 / config.q,
+        }
+        if n_jobs > 1 and len(tasks) > 1 and "fork" in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the walk graph through the initializer; only tasks are pickled.
+            with ProcessPoolExecutor(min(n_jobs, len(tasks)), mp_context=multiprocessing.get_context("fork"),
+                                     initializer=_init_walk_worker, initargs=(job,)) as pool:
+                parts = list(pool.map(_walk_worker, tasks))
+        else:
+            parts = [_walk_chunk(job, task) for task in tasks]
+        return np.concatenate(parts) if parts else np.zeros((0, config.walk_length), dtype=np.int32)
+
+    def _train_skipgram(self, walks: np.ndarray, n_vocab: int, rng: np.random.Generator) -> np.ndarray:
+        """Skip-gram with negative sampling over minibatches of (center, context) pairs.
+
+        Pairs come from every offset up to ``window_size`` in both directions
+        and are built one block of walks at a time, so memory stays bounded by
+        the walk corpus. Noise contexts are drawn from an alias table over walk
+        frequency ** 0.75, and the learning rate decays linearly with the
+        walks processed, as in word2vec.
+        """
+        config = self._config
+        dim = config.dimensions
+        w_in = ((rng.random((n_vocab, dim), dtype=np.float32) - 0.5) / dim).astype(np.float32)
+        w_out = np.zeros((n_vocab, dim), dtype=np.float32)
+        walks = np.where(walks < n_vocab, walks, -1)
+        counts = np.bincount(walks[walks >= 0], minlength=n_vocab).astype(np.float64) ** 0.75
+        if n_vocab == 0 or counts.sum() == 0:
+            return w_in
+        noise_prob, noise_alias = _alias_tables(np.array([0, n_vocab]), counts)
+
+        # Updates to a row hit several times in one step add up, so keep steps
+        # to about one hit per row or small vocabularies overshoot and diverge.
+        batch_size = max(1, min(_SGNS_BATCH, n_vocab // (config.negative_samples + 1)))
+        window = min(config.window_size, walks.shape[1] - 1)
+        block = max(1, _SGNS_BATCH // max(1, 2 * window))
+        total = config.epochs * len(walks)
+        done = 0
+        for _ in range(config.epochs):
+            order = rng.permutation(len(walks))
+            for first in range(0, len(walks), block):
+                chunk = walks[order[first:first + block]]
+                centers, contexts = [], []
+                for offset in range(1, window + 1):
+                    a, b = chunk[:, :-offset].ravel(), chunk[:, offset:].ravel()
+                    valid = (a >= 0) & (b >= 0) & (a != b)
+                    centers += [a[valid], b[valid]]
+                    contexts += [b[valid], a[valid]]
+                if not centers:
+                    continue
+                centers, contexts = np.concatenate(centers), np.concatenate(contexts)
+                lr = np.float32(config.learning_rate * max(1e-4, 1.0 - done / total))
+                done += len(chunk)
+                shuffle = rng.permutation(len(centers))
+                for start in range(0, len(centers), batch_size):
+                    batch = shuffle[start:start + batch_size]
+                    slot = rng.integers(n_vocab, size=(len(batch), config.negative_samples))
+                    negatives = np.where(rng.random(slot.shape) < noise_prob[slot], slot, noise_alias[slot])
+                    self._sgns_step(w_in, w_out, centers[batch], contexts[batch], negatives, lr)
+        return w_in
+
+    @staticmethod
+    def _sgns_step(w_in: np.ndarray, w_out: np.ndarray, centers: np.ndarray, contexts: np.ndarray,
+                   negatives: np.ndarray, lr: np.float32) -> None:
+        u = w_in[centers]
+        v = w_out[contexts]
+        v_neg = w_out[negatives]
+        positive = 1.0 / (1.0 + np.exp(-np.clip(np.einsum("bd,bd->b", u, v), -6, 6)))
+        negative = 1.0 / (1.0 + np.exp(-np.clip(np.einsum("bd,bkd->bk", u, v_neg), -6, 6)))
+        g_pos = ((1.0 - positive) * lr).astype(np.float32)
+        g_neg = (-negative * lr).astype(np.float32)
+        grad_u = g_pos[:, None] * v + np.einsum("bk,bkd->bd", g_neg, v_neg)
+        grad_out = np.concatenate([g_pos[:, None], g_neg], axis=1)[:, :, None] * u[:, None, :]
+        np.add.at(w_out, np.concatenate([contexts[:, None], negatives], axis=1).ravel(),
+                  grad_out.reshape(-1, u.shape[1]))
+        np.add.at(w_in, centers, grad_u)
 
     def get_embedding(self, node: str) -> Optional[list[float]]:
-        return self._embeddings.get(node)
+        if node not in self._embeddings:
+            return None
+        return self._embeddings[node].tolist()
 
     def similarity(self, node_a: str, node_b: str) -> float:
-        emb_a = self._embeddings.get(node_a)
-        emb_b = self._embeddings.get(node_b)
-        if not emb_a or not emb_b:
+        if node_a not in self._embeddings or node_b not in self._embeddings:
             return 0.0
-        dot = sum(a * b for a, b in zip(emb_a, emb_b))
-        norm_a = math.sqrt(sum(a ** 2 for a in emb_a))
-        norm_b = math.sqrt(sum(b ** 2 for b in emb_b))
-        if norm_a == 0 or norm_b == 0:
+        i, j = self._embeddings.index(node_a), self._embeddings.index(node_b)
+        if self._norms[i] == 0 or self._norms[j] == 0:
             return 0.0
-        return dot / (norm_a * norm_b)
+        matrix = self._embeddings.matrix
+        return float(matrix[i] @ matrix[j] / (self._norms[i] * self._norms[j]))
 
     def nearest_neighbors(self, node: str, k: int = 5) -> list[tuple[str, float]]:
-        scores = []
-        for other in self._embeddings:
-            if other != node:
-                scores.append((other, self.similarity(node, other)))
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores[:k]
+        if node not in self._embeddings:
+            return []
+        i = self._embeddings.index(node)
+        matrix = self._embeddings.matrix
+        if self._norms[i] == 0:
+            return []
+        scores = matrix @ matrix[i] / np.where(self._norms > 0, self._norms * self._norms[i], np.inf)
+        scores[i] = -np.inf
+        k = min(k, len(scores) - 1)
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        labels = self._embeddings.labels
+        return [(labels[j], float(scores[j])) for j in top.tolist()]
 
 
 # ---------------------------------------------------------------------------
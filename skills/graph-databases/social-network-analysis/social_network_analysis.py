@@ -7,14 +7,19 @@ influence metrics, clustering coefficients, and structural analysis.
 
 from __future__ import annotations
 
+import heapq
 import math
+import multiprocessing
 import random
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum, auto
 from dataclasses import dataclass, field
 from typing import Any, Optional
 from collections import defaultdict, deque
 from itertools import combinations
 
+import numpy as np
+
 logger = __import__("logging").getLogger(__name__)
 
 
@@ -42,6 +47,11 @@ class InfluenceModel(Enum):
     LINEAR_THRESHOLD = auto()
 
 
+class SpreadEstimator(Enum):
+    LIVE_EDGE = auto()
+    REVERSE_REACHABLE = auto()
+
+
 class NetworkProperty(Enum):
     DENSITY = auto()
     CLUSTERING_COEFFICIENT = auto()
@@ -107,6 +117,21 @@ class CentralityResult:
     rank: int = 0
 
 
+@dataclass
+class CentralityEstimate:
+    """Pivot-sampled centrality with an additive error bound.
+
+    With probability at least ``1 - delta`` every score is within ``epsilon``
+    of its exact value (betweenness), or every average distance is within
+    ``epsilon`` times the diameter of its exact value (closeness).
+    """
+    results: list[CentralityResult]
+    pivots: int
+    epsilon: float
+    delta: float
+    exact: bool = False
+
+
 @dataclass
 class InfluenceResult:
     seed_nodes: list[str]
@@ -115,6 +140,23 @@ class InfluenceResult:
     rounds: int = 0
 
 
+@dataclass
+class SpreadEstimate:
+    seed_nodes: list[str]
+    mean: float
+    std_error: float
+    n_simulations: int
+
+
+@dataclass
+class SeedSelection:
+    seeds: list[str]
+    marginal_gains: list[float]
+    spread: float
+    evaluations: int
+    estimator: SpreadEstimator
+
+
 @dataclass
 class NetworkMetrics:
     num_nodes: int
@@ -140,6 +182,7 @@ class SocialNetworkGraph:
         self._edge_weights: dict[tuple[str, str], float] = {}
         self._directed = directed
         self._edges: list[SocialEdge] = []
+        self._compact: Optional[CompactGraph] = None
 
     @property
     def nodes(self) -> list[SocialNode]:
@@ -157,8 +200,10 @@ class SocialNetworkGraph:
 
     def add_node(self, node: SocialNode) -> None:
         self._nodes[node.id] = node
+        self._compact = None
 
     def add_edge(self, edge: SocialEdge) -> None:
+        self._compact = None
         self._nodes[edge.source].degree += 1
         self._nodes[edge.target].degree += 1
         self._adjacency[edge.source].add(edge.target)
@@ -179,17 +224,217 @@ class SocialNetworkGraph:
     def get_common_neighbors(self, node_a: str, node_b: str) -> set[str]:
         return self._adjacency.get(node_a, set()) & self._adjacency.get(node_b, set())
 
+    def to_compact(self) -> CompactGraph:
+        """CSR snapshot of the graph, cached until the next ``add_node``/``add_edge``."""
+        if self._compact is None:
+            self._compact = CompactGraph.from_social(self)
+        return self._compact
+
+
+class CompactGraph:
+    """Read-only CSR snapshot of a ``SocialNetworkGraph`` with int32 node ids.
+
+    Neighbours of id ``i`` are ``indices[indptr[i]:indptr[i + 1]]`` with
+    matching float32 ``weights``; ``labels[i]`` is the node id it stands for.
+    """
+
+    def __init__(self, labels: list[str], indptr: np.ndarray, indices: np.ndarray,
+                 weights: np.ndarray) -> None:
+        self.labels = labels
+        self.indptr = indptr
+        self.indices = indices
+        self.weights = weights
+
+    @classmethod
+    def from_social(cls, graph: SocialNetworkGraph) -> CompactGraph:
+        labels = [node.id for node in graph.nodes]
+        index = {label: i for i, label in enumerate(labels)}
+        indptr = np.zeros(len(labels) + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum([len(graph.get_neighbors(label)) for label in labels])
+        indices = np.empty(indptr[-1], dtype=np.int32)
+        weights = np.empty(indptr[-1], dtype=np.float32)
+        for i, label in enumerate(labels):
+            neighbors = graph.get_neighbors(label)
+            indices[indptr[i]:indptr[i + 1]] = [index[v] for v in neighbors]
+            weights[indptr[i]:indptr[i + 1]] = [graph.get_weight(label, v) for v in neighbors]
+        return cls(labels, indptr, indices, weights)
+
+    @property
+    def node_count(self) -> int:
+        return len(self.labels)
+
+    def degree(self) -> np.ndarray:
+        return np.diff(self.indptr)
+
+    def out_arcs(self, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(positions, arcs)``: for each edge leaving ``nodes``, the index
+        into ``nodes`` it leaves from and its offset into ``indices``."""
+        starts = self.indptr[nodes]
+        counts = self.indptr[nodes + 1] - starts
+        total = int(counts.sum())
+        arcs = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        return np.repeat(np.arange(len(nodes)), counts), arcs
+
+    def out_edges(self, nodes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(tails, heads, weights)`` of every edge leaving ``nodes``."""
+        positions, arcs = self.out_arcs(nodes)
+        return nodes[positions], self.indices[arcs], self.weights[arcs]
+
 
 # ---------------------------------------------------------------------------
 # Centrality Calculator
 # ---------------------------------------------------------------------------
 
+# Shared inputs of a pool worker process, set once by its initializer. Each
+# pool forks its own workers, so concurrent calls never share this.
+_WORKER_JOB: dict[str, Any] = {}
+
+
+def _init_worker(job: dict[str, Any]) -> None:
+    global _WORKER_JOB
+    _WORKER_JOB = job
+
+
+def _run_worker(task: tuple[Any, Any]) -> Any:
+    worker, chunk = task
+    return worker(_WORKER_JOB, chunk)
+
+
+def _fork_map(worker: Any, chunks: list[Any], job: dict[str, Any], n_jobs: int) -> list[Any]:
+    """Map ``worker(job, chunk)`` over ``chunks`` in forked processes, or in this one when ``n_jobs <= 1``.
+
+    Forked workers inherit ``job`` through the pool initializer, so only the
+    chunks are pickled.
+    """
+    if n_jobs > 1 and len(chunks) > 1 and "fork" in multiprocessing.get_all_start_methods():
+        workers = min(n_jobs, len(chunks))
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("fork"),
+                                 initializer=_init_worker, initargs=(job,)) as pool:
+            return list(pool.map(_run_worker, [(worker, chunk) for chunk in chunks]))
+    return [worker(job, chunk) for chunk in chunks]
+
+
+# _settle, _dependencies, _betweenness_partial, _distance_sums and _pivot_count
+# are copies of those in graph-algorithms/graph_algorithms.py, since each skill
+# is loaded as a standalone module. Change both copies together.
+
+
+def _settle(csr: CompactGraph, source: int, weighted: bool, dist: np.ndarray) -> np.ndarray:
+    """Write shortest distances from ``source`` into ``dist`` (all ``inf`` on entry).
+
+    Returns the reached nodes in non-decreasing distance order. Unweighted
+    search expands one BFS frontier per numpy step; weighted search is
+    Dijkstra with vectorized relaxation.
+    """
+    dist[source] = 0.0
+    if not weighted:
+        frontier = np.array([source], dtype=np.int32)
+        order = [frontier]
+        level = 0.0
+        while True:
+            level += 1.0
+            _, heads, _ = csr.out_edges(frontier)
+            frontier = np.unique(heads[dist[heads] == np.inf])
+            if frontier.size == 0:
+                return np.concatenate(order)
+            dist[frontier] = level
+            order.append(frontier)
+
+    indptr, indices, weights = csr.indptr, csr.indices, csr.weights
+    settled: list[int] = []
+    heap: list[tuple[float, int]] = [(0.0, source)]
+    done: set[int] = set()
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        settled.append(u)
+        lo, hi = indptr[u], indptr[u + 1]
+        if lo == hi:
+            continue
+        heads = indices[lo:hi]
+        candidate = weights[lo:hi].astype(np.float64) + d
+        improved = candidate < dist[heads]
+        if improved.any():
+            heads, candidate = heads[improved], candidate[improved]
+            np.minimum.at(dist, heads, candidate)
+            for item in zip(candidate.tolist(), heads.tolist()):
+                heapq.heappush(heap, item)
+    return np.array(settled, dtype=np.int32)
+
+
+def _dependencies(csr: CompactGraph, order: np.ndarray, weighted: bool, dist: np.ndarray,
+                  sigma: np.ndarray, delta: np.ndarray) -> None:
+    """Brandes' path counting and dependency accumulation, one distance level at a time.
+
+    ``order`` comes from ``_settle``. Nodes at equal distance form a level;
+    shortest-path DAG edges run from one level to a later one, so each level
+    is a single vectorized update in either direction.
+    """
+    sigma[order[0]] = 1.0
+    cuts = np.flatnonzero(np.diff(dist[order])) + 1
+    dag: list[tuple[np.ndarray, np.ndarray]] = []
+    for level in np.split(order, cuts):
+        tails, heads, w = csr.out_edges(level)
+        step = w.astype(np.float64) if weighted else 1.0
+        on_dag = dist[tails] + step == dist[heads]
+        tails, heads = tails[on_dag], heads[on_dag]
+        np.add.at(sigma, heads, sigma[tails])
+        dag.append((tails, heads))
+    for tails, heads in reversed(dag):
+        np.add.at(delta, tails, sigma[tails] / sigma[heads] * (1.0 + delta[heads]))
+
+
+def _betweenness_partial(job: dict[str, Any], sources: np.ndarray) -> np.ndarray:
+    """Sum of dependencies over ``sources``; buffers are reset per source, not reallocated."""
+    csr: CompactGraph = job["graph"]
+    weighted: bool = job["weighted"]
+    n = csr.node_count
+    dist, sigma, delta = np.full(n, np.inf), np.zeros(n), np.zeros(n)
+    total = np.zeros(n)
+    for source in sources.tolist():
+        order = _settle(csr, source, weighted, dist)
+        _dependencies(csr, order, weighted, dist, sigma, delta)
+        delta[source] = 0.0
+        total[order] += delta[order]
+        dist[order], sigma[order], delta[order] = np.inf, 0.0, 0.0
+    return total
+
+
+def _distance_sums(job: dict[str, Any], sources: np.ndarray) -> np.ndarray:
+    """Per-node sum of finite distances from every source."""
+    csr: CompactGraph = job["graph"]
+    weighted: bool = job["weighted"]
+    dist = np.full(csr.node_count, np.inf)
+    sums = np.zeros(csr.node_count)
+    for source in sources.tolist():
+        order = _settle(csr, source, weighted, dist)
+        sums[order] += dist[order]
+        dist[order] = np.inf
+    return sums
+
+
+def _pivot_count(n: int, epsilon: float, delta: float) -> int:
+    """Pivots for a Hoeffding plus union bound over ``n`` nodes (Brandes & Pich, 2007)."""
+    return math.ceil(math.log(2 * n / delta) / (2 * epsilon * epsilon))
+
+
 class CentralityCalculator:
-    """Computes various centrality measures on social graphs."""
+    """Computes various centrality measures on social graphs.
+
+    Betweenness and closeness run over the graph's cached ``CompactGraph``
+    snapshot, which is rebuilt after the graph changes, with sources split across ``n_jobs`` forked processes.
+    ``weighted=True`` treats edge weights as lengths.
+    """
 
     def __init__(self, graph: SocialNetworkGraph) -> None:
         self._graph = graph
 
+    @property
+    def compact(self) -> CompactGraph:
+        return self._graph.to_compact()
+
     def degree_centrality(self) -> list[CentralityResult]:
         n = self._graph.node_count - 1
         if n == 0:
@@ -203,71 +448,71 @@ class CentralityCalculator:
             r.rank = i + 1
         return results
 
-    def betweenness_centrality(self, sample_size: int = 0) -> list[CentralityResult]:
-        betweenness: dict[str, float] = defaultdict(float)
-        nodes = self._graph.nodes
-        sample = nodes
-        if sample_size > 0 and sample_size < len(nodes):
-            sample = random.sample(nodes, sample_size)
-
-        for source in sample:
-            stack: list[str] = []
-            predecessors: dict[str, list[str]] = defaultdict(list)
-            sigma: dict[str, float] = {n.id: 0 for n in nodes}
-            sigma[source.id] = 1
-            distance: dict[str, int] = {n.id: -1 for n in nodes}
-            distance[source.id] = 0
-            queue = deque([source.id])
-
-            while queue:
-                v = queue.popleft()
-                stack.append(v)
-                for w in self._graph.get_neighbors(v):
-                    if distance[w] < 0:
-                        distance[w] = distance[v] + 1
-                        queue.append(w)
-                    if distance[w] == distance[v] + 1:
-                        sigma[w] += sigma[v]
-                        predecessors[w].append(v)
-
-            delta: dict[str, float] = {n.id: 0 for n in nodes}
-            while stack:
-                w = stack.pop()
-                for v in predecessors[w]:
-                    delta[v] += (sigma[v] / sigma[w]) * (1 + delta[w])
-                if w != source.id:
-                    betweenness[w] += delta[w]
-
-        n = self._graph.node_count
+    def betweenness_centrality(self, sample_size: int = 0, weighted: bool = False,
+                               n_jobs: int = 1, seed: Optional[int] = None) -> list[CentralityResult]:
+        """Brandes betweenness; ``0 < sample_size < n`` scales a distinct-pivot sample by ``n / sample_size``."""
+        n = self.compact.node_count
+        if 0 < sample_size < n:
+            pivots = np.random.default_rng(seed).choice(n, size=sample_size, replace=False)
+            scores = self._betweenness(pivots, weighted, n_jobs) * (n / sample_size)
+        else:
+            scores = self._betweenness(np.arange(n), weighted, n_jobs)
+        return self._ranked(CentralityType.BETWEENNESS, scores)
+
+    def approximate_betweenness(self, epsilon: float = 0.05, delta: float = 0.1,
+                                weighted: bool = False, n_jobs: int = 1,
+                                seed: Optional[int] = None) -> CentralityEstimate:
+        """Betweenness from ``ln(2n / delta) / (2 epsilon^2)`` uniformly drawn pivots."""
+        n = self.compact.node_count
+        k = _pivot_count(max(n, 1), epsilon, delta)
+        if k >= n:
+            return CentralityEstimate(self.betweenness_centrality(0, weighted, n_jobs), n, 0.0, 0.0, exact=True)
+        pivots = np.random.default_rng(seed).integers(n, size=k)
+        scores = self._betweenness(pivots, weighted, n_jobs) * (n / k)
+        return CentralityEstimate(self._ranked(CentralityType.BETWEENNESS, scores), k, epsilon, delta)
+
+    def closeness_centrality(self, weighted: bool = False, n_jobs: int = 1) -> list[CentralityResult]:
+        n = self.compact.node_count
+        totals = sum(self._map_sources(_distance_sums, np.arange(n), weighted, n_jobs), np.zeros(n))
+        return self._ranked(CentralityType.CLOSENESS, self._closeness(totals))
+
+    def approximate_closeness(self, epsilon: float = 0.05, delta: float = 0.1,
+                              weighted: bool = False, n_jobs: int = 1,
+                              seed: Optional[int] = None) -> CentralityEstimate:
+        """Closeness from distances to sampled pivots (Eppstein & Wang, 2004)."""
+        n = self.compact.node_count
+        k = _pivot_count(max(n, 1), epsilon, delta)
+        if k >= n:
+            return CentralityEstimate(self.closeness_centrality(weighted, n_jobs), n, 0.0, 0.0, exact=True)
+        pivots = np.random.default_rng(seed).integers(n, size=k)
+        totals = sum(self._map_sources(_distance_sums, pivots, weighted, n_jobs), np.zeros(n)) * (n / k)
+        return CentralityEstimate(self._ranked(CentralityType.CLOSENESS, self._closeness(totals)), k, epsilon, delta)
+
+    def _closeness(self, totals: np.ndarray) -> np.ndarray:
+        n = self.compact.node_count - 1
+        return np.divide(n, totals, out=np.zeros(len(totals)), where=totals > 0)
+
+    def _betweenness(self, sources: np.ndarray, weighted: bool, n_jobs: int) -> np.ndarray:
+        n = self.compact.node_count
+        total = sum(self._map_sources(_betweenness_partial, sources, weighted, n_jobs), np.zeros(n))
         norm = 1.0 / ((n - 1) * (n - 2)) if n > 2 else 1.0
-        results = []
-        for node in self._graph.nodes:
-            results.append(CentralityResult(node.id, CentralityType.BETWEENNESS, betweenness[node.id] * norm))
-        results.sort(key=lambda r: r.score, reverse=True)
-        for i, r in enumerate(results):
-            r.rank = i + 1
-        return results
+        return total * norm
 
-    def closeness_centrality(self) -> list[CentralityResult]:
-        results: list[CentralityResult] = []
-        for source in self._graph.nodes:
-            dist: dict[str, int] = {source.id: 0}
-            queue = deque([source.id])
-            while queue:
-                current = queue.popleft()
-                for neighbor in self._graph.get_neighbors(current):
-                    if neighbor not in dist:
-                        dist[neighbor] = dist[current] + 1
-                        queue.append(neighbor)
-            total_dist = sum(dist.values())
-            n = self._graph.node_count - 1
-            score = n / total_dist if total_dist > 0 else 0.0
-            results.append(CentralityResult(source.id, CentralityType.CLOSENESS, score))
+    def _ranked(self, centrality_type: CentralityType, scores: np.ndarray) -> list[CentralityResult]:
+        results = [CentralityResult(node_id, centrality_type, score)
+                   for node_id, score in zip(self.compact.labels, scores.tolist())]
         results.sort(key=lambda r: r.score, reverse=True)
         for i, r in enumerate(results):
             r.rank = i + 1
         return results
 
+    def _map_sources(self, worker: Any, sources: np.ndarray, weighted: bool,
+                     n_jobs: int) -> list[np.ndarray]:
+        # Interleaved chunks give each worker a similar mix of cheap and expensive sources.
+        n_chunks = min(len(sources), 1 if n_jobs <= 1 else 4 * n_jobs)
+        chunks = [sources[i::n_chunks] for i in range(n_chunks)]
+        return _fork_map(worker, chunks, {"graph": self.compact, "weighted": weighted}, n_jobs)
+
     def eigenvector_centrality(self, iterations: int = 100, tolerance: float = 1e-6) -> list[CentralityResult]:
         nodes = [n.id for n in self._graph.nodes]
         n = len(nodes)
@@ -385,12 +630,196 @@ class CommunityDetector:
 # Influence Propagator
 # ---------------------------------------------------------------------------
 
+# Replicas per batched cascade are capped so the visited mask stays near this many entries.
+_BATCH_ENTRIES = 1 << 24
+
+
+def _uniform(keys: np.ndarray) -> np.ndarray:
+    """Map uint64 keys to uniforms in [0, 1) with the splitmix64 finalizer."""
+    z = keys + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z = z ^ (z >> np.uint64(31))
+    return (z >> np.uint64(11)) * (1.0 / (1 << 53))
+
+
+def _live_edge_reach(graph: CompactGraph, frontier: np.ndarray, samples: np.ndarray,
+                     probability: float, max_rounds: Optional[int], salt: int,
+                     visited: np.ndarray, blocked: Optional[np.ndarray] = None) -> np.ndarray:
+    """Batched independent cascades over ``len(samples)`` live-edge graphs at once.
+
+    Replica ``r`` holds node ``v`` at flat id ``r * n + v``; ``frontier``
+    gives the flat ids of the seeds. Arc ``a`` is live in sample ``s`` when
+    ``_uniform(salt + s * E + a) < probability``, so every sample is a fixed
+    live-edge graph that costs nothing to store and reads the same in any
+    process. Nodes set in ``blocked`` are neither counted nor expanded.
+    Returns the reached flat ids, which are also set in ``visited`` (the
+    caller clears them).
+    """
+    n, n_arcs = graph.node_count, graph.indices.size
+    if blocked is not None:
+        frontier = frontier[~blocked[frontier]]
+    frontier = np.unique(frontier)
+    visited[frontier] = True
+    reached = [frontier]
+    rounds = 0
+    while frontier.size and (max_rounds is None or rounds < max_rounds):
+        rounds += 1
+        replica, node = np.divmod(frontier, n)
+        positions, arcs = graph.out_arcs(node)
+        replica = replica[positions]
+        keys = samples[replica].astype(np.uint64) * np.uint64(n_arcs) + arcs.astype(np.uint64) + np.uint64(salt)
+        live = _uniform(keys) < probability
+        heads = replica[live] * n + graph.indices[arcs[live]]
+        fresh = heads[~visited[heads]]
+        if blocked is not None:
+            fresh = fresh[~blocked[fresh]]
+        frontier = np.unique(fresh)
+        visited[frontier] = True
+        reached.append(frontier)
+    return np.concatenate(reached)
+
+
+def _spread_counts(job: dict[str, Any], samples: np.ndarray) -> np.ndarray:
+    """Number of nodes the job's seeds reach in each of ``samples``."""
+    graph: CompactGraph = job["graph"]
+    n = graph.node_count
+    block = max(1, _BATCH_ENTRIES // max(n, 1))
+    counts = np.zeros(len(samples), dtype=np.int64)
+    visited = np.zeros(min(block, len(samples)) * n, dtype=bool)
+    for first in range(0, len(samples), block):
+        batch = samples[first:first + block]
+        frontier = (np.arange(len(batch))[:, None] * n + job["sources"][None, :]).ravel()
+        reached = _live_edge_reach(graph, frontier, batch, job["probability"], job["max_rounds"],
+                                   job["salt"], visited)
+        counts[first:first + len(batch)] = np.bincount(reached // n, minlength=len(batch))
+        visited[reached] = False
+    return counts
+
+
+def _singleton_spreads(job: dict[str, Any], candidates: np.ndarray) -> np.ndarray:
+    """Mean reach of each candidate alone over all of the job's live-edge samples."""
+    graph: CompactGraph = job["graph"]
+    samples: np.ndarray = job["samples"]
+    n = graph.node_count
+    visited = np.zeros(len(samples) * n, dtype=bool)
+    offsets = np.arange(len(samples)) * n
+    spreads = np.zeros(len(candidates))
+    for i, node in enumerate(candidates.tolist()):
+        reached = _live_edge_reach(graph, offsets + node, samples, job["probability"],
+                                   job["max_rounds"], job["salt"], visited)
+        spreads[i] = reached.size / len(samples)
+        visited[reached] = False
+    return spreads
+
+
+def _rr_sets(job: dict[str, Any], set_ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Reverse-reachable sets for ``set_ids`` as ``(set id per entry, node per entry)``.
+
+    Each set starts at a hashed uniform target and follows live arcs
+    backwards; the social graph is symmetric, so that is a forward search.
+    """
+    graph: CompactGraph = job["graph"]
+    n = graph.node_count
+    block = max(1, _BATCH_ENTRIES // max(n, 1))
+    visited = np.zeros(min(block, len(set_ids)) * n, dtype=bool)
+    owners, members = [], []
+    for first in range(0, len(set_ids), block):
+        batch = set_ids[first:first + block]
+        targets = (_uniform(batch.astype(np.uint64) + np.uint64(job["target_salt"])) * n).astype(np.int64)
+        reached = _live_edge_reach(graph, np.arange(len(batch)) * n + targets, batch,
+                                   job["probability"], job["max_rounds"], job["salt"], visited)
+        visited[reached] = False
+        replica, node = np.divmod(reached, n)
+        owners.append(batch[replica])
+        members.append(node)
+    return np.concatenate(owners), np.concatenate(members)
+
+
+class _LiveEdgeGains:
+    """Marginal spread over ``R`` live-edge samples, tracking what the chosen seeds reach.
+
+    Holds two ``R x n`` boolean masks. Without a round limit, nodes the
+    seeds already reach are blocked, since nothing beyond them can be new;
+    with ``max_rounds`` the search runs in full and only uncovered nodes count.
+    """
+
+    def __init__(self, graph: CompactGraph, samples: np.ndarray, probability: float,
+                 max_rounds: Optional[int], salt: int) -> None:
+        self._graph = graph
+        self._samples = samples
+        self._probability = probability
+        self._max_rounds = max_rounds
+        self._salt = salt
+        self._offsets = np.arange(len(samples)) * graph.node_count
+        self._covered = np.zeros(len(samples) * graph.node_count, dtype=bool)
+        self._visited = np.zeros_like(self._covered)
+
+    def initial(self, n_jobs: int) -> np.ndarray:
+        candidates = np.arange(self._graph.node_count)
+        n_chunks = min(len(candidates), 1 if n_jobs <= 1 else 4 * n_jobs)
+        job = {"graph": self._graph, "samples": self._samples, "probability": self._probability,
+               "max_rounds": self._max_rounds, "salt": self._salt}
+        parts = _fork_map(_singleton_spreads, [candidates[i::n_chunks] for i in range(n_chunks)], job, n_jobs)
+        gains = np.zeros(len(candidates))
+        for i, part in enumerate(parts):
+            gains[i::n_chunks] = part
+        return gains
+
+    def _reach(self, node: int) -> np.ndarray:
+        blocked = self._covered if self._max_rounds is None else None
+        reached = _live_edge_reach(self._graph, self._offsets + node, self._samples, self._probability,
+                                   self._max_rounds, self._salt, self._visited, blocked)
+        self._visited[reached] = False
+        return reached if blocked is not None else reached[~self._covered[reached]]
+
+    def gain(self, node: int) -> float:
+        return self._reach(node).size / len(self._samples)
+
+    def commit(self, node: int) -> None:
+        self._covered[self._reach(node)] = True
+
+    def spread(self) -> float:
+        return float(np.count_nonzero(self._covered)) / len(self._samples)
+
+
+class _ReverseReachableGains:
+    """Marginal spread as ``n / theta`` times the newly covered reverse-reachable sets."""
+
+    def __init__(self, graph: CompactGraph, owners: np.ndarray, members: np.ndarray, n_sets: int) -> None:
+        self._scale = graph.node_count / n_sets
+        order = np.argsort(members, kind="stable")
+        self._sets = owners[order]
+        self._indptr = np.zeros(graph.node_count + 1, dtype=np.int64)
+        np.cumsum(np.bincount(members, minlength=graph.node_count), out=self._indptr[1:])
+        self._covered = np.zeros(n_sets, dtype=bool)
+
+    def initial(self, n_jobs: int) -> np.ndarray:
+        return np.diff(self._indptr) * self._scale
+
+    def _sets_of(self, node: int) -> np.ndarray:
+        return self._sets[self._indptr[node]:self._indptr[node + 1]]
+
+    def gain(self, node: int) -> float:
+        return float(np.count_nonzero(~self._covered[self._sets_of(node)])) * self._scale
+
+    def commit(self, node: int) -> None:
+        self._covered[self._sets_of(node)] = True
+
+    def spread(self) -> float:
+        return float(np.count_nonzero(self._covered)) * self._scale
+
+
 class InfluencePropagator:
     """Simulates influence propagation using cascade models."""
 
     def __init__(self, graph: SocialNetworkGraph) -> None:
         self._graph = graph
 
+    @property
+    def compact(self) -> CompactGraph:
+        return self._graph.to_compact()
+
     def independent_cascade(self, seeds: list[str], probability: float = 0.1,
                             max_rounds: int = 10) -> InfluenceResult:
         active = set(seeds)
@@ -451,23 +880,99 @@ class InfluencePropagator:
         )
 
     def greedy_seed_selection(self, k: int, probability: float = 0.1) -> list[str]:
-        seeds: list[str] = []
-        remaining = {n.id for n in self._graph.nodes}
-
-        for _ in range(k):
-            best_node = ""
-            best_spread = -1
-            for candidate in remaining:
-                test_seeds = seeds + [candidate]
-                result = self.independent_cascade(test_seeds, probability, max_rounds=5)
-                if result.total_reached > best_spread:
-                    best_spread = result.total_reached
-                    best_node = candidate
-            if best_node:
-                seeds.append(best_node)
-                remaining.discard(best_node)
-
-        return seeds
+        return self.celf_seed_selection(k, probability, max_rounds=5).seeds
+
+    def estimate_spread(self, seeds: list[str], probability: float = 0.1,
+                        max_rounds: Optional[int] = None, n_simulations: int = 1000,
+                        n_jobs: int = 1, seed: Optional[int] = None) -> SpreadEstimate:
+        """Expected independent-cascade spread of ``seeds`` from batched live-edge samples.
+
+        Samples are split across ``n_jobs`` forked processes. Each sample's
+        coin flips depend only on ``seed`` and the sample index, so the
+        estimate does not depend on ``n_jobs``.
+        """
+        graph = self.compact
+        index = {label: i for i, label in enumerate(graph.labels)}
+        samples = np.arange(n_simulations)
+        n_chunks = min(n_simulations, 1 if n_jobs <= 1 else 4 * n_jobs)
+        job = {"graph": graph, "sources": np.array([index[s] for s in seeds], dtype=np.int64),
+               "probability": probability, "max_rounds": max_rounds,
+               "salt": int(np.random.default_rng(seed).integers(1 << 62))}
+        parts = _fork_map(_spread_counts, [samples[i::n_chunks] for i in range(n_chunks)], job, n_jobs)
+        # Back in sample order, so the reductions below round the same for any n_jobs.
+        counts = np.zeros(n_simulations, dtype=np.int64)
+        for i, part in enumerate(parts):
+            counts[i::n_chunks] = part
+        std_error = float(counts.std(ddof=1) / math.sqrt(len(counts))) if len(counts) > 1 else 0.0
+        return SpreadEstimate(seeds, float(counts.mean()), std_error, n_simulations)
+
+    def celf_seed_selection(self, k: int, probability: float = 0.1,
+                            max_rounds: Optional[int] = None,
+                            estimator: SpreadEstimator = SpreadEstimator.REVERSE_REACHABLE,
+                            n_samples: Optional[int] = None, n_jobs: int = 1,
+                            seed: Optional[int] = None) -> SeedSelection:
+        """Lazy-greedy (CELF) seed selection for the independent cascade model.
+
+        Spread is submodular, so a candidate's marginal gain can only shrink
+        as seeds are added. Gains sit in a max-heap and only the top entry is
+        re-evaluated until it is current for this round (Leskovec et al.,
+        2007). Gains come from a fixed set of ``n_samples`` samples drawn
+        from ``seed``:
+
+        - ``REVERSE_REACHABLE`` (default ``max(10_000, 10 * n)`` sets):
+          random targets' reverse-reachable sets, generated across
+          ``n_jobs`` processes. A gain is the share of uncovered sets
+          containing the node, times n (Borgs et al., 2014), and is cheap
+          to evaluate.
+        - ``LIVE_EDGE`` (default 200 samples): live-edge graphs. The first
+          round's single-node spreads are computed across ``n_jobs``
+          processes. Memory grows with ``2 * n_samples * n`` bytes.
+
+        ``SeedSelection.spread`` is measured on the samples used for
+        selection, so it runs high when samples are few; use
+        ``estimate_spread`` for an independent estimate.
+        """
+        graph = self.compact
+        n = graph.node_count
+        k = min(k, n)
+        rng = np.random.default_rng(seed)
+        salt, target_salt = (int(x) for x in rng.integers(1 << 62, size=2))
+
+        if estimator is SpreadEstimator.LIVE_EDGE:
+            gains_model: Any = _LiveEdgeGains(graph, np.arange(n_samples or 200), probability, max_rounds, salt)
+        else:
+            n_sets = n_samples or max(10_000, 10 * n)
+            set_ids = np.arange(n_sets)
+            n_chunks = min(n_sets, 1 if n_jobs <= 1 else 4 * n_jobs)
+            job = {"graph": graph, "probability": probability, "max_rounds": max_rounds,
+                   "salt": salt, "target_salt": target_salt}
+            parts = _fork_map(_rr_sets, [set_ids[i::n_chunks] for i in range(n_chunks)], job, n_jobs)
+            owners = np.concatenate([p[0] for p in parts]) if parts else np.zeros(0, dtype=np.int64)
+            members = np.concatenate([p[1] for p in parts]) if parts else np.zeros(0, dtype=np.int64)
+            gains_model = _ReverseReachableGains(graph, owners, members, n_sets)
+
+        heap = [(-gain, node, 0) for node, gain in enumerate(gains_model.initial(n_jobs).tolist())]
+        heapq.heapify(heap)
+        evaluations = n
+        chosen: list[int] = []
+        marginal_gains: list[float] = []
+        while heap and len(chosen) < k:
+            negative_gain, node, round_evaluated = heapq.heappop(heap)
+            if round_evaluated == len(chosen):
+                chosen.append(node)
+                marginal_gains.append(-negative_gain)
+                gains_model.commit(node)
+            else:
+                evaluations += 1
+                heapq.heappush(heap, (-gains_model.gain(node), node, len(chosen)))
+
+        return SeedSelection(
+            seeds=[graph.labels[node] for node in chosen],
+            marginal_gains=marginal_gains,
+            spread=gains_model.spread(),
+            evaluations=evaluations,
+            estimator=estimator,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -650,6 +1155,11 @@ def main() -> None:
     seeds = influencer.greedy_seed_selection(k=3, probability=0.3)
     print(f"  Greedy seed selection (k=3): {seeds}")
 
+    selection = influencer.celf_seed_selection(k=3, probability=0.3, seed=7)
+    estimate = influencer.estimate_spread(selection.seeds, probability=0.3, seed=7)
+    print(f"  CELF seeds (k=3): {selection.seeds}, {selection.evaluations} gain evaluations")
+    print(f"  Expected spread: {estimate.mean:.2f} +/- {estimate.std_error:.2f} over {estimate.n_simulations} cascades")
+
     # Network Metrics
     print("\n--- Network Metrics ---")
     metrics_calc = NetworkMetricsCalculator(graph)
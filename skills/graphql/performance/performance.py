@@ -16,8 +16,10 @@ from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 import asyncio
 import hashlib
 import json
+import re
+import sys
 import time
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from functools import lru_cache
 import uuid
 
@@ -49,6 +51,13 @@ class PerformanceMetric(Enum):
     THROUGHPUT = auto()
 
 
+class EvictionPolicy(Enum):
+    """Cache eviction policies."""
+    LRU = auto()
+    LFU = auto()
+    TINY_LFU = auto()
+
+
 # Dataclasses
 @dataclass
 class ComplexityRule:
@@ -94,17 +103,34 @@ class QueryComplexity:
 
 @dataclass
 class CacheEntry:
-    """Cache entry."""
+    """Cache entry.
+
+    Timing uses a monotonic clock so hits never build a datetime;
+    ``last_accessed`` is derived from it when needed.
+    """
     key: str
     value: Any
     created_at: datetime = field(default_factory=datetime.now)
     ttl: int = 300  # seconds
     access_count: int = 0
-    last_accessed: datetime = field(default_factory=datetime.now)
+    size: int = 0  # approximate bytes
+    stored_at: float = field(default_factory=time.monotonic)
+    accessed_at: float = field(default_factory=time.monotonic)
+    stale_ttl: float = 0.0  # seconds servable after expiry while revalidating
+
+    @property
+    def expires_at(self) -> float:
+        """Monotonic time at which the entry stops being fresh."""
+        return self.stored_at + self.ttl
 
-    def is_expired(self) -> bool:
+    @property
+    def last_accessed(self) -> datetime:
+        """Wall-clock time of the last access."""
+        return self.created_at + timedelta(seconds=self.accessed_at - self.stored_at)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if cache entry is expired."""
-        return datetime.now() > self.created_at + timedelta(seconds=self.ttl)
+        return (time.monotonic() if now is None else now) >= self.expires_at
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -113,6 +139,7 @@ class CacheEntry:
             'createdAt': self.created_at.isoformat(),
             'ttl': self.ttl,
             'accessCount': self.access_count,
+            'size': self.size,
             'lastAccessed': self.last_accessed.isoformat(),
             'isExpired': self.is_expired()
         }
@@ -186,12 +213,420 @@ class QueryPlan:
         }
 
 
+# GraphQL Document Parser
+class GraphQLSyntaxError(ValueError):
+    """Raised when a GraphQL document cannot be parsed."""
+
+    def __init__(self, message: str, position: int = 0):
+        super().__init__(f"{message} (position {position})")
+        self.position = position
+
+
+@dataclass(frozen=True)
+class Variable:
+    """Reference to an operation variable inside an argument value."""
+    name: str
+
+
+@dataclass
+class FieldNode:
+    """Field selection."""
+    name: str
+    alias: Optional[str] = None
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    selections: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class FragmentSpreadNode:
+    """Named fragment spread (``...Name``)."""
+    name: str
+
+
+@dataclass
+class InlineFragmentNode:
+    """Inline fragment (``... on Type { }``)."""
+    type_condition: Optional[str]
+    selections: List[Any] = field(default_factory=list)
+
+
+@dataclass
+class OperationNode:
+    """Query, mutation or subscription definition."""
+    operation: str
+    name: Optional[str]
+    selections: List[Any]
+    variable_defaults: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class FragmentNode:
+    """Named fragment definition."""
+    name: str
+    type_condition: str
+    selections: List[Any]
+
+
+@dataclass
+class GraphQLDocument:
+    """Parsed document with its variable-independent analysis.
+
+    ``costed_fields`` holds every field that takes arguments or has a
+    selection set, with fragment spreads expanded into occurrence counts,
+    so complexity scoring never walks the tree again.
+    """
+    operations: List[OperationNode]
+    fragments: Dict[str, FragmentNode]
+    max_depth: int = 0
+    costed_fields: List[Tuple[FieldNode, int]] = field(default_factory=list)
+    variable_defaults: Dict[str, Any] = field(default_factory=dict)
+
+
+_TOKEN_PATTERN = re.compile(r'''
+    (?P<ignored>(?:[\s,\ufeff]+|\#[^\n\r]*)+)
+  | (?P<block_string>"""(?:\\"""|(?!""")[\s\S])*""")
+  | (?P<string>"(?:\\.|[^"\\\n\r])*")
+  | (?P<punct>\.\.\.|[!$&():=@\[\]{|}])
+  | (?P<number>-?(?:0|[1-9][0-9]*)(?P<fraction>\.[0-9]+)?(?P<exponent>[eE][+-]?[0-9]+)?)
+  | (?P<name>[_A-Za-z][_0-9A-Za-z]*)
+''', re.VERBOSE)
+
+
+def _tokenize(source: str) -> List[Tuple[str, Any, int]]:
+    """Split a document into (kind, value, position) tokens."""
+    tokens = []
+    position = 0
+    length = len(source)
+    
+    while position < length:
+        match = _TOKEN_PATTERN.match(source, position)
+        if match is None:
+            raise GraphQLSyntaxError(f"Unexpected character {source[position]!r}", position)
+        
+        kind = match.lastgroup
+        text = match.group()
+        if kind in ('number', 'fraction', 'exponent'):
+            if match.group('fraction') or match.group('exponent'):
+                tokens.append(('float', float(text), position))
+            else:
+                tokens.append(('int', int(text), position))
+        elif kind == 'string':
+            try:
+                tokens.append(('string', json.loads(text), position))
+            except ValueError:
+                raise GraphQLSyntaxError("Invalid string literal", position) from None
+        elif kind == 'block_string':
+            tokens.append(('string', text[3:-3].replace('\\"""', '"""'), position))
+        elif kind != 'ignored':
+            tokens.append((kind, text, position))
+        position = match.end()
+    
+    tokens.append(('eof', None, length))
+    return tokens
+
+
+class _DocumentParser:
+    """Recursive-descent parser for executable GraphQL documents."""
+    
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.index = 0
+    
+    def parse(self) -> GraphQLDocument:
+        """Parse the whole document."""
+        operations: List[OperationNode] = []
+        fragments: Dict[str, FragmentNode] = {}
+        
+        while self._peek()[0] != 'eof':
+            kind, value, position = self._peek()
+            if kind == 'punct' and value == '{':
+                operations.append(OperationNode('query', None, self._parse_selection_set()))
+            elif kind == 'name' and value in ('query', 'mutation', 'subscription'):
+                operations.append(self._parse_operation())
+            elif kind == 'name' and value == 'fragment':
+                fragment = self._parse_fragment()
+                if fragment.name in fragments:
+                    raise GraphQLSyntaxError(f"Duplicate fragment {fragment.name!r}", position)
+                fragments[fragment.name] = fragment
+            else:
+                raise GraphQLSyntaxError(f"Unexpected {value!r}", position)
+        
+        if not operations:
+            raise GraphQLSyntaxError("Document has no operations", 0)
+        
+        return GraphQLDocument(operations=operations, fragments=fragments)
+    
+    def _peek(self) -> Tuple[str, Any, int]:
+        return self.tokens[self.index]
+    
+    def _advance(self) -> Tuple[str, Any, int]:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+    
+    def _skip(self, punct: str) -> bool:
+        """Consume *punct* if it is the next token."""
+        kind, value, _ = self.tokens[self.index]
+        if kind == 'punct' and value == punct:
+            self.index += 1
+            return True
+        return False
+    
+    def _expect(self, punct: str):
+        if not self._skip(punct):
+            kind, value, position = self._peek()
+            raise GraphQLSyntaxError(f"Expected {punct!r}, found {value if kind != 'eof' else 'end of document'!r}", position)
+    
+    def _expect_name(self) -> str:
+        kind, value, position = self._advance()
+        if kind != 'name':
+            raise GraphQLSyntaxError(f"Expected name, found {value!r}", position)
+        return value
+    
+    def _parse_operation(self) -> OperationNode:
+        operation = self._expect_name()
+        name = self._expect_name() if self._peek()[0] == 'name' else None
+        defaults = self._parse_variable_definitions()
+        self._parse_directives()
+        return OperationNode(operation, name, self._parse_selection_set(), defaults)
+    
+    def _parse_variable_definitions(self) -> Dict[str, Any]:
+        defaults: Dict[str, Any] = {}
+        if not self._skip('('):
+            return defaults
+        while not self._skip(')'):
+            self._expect('$')
+            name = self._expect_name()
+            self._expect(':')
+            self._parse_type()
+            if self._skip('='):
+                defaults[name] = self._parse_value(const=True)
+            self._parse_directives()
+        return defaults
+    
+    def _parse_type(self):
+        if self._skip('['):
+            self._parse_type()
+            self._expect(']')
+        else:
+            self._expect_name()
+        self._skip('!')
+    
+    def _parse_fragment(self) -> FragmentNode:
+        self._expect_name()
+        position = self._peek()[2]
+        name = self._expect_name()
+        if name == 'on':
+            raise GraphQLSyntaxError("Fragment cannot be named 'on'", position)
+        if self._expect_name() != 'on':
+            raise GraphQLSyntaxError("Expected 'on' in fragment definition", position)
+        type_condition = self._expect_name()
+        self._parse_directives()
+        return FragmentNode(name, type_condition, self._parse_selection_set())
+    
+    def _parse_selection_set(self) -> List[Any]:
+        self._expect('{')
+        selections = []
+        while not self._skip('}'):
+            selections.append(self._parse_selection())
+        if not selections:
+            raise GraphQLSyntaxError("Empty selection set", self.tokens[self.index - 1][2])
+        return selections
+    
+    def _parse_selection(self) -> Any:
+        if self._skip('...'):
+            kind, value, _ = self._peek()
+            if kind == 'name' and value != 'on':
+                name = self._advance()[1]
+                self._parse_directives()
+                return FragmentSpreadNode(name)
+            type_condition = None
+            if kind == 'name':
+                self._advance()
+                type_condition = self._expect_name()
+            self._parse_directives()
+            return InlineFragmentNode(type_condition, self._parse_selection_set())
+        
+        name = self._expect_name()
+        alias = None
+        if self._skip(':'):
+            alias, name = name, self._expect_name()
+        arguments = self._parse_arguments()
+        self._parse_directives()
+        
+        kind, value, _ = self._peek()
+        selections = self._parse_selection_set() if kind == 'punct' and value == '{' else []
+        return FieldNode(name, alias, arguments, selections)
+    
+    def _parse_arguments(self, const: bool = False) -> Dict[str, Any]:
+        arguments: Dict[str, Any] = {}
+        if self._skip('('):
+            while not self._skip(')'):
+                name = self._expect_name()
+                self._expect(':')
+                arguments[name] = self._parse_value(const)
+        return arguments
+    
+    def _parse_directives(self):
+        while self._skip('@'):
+            self._expect_name()
+            self._parse_arguments()
+    
+    def _parse_value(self, const: bool = False) -> Any:
+        kind, value, position = self._advance()
+        if kind in ('int', 'float', 'string'):
+            return value
+        if kind == 'name':
+            return {'true': True, 'false': False, 'null': None}.get(value, value)
+        if kind == 'punct':
+            if value == '$' and not const:
+                return Variable(self._expect_name())
+            if value == '[':
+                items = []
+                while not self._skip(']'):
+                    items.append(self._parse_value(const))
+                return items
+            if value == '{':
+                fields = {}
+                while not self._skip('}'):
+                    name = self._expect_name()
+                    self._expect(':')
+                    fields[name] = self._parse_value(const)
+                return fields
+        raise GraphQLSyntaxError(f"Unexpected {value!r} in value", position)
+
+
+def _summarize_selections(
+    selections: List[Any],
+    fragments: Dict[str, FragmentNode],
+    memo: Dict[str, Tuple[int, Dict[int, List[Any]]]],
+    visiting: Set[str]
+) -> Tuple[int, Dict[int, List[Any]]]:
+    """Return (depth, costed field counts) for a selection set, expanding fragments."""
+    depth = 0
+    counts: Dict[int, List[Any]] = {}
+    
+    def merge(child: Dict[int, List[Any]], times: int = 1):
+        for key, (node, count) in child.items():
+            entry = counts.setdefault(key, [node, 0])
+            entry[1] += count * times
+    
+    for selection in selections:
+        if isinstance(selection, FieldNode):
+            child_depth, child_counts = _summarize_selections(selection.selections, fragments, memo, visiting)
+            depth = max(depth, child_depth + 1)
+            if selection.arguments or selection.selections:
+                counts.setdefault(id(selection), [selection, 0])[1] += 1
+            merge(child_counts)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name
+            if name not in memo:
+                if name not in fragments:
+                    raise GraphQLSyntaxError(f"Unknown fragment {name!r}")
+                if name in visiting:
+                    raise GraphQLSyntaxError(f"Fragment {name!r} spreads itself")
+                visiting.add(name)
+                memo[name] = _summarize_selections(fragments[name].selections, fragments, memo, visiting)
+                visiting.discard(name)
+            fragment_depth, fragment_counts = memo[name]
+            depth = max(depth, fragment_depth)
+            merge(fragment_counts)
+        else:
+            child_depth, child_counts = _summarize_selections(selection.selections, fragments, memo, visiting)
+            depth = max(depth, child_depth)
+            merge(child_counts)
+    
+    return depth, counts
+
+
+def parse_document(query: str) -> GraphQLDocument:
+    """Parse a query and precompute its depth and costed fields in one walk."""
+    try:
+        document = _DocumentParser(query).parse()
+        
+        memo: Dict[str, Tuple[int, Dict[int, List[Any]]]] = {}
+        counts: Dict[int, List[Any]] = {}
+        for operation in document.operations:
+            depth, operation_counts = _summarize_selections(operation.selections, document.fragments, memo, set())
+            document.max_depth = max(document.max_depth, depth)
+            document.variable_defaults.update(operation.variable_defaults)
+            for key, (node, count) in operation_counts.items():
+                counts.setdefault(key, [node, 0])[1] += count
+    except RecursionError:
+        raise GraphQLSyntaxError("Document is nested too deeply") from None
+    
+    document.costed_fields = [(node, count) for node, count in counts.values()]
+    return document
+
+
+# Parsed Document Cache
+class ParsedDocumentCache:
+    """LRU cache of parsed documents keyed by query hash."""
+    
+    def __init__(self, max_size: int = 1000):
+        self.max_size = max_size
+        self.documents: OrderedDict[str, GraphQLDocument] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+    
+    @staticmethod
+    def hash_query(query: str) -> str:
+        """Hash used for persisted queries and cache keys."""
+        return hashlib.sha256(query.encode()).hexdigest()[:16]
+    
+    def get(self, query: str, query_hash: Optional[str] = None) -> GraphQLDocument:
+        """Return the parsed document for a query, parsing it on a miss."""
+        query_hash = query_hash or self.hash_query(query)
+        document = self.documents.get(query_hash)
+        
+        if document is not None:
+            self.documents.move_to_end(query_hash)
+            self.hits += 1
+            return document
+        
+        self.misses += 1
+        document = parse_document(query)
+        self.put(query_hash, document)
+        return document
+    
+    def get_by_hash(self, query_hash: str) -> Optional[GraphQLDocument]:
+        """Return a cached document without parsing."""
+        document = self.documents.get(query_hash)
+        if document is not None:
+            self.documents.move_to_end(query_hash)
+            self.hits += 1
+        return document
+    
+    def put(self, query_hash: str, document: GraphQLDocument):
+        """Store a document, evicting the least recently used one."""
+        self.documents[query_hash] = document
+        self.documents.move_to_end(query_hash)
+        while len(self.documents) > self.max_size:
+            self.documents.popitem(last=False)
+    
+    def discard(self, query_hash: str):
+        """Drop a document from the cache."""
+        self.documents.pop(query_hash, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            'size': len(self.documents),
+            'maxSize': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hitRate': self.hits / total if total > 0 else 0
+        }
+
+
 # Query Complexity Analyzer
 class QueryComplexityAnalyzer:
     """Analyze query complexity."""
     
-    def __init__(self, max_complexity: int = 1000):
+    def __init__(self, max_complexity: int = 1000, document_cache: Optional[ParsedDocumentCache] = None):
         self.max_complexity = max_complexity
+        self.document_cache = document_cache or ParsedDocumentCache()
         self.complexity_rules: List[ComplexityRule] = []
         self._initialize_default_rules()
     
@@ -213,20 +648,36 @@ class QueryComplexityAnalyzer:
         """Add a complexity rule."""
         self.complexity_rules.append(rule)
     
-    def analyze(self, query: str, variables: Optional[Dict] = None) -> QueryComplexity:
+    def analyze(self, query: str, variables: Optional[Dict] = None, query_hash: Optional[str] = None) -> QueryComplexity:
         """Analyze query complexity."""
+        try:
+            document = self.document_cache.get(query, query_hash)
+        except GraphQLSyntaxError as e:
+            return QueryComplexity(
+                total_cost=0,
+                max_cost=self.max_complexity,
+                level=QueryComplexityLevel.LOW,
+                field_costs={},
+                is_valid=False,
+                message=f"Invalid query: {e}"
+            )
+        
+        return self.analyze_document(document, variables)
+    
+    def analyze_document(self, document: GraphQLDocument, variables: Optional[Dict] = None) -> QueryComplexity:
+        """Analyze complexity of an already parsed document."""
         print(f"Analyzing query complexity...")
         
-        # Parse query to extract fields
-        fields = self._extract_fields(query)
+        variables = variables or {}
         
         # Calculate field costs
-        field_costs = {}
+        field_costs: Dict[str, int] = {}
         total_cost = 0
         
-        for field_name in fields:
-            cost = self._calculate_field_cost(field_name, variables or {})
-            field_costs[field_name] = cost
+        for node, count in document.costed_fields:
+            arguments = self._variable_arguments(node.arguments, variables, document.variable_defaults)
+            cost = self._calculate_field_cost(node.name, variables, arguments) * count
+            field_costs[node.name] = field_costs.get(node.name, 0) + cost
             total_cost += cost
         
         # Determine complexity level
@@ -246,36 +697,38 @@ class QueryComplexityAnalyzer:
         )
     
     def _extract_fields(self, query: str) -> List[str]:
-        """Extract field names from query."""
-        # Simple field extraction (in real implementation, use AST)
+        """Extract costed field names (with arguments or a selection set) from query."""
+        document = self.document_cache.get(query)
         fields = []
-        
-        # Remove query/mutation/subscription keywords
-        query = query.replace("query", "").replace("mutation", "").replace("subscription", "")
-        
-        # Extract field names (simplified)
-        import re
-        field_pattern = r'(\w+)\s*(?:\(|{)'
-        matches = re.findall(field_pattern, query)
-        
-        # Filter out common keywords
-        keywords = {'query', 'mutation', 'subscription', 'fragment', 'on', 'type', 'input'}
-        fields = [f for f in matches if f.lower() not in keywords]
-        
+        for node, count in document.costed_fields:
+            fields.extend([node.name] * count)
         return fields
     
-    def _calculate_field_cost(self, field_name: str, variables: Dict) -> int:
+    def _variable_arguments(self, arguments: Dict[str, Any], variables: Dict, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Resolve field arguments bound to variables (e.g. ``first: $n``)."""
+        return {
+            name: variables.get(value.name, defaults.get(value.name))
+            for name, value in arguments.items()
+            if isinstance(value, Variable)
+        }
+    
+    def _calculate_field_cost(self, field_name: str, variables: Dict, arguments: Optional[Dict[str, Any]] = None) -> int:
         """Calculate cost for a field."""
+        arguments = arguments or {}
+        
         # Find matching rule
         for rule in self.complexity_rules:
             if rule.field_name == field_name:
                 base_cost = rule.base_cost
                 
-                # Apply multiplier if applicable
-                if rule.multiplier_field and rule.multiplier_field in variables:
-                    multiplier = variables[rule.multiplier_field]
-                    if isinstance(multiplier, (int, float)):
-                        base_cost *= int(multiplier) * rule.multiplier_factor
+                # Apply multiplier from a variable-bound argument, falling back to a same-named variable
+                if rule.multiplier_field in arguments:
+                    multiplier = arguments[rule.multiplier_field]
+                else:
+                    multiplier = variables.get(rule.multiplier_field) if rule.multiplier_field else None
+                
+                if isinstance(multiplier, (int, float)) and not isinstance(multiplier, bool):
+                    base_cost *= int(multiplier) * rule.multiplier_factor
                 
                 return base_cost
         
@@ -298,93 +751,282 @@ class QueryComplexityAnalyzer:
 class QueryDepthLimiter:
     """Limit query depth."""
     
-    def __init__(self, max_depth: int = 10):
+    def __init__(self, max_depth: int = 10, document_cache: Optional[ParsedDocumentCache] = None):
         self.max_depth = max_depth
+        self.document_cache = document_cache or ParsedDocumentCache()
     
-    def validate_depth(self, query: str) -> Tuple[bool, int, Optional[str]]:
+    def validate_depth(self, query: str, query_hash: Optional[str] = None) -> Tuple[bool, int, Optional[str]]:
         """Validate query depth."""
-        depth = self._calculate_depth(query)
+        try:
+            document = self.document_cache.get(query, query_hash)
+        except GraphQLSyntaxError as e:
+            return False, 0, f"Invalid query: {e}"
+        
+        return self.validate_document(document)
+    
+    def validate_document(self, document: GraphQLDocument) -> Tuple[bool, int, Optional[str]]:
+        """Validate depth of an already parsed document."""
+        depth = document.max_depth
         is_valid = depth <= self.max_depth
         message = None if is_valid else f"Query too deep: {depth}/{self.max_depth}"
         
         return is_valid, depth, message
     
     def _calculate_depth(self, query: str) -> int:
-        """Calculate query depth."""
-        max_depth = 0
-        current_depth = 0
-        
-        # Simple depth calculation
-        for char in query:
-            if char == '{':
-                current_depth += 1
-                max_depth = max(max_depth, current_depth)
-            elif char == '}':
-                current_depth -= 1
-        
-        return max_depth
+        """Calculate query depth (field nesting, with fragments expanded)."""
+        return self.document_cache.get(query).max_depth
+
+
+# Cache Admission Sketch
+class _FrequencySketch:
+    """Count-min sketch of recent access frequency with periodic halving (TinyLFU)."""
+    
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+    
+    def __init__(self, capacity: int):
+        width = 16
+        while width < capacity:
+            width <<= 1
+        self.mask = width - 1
+        self.rows = [[0] * width for _ in self._SEEDS]
+        self.sample_size = 10 * width
+        self.additions = 0
+    
+    def _indexes(self, key: str):
+        h = hash(key)
+        for seed in self._SEEDS:
+            mixed = ((h ^ seed) * 0x45D9F3B) & 0xFFFFFFFFFFFF
+            yield (mixed ^ (mixed >> 17)) & self.mask
+    
+    def increment(self, key: str):
+        """Record one access, ageing all counters once the sample is full."""
+        for row, index in zip(self.rows, self._indexes(key)):
+            if row[index] < 15:
+                row[index] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            for row in self.rows:
+                row[:] = [count >> 1 for count in row]
+            self.additions //= 2
+    
+    def estimate(self, key: str) -> int:
+        """Estimated recent access count."""
+        return min(row[index] for row, index in zip(self.rows, self._indexes(key)))
+
+
+# Expiry Timer Wheel
+class _TimerWheel:
+    """Hashed timer wheel bucketing keys by expiry tick."""
+    
+    def __init__(self, resolution: float, now: float, slots: int = 512):
+        self.resolution = resolution
+        self.slots: List[Dict[str, int]] = [{} for _ in range(slots)]
+        self.current_tick = int(now / resolution)
+    
+    def schedule(self, key: str, deadline: float):
+        """Schedule a key to be checked once its deadline has passed."""
+        tick = max(int(deadline / self.resolution) + 1, self.current_tick + 1)
+        self.slots[tick % len(self.slots)][key] = tick
+    
+    def advance(self, now: float) -> List[str]:
+        """Move to *now* and return keys whose tick has elapsed."""
+        target = int(now / self.resolution)
+        if target <= self.current_tick:
+            return []
+        
+        due = []
+        n_slots = len(self.slots)
+        for tick in range(self.current_tick + 1, min(target, self.current_tick + n_slots) + 1):
+            slot = self.slots[tick % n_slots]
+            if slot:
+                ready = [key for key, key_tick in slot.items() if key_tick <= target]
+                for key in ready:
+                    del slot[key]
+                due.extend(ready)
+        self.current_tick = target
+        return due
 
 
 # Cache Manager
 class CacheManager:
-    """Manage caching for GraphQL queries."""
-    
-    def __init__(self, strategy: CacheStrategy = CacheStrategy.IN_MEMORY, default_ttl: int = 300):
+    """Bounded cache for GraphQL results.
+    
+    Capacity is limited by entry count and optionally by approximate bytes.
+    Victims are chosen by the eviction policy; TinyLFU also refuses to admit
+    a new key that is accessed less often than the entry it would evict.
+    Expired entries are reaped proactively by a timer wheel, and entries
+    within the stale-while-revalidate window can still be served by
+    ``get_or_compute`` while one background refresh runs.
+    """
+    
+    def __init__(
+        self,
+        strategy: CacheStrategy = CacheStrategy.IN_MEMORY,
+        default_ttl: int = 300,
+        max_entries: Optional[int] = 10000,
+        max_bytes: Optional[int] = None,
+        eviction_policy: EvictionPolicy = EvictionPolicy.LRU,
+        stale_while_revalidate: float = 0.0,
+        wheel_resolution: float = 1.0,
+        sizer: Optional[Callable[[Any], int]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
         self.strategy = strategy
         self.default_ttl = default_ttl
-        self.cache: Dict[str, CacheEntry] = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.eviction_policy = eviction_policy
+        self.stale_while_revalidate = stale_while_revalidate
+        self.sizer = sizer or self._estimate_size
+        self.clock = clock
+        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
+        self.total_bytes: int = 0
         self.metrics = {
             'hits': 0,
             'misses': 0,
             'evictions': 0,
+            'expirations': 0,
+            'rejections': 0,
+            'staleHits': 0,
+            'coalesced': 0,
             'size': 0
         }
+        self._wheel = _TimerWheel(wheel_resolution, clock())
+        self._frequency_buckets: Dict[int, OrderedDict[str, None]] = defaultdict(OrderedDict)
+        self._min_frequency = 0
+        self._sketch = _FrequencySketch(max_entries or 1024) if eviction_policy == EvictionPolicy.TINY_LFU else None
+        self._inflight: Dict[str, asyncio.Future] = {}
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
         """Get value from cache."""
+        now = self.clock()
+        self._expire_due(now)
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        
         entry = self.cache.get(key)
         
         if entry is None:
             self.metrics['misses'] += 1
             return None
         
-        if entry.is_expired():
-            del self.cache[key]
-            self.metrics['evictions'] += 1
+        if entry.expires_at <= now:
+            if allow_stale and now < entry.expires_at + entry.stale_ttl:
+                self.metrics['staleHits'] += 1
+                self._touch(entry, now)
+                return entry.value
+            if now >= entry.expires_at + entry.stale_ttl:
+                self._remove(key)
+                self.metrics['expirations'] += 1
             self.metrics['misses'] += 1
             return None
         
-        # Update access stats
-        entry.access_count += 1
-        entry.last_accessed = datetime.now()
+        self._touch(entry, now)
         self.metrics['hits'] += 1
         
         return entry.value
     
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """Set value in cache."""
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """Set value in cache. Returns False if the value was not admitted."""
+        now = self.clock()
+        self._expire_due(now)
+        
+        size = self.sizer(value) + len(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.metrics['rejections'] += 1
+            return False
+        
+        previous = self.cache.get(key)
+        if previous is not None:
+            self._remove(key)
+        elif self._sketch is not None and self._needs_eviction(size):
+            victim = self._victim()
+            if victim is not None and self._sketch.estimate(key) <= self._sketch.estimate(victim):
+                self.metrics['rejections'] += 1
+                return False
+        
+        ttl = ttl or self.default_ttl
         entry = CacheEntry(
             key=key,
             value=value,
-            ttl=ttl or self.default_ttl
+            ttl=ttl,
+            access_count=previous.access_count if previous is not None else 0,
+            size=size,
+            stored_at=now,
+            accessed_at=now,
+            stale_ttl=self.stale_while_revalidate
         )
         
+        while self.cache and self._needs_eviction(size):
+            self._remove(self._victim())
+            self.metrics['evictions'] += 1
+        
         self.cache[key] = entry
+        self._frequency_buckets[entry.access_count][key] = None
+        self._min_frequency = min(self._min_frequency, entry.access_count) if len(self.cache) > 1 else entry.access_count
+        self.total_bytes += size
         self.metrics['size'] = len(self.cache)
+        self._wheel.schedule(key, entry.expires_at + entry.stale_ttl)
+        return True
+    
+    async def get_or_compute(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None) -> Any:
+        """Get a value, computing it once per key on a miss.
+        
+        Concurrent misses on the same key await a single ``loader`` call.
+        A stale entry is returned immediately while it is refreshed in the
+        background.
+        """
+        value = self.get(key, allow_stale=True)
+        entry = self.cache.get(key)
+        
+        if entry is not None:
+            if entry.expires_at <= self.clock() and key not in self._inflight:
+                self._start_load(key, loader, ttl)
+            return value
+        
+        if key in self._inflight:
+            self.metrics['coalesced'] += 1
+            return await asyncio.shield(self._inflight[key])
+        
+        return await asyncio.shield(self._start_load(key, loader, ttl))
+    
+    def _start_load(self, key: str, loader: Callable[[], Any], ttl: Optional[int]) -> asyncio.Future:
+        """Run *loader* as the single in-flight computation for *key*."""
+        async def load():
+            try:
+                value = loader()
+                if asyncio.iscoroutine(value) or isinstance(value, asyncio.Future):
+                    value = await value
+                self.set(key, value, ttl)
+                return value
+            finally:
+                self._inflight.pop(key, None)
+        
+        task = asyncio.ensure_future(load())
+        # Background refresh failures must not surface as unretrieved exceptions
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._inflight[key] = task
+        return task
     
     def delete(self, key: str) -> bool:
         """Delete value from cache."""
         if key in self.cache:
-            del self.cache[key]
-            self.metrics['size'] = len(self.cache)
+            self._remove(key)
             return True
         return False
     
     def clear(self):
         """Clear all cache."""
         self.cache.clear()
+        self._frequency_buckets.clear()
+        self._min_frequency = 0
+        self.total_bytes = 0
         self.metrics['size'] = 0
     
+    def purge_expired(self) -> int:
+        """Reap entries whose TTL and stale window have passed."""
+        return self._expire_due(self.clock())
+    
     def get_hit_rate(self) -> float:
         """Get cache hit rate."""
         total = self.metrics['hits'] + self.metrics['misses']
@@ -396,22 +1038,91 @@ class CacheManager:
         """Get cache metrics."""
         return {
             **self.metrics,
+            'bytes': self.total_bytes,
             'hitRate': self.get_hit_rate(),
-            'strategy': self.strategy.name
+            'strategy': self.strategy.name,
+            'evictionPolicy': self.eviction_policy.name
         }
+    
+    def _touch(self, entry: CacheEntry, now: float):
+        """Record a hit for recency and frequency ordering."""
+        key = entry.key
+        bucket = self._frequency_buckets[entry.access_count]
+        del bucket[key]
+        if not bucket:
+            del self._frequency_buckets[entry.access_count]
+            if self._min_frequency == entry.access_count:
+                self._min_frequency += 1
+        entry.access_count += 1
+        entry.accessed_at = now
+        self._frequency_buckets[entry.access_count][key] = None
+        self.cache.move_to_end(key)
+    
+    def _needs_eviction(self, incoming_size: int) -> bool:
+        if self.max_entries is not None and len(self.cache) >= self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes + incoming_size > self.max_bytes
+    
+    def _victim(self) -> Optional[str]:
+        """Key the eviction policy would remove next."""
+        if not self.cache:
+            return None
+        if self.eviction_policy == EvictionPolicy.LFU:
+            if self._min_frequency not in self._frequency_buckets:
+                self._min_frequency = min(self._frequency_buckets)
+            return next(iter(self._frequency_buckets[self._min_frequency]))
+        return next(iter(self.cache))
+    
+    def _remove(self, key: str):
+        entry = self.cache.pop(key)
+        bucket = self._frequency_buckets[entry.access_count]
+        del bucket[key]
+        if not bucket:
+            del self._frequency_buckets[entry.access_count]
+        self.total_bytes -= entry.size
+        self.metrics['size'] = len(self.cache)
+    
+    def _expire_due(self, now: float) -> int:
+        """Advance the timer wheel and drop entries past their stale window."""
+        expired = 0
+        for key in self._wheel.advance(now):
+            entry = self.cache.get(key)
+            if entry is None:
+                continue
+            if now >= entry.expires_at + entry.stale_ttl:
+                self._remove(key)
+                expired += 1
+            else:
+                self._wheel.schedule(key, entry.expires_at + entry.stale_ttl)
+        self.metrics['expirations'] += expired
+        return expired
+    
+    @staticmethod
+    def _estimate_size(value: Any) -> int:
+        """Approximate the size of a cached value in bytes."""
+        if isinstance(value, (bytes, bytearray)):
+            return len(value)
+        if isinstance(value, str):
+            return len(value.encode())
+        try:
+            return len(json.dumps(value, default=str))
+        except (TypeError, ValueError):
+            return sys.getsizeof(value)
 
 
 # Persisted Query Manager
 class PersistedQueryManager:
     """Manage persisted queries."""
     
-    def __init__(self):
+    def __init__(self, document_cache: Optional[ParsedDocumentCache] = None):
         self.queries: Dict[str, PersistedQuery] = {}
         self.enabled: bool = True
+        self.document_cache = document_cache or ParsedDocumentCache()
     
     def register_query(self, query: str, name: Optional[str] = None) -> str:
-        """Register a persisted query."""
+        """Register a persisted query, parsing it into the shared document cache."""
         query_hash = self._generate_hash(query)
+        self.document_cache.get(query, query_hash)
         
         persisted_query = PersistedQuery(
             hash=query_hash,
@@ -435,6 +1146,13 @@ class PersistedQueryManager:
         
         return None
     
+    def get_document(self, hash_value: str) -> Optional[GraphQLDocument]:
+        """Get the parsed document for a persisted query hash."""
+        document = self.document_cache.get_by_hash(hash_value)
+        if document is None and hash_value in self.queries:
+            document = self.document_cache.get(self.queries[hash_value].query, hash_value)
+        return document
+    
     def has_query(self, hash_value: str) -> bool:
         """Check if query exists."""
         return hash_value in self.queries
@@ -443,6 +1161,7 @@ class PersistedQueryManager:
         """Remove a persisted query."""
         if hash_value in self.queries:
             del self.queries[hash_value]
+            self.document_cache.discard(hash_value)
             return True
         return False
     
@@ -467,69 +1186,170 @@ class PersistedQueryManager:
     
     def _generate_hash(self, query: str) -> str:
         """Generate hash for query."""
-        return hashlib.sha256(query.encode()).hexdigest()[:16]
+        return ParsedDocumentCache.hash_query(query)
 
 
 # Query Batch Processor
 class QueryBatchProcessor:
-    """Batch multiple queries for efficiency."""
-    
-    def __init__(self, batch_size: int = 10, batch_interval: float = 0.01):
+    """Batch multiple queries for efficiency.
+    
+    A batch is flushed when ``batch_size`` distinct queries are pending or
+    ``batch_interval`` seconds after the first one arrived, whichever comes
+    first. Identical (query, variables) pairs, pending or in flight, share one
+    execution. ``max_pending`` bounds queued plus in-flight executions;
+    callers wait in ``add_query`` until capacity frees up.
+    """
+    
+    def __init__(
+        self,
+        batch_size: int = 10,
+        batch_interval: float = 0.01,
+        max_pending: int = 1000,
+        max_concurrent_batches: int = 4,
+        executor: Optional[Callable[[List[Dict[str, Any]]], Any]] = None
+    ):
         self.batch_size = batch_size
         self.batch_interval = batch_interval
-        self.pending_queries: List[Dict[str, Any]] = []
+        self.max_pending = max_pending
+        self.max_concurrent_batches = max_concurrent_batches
+        self.executor = executor
+        self.pending_queries: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+        self.inflight_queries: Dict[Tuple[str, str], Dict[str, Any]] = {}
         self.batch_stats = {
             'total_batches': 0,
             'total_queries': 0,
-            'average_batch_size': 0.0
+            'average_batch_size': 0.0,
+            'executed_queries': 0,
+            'deduplicated_queries': 0,
+            'size_flushes': 0,
+            'deadline_flushes': 0,
+            'backpressure_waits': 0
         }
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        # Created inside the running loop on first use (see _ensure_primitives)
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._capacity_available: Optional[asyncio.Event] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
     
     async def add_query(self, query: str, variables: Optional[Dict] = None) -> asyncio.Future:
         """Add query to batch."""
-        future = asyncio.get_event_loop().create_future()
-        
-        self.pending_queries.append({
+        future = asyncio.get_running_loop().create_future()
+        self._ensure_primitives()
+        key = self._batch_key(query, variables or {})
+        self.batch_stats['total_queries'] += 1
+        
+        # Backpressure: wait until a batch completes
+        waited = False
+        while key not in self.pending_queries and key not in self.inflight_queries and (
+            len(self.pending_queries) + len(self.inflight_queries) >= self.max_pending
+        ):
+            if not waited:
+                self.batch_stats['backpressure_waits'] += 1
+                waited = True
+            self._capacity_available.clear()
+            await self._capacity_available.wait()
+        
+        # Coalesce with an identical pending or in-flight query
+        entry = self.pending_queries.get(key) or self.inflight_queries.get(key)
+        if entry is not None:
+            entry['futures'].append(future)
+            self.batch_stats['deduplicated_queries'] += 1
+            return future
+        
+        self.pending_queries[key] = {
             'query': query,
             'variables': variables or {},
-            'future': future
-        })
+            'futures': [future]
+        }
         
-        # Trigger batch if size reached
+        # Trigger batch if size reached, otherwise arm the deadline
         if len(self.pending_queries) >= self.batch_size:
-            await self._execute_batch()
+            self.batch_stats['size_flushes'] += 1
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.batch_interval, self._flush_deadline)
         
         return future
     
-    async def _execute_batch(self):
-        """Execute batched queries."""
+    async def flush(self):
+        """Execute pending queries now and wait for all running batches."""
+        self._flush()
+        while self._batch_tasks:
+            await asyncio.gather(*list(self._batch_tasks), return_exceptions=True)
+    
+    def _flush_deadline(self):
+        self._flush_handle = None
+        if self.pending_queries:
+            self.batch_stats['deadline_flushes'] += 1
+            self._flush()
+    
+    def _flush(self):
+        """Move pending queries into a batch task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
         if not self.pending_queries:
             return
         
-        queries = self.pending_queries.copy()
-        self.pending_queries.clear()
-        
-        print(f"Executing batch of {len(queries)} queries")
+        self._ensure_primitives()
+        batch = list(self.pending_queries.items())
+        self.pending_queries = OrderedDict()
+        self.inflight_queries.update(batch)
         
-        # Execute queries in parallel
-        results = await asyncio.gather(
-            *[self._execute_single_query(q) for q in queries],
-            return_exceptions=True
-        )
+        task = asyncio.ensure_future(self._execute_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    def _ensure_primitives(self):
+        """Create the semaphore and event in the running loop.
         
-        # Resolve futures
-        for query_info, result in zip(queries, results):
-            future = query_info['future']
-            if not future.done():
-                if isinstance(result, Exception):
-                    future.set_exception(result)
+        Before Python 3.10 asyncio primitives bind to the loop current at
+        construction, so they cannot be built in ``__init__``.
+        """
+        if self._batch_slots is None:
+            self._batch_slots = asyncio.Semaphore(self.max_concurrent_batches)
+            self._capacity_available = asyncio.Event()
+    
+    async def _execute_batch(self, batch: List[Tuple[Tuple[str, str], Dict[str, Any]]]):
+        """Execute batched queries."""
+        queries = [query_info for _, query_info in batch]
+        
+        async with self._batch_slots:
+            print(f"Executing batch of {len(queries)} queries")
+            
+            try:
+                if self.executor is not None:
+                    results = self.executor(queries)
+                    if asyncio.iscoroutine(results) or isinstance(results, asyncio.Future):
+                        results = await results
+                    results = list(results)
+                    if len(results) != len(queries):
+                        raise ValueError(f"Executor returned {len(results)} results for {len(queries)} queries")
                 else:
-                    future.set_result(result)
+                    # Execute queries in parallel
+                    results = await asyncio.gather(
+                        *[self._execute_single_query(q) for q in queries],
+                        return_exceptions=True
+                    )
+            except Exception as e:
+                results = [e] * len(queries)
+        
+        # Resolve every future waiting on each query
+        for (key, query_info), result in zip(batch, results):
+            self.inflight_queries.pop(key, None)
+            for future in query_info['futures']:
+                if not future.done():
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        self._capacity_available.set()
         
         # Update stats
         self.batch_stats['total_batches'] += 1
-        self.batch_stats['total_queries'] += len(queries)
+        self.batch_stats['executed_queries'] += len(queries)
         self.batch_stats['average_batch_size'] = (
-            self.batch_stats['total_queries'] / self.batch_stats['total_batches']
+            self.batch_stats['executed_queries'] / self.batch_stats['total_batches']
         )
     
     async def _execute_single_query(self, query_info: Dict[str, Any]) -> Any:
@@ -545,11 +1365,130 @@ class QueryBatchProcessor:
             }
         }
     
+    def _batch_key(self, query: str, variables: Dict) -> Tuple[str, str]:
+        """Identity of a (query, variables) pair for coalescing."""
+        return ParsedDocumentCache.hash_query(query), json.dumps(variables, sort_keys=True, default=str)
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get batch statistics."""
         return self.batch_stats.copy()
 
 
+# DataLoader
+class DataLoader:
+    """Per-key batching and memoization for resolvers.
+    
+    Keys requested in the same event-loop tick (or within ``batch_interval``)
+    are passed together to ``batch_load_fn``, which returns one value per key
+    in the same order; an Exception instance fails just that key.
+    """
+    
+    def __init__(
+        self,
+        batch_load_fn: Callable[[List[Any]], Any],
+        max_batch_size: int = 100,
+        batch_interval: float = 0.0,
+        cache: bool = True
+    ):
+        self.batch_load_fn = batch_load_fn
+        self.max_batch_size = max_batch_size
+        self.batch_interval = batch_interval
+        self.cache = cache
+        self._futures: Dict[Any, asyncio.Future] = {}
+        self._queue: OrderedDict[Any, List[asyncio.Future]] = OrderedDict()
+        self._dispatch_handle: Optional[asyncio.Handle] = None
+        self._batch_tasks: Set[asyncio.Task] = set()
+        self.stats = {
+            'batches': 0,
+            'loaded_keys': 0,
+            'cache_hits': 0
+        }
+    
+    def load(self, key: Any) -> asyncio.Future:
+        """Load a value by key; await the returned future."""
+        if self.cache and key in self._futures:
+            self.stats['cache_hits'] += 1
+            return self._futures[key]
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._futures[key] = future
+        
+        self._queue.setdefault(key, []).append(future)
+        
+        if len(self._queue) >= self.max_batch_size:
+            self._dispatch()
+        elif self._dispatch_handle is None:
+            if self.batch_interval > 0:
+                self._dispatch_handle = loop.call_later(self.batch_interval, self._dispatch)
+            else:
+                self._dispatch_handle = loop.call_soon(self._dispatch)
+        
+        return future
+    
+    async def load_many(self, keys: List[Any]) -> List[Any]:
+        """Load several keys in one batch."""
+        return list(await asyncio.gather(*[self.load(key) for key in keys]))
+    
+    def prime(self, key: Any, value: Any):
+        """Seed the cache with a known value."""
+        if self.cache and key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+    
+    def clear(self, key: Any = None):
+        """Forget one cached key, or all of them."""
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+    
+    def _dispatch(self):
+        """Send queued keys to the batch function."""
+        if self._dispatch_handle is not None:
+            self._dispatch_handle.cancel()
+            self._dispatch_handle = None
+        if not self._queue:
+            return
+        
+        queue = self._queue
+        self._queue = OrderedDict()
+        
+        task = asyncio.ensure_future(self._load_batch(queue))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+    
+    async def _load_batch(self, queue: OrderedDict):
+        """Call the batch function and resolve each key's futures."""
+        keys = list(queue)
+        
+        try:
+            values = self.batch_load_fn(keys)
+            if asyncio.iscoroutine(values) or isinstance(values, asyncio.Future):
+                values = await values
+            values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(f"batch_load_fn returned {len(values)} values for {len(keys)} keys")
+        except Exception as e:
+            values = [e] * len(keys)
+        
+        for key, value in zip(keys, values):
+            if isinstance(value, Exception):
+                # Failures are not cached so a later load can retry
+                self._futures.pop(key, None)
+            for future in queue[key]:
+                if not future.done():
+                    if isinstance(value, Exception):
+                        future.set_exception(value)
+                    else:
+                        future.set_result(value)
+        
+        self.stats['batches'] += 1
+        self.stats['loaded_keys'] += len(keys)
+
+
 # Performance Monitor
 class PerformanceMonitor:
     """Monitor GraphQL performance."""
@@ -726,10 +1665,11 @@ class PerformanceOptimizer:
     """Main performance optimization engine."""
     
     def __init__(self):
-        self.complexity_analyzer = QueryComplexityAnalyzer()
-        self.depth_limiter = QueryDepthLimiter()
+        self.document_cache = ParsedDocumentCache()
+        self.complexity_analyzer = QueryComplexityAnalyzer(document_cache=self.document_cache)
+        self.depth_limiter = QueryDepthLimiter(document_cache=self.document_cache)
         self.cache_manager = CacheManager()
-        self.persisted_query_manager = PersistedQueryManager()
+        self.persisted_query_manager = PersistedQueryManager(self.document_cache)
         self.batch_processor = QueryBatchProcessor()
         self.performance_monitor = PerformanceMonitor()
         self.query_optimizer = QueryOptimizer()
@@ -740,14 +1680,16 @@ class PerformanceOptimizer:
         
         start_time = time.time()
         
+        # Parse once; persisted and repeated queries are a cache hit
+        query_hash = self.document_cache.hash_query(query)
+        
         # Analyze complexity
-        complexity = self.complexity_analyzer.analyze(query, variables)
+        complexity = self.complexity_analyzer.analyze(query, variables, query_hash)
         
         # Validate depth
-        is_valid_depth, depth, depth_message = self.depth_limiter.validate_depth(query)
+        is_valid_depth, depth, depth_message = self.depth_limiter.validate_depth(query, query_hash)
         
         # Check persisted queries
-        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
         is_persisted = self.persisted_query_manager.has_query(query_hash)
         
         # Check cache
@@ -825,6 +1767,7 @@ class PerformanceOptimizer:
             'metrics': self.performance_monitor.get_metrics().to_dict(),
             'cache': self.cache_manager.get_metrics(),
             'persistedQueries': self.persisted_query_manager.get_statistics(),
+            'documentCache': self.document_cache.get_stats(),
             'batchProcessor': self.batch_processor.get_stats()
         }
 
@@ -890,6 +1833,25 @@ async def main():
     print(f"   Cache hit for user:3: {user3 is not None}")
     print(f"   Cache metrics: {cache.get_metrics()}")
     
+    # Bounded cache: TinyLFU keeps hot keys when a scan of cold keys passes through
+    bounded_cache = CacheManager(max_entries=2, eviction_policy=EvictionPolicy.TINY_LFU)
+    for _ in range(3):
+        bounded_cache.get("user:1") or bounded_cache.set("user:1", {"id": "1"})
+    for i in range(5):
+        bounded_cache.get(f"scan:{i}") or bounded_cache.set(f"scan:{i}", {"id": i})
+    print(f"   Bounded cache keeps hot key: {bounded_cache.get('user:1') is not None}")
+    
+    # Request coalescing: concurrent misses share one computation
+    loads = []
+    
+    async def load_user():
+        loads.append(1)
+        await asyncio.sleep(0.01)
+        return {"id": "1", "name": "Alice"}
+    
+    await asyncio.gather(*[bounded_cache.get_or_compute("user:profile:1", load_user) for _ in range(5)])
+    print(f"   Coalesced 5 concurrent misses into {len(loads)} load")
+    
     # Demo 4: Persisted Queries
     print("\n4. Persisted Queries:")
     
@@ -916,11 +1878,13 @@ async def main():
     
     batch_processor = QueryBatchProcessor(batch_size=3, batch_interval=0.01)
     
-    # Add queries to batch
+    # Add queries to batch (the repeated query shares one execution)
     queries = [
         "query { user(id: \"1\") { name } }",
         "query { user(id: \"2\") { name } }",
+        "query { user(id: \"1\") { name } }",
         "query { user(id: \"3\") { name } }",
+        "query { user(id: \"4\") { name } }",
     ]
     
     futures = []
@@ -933,6 +1897,17 @@ async def main():
     
     print(f"   Batch stats: {batch_processor.get_stats()}")
     
+    # DataLoader: resolver loads in one tick become one backend call
+    backend_calls = []
+    
+    async def load_users(ids):
+        backend_calls.append(ids)
+        return [{"id": user_id, "name": f"User {user_id}"} for user_id in ids]
+    
+    user_loader = DataLoader(load_users)
+    await asyncio.gather(*[user_loader.load(user_id) for user_id in ["1", "2", "1", "3"]])
+    print(f"   DataLoader backend calls: {backend_calls}")
+    
     # Demo 6: Performance Monitor
     print("\n6. Performance Monitor:")
     
@@ -999,6 +1974,7 @@ async def main():
     print(f"   Performance report:")
     print(f"     Metrics: {report['metrics']['totalQueries']} queries")
     print(f"     Cache hit rate: {report['cache']['hitRate']:.2%}")
+    print(f"     Parsed document cache: {report['documentCache']}")
     
     # Demo 10: Comprehensive Analysis
     print("\n10. Comprehensive Analysis:")
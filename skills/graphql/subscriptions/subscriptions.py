@@ -12,12 +12,12 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, AsyncGenerator, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 import asyncio
 import json
 import hashlib
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import defaultdict, deque
 import uuid
 
 
@@ -59,6 +59,13 @@ class EventType(Enum):
     CUSTOM = auto()
 
 
+class OverflowPolicy(Enum):
+    """What to do when a subscriber's delivery queue is full."""
+    DROP_OLDEST = auto()
+    DROP_NEWEST = auto()
+    DISCONNECT = auto()
+
+
 # Dataclasses
 @dataclass
 class SubscriptionFilter:
@@ -85,6 +92,8 @@ class SubscriptionOptions:
     connection_timeout: int = 60
     retry_attempts: int = 3
     retry_delay: int = 1000
+    queue_size: int = 100
+    overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -94,7 +103,9 @@ class SubscriptionOptions:
             'heartbeatInterval': self.heartbeat_interval,
             'connectionTimeout': self.connection_timeout,
             'retryAttempts': self.retry_attempts,
-            'retryDelay': self.retry_delay
+            'retryDelay': self.retry_delay,
+            'queueSize': self.queue_size,
+            'overflowPolicy': self.overflow_policy.name
         }
 
 
@@ -179,6 +190,7 @@ class ConnectionMetrics:
     messages_per_second: float = 0.0
     average_latency: float = 0.0
     error_rate: float = 0.0
+    dropped_messages: int = 0
     last_updated: datetime = field(default_factory=datetime.now)
 
     def to_dict(self) -> dict:
@@ -190,6 +202,7 @@ class ConnectionMetrics:
             'messagesPerSecond': self.messages_per_second,
             'averageLatency': self.average_latency,
             'errorRate': self.error_rate,
+            'droppedMessages': self.dropped_messages,
             'lastUpdated': self.last_updated.isoformat()
         }
 
@@ -198,28 +211,33 @@ class ConnectionMetrics:
 class PubSub:
     """Publish/Subscribe system for GraphQL subscriptions."""
     
-    def __init__(self):
+    def __init__(self, history_size: int = 1000):
         self.subscribers: Dict[str, List[Callable]] = defaultdict(list)
-        self.events: List[SubscriptionEvent] = []
+        self.events: Deque[SubscriptionEvent] = deque(maxlen=history_size)
         self.metrics = ConnectionMetrics()
     
     async def publish(self, event: SubscriptionEvent):
         """Publish an event to subscribers."""
         print(f"Publishing event: {event.type.name}")
         
-        # Store event
+        # Store event (ring buffer keeps the most recent history_size)
         self.events.append(event)
         
         # Update metrics
         self.metrics.total_messages += 1
         
-        # Notify subscribers
+        # Notify subscribers concurrently
         topic = event.type.name
-        for callback in self.subscribers.get(topic, []):
-            try:
-                await callback(event)
-            except Exception as e:
-                print(f"Error notifying subscriber: {e}")
+        callbacks = self.subscribers.get(topic, [])
+        results = await asyncio.gather(*[callback(event) for callback in callbacks], return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error notifying subscriber: {result}")
+    
+    def get_history(self, event_type: Optional[EventType] = None, limit: Optional[int] = None) -> List[SubscriptionEvent]:
+        """Get recent events, oldest first."""
+        events = [e for e in self.events if event_type is None or e.type == event_type]
+        return events[-limit:] if limit else events
     
     def subscribe(self, topic: str, callback: Callable):
         """Subscribe to a topic."""
@@ -240,13 +258,34 @@ class PubSub:
 
 # Subscription Manager
 class SubscriptionManager:
-    """Manage GraphQL subscriptions."""
+    """Manage GraphQL subscriptions.
+    
+    Subscriptions are indexed by the event types their query listens to and,
+    when they have an equality filter, by that field's value, so an event only
+    reaches subscriptions that can match it. Matching events go onto bounded
+    per-subscription queues drained by a pool of delivery workers.
+    """
     
-    def __init__(self, pubsub: PubSub):
+    def __init__(self, pubsub: PubSub, delivery_concurrency: int = 16):
         self.pubsub = pubsub
         self.subscriptions: Dict[str, Subscription] = {}
         self.connections: Dict[str, Dict[str, Any]] = {}
         self.metrics = ConnectionMetrics()
+        self.delivery_concurrency = delivery_concurrency
+        
+        # Routing index: event type -> unfiltered subscriptions, and
+        # event type -> field -> value -> subscriptions with that eq filter
+        self._unfiltered: Dict[EventType, Dict[str, Subscription]] = defaultdict(dict)
+        self._by_value: Dict[EventType, Dict[str, Dict[Any, Dict[str, Subscription]]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        self._routes: Dict[str, Tuple[Set[EventType], Optional[SubscriptionFilter], List[SubscriptionFilter]]] = {}
+        
+        # Delivery: bounded queue per subscription, ready subscriptions for workers
+        self._queues: Dict[str, Deque[SubscriptionEvent]] = {}
+        self._ready: Optional[asyncio.Queue] = None
+        self._scheduled: Set[str] = set()
+        self._workers: List[asyncio.Task] = []
     
     async def create_subscription(
         self,
@@ -267,6 +306,7 @@ class SubscriptionManager:
         )
         
         self.subscriptions[subscription_id] = subscription
+        self._index_subscription(subscription)
         self.metrics.total_connections += 1
         self.metrics.active_connections += 1
         
@@ -278,6 +318,7 @@ class SubscriptionManager:
         if subscription_id in self.subscriptions:
             subscription = self.subscriptions[subscription_id]
             subscription.status = SubscriptionStatus.DISCONNECTED
+            self._unindex_subscription(subscription_id)
             del self.subscriptions[subscription_id]
             self.metrics.active_connections -= 1
             
@@ -299,25 +340,163 @@ class SubscriptionManager:
         return subscriptions
     
     async def handle_event(self, event: SubscriptionEvent):
-        """Handle an incoming event and notify relevant subscriptions."""
+        """Handle an incoming event and queue it for relevant subscriptions."""
         print(f"Handling event: {event.type.name}")
         
-        for subscription in self.subscriptions.values():
-            if await self._should_notify(subscription, event):
-                await self._notify_subscription(subscription, event)
+        for subscription in self._candidates(event):
+            residual_filters = self._routes[subscription.id][2]
+            if all(self._matches_filter(event, f) for f in residual_filters):
+                self._enqueue(subscription, event)
+    
+    async def drain(self):
+        """Wait until every queued event has been delivered."""
+        if self._ready is not None:
+            await self._ready.join()
+    
+    async def close(self):
+        """Stop the delivery workers."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._ready = None
+        self._scheduled.clear()
+    
+    def matching_subscriptions(self, event: SubscriptionEvent) -> List[Subscription]:
+        """Subscriptions an event would be delivered to."""
+        return [s for s in self._candidates(event) if all(
+            self._matches_filter(event, f) for f in self._routes[s.id][2]
+        )]
     
     async def _should_notify(self, subscription: Subscription, event: SubscriptionEvent) -> bool:
         """Check if subscription should be notified of event."""
-        # Check filters
+        route = self._routes.get(subscription.id) or self._build_route(subscription)
+        if event.type not in route[0]:
+            return False
+        return all(self._matches_filter(event, f) for f in subscription.options.filters)
+    
+    def _candidates(self, event: SubscriptionEvent) -> List[Subscription]:
+        """Subscriptions listening to the event type whose indexed filter matches."""
+        candidates = list(self._unfiltered.get(event.type, {}).values())
+        for field_name, by_value in self._by_value.get(event.type, {}).items():
+            value = event.payload.get(field_name)
+            try:
+                matched = by_value.get(value)
+            except TypeError:  # unhashable payload value cannot equal an indexed one
+                continue
+            if matched:
+                candidates.extend(matched.values())
+        return candidates
+    
+    def _build_route(
+        self, subscription: Subscription
+    ) -> Tuple[Set[EventType], Optional[SubscriptionFilter], List[SubscriptionFilter]]:
+        """Resolve event types once and pick an equality filter to index on."""
+        # Root fields are camelCase (postCreated) while event types are POST_CREATED
+        query = subscription.query.lower().replace('_', '')
+        event_types = {
+            event_type for event_type in EventType
+            if event_type.name.lower().replace('_', '') in query
+        }
+        
+        indexed_filter = None
+        residual_filters = []
         for filter_option in subscription.options.filters:
-            if not self._matches_filter(event, filter_option):
-                return False
+            if indexed_filter is None and filter_option.operator == "eq":
+                try:
+                    hash(filter_option.field_value)
+                    indexed_filter = filter_option
+                    continue
+                except TypeError:
+                    pass
+            residual_filters.append(filter_option)
         
-        # Check query relevance (simplified)
-        query_lower = subscription.query.lower()
-        event_type = event.type.name.lower()
+        return event_types, indexed_filter, residual_filters
+    
+    def _index_subscription(self, subscription: Subscription):
+        route = self._build_route(subscription)
+        self._routes[subscription.id] = route
+        event_types, indexed_filter, _ = route
+        
+        for event_type in event_types:
+            if indexed_filter is None:
+                self._unfiltered[event_type][subscription.id] = subscription
+            else:
+                by_value = self._by_value[event_type][indexed_filter.field_name]
+                by_value.setdefault(indexed_filter.field_value, {})[subscription.id] = subscription
+    
+    def _unindex_subscription(self, subscription_id: str):
+        route = self._routes.pop(subscription_id, None)
+        self._queues.pop(subscription_id, None)
+        if route is None:
+            return
+        
+        event_types, indexed_filter, _ = route
+        for event_type in event_types:
+            if indexed_filter is None:
+                self._unfiltered[event_type].pop(subscription_id, None)
+                continue
+            by_field = self._by_value[event_type]
+            by_value = by_field[indexed_filter.field_name]
+            matched = by_value.get(indexed_filter.field_value, {})
+            matched.pop(subscription_id, None)
+            if not matched:
+                by_value.pop(indexed_filter.field_value, None)
+                if not by_value:
+                    del by_field[indexed_filter.field_name]
+    
+    def _enqueue(self, subscription: Subscription, event: SubscriptionEvent):
+        """Put an event on a subscription's bounded queue, applying its overflow policy."""
+        options = subscription.options
+        queue = self._queues.get(subscription.id)
+        if queue is None:
+            queue = self._queues[subscription.id] = deque()
         
-        return event_type in query_lower
+        if len(queue) >= options.queue_size:
+            if options.overflow_policy == OverflowPolicy.DISCONNECT:
+                print(f"  Disconnecting slow consumer {subscription.id}")
+                # Every queued event is lost along with the incoming one
+                self.metrics.dropped_messages += len(queue) + 1
+                self._unindex_subscription(subscription.id)
+                self.subscriptions.pop(subscription.id, None)
+                subscription.status = SubscriptionStatus.ERROR
+                self.metrics.active_connections -= 1
+                return
+            self.metrics.dropped_messages += 1
+            if options.overflow_policy == OverflowPolicy.DROP_NEWEST:
+                return
+            queue.popleft()
+        
+        queue.append(event)
+        
+        if subscription.id not in self._scheduled:
+            self._ensure_workers()
+            self._scheduled.add(subscription.id)
+            self._ready.put_nowait(subscription.id)
+    
+    def _ensure_workers(self):
+        if self._ready is None:
+            self._ready = asyncio.Queue()
+        if not self._workers:
+            self._workers = [
+                asyncio.ensure_future(self._delivery_worker())
+                for _ in range(self.delivery_concurrency)
+            ]
+    
+    async def _delivery_worker(self):
+        """Deliver queued events; one worker owns a subscription at a time, keeping order."""
+        while True:
+            subscription_id = await self._ready.get()
+            try:
+                queue = self._queues.get(subscription_id)
+                while queue:
+                    subscription = self.subscriptions.get(subscription_id)
+                    if subscription is None:
+                        break
+                    await self._notify_subscription(subscription, queue.popleft())
+            finally:
+                self._scheduled.discard(subscription_id)
+                self._ready.task_done()
     
     def _matches_filter(self, event: SubscriptionEvent, filter_option: SubscriptionFilter) -> bool:
         """Check if event matches filter."""
@@ -822,6 +1001,16 @@ async def main():
     # Handle events
     await manager.handle_event(post_event)
     await manager.handle_event(comment_event)
+    await manager.drain()
+    
+    # Only subscriptions indexed under the event type and filter value are touched
+    other_author_event = SubscriptionEvent(
+        id=str(uuid.uuid4()),
+        type=EventType.POST_CREATED,
+        payload={"id": "2", "title": "Another Post", "authorId": "7"}
+    )
+    print(f"  Matches for authorId=7: {len(manager.matching_subscriptions(other_author_event))}")
+    print(f"  Event history: {len(pubsub.get_history())} events")
     
     # Demo 3: WebSocket Manager
     print("\n3. WebSocket Manager:")
@@ -985,6 +1174,7 @@ async def main():
     
     print(f"  Final connection count: {ws_manager.get_connection_count()}")
     print(f"  Final subscription count: {manager.get_metrics().active_connections}")
+    await manager.close()
     
     print("\n=== Demo Complete ===")
 
@@ -11,6 +11,7 @@ from __future__ import annotations
 
 import warnings
 import logging
+import math
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from enum import Enum, auto
 from dataclasses import dataclass, field
@@ -97,7 +98,7 @@ class EncodingConfig:
     encoding_type: EncodingType = EncodingType.ANGLE
     rotation_axis: str = "y"
     normalize: bool = True
-    feature_range: Tuple[float, float] = (-np.pi, np.pi)
+    feature_range: Tuple[float, float] = (-math.pi, math.pi)
     n_features: Optional[int] = None
 
     def __post_init__(self) -> None:
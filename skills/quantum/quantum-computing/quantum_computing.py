@@ -15,6 +15,7 @@ from __future__ import annotations
 import math
 import copy
 import enum
+import functools
 import logging
 from dataclasses import dataclass, field
 from typing import Any, Optional
@@ -167,14 +168,33 @@ class CircuitResult:
 # ---------------------------------------------------------------------------
 # Pauli Matrices (constants)
 # ---------------------------------------------------------------------------
+#
+# Built on first use instead of at import so loading this module does not
+# materialise numpy; ``PAULI_X`` and friends remain module attributes through
+# ``__getattr__`` below.
+
+_CONSTANT_MATRIX_NAMES = frozenset(
+    {"I_MATRIX", "PAULI_X", "PAULI_Y", "PAULI_Z", "HADAMARD", "PHASE_S", "PHASE_T"}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _constant_matrices() -> dict[str, np.ndarray]:
+    return {
+        "I_MATRIX": np.eye(2, dtype=complex),
+        "PAULI_X": np.array([[0, 1], [1, 0]], dtype=complex),
+        "PAULI_Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+        "PAULI_Z": np.array([[1, 0], [0, -1]], dtype=complex),
+        "HADAMARD": (1 / math.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex),
+        "PHASE_S": np.array([[1, 0], [0, 1j]], dtype=complex),
+        "PHASE_T": np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=complex),
+    }
+
 
-I_MATRIX = np.eye(2, dtype=complex)
-PAULI_X = np.array([[0, 1], [1, 0]], dtype=complex)
-PAULI_Y = np.array([[0, -1j], [1j, 0]], dtype=complex)
-PAULI_Z = np.array([[1, 0], [0, -1]], dtype=complex)
-HADAMARD = (1 / math.sqrt(2)) * np.array([[1, 1], [1, -1]], dtype=complex)
-PHASE_S = np.array([[1, 0], [0, 1j]], dtype=complex)
-PHASE_T = np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=complex)
+def __getattr__(name: str) -> Any:
+    if name in _CONSTANT_MATRIX_NAMES:
+        return _constant_matrices()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _rotation_x(theta: float) -> np.ndarray:
@@ -205,19 +225,19 @@ def _rotation_z(theta: float) -> np.ndarray:
 class GateMatrixFactory:
     """Produces unitary matrices for supported gates."""
 
-    _SINGLE_QUBIT_GATES: dict[GateType, np.ndarray] = {
-        GateType.H: HADAMARD,
-        GateType.X: PAULI_X,
-        GateType.Y: PAULI_Y,
-        GateType.Z: PAULI_Z,
-        GateType.S: PHASE_S,
-        GateType.T: PHASE_T,
+    _SINGLE_QUBIT_GATES: dict[GateType, str] = {
+        GateType.H: "HADAMARD",
+        GateType.X: "PAULI_X",
+        GateType.Y: "PAULI_Y",
+        GateType.Z: "PAULI_Z",
+        GateType.S: "PHASE_S",
+        GateType.T: "PHASE_T",
     }
 
     @classmethod
     def get_matrix(cls, gate: Gate) -> np.ndarray:
         if gate.gate_type in cls._SINGLE_QUBIT_GATES:
-            return cls._SINGLE_QUBIT_GATES[gate.gate_type].copy()
+            return _constant_matrices()[cls._SINGLE_QUBIT_GATES[gate.gate_type]].copy()
         if gate.gate_type == GateType.RX:
             return _rotation_x(gate.params[0])
         if gate.gate_type == GateType.RY:
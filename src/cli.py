@@ -18,35 +18,22 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
+import json
+import os
 import sys
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, Iterable, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 # Project root is two levels up from this file (src/ -> <project_root>).
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
 AGENTS_DIR = PROJECT_ROOT / "agents"
 SKILLS_DIR = PROJECT_ROOT / "skills"
 
-
-def _discover_dirs_with_file(parent: Path, target_filename: str) -> List[Path]:
-    """Return sorted child directories of *parent* that contain *target_filename*.
-
-    Silently returns an empty list if *parent* does not exist, so the CLI is
-    usable even when only one of ``agents/`` / ``skills/`` is present.
-    """
-    if not parent.is_dir():
-        return []
-    found = []
-    for child in parent.iterdir():
-        if child.is_dir() and (child / target_filename).exists():
-            found.append(child)
-    return sorted(found)
-
-
-def list_agents() -> List[str]:
-    """List all available agent names (sorted)."""
-    return [d.name for d in _discover_dirs_with_file(AGENTS_DIR, "agent.py")]
+# Discovery manifest (see ``load_index``). Override the location with
+# ``GROK_INDEX_PATH`` when the checkout itself is read-only.
+INDEX_PATH = Path(os.environ.get("GROK_INDEX_PATH", PROJECT_ROOT / ".grok-index.json"))
+INDEX_VERSION = 1
 
 
 def _find_skill_script(skill_dir: Path) -> Optional[Path]:
@@ -68,29 +55,321 @@ def _find_skill_script(skill_dir: Path) -> Optional[Path]:
     return None
 
 
-def list_skills() -> List[str]:
+def _find_agent_script(agent_dir: Path) -> Optional[Path]:
+    """Locate ``agent.py`` inside an agent directory, or ``None``."""
+    script = agent_dir / "agent.py"
+    return script if script.exists() else None
+
+
+# ---------------------------------------------------------------------------
+# Static metadata
+# ---------------------------------------------------------------------------
+#
+# Executing an agent or skill is the only way ``_run_entry`` learns what it
+# exposes, and some modules are thousands of lines and import numpy. The
+# helpers below read the same facts from the syntax tree instead, so a module
+# can be inventoried without running any of its code.
+
+
+def _first_line(doc: Optional[str]) -> str:
+    """Return the first non-blank line of *doc* (``""`` if there is none)."""
+    return next((line.strip() for line in (doc or "").splitlines() if line.strip()), "")
+
+
+def _function_info(node: Any) -> Dict[str, Any]:
+    """Describe a ``def``/``async def`` node: name, signature, summary and line."""
+    import ast
+
+    prefix = "async " if isinstance(node, ast.AsyncFunctionDef) else ""
+    signature = f"{prefix}{node.name}({ast.unparse(node.args)})"
+    if node.returns is not None:
+        signature += f" -> {ast.unparse(node.returns)}"
+    return {
+        "name": node.name,
+        "signature": signature,
+        "summary": _first_line(ast.get_docstring(node)),
+        "lineno": node.lineno,
+    }
+
+
+def extract_metadata(module_path: Path) -> Dict[str, Any]:
+    """Statically describe the Python module at *module_path* without importing it.
+
+    Returns a JSON-serialisable dict with the module ``docstring`` and its
+    ``summary`` line, ``has_main``, the sorted top-level ``imports`` (module
+    names; relative imports keep their leading dots), public ``classes`` with
+    their bases and public methods, public top-level ``functions`` and the
+    number of ``lines``.
+
+    Raises ``OSError`` if the file cannot be read and ``SyntaxError`` if it
+    does not parse.
+    """
+    import ast
+
+    source = module_path.read_bytes()
+    tree = ast.parse(source, filename=str(module_path))
+
+    imports = set()
+    classes: List[Dict[str, Any]] = []
+    functions: List[Dict[str, Any]] = []
+    has_main = False
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            imports.add("." * node.level + (node.module or ""))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            has_main = has_main or node.name == "main"
+            if not node.name.startswith("_"):
+                functions.append(_function_info(node))
+        elif isinstance(node, ast.ClassDef) and not node.name.startswith("_"):
+            methods = [
+                item.name
+                for item in node.body
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef))
+                and (not item.name.startswith("_") or item.name == "__init__")
+            ]
+            classes.append(
+                {
+                    "name": node.name,
+                    "bases": [ast.unparse(base) for base in node.bases],
+                    "summary": _first_line(ast.get_docstring(node)),
+                    "methods": methods,
+                    "lineno": node.lineno,
+                }
+            )
+
+    docstring = ast.get_docstring(tree) or ""
+    return {
+        "docstring": docstring,
+        "summary": _first_line(docstring),
+        "has_main": has_main,
+        "imports": sorted(imports),
+        "classes": classes,
+        "functions": functions,
+        "lines": len(source.splitlines()),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Discovery manifest
+# ---------------------------------------------------------------------------
+#
+# Walking ``agents/`` and every ``skills/<category>/`` and probing candidate
+# scripts costs one directory read plus up to two failed lookups per entry,
+# which is slow on network-mounted checkouts. The manifest caches the result
+# keyed by directory mtime: a directory is only re-read when its own mtime
+# changed, and an entry is only re-probed when its directory or script mtime
+# changed. Entries without a script are always re-probed, since a legacy
+# ``resources/resources.py`` can appear without touching the skill directory's
+# mtime. Layout::
+#
+#     {"version": 1, "root": "...",
+#      "agents": {"mtime_ns": ..., "entries": {"<name>": <entry>}},
+#      "skills": {"mtime_ns": ..., "entries": {"<category>":
+#                 {"mtime_ns": ..., "entries": {"<skill>": <entry>}}}}}
+#
+# where ``<entry>`` is ``{"mtime_ns", "script", "script_mtime_ns", "has_main",
+# "summary"}`` and ``script`` is relative to the project root (``None`` for
+# directories without a runnable script).
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return the mtime of *path* in nanoseconds, or ``None`` if it is gone."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _script_summary(script: Path) -> Dict[str, Any]:
+    """Return ``has_main`` and the first docstring line of *script* without importing it."""
+    try:
+        metadata = extract_metadata(script)
+    except (OSError, SyntaxError, ValueError):
+        return {"has_main": False, "summary": ""}
+    return {"has_main": metadata["has_main"], "summary": metadata["summary"]}
+
+
+def _refresh_entry(
+    directory: Path,
+    cached: Optional[Dict[str, Any]],
+    locate: Callable[[Path], Optional[Path]],
+) -> Optional[Dict[str, Any]]:
+    """Return the manifest entry for *directory*, reusing *cached* when still valid."""
+    mtime = _mtime_ns(directory)
+    if mtime is None:
+        return None
+    if cached is not None and cached.get("mtime_ns") == mtime and cached.get("script") is not None:
+        if _mtime_ns(PROJECT_ROOT / cached["script"]) == cached.get("script_mtime_ns"):
+            return cached
+
+    script = locate(directory)
+    entry: Dict[str, Any] = {
+        "mtime_ns": mtime,
+        "script": None,
+        "script_mtime_ns": None,
+        "has_main": False,
+        "summary": "",
+    }
+    if script is not None:
+        entry["script"] = script.relative_to(PROJECT_ROOT).as_posix()
+        entry["script_mtime_ns"] = _mtime_ns(script)
+        entry.update(_script_summary(script))
+    return entry
+
+
+def _sync_children(
+    parent: Path,
+    cached: Optional[Dict[str, Any]],
+    refresh: Callable[[Path, Optional[Dict[str, Any]]], Optional[Dict[str, Any]]],
+) -> Dict[str, Any]:
+    """Refresh the manifest node for the child directories of *parent*.
+
+    The listing of *parent* is only re-read when its mtime changed (children
+    were added, removed or renamed); otherwise the cached child names are
+    reused and each child is handed to *refresh* with its cached entry.
+    """
+    mtime = _mtime_ns(parent)
+    if mtime is None:
+        return {"mtime_ns": None, "entries": {}}
+    cached = cached or {}
+    old_entries: Dict[str, Any] = cached.get("entries", {})
+    if cached.get("mtime_ns") == mtime:
+        names = list(old_entries)
+    else:
+        names = sorted(child.name for child in parent.iterdir() if child.is_dir())
+    entries: Dict[str, Any] = {}
+    for name in names:
+        entry = refresh(parent / name, old_entries.get(name))
+        if entry is not None:
+            entries[name] = entry
+    return {"mtime_ns": mtime, "entries": entries}
+
+
+def _read_index() -> Optional[Dict[str, Any]]:
+    """Load the manifest from disk; ``None`` if missing, corrupt or for another checkout."""
+    try:
+        with open(INDEX_PATH, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return None
+    if data.get("root") != str(PROJECT_ROOT):
+        return None
+    return data
+
+
+def _write_index(index: Dict[str, Any]) -> None:
+    """Atomically persist *index*. Failures (e.g. read-only checkout) are ignored."""
+    tmp_path = INDEX_PATH.with_name(f"{INDEX_PATH.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(index, handle, separators=(",", ":"))
+        os.replace(tmp_path, INDEX_PATH)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_index(rebuild: bool = False) -> Dict[str, Any]:
+    """Return the discovery manifest, refreshing only directories whose mtime changed.
+
+    With *rebuild* the cached manifest is ignored and every agent and skill is
+    re-probed. The refreshed manifest is written back only when it changed.
+    """
+    cached = None if rebuild else _read_index()
+    old = cached or {}
+
+    def refresh_agent(agent_dir: Path, entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return _refresh_entry(agent_dir, entry, _find_agent_script)
+
+    def refresh_skill(skill_dir: Path, entry: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        return _refresh_entry(skill_dir, entry, _find_skill_script)
+
+    def refresh_category(category_dir: Path, node: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return _sync_children(category_dir, node, refresh_skill)
+
+    index = {
+        "version": INDEX_VERSION,
+        "root": str(PROJECT_ROOT),
+        "agents": _sync_children(AGENTS_DIR, old.get("agents"), refresh_agent),
+        "skills": _sync_children(SKILLS_DIR, old.get("skills"), refresh_category),
+    }
+    if index != cached:
+        _write_index(index)
+    return index
+
+
+def _indexed_agents(index: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map agent name -> manifest entry for agents that have a script."""
+    return {
+        name: entry
+        for name, entry in index["agents"]["entries"].items()
+        if entry.get("script") is not None
+    }
+
+
+def _indexed_skills(index: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Map ``<category>/<skill-name>`` -> manifest entry for skills that have a script."""
+    skills: Dict[str, Dict[str, Any]] = {}
+    for category, node in index["skills"]["entries"].items():
+        for name, entry in node["entries"].items():
+            if entry.get("script") is not None:
+                skills[f"{category}/{name}"] = entry
+    return skills
+
+
+def list_agents(rebuild: bool = False) -> List[str]:
+    """List all available agent names (sorted)."""
+    return sorted(_indexed_agents(load_index(rebuild)))
+
+
+def list_skills(rebuild: bool = False) -> List[str]:
     """List all available skills as ``<category>/<skill-name>`` (sorted, unique)."""
-    if not SKILLS_DIR.is_dir():
-        return []
-    skills: List[str] = []
-    for category_dir in sorted(SKILLS_DIR.iterdir()):
-        if not category_dir.is_dir():
-            continue
-        for skill_dir in sorted(category_dir.iterdir()):
-            if not skill_dir.is_dir():
-                continue
-            if _find_skill_script(skill_dir) is not None:
-                skills.append(f"{category_dir.name}/{skill_dir.name}")
-    # Deduplicate defensively (category/skill pairs are unique already).
-    return sorted(set(skills))
+    return sorted(_indexed_skills(load_index(rebuild)))
+
 
+# Heavy third-party packages whose plain ``import x`` is deferred while an
+# agent or skill module executes: the name is bound to a lazy module that
+# runs the real import on first attribute access, i.e. when a class that
+# needs it is first used. ``from x import y`` still imports eagerly, since it
+# reads an attribute immediately. Set ``GROK_EAGER_IMPORTS=1`` to disable.
+LAZY_IMPORTS = frozenset({"numpy", "scipy", "pandas", "matplotlib", "sklearn", "torch"})
 
-def _load_module(module_path: Path, module_name: str) -> ModuleType:
+
+class _LazyImportFinder:
+    """Meta-path finder that wraps ``LAZY_IMPORTS`` specs in ``importlib.util.LazyLoader``."""
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self._names = frozenset(names)
+        self._finding: set = set()
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if fullname not in self._names or fullname in self._finding:
+            return None
+        # Ask the remaining finders for the real spec; guard against recursion.
+        self._finding.add(fullname)
+        try:
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            self._finding.discard(fullname)
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        return spec
+
+
+def _load_module(module_path: Path, module_name: str, lazy: bool = True) -> ModuleType:
     """Dynamically import *module_path* under a unique *module_name*.
 
     Uses a unique name per call so repeated invocations do not overwrite each
     other in ``sys.modules`` (the previous implementation reused the same key
     for every agent/skill, causing stale modules to leak across calls).
+    With ``lazy=False`` the ``LAZY_IMPORTS`` packages are imported eagerly.
     """
     spec = importlib.util.spec_from_file_location(module_name, module_path)
     if spec is None or spec.loader is None:  # pragma: no cover - extremely rare
@@ -98,12 +377,19 @@ def _load_module(module_path: Path, module_name: str) -> ModuleType:
     module = importlib.util.module_from_spec(spec)
     # Register before exec so the module can import itself by name if needed.
     sys.modules[module_name] = module
+    finder = None
+    if lazy and not os.environ.get("GROK_EAGER_IMPORTS"):
+        finder = _LazyImportFinder(LAZY_IMPORTS)
+        sys.meta_path.insert(0, finder)
     try:
         spec.loader.exec_module(module)
     except Exception:
         # Don't leave a half-loaded module in sys.modules on failure.
         sys.modules.pop(module_name, None)
         raise
+    finally:
+        if finder is not None:
+            sys.meta_path.remove(finder)
     return module
 
 
@@ -121,13 +407,21 @@ def _run_entry(name: str, module_path: Path, kind: str, verbose: bool) -> int:
         print(f"Running {kind}: {name}")
         print(f"  path: {module_path}")
 
-    module_name = f"awesome_grok_skills_{kind}_{name.replace('-', '_').replace('/', '_')}"
     try:
-        module = _load_module(module_path, module_name)
+        module = _load_module(module_path, _module_name(kind, name))
     except Exception as exc:  # noqa: BLE001 - surface any load failure to the user
         print(f"Error: failed to load {kind} '{name}': {exc}", file=sys.stderr)
         return 1
+    return _invoke_main(module, name, kind)
+
+
+def _module_name(kind: str, name: str) -> str:
+    """Return the ``sys.modules`` key an agent or skill is loaded under."""
+    return f"awesome_grok_skills_{kind}_{name.replace('-', '_').replace('/', '_')}"
 
+
+def _invoke_main(module: ModuleType, name: str, kind: str) -> int:
+    """Call ``module.main()`` and turn its outcome into a process exit code."""
     main_fn: Optional[Callable[..., object]] = getattr(module, "main", None)
     if main_fn is None or not callable(main_fn):
         print(f"No main() function found in {kind} {name}", file=sys.stderr)
@@ -135,11 +429,16 @@ def _run_entry(name: str, module_path: Path, kind: str, verbose: bool) -> int:
         print(f"Available in module: {public}", file=sys.stderr)
         return 1
 
+    # Entries that parse sys.argv must not see the grok command line itself.
+    saved_argv = sys.argv
+    sys.argv = [getattr(module, "__file__", None) or name]
     try:
         result = main_fn()
     except SystemExit as exc:
         # Honour explicit sys.exit() calls inside the entry's main().
         return int(exc.code) if exc.code is not None else 0
+    finally:
+        sys.argv = saved_argv
     # main() may return None, an int, or anything coercible to int-ish.
     if isinstance(result, int):
         return result
@@ -171,14 +470,653 @@ def run_skill(skill_name: str, verbose: bool = False) -> int:
     return _run_entry(skill_name, skill_path, "skill", verbose)
 
 
-def _print_list(title: str, items: Iterable[str]) -> int:
-    """Print a bordered list of *items* and a total count. Returns 0."""
+def resolve_entry(name: str) -> Optional[tuple]:
+    """Map *name* to ``(kind, script_path)``.
+
+    ``<category>/<skill-name>`` names a skill and anything else an agent.
+    Returns ``None`` if no script exists for *name*.
+    """
+    if "/" in name:
+        category, _, skill = name.partition("/")
+        script = _find_skill_script(SKILLS_DIR / category / skill)
+        return ("skill", script) if script is not None else None
+    script = _find_agent_script(AGENTS_DIR / name)
+    return ("agent", script) if script is not None else None
+
+
+def describe(name: str, as_json: bool = False) -> int:
+    """Print the static metadata of agent or skill *name*. Returns a process exit code.
+
+    Nothing from the module is executed; see ``extract_metadata``.
+    """
+    resolved = resolve_entry(name)
+    if resolved is None:
+        print(
+            f"Error: no agent or skill named '{name}'.\n"
+            f"Use --list-agents or --list-skills to see what is available.",
+            file=sys.stderr,
+        )
+        return 1
+    kind, script = resolved
+    try:
+        metadata = extract_metadata(script)
+    except (OSError, SyntaxError, ValueError) as exc:
+        print(f"Error: failed to parse {kind} '{name}': {exc}", file=sys.stderr)
+        return 1
+
+    relative = script.relative_to(PROJECT_ROOT).as_posix()
+    if as_json:
+        print(json.dumps({"name": name, "kind": kind, "path": relative, **metadata}, indent=2))
+        return 0
+
+    print(f"\n{kind.capitalize()}: {name}")
+    print(f"  path:    {relative} ({metadata['lines']} lines)")
+    if metadata["summary"]:
+        print(f"  summary: {metadata['summary']}")
+    print(f"  main():  {'yes' if metadata['has_main'] else 'no'}")
+    print(f"  imports: {', '.join(metadata['imports']) or '-'}")
+    print(f"\n  Classes ({len(metadata['classes'])}):")
+    for cls in metadata["classes"]:
+        bases = f"({', '.join(cls['bases'])})" if cls["bases"] else ""
+        summary = f" - {cls['summary']}" if cls["summary"] else ""
+        print(f"    {cls['name']}{bases}{summary}")
+        if cls["methods"]:
+            print(f"      methods: {', '.join(cls['methods'])}")
+    print(f"\n  Functions ({len(metadata['functions'])}):")
+    for func in metadata["functions"]:
+        summary = f" - {func['summary']}" if func["summary"] else ""
+        print(f"    {func['signature']}{summary}")
+    print()
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Import profiling
+# ---------------------------------------------------------------------------
+#
+# ``grok --profile-import <name>`` executes a module's top-level statements one
+# at a time in a fresh interpreter started with ``-X importtime``, reporting
+# how long each statement took and the cumulative cost of every module it
+# imported directly. The probe below keeps its own imports to a few small
+# stdlib modules so the target's imports are measured cold.
+
+_PROFILE_START = "@@GROK-PROFILE-START@@"
+_PROFILE_END = "@@GROK-PROFILE-END@@"
+_PROFILE_PROBE = r"""
+import __future__, ast, os, sys, time, types
+
+script, start_marker, end_marker = sys.argv[1], sys.argv[2], sys.argv[3]
+with open(script, "rb") as handle:
+    tree = ast.parse(handle.read(), script)
+module = types.ModuleType("grok_profile_target", ast.get_docstring(tree))
+module.__file__ = script
+sys.modules[module.__name__] = module
+sys.argv = [script]
+
+def label(node):
+    if isinstance(node, (ast.Import, ast.ImportFrom, ast.Assign, ast.AnnAssign, ast.AugAssign)):
+        text = ast.unparse(node)
+    elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        text = "def " + node.name
+    elif isinstance(node, ast.ClassDef):
+        text = "class " + node.name
+    elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+        text = "docstring"
+    else:
+        text = ast.unparse(node).splitlines()[0]
+    return text if len(text) <= 72 else text[:69] + "..."
+
+flags, records, error = 0, [], None
+real_stdout = sys.stdout
+sys.stdout = open(os.devnull, "w")
+sys.stderr.write(start_marker + "\n")
+sys.stderr.flush()
+for node in tree.body:
+    if isinstance(node, ast.ImportFrom) and node.module == "__future__":
+        for alias in node.names:
+            feature = getattr(__future__, alias.name, None)
+            flags |= getattr(feature, "compiler_flag", 0)
+    code = compile(ast.Module(body=[node], type_ignores=[]), script, "exec", flags=flags, dont_inherit=True)
+    started = time.perf_counter()
+    try:
+        exec(code, module.__dict__)
+    except BaseException as exc:
+        error = "line %d: %s: %s" % (node.lineno, type(exc).__name__, exc)
+    records.append({
+        "lineno": node.lineno,
+        "kind": type(node).__name__,
+        "label": label(node),
+        "ms": (time.perf_counter() - started) * 1000,
+    })
+    if error:
+        break
+sys.stderr.write(end_marker + "\n")
+sys.stderr.flush()
+sys.stdout = real_stdout
+import json
+print(json.dumps({"statements": records, "error": error}))
+"""
+
+
+def _parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Return the direct imports between the profile markers in ``-X importtime`` output."""
+    imports: List[Dict[str, Any]] = []
+    inside = False
+    for line in stderr.splitlines():
+        if line == _PROFILE_START:
+            inside = True
+        elif line == _PROFILE_END:
+            break
+        elif inside and line.startswith("import time:"):
+            fields = line[len("import time:"):].split("|")
+            if len(fields) != 3 or not fields[0].strip().isdigit():
+                continue  # Header line.
+            name = fields[2].rstrip()
+            # One space after "|", then two spaces per nesting level.
+            if len(name) - len(name.lstrip()) > 1:
+                continue
+            imports.append(
+                {
+                    "module": name.strip(),
+                    "self_ms": int(fields[0]) / 1000,
+                    "cumulative_ms": int(fields[1]) / 1000,
+                }
+            )
+    return imports
+
+
+def profile_import(script: Path, timeout: float = 120.0) -> Dict[str, Any]:
+    """Profile the cold import of *script* statement by statement.
+
+    Returns ``statements`` (per top-level statement: ``lineno``, ``kind``,
+    ``label``, ``ms``), ``imports`` (modules imported directly, with self and
+    cumulative ms), ``total_ms`` and ``error`` (the first failing statement,
+    or ``None``). Raises ``RuntimeError`` if the probe itself fails.
+    """
+    import subprocess
+
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROFILE_PROBE, str(script), _PROFILE_START, _PROFILE_END],
+        cwd=PROJECT_ROOT,
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        errors="replace",
+        timeout=timeout,
+    )
+    try:
+        report = json.loads(completed.stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        tail = (completed.stderr.strip().splitlines() or ["no output"])[-1]
+        raise RuntimeError(f"profiling probe exited with {completed.returncode}: {tail}") from None
+    report["imports"] = _parse_importtime(completed.stderr)
+    report["total_ms"] = sum(record["ms"] for record in report["statements"])
+    return report
+
+
+def print_import_profile(name: str, as_json: bool = False, top: int = 15) -> int:
+    """Print the import profile of agent or skill *name*. Returns a process exit code."""
+    resolved = resolve_entry(name)
+    if resolved is None:
+        print(f"Error: no agent or skill named '{name}'.", file=sys.stderr)
+        return 1
+    try:
+        report = profile_import(resolved[1])
+    except (OSError, RuntimeError) as exc:
+        print(f"Error: failed to profile '{name}': {exc}", file=sys.stderr)
+        return 1
+
+    if as_json:
+        print(json.dumps({"name": name, **report}, indent=2))
+        return 0 if report["error"] is None else 1
+
+    print(f"\nImport profile: {name} ({report['total_ms']:.1f} ms)")
+    if report["error"]:
+        print(f"  stopped at {report['error']}")
+    print(f"\n  Slowest top-level statements (of {len(report['statements'])}):")
+    for record in sorted(report["statements"], key=lambda r: r["ms"], reverse=True)[:top]:
+        print(f"    {record['ms']:8.2f} ms  line {record['lineno']:<5} {record['label']}")
+    print("\n  Direct imports (cumulative):")
+    for record in sorted(report["imports"], key=lambda r: r["cumulative_ms"], reverse=True)[:top]:
+        print(f"    {record['cumulative_ms']:8.2f} ms  {record['module']}")
+    print()
+    return 0 if report["error"] is None else 1
+
+
+# ---------------------------------------------------------------------------
+# Warm runner daemon
+# ---------------------------------------------------------------------------
+#
+# ``grok --serve`` keeps agents and skills imported in one long-lived process
+# and answers run requests over a Unix socket, so ``grok --daemon --skill ...``
+# skips interpreter start-up and module import. The daemon imports each entry
+# once (re-importing it when its script's mtime changes) and runs every request
+# in a forked child: the child inherits the imported modules copy-on-write, so
+# whatever main() mutates dies with it and concurrent requests do not share
+# state. A request is one JSON line ``{"kind": "skill", "name": "..."}``; the
+# child answers with one JSON document holding the exit code, main()'s
+# buffered stdout/stderr and the request's timings in milliseconds.
+
+# module name -> (script mtime_ns, module) for entries imported by the daemon.
+_WARM_MODULES: Dict[str, tuple] = {}
+
+
+def default_socket_path() -> Path:
+    """Return the daemon socket path for this checkout.
+
+    ``GROK_DAEMON_SOCKET`` overrides it; otherwise the socket lives in
+    ``$XDG_RUNTIME_DIR`` (or ``/tmp``) under a name derived from the project
+    root, keeping it short enough for ``AF_UNIX`` path limits.
+    """
+    override = os.environ.get("GROK_DAEMON_SOCKET")
+    if override:
+        return Path(override)
+    import hashlib
+
+    digest = hashlib.sha1(str(PROJECT_ROOT).encode("utf-8")).hexdigest()[:12]
+    return Path(os.environ.get("XDG_RUNTIME_DIR") or "/tmp") / f"grok-{digest}.sock"
+
+
+def _warm_module(kind: str, name: str, script: Path) -> tuple:
+    """Return ``(module, load_ms)``, importing *script* only if it is not already warm.
+
+    Heavy packages are imported eagerly here: a lazy module would stay
+    unexecuted in the daemon and be imported again, then thrown away, by
+    every forked child.
+    """
+    import time
+
+    module_name = _module_name(kind, name)
+    mtime = _mtime_ns(script)
+    cached = _WARM_MODULES.get(module_name)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], 0.0
+    started = time.perf_counter()
+    module = _load_module(script, module_name, lazy=False)
+    _WARM_MODULES[module_name] = (mtime, module)
+    return module, (time.perf_counter() - started) * 1000
+
+
+def _run_captured(module: ModuleType, name: str, kind: str) -> tuple:
+    """Run ``main()`` with stdout/stderr buffered. Returns ``(code, out, err, run_ms)``."""
+    import contextlib
+    import io
+    import time
+    import traceback
+
+    out, err = io.StringIO(), io.StringIO()
+    started = time.perf_counter()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            code = _invoke_main(module, name, kind)
+        except Exception:  # noqa: BLE001 - report like an uncaught error would
+            traceback.print_exc()
+            code = 1
+    return code, out.getvalue(), err.getvalue(), (time.perf_counter() - started) * 1000
+
+
+def _send_json(conn: Any, payload: Dict[str, Any]) -> None:
+    """Send *payload* over *conn* as one JSON document, ignoring a vanished client."""
+    try:
+        conn.sendall(json.dumps(payload).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def _handle_request(conn: Any, listener: Any = None) -> Optional[int]:
+    """Serve one daemon request arriving on *conn*.
+
+    Lookup and import happen in the daemon itself so the module stays warm;
+    main() runs in a forked child that answers on *conn* and exits. Returns
+    the child's pid, or ``None`` if the request was answered without forking.
+    *listener* is closed in the child so it cannot accept connections.
+    """
+    import time
+
+    started = time.perf_counter()
+    try:
+        conn.settimeout(5.0)
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = conn.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+        conn.settimeout(None)
+        request = json.loads(data.decode("utf-8"))
+        kind, name = request["kind"], request["name"]
+    except (OSError, ValueError, KeyError, TypeError):
+        _send_json(conn, {"exit_code": 1, "stdout": "", "stderr": "Error: malformed daemon request\n"})
+        conn.close()
+        return None
+
+    resolved = resolve_entry(name) if isinstance(name, str) else None
+    if resolved is None or resolved[0] != kind:
+        _send_json(conn, {"exit_code": 1, "stdout": "", "stderr": f"Error: {kind} '{name}' not found\n"})
+        conn.close()
+        return None
+    try:
+        module, load_ms = _warm_module(kind, name, resolved[1])
+    except Exception as exc:  # noqa: BLE001 - surface any load failure to the client
+        message = f"Error: failed to load {kind} '{name}': {exc}\n"
+        _send_json(conn, {"exit_code": 1, "stdout": "", "stderr": message})
+        conn.close()
+        return None
+
+    pid = os.fork()
+    if pid:
+        conn.close()
+        return pid
+
+    # Child: run main() and answer; never return into the daemon's loop.
+    try:
+        if listener is not None:
+            listener.close()
+        code, out, err, run_ms = _run_captured(module, name, kind)
+        total_ms = (time.perf_counter() - started) * 1000
+        _send_json(
+            conn,
+            {
+                "exit_code": code,
+                "stdout": out,
+                "stderr": err,
+                "load_ms": round(load_ms, 3),
+                "run_ms": round(run_ms, 3),
+                "total_ms": round(total_ms, 3),
+            },
+        )
+        conn.close()
+        print(
+            f"[grok-daemon] {kind} {name}: exit={code} load={load_ms:.1f}ms "
+            f"run={run_ms:.1f}ms total={total_ms:.1f}ms",
+            file=sys.stderr,
+            flush=True,
+        )
+    finally:
+        os._exit(0)
+
+
+def _reap_children() -> None:
+    """Collect exited request children so they do not linger as zombies."""
+    while True:
+        try:
+            pid, _ = os.waitpid(-1, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if pid == 0:
+            return
+
+
+def serve(socket_path: Optional[Path] = None, preload: Iterable[str] = ()) -> int:
+    """Run the warm runner daemon in the foreground until interrupted.
+
+    *preload* names agents/skills to import before accepting requests.
+    Requires ``fork`` and ``AF_UNIX`` sockets. Returns a process exit code.
+    """
+    import socket
+
+    if not hasattr(os, "fork") or not hasattr(socket, "AF_UNIX"):
+        print("Error: --serve needs a POSIX platform (fork and Unix sockets).", file=sys.stderr)
+        return 1
+
+    path = socket_path or default_socket_path()
+    if path.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(path))
+        except OSError:
+            path.unlink()  # Stale socket left behind by a daemon that died.
+        else:
+            print(f"Error: a daemon is already listening on {path}", file=sys.stderr)
+            return 1
+        finally:
+            probe.close()
+
+    for name in preload:
+        resolved = resolve_entry(name)
+        if resolved is None:
+            print(f"Error: cannot preload unknown agent or skill '{name}'", file=sys.stderr)
+            return 1
+        try:
+            _warm_module(resolved[0], name, resolved[1])
+        except Exception as exc:  # noqa: BLE001 - surface any load failure to the user
+            print(f"Error: failed to preload '{name}': {exc}", file=sys.stderr)
+            return 1
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # Socket is private to the invoking user.
+    try:
+        listener.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    listener.listen(128)
+    listener.settimeout(1.0)
+    print(f"grok daemon listening on {path} (Ctrl-C to stop)", file=sys.stderr, flush=True)
+    try:
+        while True:
+            _reap_children()
+            try:
+                conn, _ = listener.accept()
+            except socket.timeout:
+                continue
+            _handle_request(conn, listener)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        listener.close()
+        try:
+            path.unlink()
+        except OSError:
+            pass
+    return 0
+
+
+def run_via_daemon(kind: str, name: str, socket_path: Optional[Path] = None, verbose: bool = False) -> Optional[int]:
+    """Ask a running daemon to run agent/skill *name*. Returns its exit code.
+
+    Returns ``None`` when no daemon is reachable so the caller can fall back
+    to running the entry in-process.
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    path = socket_path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+
+    chunks = []
+    with sock:
+        sock.sendall(json.dumps({"kind": kind, "name": name}).encode("utf-8") + b"\n")
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    try:
+        response = json.loads(b"".join(chunks).decode("utf-8"))
+    except ValueError:
+        print(f"Error: daemon at {path} closed the connection without a result", file=sys.stderr)
+        return 1
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    if verbose and "total_ms" in response:
+        print(
+            f"[grok-daemon] load {response['load_ms']:.1f}ms, run {response['run_ms']:.1f}ms, "
+            f"total {response['total_ms']:.1f}ms",
+            file=sys.stderr,
+        )
+    return int(response.get("exit_code", 1))
+
+
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+#
+# ``--agents``/``--skills``/``--all-agents``/``--all-skills`` run many entries
+# at once. Every entry runs as its own ``cli.py --agent/--skill`` subprocess,
+# so output is captured per entry at the file-descriptor level, a crash or
+# sys.exit() only affects that entry, and a hung main() can be killed at its
+# timeout. A thread pool of ``--jobs`` workers keeps that many subprocesses
+# running.
+
+
+def _run_batch_entry(kind: str, name: str, timeout: Optional[float]) -> Dict[str, Any]:
+    """Run one agent/skill in a subprocess and return its result record."""
+    import subprocess
+    import time
+
+    command = [sys.executable, str(Path(__file__).resolve()), f"--{kind}", name]
+    started = time.perf_counter()
+    try:
+        completed = subprocess.run(
+            command,
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            errors="replace",
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as exc:
+        def _text(value: Any) -> str:
+            if isinstance(value, bytes):
+                return value.decode("utf-8", "replace")
+            return value or ""
+
+        return {
+            "kind": kind,
+            "name": name,
+            "status": "timeout",
+            "exit_code": None,
+            "duration_s": round(time.perf_counter() - started, 3),
+            "stdout": _text(exc.stdout),
+            "stderr": _text(exc.stderr),
+        }
+    return {
+        "kind": kind,
+        "name": name,
+        "status": "passed" if completed.returncode == 0 else "failed",
+        "exit_code": completed.returncode,
+        "duration_s": round(time.perf_counter() - started, 3),
+        "stdout": completed.stdout,
+        "stderr": completed.stderr,
+    }
+
+
+def run_batch(
+    entries: List[tuple],
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Run ``(kind, name)`` *entries* concurrently, *jobs* at a time.
+
+    Each entry gets *timeout* seconds (``None`` for no limit). *on_result* is
+    called with each result record as it completes. Returns the records in
+    the order of *entries*.
+    """
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    workers = max(1, jobs or os.cpu_count() or 1)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(entries)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_run_batch_entry, kind, name, timeout): position
+            for position, (kind, name) in enumerate(entries)
+        }
+        for future in as_completed(futures):
+            result = future.result()
+            results[futures[future]] = result
+            if on_result is not None:
+                on_result(result)
+    return [result for result in results if result is not None]
+
+
+def _batch_summary(results: List[Dict[str, Any]], elapsed_s: float) -> Dict[str, Any]:
+    """Aggregate batch *results* into counts plus the per-entry records."""
+    counts = {status: 0 for status in ("passed", "failed", "timeout")}
+    for result in results:
+        counts[result["status"]] += 1
+    return {
+        "total": len(results),
+        **counts,
+        "elapsed_s": round(elapsed_s, 3),
+        "exit_code": 0 if counts["passed"] == len(results) else 1,
+        "results": results,
+    }
+
+
+def _batch_entries(args: argparse.Namespace) -> List[tuple]:
+    """Collect the ``(kind, name)`` pairs requested by the batch flags."""
+    entries: List[tuple] = []
+    if args.all_agents or args.all_skills:
+        index = load_index(rebuild=args.rebuild_index)
+        if args.all_agents:
+            entries += [("agent", name) for name in sorted(_indexed_agents(index))]
+        if args.all_skills:
+            entries += [("skill", name) for name in sorted(_indexed_skills(index))]
+    if args.agents:
+        entries += [("agent", name) for name in args.agents.split(",") if name]
+    if args.skills:
+        entries += [("skill", name) for name in args.skills.split(",") if name]
+    # Preserve order but run each entry once.
+    return list(dict.fromkeys(entries))
+
+
+def _main_batch(args: argparse.Namespace) -> int:
+    """Run the batch described by *args* and report it. Returns the aggregate exit code."""
+    import time
+
+    entries = _batch_entries(args)
+    timeout = args.timeout if args.timeout and args.timeout > 0 else None
+
+    def report(result: Dict[str, Any]) -> None:
+        if args.json:
+            return
+        label = {"passed": "PASS", "failed": "FAIL", "timeout": "TIME"}[result["status"]]
+        print(f"  {label}  {result['kind']} {result['name']} ({result['duration_s']:.2f}s)", flush=True)
+        if args.verbose and result["status"] != "passed" and result["stderr"]:
+            for line in result["stderr"].rstrip().splitlines()[-10:]:
+                print(f"        {line}")
+
+    if not args.json:
+        print(f"\nRunning {len(entries)} entries with {args.jobs or os.cpu_count() or 1} jobs\n")
+    started = time.perf_counter()
+    results = run_batch(entries, jobs=args.jobs, timeout=timeout, on_result=report)
+    summary = _batch_summary(results, time.perf_counter() - started)
+
+    if args.summary_json:
+        with open(args.summary_json, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+    if args.json:
+        print(json.dumps(summary, indent=2))
+    else:
+        print(
+            f"\n  Total: {summary['total']}, passed: {summary['passed']}, "
+            f"failed: {summary['failed']}, timed out: {summary['timeout']} "
+            f"in {summary['elapsed_s']:.2f}s\n"
+        )
+    return summary["exit_code"]
+
+
+def _print_list(title: str, items: Iterable[str], summaries: Optional[Dict[str, str]] = None) -> int:
+    """Print a bordered list of *items* and a total count. Returns 0.
+
+    When *summaries* is given, each item is followed by its one-line summary.
+    """
     items = list(items)
     print(f"\n{'=' * 60}")
     print(f"  {title}")
     print(f"{'=' * 60}\n")
     for item in items:
-        print(f"  - {item}")
+        summary = summaries.get(item) if summaries else None
+        print(f"  - {item} - {summary}" if summary else f"  - {item}")
     label = title.rsplit(" ", 1)[-1].lower()
     print(f"\n  Total: {len(items)} {label}\n")
     return 0
@@ -196,12 +1134,66 @@ Examples:
   %(prog)s --agent full-stack-planner Run the full-stack-planner agent
   %(prog)s --agent development        Run the development agent
   %(prog)s --skill ai-ml/neural-architecture-search  Run a skill
+  %(prog)s --list-skills --rebuild-index  Re-scan everything, then list
+  %(prog)s --describe analytics       Show an agent's classes without running it
+  %(prog)s --profile-import data-science/time-series  Show where import time goes
+  %(prog)s --serve --preload data-science/time-series  Start the warm runner daemon
+  %(prog)s --daemon --skill data-science/time-series   Run through the daemon if it is up
+  %(prog)s --all-skills --jobs 8 --timeout 60 --summary-json out.json  Smoke-test every skill
 """,
     )
     parser.add_argument("--list-agents", action="store_true", help="List all available agents")
     parser.add_argument("--list-skills", action="store_true", help="List all available skills")
     parser.add_argument("--agent", type=str, help="Run a specific agent by name")
     parser.add_argument("--skill", type=str, help="Run a specific skill by name (<category>/<skill-name>)")
+    parser.add_argument(
+        "--describe",
+        type=str,
+        metavar="NAME",
+        help="Show an agent's or skill's classes, functions and imports without importing it",
+    )
+    parser.add_argument(
+        "--profile-import",
+        type=str,
+        metavar="NAME",
+        help="Time an agent's or skill's import per top-level statement and per imported module",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit --describe, --profile-import or batch output as JSON")
+    parser.add_argument(
+        "--rebuild-index",
+        action="store_true",
+        help="Discard the cached discovery manifest and re-scan all agents and skills",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the warm runner daemon on a Unix socket (foreground)",
+    )
+    parser.add_argument(
+        "--preload",
+        type=str,
+        metavar="NAMES",
+        help="Comma-separated agents/skills for --serve to import before accepting requests",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run --agent/--skill through the warm runner daemon, falling back to in-process",
+    )
+    parser.add_argument("--socket", type=Path, help="Daemon socket path (default: per-checkout)")
+    parser.add_argument("--agents", type=str, metavar="NAMES", help="Run comma-separated agents concurrently")
+    parser.add_argument("--skills", type=str, metavar="NAMES", help="Run comma-separated skills concurrently")
+    parser.add_argument("--all-agents", action="store_true", help="Run every agent concurrently")
+    parser.add_argument("--all-skills", action="store_true", help="Run every skill concurrently")
+    parser.add_argument("--jobs", "-j", type=int, metavar="N", help="Parallel workers for batch runs (default: CPU count)")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=60.0,
+        metavar="SECONDS",
+        help="Per-entry timeout for batch runs; 0 disables it (default: 60)",
+    )
+    parser.add_argument("--summary-json", type=Path, metavar="PATH", help="Write the batch summary as JSON to PATH")
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose output")
     return parser
 
@@ -214,11 +1206,44 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    if args.list_agents:
-        return _print_list("Available Agents", list_agents())
+    if args.list_agents or args.list_skills:
+        index = load_index(rebuild=args.rebuild_index)
+        if args.list_agents:
+            agents = _indexed_agents(index)
+            summaries = {n: e["summary"] for n, e in agents.items()} if args.verbose else None
+            return _print_list("Available Agents", sorted(agents), summaries)
+        skills = _indexed_skills(index)
+        summaries = {n: e["summary"] for n, e in skills.items()} if args.verbose else None
+        return _print_list("Available Skills", sorted(skills), summaries)
+
+    if args.rebuild_index:
+        index = load_index(rebuild=True)
+        print(
+            f"Indexed {len(_indexed_agents(index))} agents and "
+            f"{len(_indexed_skills(index))} skills into {INDEX_PATH}"
+        )
+        return 0
+
+    if args.describe:
+        return describe(args.describe, as_json=args.json)
+
+    if args.profile_import:
+        return print_import_profile(args.profile_import, as_json=args.json)
+
+    if args.agents or args.skills or args.all_agents or args.all_skills:
+        return _main_batch(args)
+
+    if args.serve:
+        preload = [name for name in (args.preload or "").split(",") if name]
+        return serve(args.socket, preload)
 
-    if args.list_skills:
-        return _print_list("Available Skills", list_skills())
+    if args.daemon and (args.agent or args.skill):
+        kind, name = ("agent", args.agent) if args.agent else ("skill", args.skill)
+        code = run_via_daemon(kind, name, args.socket, verbose=args.verbose)
+        if code is not None:
+            return code
+        if args.verbose:
+            print("No daemon reachable; running in-process.", file=sys.stderr)
 
     if args.agent:
         return run_agent(args.agent, verbose=args.verbose)
@@ -0,0 +1,172 @@
+"""
+Tests for the advanced analytics skill (skills/data-science/advanced-analytics).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "data-science" / "advanced-analytics"
+sys.path.insert(0, str(SKILL_DIR))
+
+import advanced_analytics as aa  # noqa: E402
+
+
+def _regression_data(seed=0, n=500):
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n, 2))
+    y = X @ [1.5, -2.0] + 0.5 + rng.normal(0, 0.3, n)
+    return X, y
+
+
+def _reference_log_density(X, y, params, priors, model_type):
+    """The original per-state prior plus likelihood, evaluated from the raw data."""
+    n_features = X.shape[1]
+    beta, intercept = params[:n_features], params[n_features]
+    cp, ip = priors.coefficient_prior, priors.intercept_prior
+    log_p = np.sum(-0.5 * ((beta - cp["mean"]) / cp["std"]) ** 2) - n_features * np.log(cp["std"] * np.sqrt(2 * np.pi))
+    log_p += -0.5 * ((intercept - ip["mean"]) / ip["std"]) ** 2 - np.log(ip["std"] * np.sqrt(2 * np.pi))
+    mu = X @ beta + intercept
+    if model_type == aa.ModelType.LOGISTIC_REGRESSION:
+        probs = 1 / (1 + np.exp(-mu))
+        return log_p + np.sum(y * np.log(probs + 1e-10) + (1 - y) * np.log(1 - probs + 1e-10))
+    sigma = params[n_features + 1]
+    alpha, b = priors.noise_prior["alpha"], priors.noise_prior["beta"]
+    log_p += (alpha - 1) * np.log(sigma) - b / sigma
+    return log_p - len(y) / 2 * np.log(2 * np.pi * sigma ** 2) - np.sum((y - mu) ** 2) / (2 * sigma ** 2)
+
+
+class TestBayesianSampler:
+    """Tests for the lockstep multi-chain Metropolis-Hastings sampler."""
+
+    @pytest.mark.parametrize("model_type", [aa.ModelType.LINEAR_REGRESSION, aa.ModelType.LOGISTIC_REGRESSION])
+    def test_batched_log_density_matches_reference(self, model_type):
+        """Test prior and likelihood over a batch of states equal the per-state formulas."""
+        X, y = _regression_data(1, n=200)
+        if model_type == aa.ModelType.LOGISTIC_REGRESSION:
+            y = (y > 0.5).astype(float)
+        engine, priors = aa.BayesianInferenceEngine(), aa.PriorSpec()
+        params = np.random.default_rng(2).normal(size=(6, 4))
+        params[:, 3] = np.abs(params[:, 3]) + 0.1
+        stats = engine._linear_sufficient_stats(X, y)
+        batched = engine._log_prior(params, priors, 2, model_type)
+        if model_type == aa.ModelType.LINEAR_REGRESSION:
+            batched = batched + engine._log_likelihood_linear(X, y, params, 2, stats)
+        else:
+            batched = batched + engine._log_likelihood_logistic_single(X, y, params, 2)
+        expected = [_reference_log_density(X, y, row, priors, model_type) for row in params]
+        np.testing.assert_allclose(batched, expected, rtol=1e-9)
+
+    def test_merge_moments_matches_covariance(self):
+        """Test the pooled running scatter matrix equals np.cov over all rows."""
+        rows = np.random.default_rng(3).normal(size=(300, 4)) @ np.diag([1, 2, 3, 4])
+        count, mean, m2 = 0, np.zeros(4), np.zeros((4, 4))
+        for batch in np.array_split(rows, 9):
+            count, mean, m2 = aa._merge_moments(count, mean, m2, batch)
+        np.testing.assert_allclose(mean, rows.mean(axis=0))
+        np.testing.assert_allclose(m2 / (count - 1), np.cov(rows, rowvar=False))
+
+    @pytest.mark.parametrize("adapt_proposal", [False, True])
+    def test_linear_posterior_matches_least_squares(self, adapt_proposal):
+        """Test posterior means and spreads agree with the near-flat-prior analytic posterior."""
+        X, y = _regression_data()
+        config = aa.MCMCConfig(n_samples=2000, n_warmup=2000, seed=1, adapt_proposal=adapt_proposal)
+        result = aa.BayesianInferenceEngine().linear_regression(X, y, config=config)
+        design = np.column_stack([X, np.ones(len(y))])
+        coef, rss = np.linalg.lstsq(design, y, rcond=None)[:2]
+        std = np.sqrt(rss[0] / (len(y) - 3) * np.diag(np.linalg.inv(design.T @ design)))
+        assert np.all(np.abs(result.coefficient_means - coef[:2]) < 4 * std[:2])
+        assert result.intercept_mean == pytest.approx(coef[2], abs=4 * std[2])
+        assert result.noise_variance_mean == pytest.approx(rss[0] / len(y), rel=0.1)
+        assert result.diagnostics.status == aa.ConvergenceStatus.CONVERGED
+        if adapt_proposal:
+            np.testing.assert_allclose(result.coefficient_stds, std[:2], rtol=0.3)
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test a fixed seed gives identical chains, serially and across worker processes."""
+        X, y = _regression_data(4, n=100)
+        for n_jobs in (1, 2):
+            config = aa.MCMCConfig(n_samples=200, n_warmup=200, n_chains=4, seed=5, n_jobs=n_jobs)
+            first = aa.BayesianInferenceEngine().linear_regression(X, y, config=config)
+            second = aa.BayesianInferenceEngine().linear_regression(X, y, config=config)
+            for name, samples in first.posterior_samples.items():
+                np.testing.assert_array_equal(samples, second.posterior_samples[name])
+            assert len(first.posterior_samples["intercept"]) == 4 * 200
+
+
+def _loss(x, y):
+    """Vectorised model: one value per draw of x and y."""
+    return x * y - 0.5 * x
+
+
+_DISTRIBUTIONS = {
+    "x": {"type": "normal", "mean": 1.0, "std": 2.0},
+    "y": {"type": "uniform", "low": 0.0, "high": 3.0},
+}
+
+
+class TestStreamingMonteCarlo:
+    """Tests for block-wise Monte Carlo with running moments and a quantile sketch."""
+
+    def test_running_moments_merge_matches_numpy(self):
+        """Test merged block moments equal the mean and variance of all values."""
+        values = np.random.default_rng(10).lognormal(size=5000) + 1e6
+        moments = aa.RunningMoments()
+        for block in np.array_split(values, 13):
+            moments.update(block)
+        assert moments.mean == pytest.approx(values.mean(), rel=1e-12)
+        assert moments.variance(ddof=1) == pytest.approx(values.var(ddof=1), rel=1e-9)
+
+    def test_sketch_matches_exact_statistics(self):
+        """Test sketch quantiles, tail fractions and CVaR against the stored samples."""
+        simulator = aa.MonteCarloSimulator(n_simulations=200_000)
+        streamed = simulator.run_streaming(_loss, _DISTRIBUTIONS, seed=11, block_size=20_000, vectorized=True)
+        samples = np.concatenate([
+            _loss(**simulator._generate_samples(_DISTRIBUTIONS, 20_000, np.random.default_rng(seed),
+                                                aa.SamplingMethod.RANDOM, False))
+            for seed in np.random.SeedSequence(11).spawn(10)
+        ])
+        exact = aa.MonteCarloResult(samples, len(samples), aa.SamplingMethod.RANDOM, False, 11, 0.0)
+        assert streamed.n_simulations == len(samples)
+        assert streamed.mean() == pytest.approx(exact.mean(), rel=1e-10)
+        assert streamed.std() == pytest.approx(exact.std(), rel=1e-10)
+        for q in (1, 5, 50, 95, 99):
+            assert (samples < streamed.percentile(q)).mean() * 100 == pytest.approx(q, abs=0.5)
+        assert streamed.probability_below(0.0) == pytest.approx(exact.probability_below(0.0), abs=0.005)
+        assert streamed.cvar(0.95) == pytest.approx(exact.cvar(0.95), rel=0.02)
+
+    def test_blocks_are_independent_of_jobs(self):
+        """Test n_jobs does not change the merged result for a fixed seed."""
+        simulator = aa.MonteCarloSimulator(n_simulations=40_000)
+        runs = [
+            simulator.run_streaming(_loss, _DISTRIBUTIONS, seed=12, block_size=5_000, vectorized=True, n_jobs=n_jobs)
+            for n_jobs in (1, 3)
+        ]
+        assert runs[0].mean() == runs[1].mean()
+        assert runs[0].percentile(90) == runs[1].percentile(90)
+
+    def test_stops_at_target_interval_width(self):
+        """Test the run stops at the first block whose mean interval is narrow enough."""
+        simulator = aa.MonteCarloSimulator(n_simulations=1_000_000)
+        result = simulator.run_streaming(
+            _loss, _DISTRIBUTIONS, seed=13, block_size=10_000, vectorized=True, target_ci_width=0.05
+        )
+        assert result.converged
+        assert result.n_blocks < 100
+        lower, upper = result.mean_confidence_interval()
+        assert upper - lower <= 0.05
+
+    def test_all_failed_draws_give_nan(self):
+        """Test a model that always fails reports NaN rather than a zero mean."""
+        def failing(x, y):
+            raise ValueError("diverged")
+
+        result = aa.MonteCarloSimulator(n_simulations=50).run_streaming(failing, _DISTRIBUTIONS, seed=14)
+        assert result.n_simulations == 0
+        assert result.n_failed == 50
+        assert np.isnan(result.mean())
+        assert np.isnan(result.percentile(50))
+        assert all(np.isnan(result.mean_confidence_interval()))
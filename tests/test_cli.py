@@ -0,0 +1,347 @@
+"""
+Tests for the ``grok`` command-line entry point (src/cli.py).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import cli  # noqa: E402
+
+
+AGENT_SOURCE = '''"""
+Demo Agent
+Used by the CLI tests.
+"""
+
+
+class DemoAgent:
+    """A tiny agent."""
+
+    def run(self):
+        return 1
+
+
+def main():
+    print("demo agent ran")
+'''
+
+SKILL_SOURCE = '''"""Demo skill summary line."""
+
+import json
+
+
+def helper():
+    return json.dumps({})
+
+
+def main():
+    return 0
+'''
+
+
+@pytest.fixture
+def fake_root(tmp_path, monkeypatch):
+    """Point the CLI at a throwaway project tree with one agent and one skill."""
+    agent_dir = tmp_path / "agents" / "demo"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "agent.py").write_text(AGENT_SOURCE)
+    (tmp_path / "agents" / "empty").mkdir()
+
+    skill_dir = tmp_path / "skills" / "tools" / "demo-skill"
+    skill_dir.mkdir(parents=True)
+    (skill_dir / "demo_skill.py").write_text(SKILL_SOURCE)
+
+    monkeypatch.setattr(cli, "PROJECT_ROOT", tmp_path)
+    monkeypatch.setattr(cli, "AGENTS_DIR", tmp_path / "agents")
+    monkeypatch.setattr(cli, "SKILLS_DIR", tmp_path / "skills")
+    monkeypatch.setattr(cli, "INDEX_PATH", tmp_path / ".grok-index.json")
+    return tmp_path
+
+
+def _bump_mtime(path: Path) -> None:
+    """Advance *path*'s mtime so coarse filesystem timestamps still register a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+class TestDiscoveryIndex:
+    """Test the mtime-validated discovery manifest."""
+
+    def test_lists_agents_and_skills(self, fake_root):
+        """Test listing finds entries with a script and skips empty dirs."""
+        assert cli.list_agents() == ["demo"]
+        assert cli.list_skills() == ["tools/demo-skill"]
+        assert (fake_root / ".grok-index.json").exists()
+
+    def test_index_records_metadata(self, fake_root):
+        """Test entries carry script path, main() presence and summary."""
+        index = cli.load_index()
+        agent = cli._indexed_agents(index)["demo"]
+        assert agent["script"] == "agents/demo/agent.py"
+        assert agent["has_main"] is True
+        assert agent["summary"] == "Demo Agent"
+        skill = cli._indexed_skills(index)["tools/demo-skill"]
+        assert skill["summary"] == "Demo skill summary line."
+
+    def test_unchanged_tree_is_not_reparsed(self, fake_root, monkeypatch):
+        """Test a warm index does not re-read any script."""
+        cli.load_index()
+        calls = []
+        monkeypatch.setattr(cli, "_script_summary", lambda path: calls.append(path) or {})
+        cli.load_index()
+        assert calls == []
+
+    def test_only_changed_entries_are_reparsed(self, fake_root, monkeypatch):
+        """Test adding a skill re-probes just that directory."""
+        cli.load_index()
+        new_dir = fake_root / "skills" / "tools" / "other-skill"
+        new_dir.mkdir()
+        (new_dir / "other_skill.py").write_text('"""Other."""\n')
+        _bump_mtime(fake_root / "skills" / "tools")
+
+        original = cli._script_summary
+        calls = []
+
+        def spy(path):
+            calls.append(path.name)
+            return original(path)
+
+        monkeypatch.setattr(cli, "_script_summary", spy)
+        assert cli.list_skills() == ["tools/demo-skill", "tools/other-skill"]
+        assert calls == ["other_skill.py"]
+
+    def test_edited_script_is_refreshed(self, fake_root):
+        """Test an in-place script edit updates main() presence."""
+        cli.load_index()
+        script = fake_root / "agents" / "demo" / "agent.py"
+        script.write_text('"""Demo Agent"""\n')
+        _bump_mtime(script)
+        assert cli._indexed_agents(cli.load_index())["demo"]["has_main"] is False
+
+    def test_late_legacy_script_is_found(self, fake_root):
+        """Test a resources/resources.py added to an existing resources/ dir is picked up."""
+        skill_dir = fake_root / "skills" / "tools" / "legacy-skill"
+        (skill_dir / "resources").mkdir(parents=True)
+        _bump_mtime(fake_root / "skills" / "tools")
+        assert cli.list_skills() == ["tools/demo-skill"]
+        skill_mtime = skill_dir.stat().st_mtime_ns
+        (skill_dir / "resources" / "resources.py").write_text('"""Legacy."""\n')
+        assert skill_dir.stat().st_mtime_ns == skill_mtime
+        assert cli.list_skills() == ["tools/demo-skill", "tools/legacy-skill"]
+
+    def test_corrupt_index_is_rebuilt(self, fake_root):
+        """Test a corrupt manifest is ignored rather than crashing the CLI."""
+        (fake_root / ".grok-index.json").write_text("{not json")
+        assert cli.list_agents() == ["demo"]
+
+    def test_rebuild_index_flag(self, fake_root, capsys):
+        """Test --rebuild-index re-scans and reports counts."""
+        assert cli.main(["--rebuild-index"]) == 0
+        assert "Indexed 1 agents and 1 skills" in capsys.readouterr().out
+
+
+class TestDescribe:
+    """Test static, import-free metadata extraction."""
+
+    def test_extract_metadata(self, fake_root):
+        """Test classes, methods, imports and main() are reported."""
+        metadata = cli.extract_metadata(fake_root / "agents" / "demo" / "agent.py")
+        assert metadata["summary"] == "Demo Agent"
+        assert metadata["has_main"] is True
+        assert metadata["classes"] == [
+            {"name": "DemoAgent", "bases": [], "summary": "A tiny agent.", "methods": ["run"], "lineno": 7}
+        ]
+        assert [f["signature"] for f in metadata["functions"]] == ["main()"]
+
+    def test_extract_metadata_does_not_execute(self, fake_root):
+        """Test module-level code is never run."""
+        script = fake_root / "agents" / "demo" / "agent.py"
+        script.write_text("import not_a_real_module\nraise SystemExit(3)\n")
+        metadata = cli.extract_metadata(script)
+        assert metadata["imports"] == ["not_a_real_module"]
+        assert metadata["has_main"] is False
+
+    def test_describe_json(self, fake_root, capsys):
+        """Test --describe --json emits the metadata for a skill."""
+        assert cli.main(["--describe", "tools/demo-skill", "--json"]) == 0
+        payload = json.loads(capsys.readouterr().out)
+        assert payload["kind"] == "skill"
+        assert payload["path"] == "skills/tools/demo-skill/demo_skill.py"
+        assert payload["imports"] == ["json"]
+
+    def test_describe_unknown(self, fake_root, capsys):
+        """Test an unknown name is a non-zero exit with an error."""
+        assert cli.main(["--describe", "missing"]) == 1
+        assert "no agent or skill named" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="daemon needs fork()")
+class TestWarmDaemon:
+    """Test the warm runner daemon's request handling and client fallback."""
+
+    def _request(self, payload: bytes):
+        import socket
+
+        server_end, client_end = socket.socketpair()
+        with client_end:
+            client_end.sendall(payload)
+            pid = cli._handle_request(server_end)
+            response = b""
+            while True:
+                chunk = client_end.recv(65536)
+                if not chunk:
+                    break
+                response += chunk
+        if pid is not None:
+            os.waitpid(pid, 0)
+        return json.loads(response)
+
+    def test_runs_main_in_child_and_keeps_module_warm(self, fake_root, monkeypatch):
+        """Test output is returned and the second request skips the import."""
+        monkeypatch.setattr(cli, "_WARM_MODULES", {})
+        first = self._request(b'{"kind": "agent", "name": "demo"}\n')
+        assert first["exit_code"] == 0
+        assert first["stdout"] == "demo agent ran\n"
+        assert {"load_ms", "run_ms", "total_ms"} <= set(first)
+
+        second = self._request(b'{"kind": "agent", "name": "demo"}\n')
+        assert second["stdout"] == "demo agent ran\n"
+        assert second["load_ms"] == 0.0
+
+    def test_unknown_entry(self, fake_root):
+        """Test an unknown skill is answered without forking."""
+        response = self._request(b'{"kind": "skill", "name": "tools/missing"}\n')
+        assert response["exit_code"] == 1
+        assert "not found" in response["stderr"]
+
+    def test_malformed_request(self, fake_root):
+        """Test garbage input gets an error response."""
+        response = self._request(b"not json\n")
+        assert response["exit_code"] == 1
+
+    def test_client_falls_back_without_daemon(self, fake_root):
+        """Test the client reports no daemon when the socket is absent."""
+        assert cli.run_via_daemon("agent", "demo", fake_root / "none.sock") is None
+
+
+class TestBatchMode:
+    """Test concurrent batch execution and its summary."""
+
+    def test_results_keep_request_order(self, monkeypatch):
+        """Test records come back in request order with aggregated counts."""
+        def fake_entry(kind, name, timeout):
+            status = "passed" if name != "bad" else "failed"
+            return {"kind": kind, "name": name, "status": status, "exit_code": int(status == "failed")}
+
+        monkeypatch.setattr(cli, "_run_batch_entry", fake_entry)
+        entries = [("agent", "a"), ("agent", "bad"), ("skill", "x/y")]
+        results = cli.run_batch(entries, jobs=3)
+        assert [r["name"] for r in results] == ["a", "bad", "x/y"]
+
+        summary = cli._batch_summary(results, 1.0)
+        assert (summary["total"], summary["passed"], summary["failed"]) == (3, 2, 1)
+        assert summary["exit_code"] == 1
+
+    def test_batch_entries_deduplicates(self):
+        """Test the same entry requested twice runs once."""
+        args = cli.build_parser().parse_args(["--agents", "a,b,a", "--skills", "c/d"])
+        assert cli._batch_entries(args) == [("agent", "a"), ("agent", "b"), ("skill", "c/d")]
+
+    def test_entry_runs_in_subprocess(self):
+        """Test a failing entry is captured rather than raised."""
+        result = cli._run_batch_entry("agent", "no-such-agent", timeout=60)
+        assert result["status"] == "failed"
+        assert result["exit_code"] == 1
+        assert "not found" in result["stderr"]
+
+
+class TestImportProfiling:
+    """Test the per-statement import profiler and lazy heavy imports."""
+
+    def test_profile_reports_statements_and_imports(self, fake_root):
+        """Test every top-level statement is timed and direct imports are listed."""
+        report = cli.profile_import(fake_root / "skills" / "tools" / "demo-skill" / "demo_skill.py")
+        assert report["error"] is None
+        assert [r["label"] for r in report["statements"]] == [
+            "docstring",
+            "import json",
+            "def helper",
+            "def main",
+        ]
+        assert report["total_ms"] >= 0
+
+    def test_profile_stops_at_failing_statement(self, fake_root):
+        """Test a failing statement is reported with its line number."""
+        script = fake_root / "broken.py"
+        script.write_text("x = 1\nraise RuntimeError('boom')\ny = 2\n")
+        report = cli.profile_import(script)
+        assert report["error"].startswith("line 2: RuntimeError")
+        assert len(report["statements"]) == 2
+
+    def test_parse_importtime_keeps_direct_imports(self):
+        """Test nested imports are folded into their importer."""
+        stderr = "\n".join(
+            [
+                "import time: self [us] | cumulative | imported package",
+                "import time:       50 |         50 | ast",
+                cli._PROFILE_START,
+                "import time:       10 |         10 |   _json",
+                "import time:       40 |         50 | json",
+                cli._PROFILE_END,
+                "import time:        5 |          5 | late",
+            ]
+        )
+        assert cli._parse_importtime(stderr) == [{"module": "json", "self_ms": 0.04, "cumulative_ms": 0.05}]
+
+    def test_lazy_import_defers_heavy_module(self, tmp_path, monkeypatch):
+        """Test a LAZY_IMPORTS package is bound but not executed until used."""
+        package = tmp_path / "heavy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("import builtins\nbuiltins.HEAVY_LOADED = True\nVALUE = 42\n")
+        script = tmp_path / "uses_heavy.py"
+        script.write_text("import heavy_pkg\n\n\ndef value():\n    return heavy_pkg.VALUE\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(cli, "LAZY_IMPORTS", frozenset({"heavy_pkg"}))
+        monkeypatch.delenv("GROK_EAGER_IMPORTS", raising=False)
+        import builtins
+
+        try:
+            module = cli._load_module(script, "test_uses_heavy")
+            assert not hasattr(builtins, "HEAVY_LOADED")
+            assert module.value() == 42
+            assert builtins.HEAVY_LOADED is True
+        finally:
+            sys.modules.pop("heavy_pkg", None)
+            sys.modules.pop("test_uses_heavy", None)
+            if hasattr(builtins, "HEAVY_LOADED"):
+                del builtins.HEAVY_LOADED
+
+    def test_warm_module_imports_heavy_module_eagerly(self, tmp_path, monkeypatch):
+        """Test the daemon resolves LAZY_IMPORTS before forking children."""
+        package = tmp_path / "heavy_pkg"
+        package.mkdir()
+        (package / "__init__.py").write_text("import builtins\nbuiltins.HEAVY_LOADED = True\nVALUE = 42\n")
+        script = tmp_path / "uses_heavy.py"
+        script.write_text("import heavy_pkg\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(cli, "LAZY_IMPORTS", frozenset({"heavy_pkg"}))
+        monkeypatch.delenv("GROK_EAGER_IMPORTS", raising=False)
+        import builtins
+
+        module_name = cli._module_name("skill", "tools/uses-heavy")
+        try:
+            cli._warm_module("skill", "tools/uses-heavy", script)
+            assert builtins.HEAVY_LOADED is True
+        finally:
+            cli._WARM_MODULES.pop(module_name, None)
+            sys.modules.pop("heavy_pkg", None)
+            sys.modules.pop(module_name, None)
+            if hasattr(builtins, "HEAVY_LOADED"):
+                del builtins.HEAVY_LOADED
@@ -0,0 +1,232 @@
+"""
+Tests for the feature engineering skill (skills/data-science/feature-engineering).
+"""
+
+import sys
+import warnings
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "data-science" / "feature-engineering"
+sys.path.insert(0, str(SKILL_DIR))
+
+import feature_engineering as fe  # noqa: E402
+
+
+def _reference_rolling(column, windows, functions):
+    """The original per-row loop: row i summarises column[i - window:i]."""
+    out = np.zeros((len(column), len(windows) * len(functions)))
+    pairs = [(window, func) for window in windows for func in functions]
+    with warnings.catch_warnings():
+        # np.std(ddof=1) of a single value warns and returns NaN.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        for j, (window, func) in enumerate(pairs):
+            for i in range(window, len(column)):
+                w = column[i - window:i]
+                if func == "mean":
+                    out[i, j] = np.mean(w)
+                elif func == "std":
+                    out[i, j] = np.std(w, ddof=1)
+                elif func == "min":
+                    out[i, j] = np.min(w)
+                elif func == "max":
+                    out[i, j] = np.max(w)
+                elif func == "skew":
+                    m, s = np.mean(w), np.std(w, ddof=1)
+                    out[i, j] = float(np.mean(((w - m) / s) ** 3)) if s > 0 else 0
+    return out
+
+
+class TestRollingFeatures:
+    """Tests for the vectorised rolling window statistics."""
+
+    WINDOWS = [1, 3, 7, 30]
+    FUNCTIONS = ["mean", "std", "min", "max", "skew"]
+
+    def test_matches_reference_loop(self):
+        """Test every window and function against the direct loop."""
+        rng = np.random.default_rng(0)
+        data = np.column_stack([rng.normal(size=200).cumsum() * 1e3, rng.exponential(size=200)])
+        for col in range(data.shape[1]):
+            features, names = fe.FeatureConstructor().create_rolling_features(
+                data, col, self.WINDOWS, self.FUNCTIONS
+            )
+            expected = _reference_rolling(data[:, col], self.WINDOWS, self.FUNCTIONS)
+            assert names == [f"rolling_{w}_{f}" for w in self.WINDOWS for f in self.FUNCTIONS]
+            # std of a single value is NaN in both; compare everything else.
+            np.testing.assert_allclose(features, expected, rtol=1e-8, atol=1e-9)
+
+    def test_constant_windows_are_exact(self):
+        """Test near-constant windows do not lose digits to cancellation."""
+        data = np.full((50, 1), 1e9)
+        data[25:, 0] += 1e-3
+        features, _ = fe.FeatureConstructor().create_rolling_features(data, 0, [5], ["std", "skew"])
+        # std and skew are shift invariant; the shifted loop is exact here.
+        expected = _reference_rolling(data[:, 0] - 1e9, [5], ["std", "skew"])
+        np.testing.assert_allclose(features, expected, rtol=1e-6, atol=1e-9)
+
+    def test_streaming_update_matches_transform(self):
+        """Test chunks fed to update() reproduce transform() on the whole series."""
+        rng = np.random.default_rng(1)
+        data = rng.normal(size=(300, 2))
+        engine = fe.RollingFeatureEngine([4, 16], ["mean", "std", "min", "max"])
+        full = engine.transform(data)
+        streamed = np.vstack([engine.update(chunk) for chunk in np.array_split(data, [5, 17, 100, 101])])
+        np.testing.assert_allclose(streamed, full)
+
+    def test_nan_window_yields_nan(self):
+        """Test a window containing NaN produces NaN and later windows recover."""
+        data = np.arange(20, dtype=float)
+        data[10] = np.nan
+        features = fe.RollingFeatureEngine([3], ["mean", "max"]).transform(data)
+        assert np.isnan(features[11:14]).all()
+        assert features[14, 0] == pytest.approx(12.0)
+        assert features[14, 1] == 13.0
+
+
+def _numeric_pipeline():
+    return (
+        fe.FeaturePipeline("stream")
+        .add_step(fe.PipelineStep("impute", "mean_imputer"))
+        .add_step(fe.PipelineStep("scale", "standard_scaler"))
+    )
+
+
+class TestStreamingPipeline:
+    """Tests for partial_fit and chunked transform."""
+
+    def test_running_stats_match_one_pass(self):
+        """Test merged chunk statistics equal numpy over the whole array."""
+        rng = np.random.default_rng(2)
+        X = rng.normal(5.0, 3.0, size=(1000, 3))
+        X[rng.random(X.shape) < 0.1] = np.nan
+        stats = fe.RunningStats(3)
+        for chunk in np.array_split(X, 7):
+            stats.update(chunk)
+        np.testing.assert_allclose(stats.mean, np.nanmean(X, axis=0))
+        np.testing.assert_allclose(stats.variance(), np.nanvar(X, axis=0))
+        np.testing.assert_allclose(stats.min, np.nanmin(X, axis=0))
+
+    def test_quantile_sketch_rank_error(self):
+        """Test sketch quantiles sit within 1% rank of the exact ones."""
+        values = np.random.default_rng(3).normal(size=100_000)
+        sketch = fe.QuantileSketch(k=512, seed=0)
+        for chunk in np.array_split(values, 37):
+            sketch.update(chunk)
+        levels = [1, 25, 50, 75, 99]
+        ranks = [(values < q).mean() * 100 for q in sketch.quantiles(levels)]
+        np.testing.assert_allclose(ranks, levels, atol=1.0)
+
+    def test_short_stream_quantiles_are_exact(self):
+        """Test a stream below the sketch capacity matches np.percentile."""
+        values = np.random.default_rng(4).normal(size=300)
+        sketch = fe.QuantileSketch(k=512).update(values)
+        np.testing.assert_allclose(sketch.quantiles([10, 50, 90]), np.percentile(values, [10, 50, 90]))
+
+    @pytest.mark.parametrize("transformer", ["mean_imputer", "standard_scaler", "minmax_scaler"])
+    def test_partial_fit_matches_fit(self, transformer):
+        """Test fitting one step on chunks equals fitting it on all rows."""
+        rng = np.random.default_rng(5)
+        X = rng.normal(size=(2000, 4)) * [1, 10, 100, 1000]
+        X[rng.random(X.shape) < 0.05] = np.nan
+        batch = fe.FeaturePipeline().add_step(fe.PipelineStep("step", transformer)).fit(X)
+        streamed = fe.FeaturePipeline().add_step(fe.PipelineStep("step", transformer))
+        for chunk in fe.iter_chunks(X, chunk_size=300):
+            streamed.partial_fit(chunk)
+        np.testing.assert_allclose(streamed.transform(X), batch.transform(X))
+
+    def test_partial_fit_chain_converges_to_fit(self):
+        """Test later steps, fitted on earlier steps' running output, end up close."""
+        rng = np.random.default_rng(5)
+        X = rng.normal(size=(20_000, 3))
+        X[rng.random(X.shape) < 0.05] = np.nan
+        streamed = _numeric_pipeline()
+        for chunk in fe.iter_chunks(X, chunk_size=1000):
+            streamed.partial_fit(chunk)
+        np.testing.assert_allclose(streamed.transform(X), _numeric_pipeline().fit(X).transform(X), atol=5e-3)
+
+    def test_transform_iter_from_npy(self, tmp_path):
+        """Test transform_iter over a memory-mapped file equals one transform."""
+        X = np.random.default_rng(6).normal(size=(1000, 3))
+        path = tmp_path / "rows.npy"
+        np.save(path, X)
+        pipeline = _numeric_pipeline().fit(X)
+        chunks = list(pipeline.transform_iter(str(path), chunk_size=128))
+        assert len(chunks) == 8
+        np.testing.assert_allclose(np.vstack(chunks), pipeline.transform(X))
+
+    def test_partial_fit_rejects_mutual_information(self):
+        """Test a step that needs every row at once refuses partial_fit."""
+        pipeline = fe.FeaturePipeline().add_step(fe.PipelineStep("mi", "mutual_information_selector"))
+        with pytest.raises(ValueError, match="does not support partial_fit"):
+            pipeline.partial_fit(np.zeros((10, 2)), np.zeros(10))
+
+
+class TestPipelineArtifact:
+    """Tests for saving fitted pipelines and loading them transform-only."""
+
+    @pytest.mark.parametrize(
+        "steps",
+        [
+            ["mean_imputer", "standard_scaler"],
+            ["median_imputer", "robust_scaler"],
+            ["mean_imputer", "quantile_scaler"],
+            ["mean_imputer", "minmax_scaler", "variance_threshold"],
+        ],
+    )
+    def test_loaded_pipeline_matches_fitted(self, tmp_path, steps):
+        """Test the loaded pipeline transforms exactly like the one that was saved."""
+        rng = np.random.default_rng(7)
+        X = rng.normal(size=(500, 4)) * [1, 5, 0.0, 50]
+        X[rng.random(X.shape) < 0.05] = np.nan
+        pipeline = fe.FeaturePipeline("artifact")
+        for i, transformer in enumerate(steps):
+            pipeline.add_step(fe.PipelineStep(f"s{i}", transformer))
+        expected = pipeline.fit_transform(X)
+        path = tmp_path / "pipeline.fpa"
+        digest = pipeline.save(path)
+        loaded = fe.FeaturePipeline.load(path)
+        assert loaded.content_hash == digest
+        np.testing.assert_allclose(loaded.transform(X), expected)
+
+    def test_target_encoder_round_trip(self, tmp_path):
+        """Test category lookups, including unseen categories, survive the round trip."""
+        rng = np.random.default_rng(8)
+        plans = rng.choice(["basic", "pro", "team"], 400)
+        X = np.column_stack([rng.normal(size=400), plans]).astype(object)
+        y = (plans == "pro").astype(float)
+        names = ["usage", "plan"]
+        pipeline = fe.FeaturePipeline().add_step(fe.PipelineStep("enc", "target_encoder"))
+        pipeline.fit(X, y, names)
+        pipeline.save(tmp_path / "enc.fpa")
+        loaded = fe.FeaturePipeline.load(tmp_path / "enc.fpa")
+        probe = np.array([[0.5, "pro"], [1.0, "enterprise"]], dtype=object)
+        np.testing.assert_allclose(loaded.transform(probe, names), pipeline.transform(probe, names))
+
+    def test_corrupt_artifact_is_rejected(self, tmp_path):
+        """Test a flipped data byte fails hash verification."""
+        X = np.random.default_rng(9).normal(size=(50, 2))
+        path = tmp_path / "pipeline.fpa"
+        _numeric_pipeline().fit(X).save(path)
+        raw = bytearray(path.read_bytes())
+        raw[-1] ^= 0xFF
+        path.write_bytes(bytes(raw))
+        with pytest.raises(ValueError, match="Content hash mismatch"):
+            fe.FeaturePipeline.load(path)
+        fe.FeaturePipeline.load(path, verify=False)
+
+    def test_loaded_pipeline_is_transform_only(self, tmp_path):
+        """Test partial_fit on a loaded pipeline is refused."""
+        X = np.random.default_rng(10).normal(size=(50, 2))
+        _numeric_pipeline().fit(X).save(tmp_path / "p.fpa")
+        loaded = fe.FeaturePipeline.load(tmp_path / "p.fpa")
+        with pytest.raises(RuntimeError, match="transform-only"):
+            loaded.partial_fit(X)
+
+    def test_frozen_transformer_is_abstract(self):
+        """Test the frozen step base class cannot be instantiated."""
+        with pytest.raises(TypeError):
+            fe.FrozenTransformer([], {})
@@ -0,0 +1,257 @@
+"""
+Tests for the graph algorithms skill (skills/graph-databases/graph-algorithms).
+"""
+
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+nx = pytest.importorskip("networkx")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "graph-databases" / "graph-algorithms"
+sys.path.insert(0, str(SKILL_DIR))
+
+import graph_algorithms as ga  # noqa: E402
+
+
+def _random_graphs(seed, n=60, p=0.06, directed=True):
+    """Build the same random graph as an AdjacencyListGraph and a networkx graph.
+
+    Weights are multiples of 1/4 so float32 CSR weights are exact.
+    """
+    rng = random.Random(seed)
+    graph = ga.AdjacencyListGraph(directed=directed)
+    reference = nx.DiGraph() if directed else nx.Graph()
+    for i in range(n):
+        graph.add_node(f"n{i}")
+        reference.add_node(f"n{i}")
+    for i in range(n):
+        for j in range(n if directed else i):
+            if i != j and rng.random() < p:
+                weight = rng.randint(1, 20) / 4
+                graph.add_edge(f"n{i}", f"n{j}", weight)
+                reference.add_edge(f"n{i}", f"n{j}", weight=weight)
+    return graph, reference
+
+
+def _reference_pagerank(reference, nodes, damping=0.85, teleport=None):
+    """Solve the Google-matrix linear system densely; dangling rows jump along the teleport vector."""
+    n = len(nodes)
+    teleport = np.full(n, 1.0 / n) if teleport is None else teleport / teleport.sum()
+    transition = nx.to_numpy_array(reference, nodelist=nodes, weight=None)
+    out_degree = transition.sum(axis=1)
+    transition[out_degree == 0] = teleport
+    transition[out_degree > 0] /= out_degree[out_degree > 0, None]
+    scores = np.linalg.solve(np.eye(n) - damping * transition.T, (1 - damping) * teleport)
+    return dict(zip(nodes, scores))
+
+
+class TestCSRGraph:
+    """Tests for the compressed sparse row graph."""
+
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_adjacency_matches_source_graph(self, directed):
+        """Test out- and in-neighbours and pull() equal the adjacency list's."""
+        graph, reference = _random_graphs(0, directed=directed)
+        csr = graph.to_csr()
+        assert (csr.node_count, csr.edge_count) == (graph.node_count, graph.edge_count)
+        for label in graph.nodes:
+            targets, weights = csr.out_neighbors(csr.node_id(label))
+            got = sorted(zip([csr.label(t) for t in targets.tolist()], weights.tolist()))
+            assert got == sorted(graph.get_neighbors(label))
+            sources, _ = csr.in_neighbors(csr.node_id(label))
+            predecessors = reference.predecessors(label) if directed else reference.neighbors(label)
+            assert sorted(csr.label(s) for s in sources.tolist()) == sorted(predecessors)
+        values = np.random.default_rng(1).random(csr.node_count)
+        adjacency = nx.to_numpy_array(reference, nodelist=csr.labels, weight=None)
+        np.testing.assert_allclose(csr.pull(values), adjacency.T @ values)
+
+    def test_from_edges_matches_from_adjacency(self):
+        """Test streaming edges builds the same graph as freezing an adjacency list."""
+        graph, _ = _random_graphs(2)
+        edges = [(e.source, e.target, e.weight) for e in graph.get_all_edges()]
+        streamed = ga.CSRGraph.from_edges(edges, nodes=sorted(graph.nodes))
+        frozen = graph.to_csr()
+        assert streamed.labels == frozen.labels
+        np.testing.assert_array_equal(streamed.indptr, frozen.indptr)
+        np.testing.assert_array_equal(streamed.rev_indptr, frozen.rev_indptr)
+        for node_id in range(frozen.node_count):
+            assert sorted(zip(*map(np.ndarray.tolist, streamed.out_neighbors(node_id)))) == \
+                sorted(zip(*map(np.ndarray.tolist, frozen.out_neighbors(node_id))))
+
+
+class TestPageRankAndDijkstra:
+    """Tests for the CSR PageRank and Dijkstra kernels against reference solutions."""
+
+    @pytest.mark.parametrize("seed", [3, 4])
+    def test_pagerank_matches_linear_solve(self, seed):
+        """Test scores, including dangling-node redistribution, solve the Google-matrix system."""
+        graph, reference = _random_graphs(seed, p=0.04)
+        assert any(graph.get_out_degree(node) == 0 for node in graph.nodes)
+        result = ga.PageRank(tolerance=1e-12, max_iterations=1000).compute(graph)
+        expected = _reference_pagerank(reference, list(reference))
+        assert result.converged
+        for node, score in expected.items():
+            assert result.scores[node] == pytest.approx(score, abs=1e-9)
+
+    def test_personalized_pagerank_matches_linear_solve(self):
+        """Test teleporting to weighted seeds matches the personalized linear system."""
+        graph, reference = _random_graphs(5, p=0.05)
+        seeds = {"n0": 2.0, "n7": 1.0}
+        result = ga.PageRank(tolerance=1e-12).personalized_pr(graph.to_csr(), seeds, max_iterations=1000)
+        nodes = list(reference)
+        expected = _reference_pagerank(reference, nodes, teleport=np.array([seeds.get(node, 0.0) for node in nodes]))
+        for node, score in expected.items():
+            assert result.scores[node] == pytest.approx(score, abs=1e-9)
+
+    @pytest.mark.parametrize("directed", [True, False])
+    def test_dijkstra_matches_networkx(self, directed):
+        """Test distances and predecessor paths on both graph representations."""
+        graph, reference = _random_graphs(6, directed=directed)
+        expected = nx.single_source_dijkstra_path_length(reference, "n0")
+        for result in (ga.Dijkstra().compute(graph, "n0"), ga.Dijkstra().compute(graph.to_csr(), "n0")):
+            for node in graph.nodes:
+                assert result.distance_to(node) == expected.get(node, float("inf"))
+                path = result.path_to(node)
+                if node in expected:
+                    assert sum(reference[u][v]["weight"] for u, v in zip(path, path[1:])) == expected[node]
+                else:
+                    assert path == []
+
+    def test_dijkstra_rejects_negative_weights(self):
+        """Test a negative edge weight raises on the CSR path as on the adjacency path."""
+        graph = ga.AdjacencyListGraph()
+        graph.add_edge("a", "b", 1.0)
+        graph.add_edge("b", "c", -1.0)
+        for target in (graph, graph.to_csr()):
+            with pytest.raises(ValueError, match="negative weights"):
+                ga.Dijkstra().compute(target, "a")
+
+
+def _from_networkx(reference):
+    """Copy a weighted undirected networkx graph into an AdjacencyListGraph."""
+    graph = ga.AdjacencyListGraph(directed=False)
+    for node in reference:
+        graph.add_node(str(node))
+    for u, v, weight in reference.edges(data="weight", default=1.0):
+        graph.add_edge(str(u), str(v), weight)
+    return graph
+
+
+def _clustered_graph(seed, groups=6, size=15):
+    """Planted-partition graph with weights that are multiples of 1/4."""
+    reference = nx.planted_partition_graph(groups, size, 0.4, 0.03, seed=seed)
+    rng = random.Random(seed)
+    for u, v in reference.edges:
+        reference[u][v]["weight"] = rng.randint(1, 8) / 4
+    return nx.relabel_nodes(reference, str)
+
+
+class TestLouvain:
+    """Tests for multi-level Louvain and Leiden refinement."""
+
+    @pytest.mark.parametrize("refine", [False, True])
+    @pytest.mark.parametrize("resolution", [0.5, 1.0, 2.0])
+    def test_reported_modularity_matches_networkx(self, refine, resolution):
+        """Test the incrementally tracked modularity equals networkx's for the returned partition."""
+        reference = _clustered_graph(0)
+        detector = ga.LouvainCommunity(resolution=resolution, seed=1, refine=refine)
+        result = detector.detect(_from_networkx(reference))
+        partition = [result.get_community_members(c) for c in range(result.num_communities)]
+        assert set(result.communities) == set(reference)
+        assert set(result.communities.values()) == set(range(result.num_communities))
+        expected = nx.community.modularity(reference, partition, resolution=resolution)
+        assert result.modularity == pytest.approx(expected, abs=1e-9)
+        assert detector.modularity(_from_networkx(reference), result.communities) == pytest.approx(expected, abs=1e-9)
+
+    @pytest.mark.parametrize("refine", [False, True])
+    def test_quality_on_par_with_networkx(self, refine):
+        """Test modularity is close to networkx's Louvain and the planted groups are found."""
+        reference = _clustered_graph(2, groups=8, size=25)
+        result = ga.LouvainCommunity(seed=3, refine=refine).detect(_from_networkx(reference))
+        baseline = nx.community.modularity(reference, nx.community.louvain_communities(reference, seed=3))
+        assert result.modularity >= baseline - 0.02
+        planted = [set(map(str, block)) for block in reference.graph["partition"]]
+        found = [result.get_community_members(c) for c in range(result.num_communities)]
+        assert sum(max(len(block & group) for group in found) for block in planted) >= 0.9 * len(reference)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_leiden_communities_are_connected(self, seed):
+        """Test every refined community induces a connected subgraph."""
+        reference = nx.relabel_nodes(nx.gnm_random_graph(120, 200, seed=seed), str)
+        result = ga.LouvainCommunity(seed=seed, refine=True).detect(_from_networkx(reference))
+        for c in range(result.num_communities):
+            assert nx.is_connected(reference.subgraph(result.get_community_members(c)))
+
+    def test_seed_fixes_result(self):
+        """Test the same seed gives the same partition."""
+        graph = _from_networkx(_clustered_graph(4))
+        for refine in (False, True):
+            first = ga.LouvainCommunity(seed=5, refine=refine).detect(graph)
+            assert ga.LouvainCommunity(seed=5, refine=refine).detect(graph) == first
+
+
+class TestCentrality:
+    """Tests for the CSR betweenness and closeness kernels."""
+
+    @pytest.mark.parametrize("directed", [True, False])
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_betweenness_matches_networkx(self, directed, weighted):
+        """Test exact Brandes scores, with hop or weighted lengths, equal networkx's normalized ones."""
+        graph, reference = _random_graphs(7, directed=directed, p=0.08)
+        scores = ga.CentralityCalculator(graph).betweenness_centrality(weighted=weighted)
+        expected = nx.betweenness_centrality(reference, weight="weight" if weighted else None)
+        for node, score in expected.items():
+            assert scores[node] == pytest.approx(score, abs=1e-12)
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_closeness_matches_distance_sums(self, weighted):
+        """Test closeness is (n - 1) over the summed distances to reachable nodes."""
+        graph, reference = _random_graphs(8, p=0.05)
+        scores = ga.CentralityCalculator(graph).closeness_centrality(weighted=weighted)
+        n = reference.number_of_nodes()
+        for node in reference:
+            if weighted:
+                total = sum(nx.single_source_dijkstra_path_length(reference, node).values())
+            else:
+                total = sum(nx.single_source_shortest_path_length(reference, node).values())
+            assert scores[node] == pytest.approx((n - 1) / total if total else 0.0)
+
+    def test_results_independent_of_jobs(self):
+        """Test worker processes return the same scores as a serial run."""
+        graph, _ = _random_graphs(9)
+        calculator = ga.CentralityCalculator(graph)
+        for method in (calculator.betweenness_centrality, calculator.closeness_centrality):
+            serial, forked = method(weighted=True), method(weighted=True, n_jobs=2)
+            assert forked == pytest.approx(serial, abs=1e-12)
+        serial = calculator.approximate_betweenness(epsilon=0.4, seed=1)
+        forked = calculator.approximate_betweenness(epsilon=0.4, seed=1, n_jobs=2)
+        assert not serial.exact
+        assert forked.scores == pytest.approx(serial.scores, abs=1e-12)
+
+    def test_concurrent_calculators_do_not_share_jobs(self):
+        """Test calculators running in threads at once each score their own graph."""
+        graphs = [_random_graphs(seed, p=0.1)[0] for seed in (10, 11, 12)]
+        expected = [ga.CentralityCalculator(graph).betweenness_centrality() for graph in graphs]
+        with ThreadPoolExecutor(len(graphs)) as threads:
+            results = list(threads.map(
+                lambda graph: ga.CentralityCalculator(graph).betweenness_centrality(n_jobs=2), graphs))
+        for got, want in zip(results, expected):
+            assert got == pytest.approx(want, abs=1e-12)
+
+    def test_snapshot_rebuilt_after_edits(self):
+        """Test a calculator sees nodes and edges added after its first query."""
+        graph = ga.AdjacencyListGraph(directed=False)
+        graph.add_edge("a", "b")
+        graph.add_edge("b", "c")
+        calculator = ga.CentralityCalculator(graph)
+        assert calculator.betweenness_centrality()["b"] == 1.0
+        graph.add_edge("a", "c")
+        assert calculator.betweenness_centrality()["b"] == 0.0
+        graph.add_node("d")
+        assert calculator.csr.node_count == 4
+        assert calculator.closeness_centrality()["d"] == 0.0
@@ -0,0 +1,317 @@
+"""
+Tests for the GraphQL performance skill (skills/graphql/performance).
+"""
+
+import asyncio
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "graphql" / "performance"
+sys.path.insert(0, str(SKILL_DIR))
+
+import performance as perf  # noqa: E402
+
+
+def _reference_walk(selections, fragments):
+    """Expand fragment spreads naively; return (depth, Counter of costed field names)."""
+    depth, fields = 0, Counter()
+    for selection in selections:
+        if isinstance(selection, perf.FieldNode):
+            child_depth, child_fields = _reference_walk(selection.selections, fragments)
+            depth = max(depth, child_depth + 1)
+            if selection.arguments or selection.selections:
+                fields[selection.name] += 1
+            fields.update(child_fields)
+        else:
+            inner = fragments[selection.name].selections if isinstance(selection, perf.FragmentSpreadNode) \
+                else selection.selections
+            child_depth, child_fields = _reference_walk(inner, fragments)
+            depth = max(depth, child_depth)
+            fields.update(child_fields)
+    return depth, fields
+
+
+DOCUMENTS = [
+    "{ user(id: 1) { name posts(first: 2) { title } } }",
+    """
+    query Feed($n: Int = 5) {
+      me: user(id: "a { b } c") { ...Profile friends: users(first: $n) { ...Profile } }
+    }
+    fragment Profile on User { name profile { avatar settings { theme } } ...Counts }
+    fragment Counts on User { posts(first: 3) { id } comments(first: 1) { id } }
+    """,
+    """
+    # a comment with { braces }
+    query Search {
+      search(text: \"\"\"multi
+      line { \"\"\") {
+        ... on Post { title comments(first: 4) { author { name } } }
+        ... on User { name }
+      }
+    }
+    """,
+]
+
+
+class TestGraphQLDocumentParser:
+    """Tests for the AST parser and fragment-resolving analysis."""
+
+    @pytest.mark.parametrize("query", DOCUMENTS)
+    def test_summary_matches_naive_expansion(self, query):
+        """Test precomputed depth and field counts equal inlining every fragment."""
+        document = perf.parse_document(query)
+        depth, fields = 0, Counter()
+        for operation in document.operations:
+            op_depth, op_fields = _reference_walk(operation.selections, document.fragments)
+            depth = max(depth, op_depth)
+            fields.update(op_fields)
+        assert document.max_depth == depth
+        costed = Counter()
+        for node, count in document.costed_fields:
+            costed[node.name] += count
+        assert costed == fields
+
+    def test_fragments_aliases_and_strings(self):
+        """Test aliases keep the field name and braces in strings are not selections."""
+        document = perf.parse_document(DOCUMENTS[1])
+        operation = document.operations[0]
+        user = operation.selections[0]
+        assert (user.alias, user.name, user.arguments) == ("me", "user", {"id": "a { b } c"})
+        assert operation.variable_defaults == {"n": 5}
+        assert document.max_depth == 5
+        counts = {node.name: count for node, count in document.costed_fields}
+        assert counts["posts"] == 2
+        assert counts["settings"] == 2
+
+    def test_complexity_uses_variables_and_fragments(self):
+        """Test field costs resolve variable multipliers and count each fragment use."""
+        analyzer = perf.QueryComplexityAnalyzer()
+        result = analyzer.analyze(DOCUMENTS[1], {"n": 2})
+        # users: base 10 * $n * factor 10; literal arguments are not multipliers.
+        assert result.field_costs["users"] == 200
+        assert result.field_costs["posts"] == 2 * 8
+        assert result.field_costs["comments"] == 2 * 6
+        assert analyzer.analyze(DOCUMENTS[1]).field_costs["users"] == 500
+
+    @pytest.mark.parametrize("query, message", [
+        ("{ user { ...Missing } }", "Unknown fragment"),
+        ("{ ...A } fragment A on Q { ...B } fragment B on Q { ...A }", "spreads itself"),
+        ("{ user(id: 1) { } }", "Empty selection set"),
+        ("{ user(id: 1) { name }", "Expected"),
+        ('{ user(id: "unterminated) { name } }', "Unexpected character"),
+    ])
+    def test_invalid_documents_are_rejected(self, query, message):
+        """Test malformed documents raise GraphQLSyntaxError and analyze reports them."""
+        with pytest.raises(perf.GraphQLSyntaxError, match=message):
+            perf.parse_document(query)
+        assert not perf.QueryComplexityAnalyzer().analyze(query).is_valid
+        assert not perf.QueryDepthLimiter().validate_depth(query)[0]
+
+    def test_deep_nesting_is_a_syntax_error(self):
+        """Test pathological nesting is reported instead of overflowing the stack."""
+        query = "{" + " a {" * 5000 + " b" + " }" * 5000 + " }"
+        with pytest.raises(perf.GraphQLSyntaxError, match="nested too deeply"):
+            perf.parse_document(query)
+
+
+class TestParsedDocumentCache:
+    """Tests for the shared LRU of parsed documents."""
+
+    def test_lru_eviction_order(self):
+        """Test the least recently used document is evicted first."""
+        cache = perf.ParsedDocumentCache(max_size=2)
+        queries = ["{ a(x: 1) { b } }", "{ c(x: 1) { d } }", "{ e(x: 1) { f } }"]
+        cache.get(queries[0])
+        cache.get(queries[1])
+        cache.get(queries[0])
+        cache.get(queries[2])
+        hashes = [cache.hash_query(q) for q in queries]
+        assert list(cache.documents) == [hashes[0], hashes[2]]
+        assert cache.get_stats()["hits"] == 1
+
+    def test_persisted_queries_share_parsed_documents(self):
+        """Test analysers reuse documents parsed when a query is registered."""
+        cache = perf.ParsedDocumentCache()
+        manager = perf.PersistedQueryManager(cache)
+        analyzer = perf.QueryComplexityAnalyzer(document_cache=cache)
+        limiter = perf.QueryDepthLimiter(document_cache=cache)
+        query_hash = manager.register_query(DOCUMENTS[0])
+        assert manager.get_document(query_hash) is cache.get_by_hash(query_hash)
+        analyzer.analyze(DOCUMENTS[0], query_hash=query_hash)
+        assert limiter.validate_depth(DOCUMENTS[0], query_hash) == (True, 3, None)
+        assert cache.get_stats()["misses"] == 1
+        manager.remove_query(query_hash)
+        assert cache.get_by_hash(query_hash) is None
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _reference_cache_trace(policy, capacity, operations):
+    """Replay get/set operations on a plain-dict LRU or LFU; return final keys in order."""
+    entries = {}  # key -> [frequency, tick of last use or last frequency change]
+    for tick, (op, key) in enumerate(operations):
+        if op == "get":
+            if key in entries:
+                entries[key] = [entries[key][0] + 1, tick]
+        elif key in entries:
+            entries[key][1] = tick
+        else:
+            if len(entries) >= capacity:
+                rank = (lambda k: entries[k][1]) if policy == "lru" else (lambda k: tuple(entries[k]))
+                del entries[min(entries, key=rank)]
+            entries[key] = [0, tick]
+    return sorted(entries)
+
+
+class TestCacheManager:
+    """Tests for the bounded cache with eviction policies and a TTL wheel."""
+
+    @pytest.mark.parametrize("policy", [perf.EvictionPolicy.LRU, perf.EvictionPolicy.LFU])
+    def test_eviction_matches_reference(self, policy):
+        """Test a random get/set trace keeps the same keys as a plain reference cache."""
+        rng = random.Random(0)
+        operations = [(rng.choice(["get", "set"]), f"k{int(rng.paretovariate(1.2)) % 40}") for _ in range(3000)]
+        cache = perf.CacheManager(max_entries=8, eviction_policy=policy, default_ttl=10 ** 6)
+        for op, key in operations:
+            if op == "get":
+                cache.get(key)
+            else:
+                cache.set(key, key)
+        name = "lru" if policy == perf.EvictionPolicy.LRU else "lfu"
+        assert sorted(cache.cache) == _reference_cache_trace(name, 8, operations)
+        assert len(cache.cache) == 8
+
+    def test_byte_capacity_accounting(self):
+        """Test total_bytes tracks stored sizes and never exceeds max_bytes."""
+        cache = perf.CacheManager(max_entries=None, max_bytes=1000)
+        for i in range(200):
+            cache.set(f"k{i}", "x" * (i % 50 + 1))
+            assert cache.total_bytes == sum(entry.size for entry in cache.cache.values())
+            assert cache.total_bytes <= 1000
+        assert not cache.set("huge", "x" * 2000)
+        assert cache.get_metrics()["rejections"] == 1
+
+    def test_tiny_lfu_resists_scans(self):
+        """Test keys re-read during a scan of one-off keys stay cached under TinyLFU but not LRU."""
+        def hot_hits(policy):
+            cache = perf.CacheManager(max_entries=10, eviction_policy=policy)
+            hits = 0
+            for i in range(3000):
+                key = f"hot{i // 3 % 5}" if i % 3 == 0 else f"scan{i}"
+                if cache.get(key) is not None:
+                    hits += 1
+                else:
+                    cache.set(key, i)
+            return hits, cache
+
+        lru_hits, _ = hot_hits(perf.EvictionPolicy.LRU)
+        tiny_hits, cache = hot_hits(perf.EvictionPolicy.TINY_LFU)
+        assert lru_hits == 0
+        assert tiny_hits > 900
+        assert all(f"hot{i}" in cache.cache for i in range(5))
+        assert cache.get_metrics()["rejections"] > 0
+
+    def test_timer_wheel_expires_without_reads(self):
+        """Test expired entries are reaped by the wheel, not only on access."""
+        clock = _FakeClock()
+        cache = perf.CacheManager(default_ttl=5, clock=clock)
+        cache.set("short", 1, ttl=2)
+        cache.set("long", 2, ttl=100)
+        clock.now += 3
+        assert cache.purge_expired() == 1
+        assert list(cache.cache) == ["long"]
+        clock.now += 1000
+        cache.set("other", 3)
+        assert list(cache.cache) == ["other"]
+        assert cache.get_metrics()["expirations"] == 2
+
+    def test_stale_while_revalidate_and_coalescing(self):
+        """Test concurrent misses load once and a stale hit refreshes in the background."""
+        clock = _FakeClock()
+        cache = perf.CacheManager(default_ttl=10, stale_while_revalidate=30, clock=clock)
+        calls = []
+
+        async def loader():
+            calls.append(clock.now)
+            await asyncio.sleep(0)
+            return len(calls)
+
+        async def scenario():
+            first = await asyncio.gather(*[cache.get_or_compute("q", loader) for _ in range(5)])
+            clock.now += 15
+            stale = await cache.get_or_compute("q", loader)
+            await asyncio.sleep(0.01)
+            return first, stale, cache.get("q")
+
+        first, stale, fresh = asyncio.run(scenario())
+        assert first == [1] * 5
+        assert (stale, fresh) == (1, 2)
+        assert len(calls) == 2
+        assert cache.get_metrics()["coalesced"] == 4
+
+
+class TestQueryBatchProcessor:
+    """Tests for deadline batching, coalescing and backpressure."""
+
+    @staticmethod
+    def _echo_executor(calls):
+        async def execute(queries):
+            calls.append([q["variables"].get("id") for q in queries])
+            await asyncio.sleep(0.001)
+            return [{"id": q["variables"].get("id")} for q in queries]
+        return execute
+
+    def test_primitives_are_created_in_the_running_loop(self):
+        """Test a processor built outside any loop works in loops created later."""
+        processor = perf.QueryBatchProcessor(batch_size=2)
+        assert processor._batch_slots is None and processor._capacity_available is None
+
+        async def scenario():
+            futures = [await processor.add_query("query($id: ID) { user(id: $id) { name } }", {"id": i}) for i in range(3)]
+            await processor.flush()
+            return [f.result()["extensions"]["batched"] for f in futures]
+
+        assert asyncio.run(scenario()) == [True] * 3
+        assert processor.get_stats()["size_flushes"] == 1
+
+    def test_batches_by_size_and_deadline_and_coalesces(self):
+        """Test size and deadline flushes each run once and duplicates share a result."""
+        calls = []
+        processor = perf.QueryBatchProcessor(batch_size=3, batch_interval=0.005, executor=self._echo_executor(calls))
+        query = "query($id: ID) { user(id: $id) { name } }"
+
+        async def scenario():
+            futures = [await processor.add_query(query, {"id": i % 4}) for i in range(6)]
+            results = await asyncio.gather(*futures)
+            return [r["id"] for r in results]
+
+        assert asyncio.run(scenario()) == [0, 1, 2, 3, 0, 1]
+        assert calls == [[0, 1, 2], [3]]
+        stats = processor.get_stats()
+        assert (stats["size_flushes"], stats["deadline_flushes"], stats["deduplicated_queries"]) == (1, 1, 2)
+
+    def test_backpressure_waits_for_capacity(self):
+        """Test add_query blocks at max_pending until a batch completes."""
+        calls = []
+        processor = perf.QueryBatchProcessor(
+            batch_size=2, max_pending=2, max_concurrent_batches=1, executor=self._echo_executor(calls)
+        )
+
+        async def scenario():
+            futures = [await processor.add_query("{ user(id: 1) { name } }", {"id": i}) for i in range(6)]
+            await processor.flush()
+            return [f.result()["id"] for f in futures]
+
+        assert asyncio.run(scenario()) == list(range(6))
+        assert calls == [[0, 1], [2, 3], [4, 5]]
+        assert processor.get_stats()["backpressure_waits"] == 2
@@ -0,0 +1,136 @@
+"""
+Tests for the GraphQL subscriptions skill (skills/graphql/subscriptions).
+"""
+
+import asyncio
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "graphql" / "subscriptions"
+sys.path.insert(0, str(SKILL_DIR))
+
+import subscriptions as subs  # noqa: E402
+
+
+class _RecordingManager(subs.SubscriptionManager):
+    """Manager that records delivered (subscription id, event id) pairs."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.delivered = []
+
+    async def _notify_subscription(self, subscription, event):
+        await asyncio.sleep(0)
+        self.delivered.append((subscription.id, event.id))
+
+
+def _event(index, event_type=subs.EventType.POST_CREATED, **payload):
+    return subs.SubscriptionEvent(id=f"e{index}", type=event_type, payload=payload)
+
+
+QUERIES = [
+    "subscription { postCreated { id } }",
+    "subscription { commentAdded { id } }",
+    "subscription { postCreated { id } postUpdated { id } }",
+]
+
+
+def _random_filters(rng):
+    choices = [
+        lambda: subs.SubscriptionFilter("author", rng.randrange(4)),
+        lambda: subs.SubscriptionFilter("author", rng.randrange(4), "neq"),
+        lambda: subs.SubscriptionFilter("score", rng.randrange(10), "gt"),
+        lambda: subs.SubscriptionFilter("tag", ["a", "b"][: rng.randrange(1, 3)], "in"),
+        lambda: subs.SubscriptionFilter("tags", ["a"]),  # unhashable eq stays a residual filter
+    ]
+    return [rng.choice(choices)() for _ in range(rng.randrange(3))]
+
+
+class TestSubscriptionRouting:
+    """Tests for the event-type and equality-filter routing index."""
+
+    def test_index_matches_full_scan(self):
+        """Test indexed routing selects exactly the subscriptions a full filter scan does."""
+        rng = random.Random(0)
+
+        async def scenario():
+            manager = subs.SubscriptionManager(subs.PubSub())
+            created = []
+            for _ in range(60):
+                options = subs.SubscriptionOptions(filters=_random_filters(rng))
+                created.append(await manager.create_subscription(rng.choice(QUERIES), {}, options))
+            for subscription in created[::7]:
+                await manager.cancel_subscription(subscription.id)
+            mismatches = 0
+            for i in range(200):
+                event = _event(
+                    i, rng.choice(list(subs.EventType)[:4]),
+                    author=rng.randrange(4), score=rng.randrange(10),
+                    tag=rng.choice("abc"), tags=rng.choice([["a"], ["b"]]),
+                )
+                routed = {s.id for s in manager.matching_subscriptions(event)}
+                expected = {s.id for s in manager.subscriptions.values() if await manager._should_notify(s, event)}
+                mismatches += routed != expected
+            return mismatches, len(manager.subscriptions)
+
+        mismatches, remaining = asyncio.run(scenario())
+        assert mismatches == 0
+        assert remaining == 60 - len(range(0, 60, 7))
+
+    def test_delivery_keeps_per_subscription_order(self):
+        """Test events reach each subscription once and in publish order."""
+        async def scenario():
+            manager = _RecordingManager(subs.PubSub(), delivery_concurrency=4)
+            ids = [(await manager.create_subscription(QUERIES[0], {})).id for _ in range(10)]
+            for i in range(50):
+                await manager.handle_event(_event(i))
+                if i % 10 == 0:
+                    await asyncio.sleep(0)
+            await manager.drain()
+            await manager.close()
+            return ids, manager.delivered
+
+        ids, delivered = asyncio.run(scenario())
+        for subscription_id in ids:
+            assert [e for s, e in delivered if s == subscription_id] == [f"e{i}" for i in range(50)]
+
+
+class TestOverflowPolicies:
+    """Tests for bounded per-subscription queues."""
+
+    @staticmethod
+    def _overflow(policy, n_events=5, queue_size=3):
+        async def scenario():
+            manager = _RecordingManager(subs.PubSub())
+            options = subs.SubscriptionOptions(queue_size=queue_size, overflow_policy=policy)
+            subscription = await manager.create_subscription(QUERIES[0], {}, options)
+            for i in range(n_events):  # no await in between, so the workers never run
+                manager._enqueue(subscription, _event(i))
+            await manager.drain()
+            await manager.close()
+            return manager, subscription
+
+        return asyncio.run(scenario())
+
+    @pytest.mark.parametrize("policy, kept", [
+        (subs.OverflowPolicy.DROP_OLDEST, ["e2", "e3", "e4"]),
+        (subs.OverflowPolicy.DROP_NEWEST, ["e0", "e1", "e2"]),
+    ])
+    def test_drop_policies(self, policy, kept):
+        """Test the oldest or newest events are dropped and counted."""
+        manager, _ = self._overflow(policy)
+        assert [e for _, e in manager.delivered] == kept
+        assert manager.metrics.dropped_messages == 2
+
+    def test_disconnect_counts_queued_and_incoming_events(self):
+        """Test a disconnected consumer reports the queued events plus the one that overflowed."""
+        manager, subscription = self._overflow(subs.OverflowPolicy.DISCONNECT, n_events=4)
+        assert manager.delivered == []
+        assert manager.metrics.dropped_messages == 3 + 1
+        assert subscription.status == subs.SubscriptionStatus.ERROR
+        assert subscription.id not in manager.subscriptions
+        assert manager.metrics.active_connections == 0
+        assert manager.matching_subscriptions(_event(9)) == []
@@ -0,0 +1,75 @@
+"""
+Tests for the knowledge graphs skill (skills/graph-databases/knowledge-graphs).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "graph-databases" / "knowledge-graphs"
+sys.path.insert(0, str(SKILL_DIR))
+
+import knowledge_graphs as kg  # noqa: E402
+
+
+def _embedder(edges, p=1.0, q=1.0, walk_length=10, num_walks=1):
+    config = kg.EmbeddingConfig(method=kg.EmbeddingMethod.NODE2VEC, p=p, q=q,
+                                walk_length=walk_length, num_walks=num_walks)
+    embedder = kg.GraphEmbedder(config)
+    for source, target, weight in edges:
+        embedder.add_edge(source, target, weight)
+    return embedder
+
+
+def _walks(embedder, labels, n_jobs=1, seed=0):
+    return embedder._generate_walks(labels, len(labels), n_jobs, np.random.SeedSequence(seed))
+
+
+# Square a-b-c-d with chord b-d and a pendant e on c.
+_EDGES = [("a", "b", 1.0), ("b", "c", 2.0), ("c", "d", 1.0), ("d", "a", 3.0), ("b", "d", 1.0), ("c", "e", 2.0)]
+_LABELS = ["a", "b", "c", "d", "e"]
+
+
+class TestNode2VecWalks:
+    """Tests for the batched second-order random walks."""
+
+    def test_star_with_infinite_q_always_returns(self):
+        """Test a walker at the hub of a star can only step back to the leaf it came from."""
+        leaves = [f"leaf{i}" for i in range(300)]
+        embedder = _embedder([("hub", leaf, 1.0) for leaf in leaves], q=float("inf"), walk_length=8)
+        walks = _walks(embedder, ["hub"] + leaves)
+        assert (walks >= 0).all()
+        np.testing.assert_array_equal(walks[:, 2:], walks[:, :-2])
+
+    @pytest.mark.parametrize("max_rejections", [0, 64])
+    def test_transitions_follow_alpha_weights(self, monkeypatch, max_rejections):
+        """Test second steps match weight times alpha, by rejection or by exact row sampling."""
+        monkeypatch.setattr(kg, "_MAX_REJECTIONS", max_rejections)
+        p, q = 0.5, 4.0
+        embedder = _embedder(_EDGES, p=p, q=q, walk_length=3, num_walks=20_000)
+        walks = _walks(embedder, _LABELS)
+        weight = {}
+        for u, v, w in _EDGES:
+            weight[u, v] = weight[v, u] = w
+        for back, node in [("a", "b"), ("d", "c"), ("e", "c")]:
+            i, j = _LABELS.index(back), _LABELS.index(node)
+            nxt = walks[(walks[:, 0] == i) & (walks[:, 1] == j), 2]
+            heads = [x for x in _LABELS if (node, x) in weight]
+            alpha = [1 / p if x == back else 1.0 if (back, x) in weight else 1 / q for x in heads]
+            expected = np.array([weight[node, x] * a for x, a in zip(heads, alpha)])
+            observed = np.array([(nxt == _LABELS.index(x)).mean() for x in heads])
+            np.testing.assert_allclose(observed, expected / expected.sum(), atol=0.02)
+
+    def test_walks_independent_of_jobs(self):
+        """Test worker processes produce the same walks as a serial run."""
+        rng = np.random.default_rng(1)
+        edges = [(f"n{i}", f"n{j}", float(rng.integers(1, 4)))
+                 for i in range(300) for j in rng.choice(300, size=3) if i != j]
+        embedder = _embedder(edges, p=0.5, q=2.0, num_walks=20)
+        labels = [f"n{i}" for i in range(300)]
+        serial = _walks(embedder, labels)
+        assert len(serial) > kg._WALK_CHUNK
+        np.testing.assert_array_equal(_walks(embedder, labels, n_jobs=2), serial)
@@ -139,3 +139,46 @@ class TestConcurrencyPerformance:
             assert len(agents) == 10
         except ImportError:
             pytest.skip("Agent not available")
+
+
+class TestBenchmarkHarness:
+    """Test the statistics and regression gate of scripts/benchmark.py."""
+    
+    def test_percentile_and_summary(self, project_root):
+        """Test repeated samples reduce to min/median/p95."""
+        from scripts import benchmark
+        
+        samples = [{"import_ms": float(v), "error": None} for v in (5, 1, 3, 2, 4)]
+        summary = benchmark.summarize(samples)
+        
+        assert summary["samples"] == 5
+        assert summary["import_ms"] == {"min": 1.0, "median": 3.0, "p95": 5.0}
+        assert "main_ms" not in summary
+        assert benchmark.percentile([1, 2, 3, 4, 5, 6, 7, 8, 9, 10], 50) == 5
+    
+    def test_baseline_regressions(self, project_root):
+        """Test only changes past both thresholds are reported."""
+        from scripts import benchmark
+        
+        def run(import_ms, error=None):
+            stats = {"min": import_ms, "median": import_ms, "p95": import_ms}
+            return {"entries": {"skill:a/b": {"import_ms": stats, "error": error}}}
+        
+        baseline = run(100.0)
+        assert benchmark.compare_to_baseline(run(110.0), baseline, 0.2, 2.0, 1024) == []
+        assert len(benchmark.compare_to_baseline(run(150.0), baseline, 0.2, 2.0, 1024)) == 1
+        assert benchmark.compare_to_baseline(run(1.5), run(1.0), 0.2, 2.0, 1024) == []
+        assert "now fails" in benchmark.compare_to_baseline(run(100.0, "boom"), baseline, 0.2, 2.0, 1024)[0]
+    
+    def test_probe_measures_cold_import(self, project_root, tmp_path):
+        """Test the subprocess probe reports import time and RSS."""
+        from scripts import benchmark
+        
+        script = tmp_path / "tiny.py"
+        script.write_text("def main():\n    print('hi')\n")
+        result = benchmark.probe_once(script, run_main=True, timeout=60)
+        
+        assert result["error"] is None
+        assert result["import_ms"] >= 0
+        assert result["main_ms"] >= 0
+        assert result["process_ms"] >= result["import_ms"]
@@ -0,0 +1,174 @@
+"""
+Tests for the social network analysis skill (skills/graph-databases/social-network-analysis).
+"""
+
+import inspect
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+nx = pytest.importorskip("networkx")
+
+GRAPH_DIR = Path(__file__).parent.parent / "skills" / "graph-databases"
+sys.path.insert(0, str(GRAPH_DIR / "social-network-analysis"))
+sys.path.insert(0, str(GRAPH_DIR / "graph-algorithms"))
+
+import graph_algorithms as ga  # noqa: E402
+import social_network_analysis as sna  # noqa: E402
+
+
+def _random_graphs(seed, n=50, p=0.08):
+    """Build the same random undirected graph as a SocialNetworkGraph and a networkx graph."""
+    rng = random.Random(seed)
+    graph, reference = sna.SocialNetworkGraph(), nx.Graph()
+    for i in range(n):
+        graph.add_node(sna.SocialNode(f"u{i}"))
+        reference.add_node(f"u{i}")
+    for i in range(n):
+        for j in range(i):
+            if rng.random() < p:
+                weight = rng.randint(1, 20) / 4
+                graph.add_edge(sna.SocialEdge(f"u{i}", f"u{j}", weight))
+                reference.add_edge(f"u{i}", f"u{j}", weight=weight)
+    return graph, reference
+
+
+TINY_EDGES = [("a", "b"), ("a", "c"), ("b", "c"), ("c", "d"), ("d", "e"), ("e", "f"), ("b", "f")]
+
+
+def _tiny_graph():
+    graph = sna.SocialNetworkGraph()
+    for node_id in "abcdef":
+        graph.add_node(sna.SocialNode(node_id))
+    for source, target in TINY_EDGES:
+        graph.add_edge(sna.SocialEdge(source, target))
+    return graph
+
+
+def _exact_spread(seeds, probability):
+    """Expected independent-cascade reach, enumerating every live/dead outcome of every arc."""
+    arcs = TINY_EDGES + [(v, u) for u, v in TINY_EDGES]
+    expected = 0.0
+    for live in itertools.product([False, True], repeat=len(arcs)):
+        weight = probability ** sum(live) * (1 - probability) ** (len(arcs) - sum(live))
+        reached, frontier = set(seeds), list(seeds)
+        while frontier:
+            node = frontier.pop()
+            for (u, v), is_live in zip(arcs, live):
+                if is_live and u == node and v not in reached:
+                    reached.add(v)
+                    frontier.append(v)
+        expected += weight * len(reached)
+    return expected
+
+
+def _scores(results):
+    return {r.node_id: r.score for r in results}
+
+
+class TestCentrality:
+    """Tests for betweenness and closeness over the compact snapshot."""
+
+    @pytest.mark.parametrize("weighted", [False, True])
+    def test_betweenness_matches_networkx(self, weighted):
+        """Test exact Brandes scores equal networkx's normalized ones."""
+        graph, reference = _random_graphs(0)
+        scores = _scores(sna.CentralityCalculator(graph).betweenness_centrality(weighted=weighted))
+        expected = nx.betweenness_centrality(reference, weight="weight" if weighted else None)
+        for node, score in expected.items():
+            assert scores[node] == pytest.approx(score, abs=1e-12)
+
+    def test_closeness_matches_distance_sums(self):
+        """Test closeness is (n - 1) over the summed distances to reachable nodes."""
+        graph, reference = _random_graphs(1, p=0.05)
+        scores = _scores(sna.CentralityCalculator(graph).closeness_centrality(weighted=True, n_jobs=2))
+        n = reference.number_of_nodes()
+        for node in reference:
+            total = sum(nx.single_source_dijkstra_path_length(reference, node).values())
+            assert scores[node] == pytest.approx((n - 1) / total if total else 0.0)
+
+    def test_snapshot_rebuilt_after_edits(self):
+        """Test a calculator sees nodes and edges added after its first query."""
+        graph = sna.SocialNetworkGraph()
+        for node_id in "abc":
+            graph.add_node(sna.SocialNode(node_id))
+        graph.add_edge(sna.SocialEdge("a", "b"))
+        graph.add_edge(sna.SocialEdge("b", "c"))
+        calculator = sna.CentralityCalculator(graph)
+        assert _scores(calculator.betweenness_centrality())["b"] == 1.0
+        graph.add_edge(sna.SocialEdge("a", "c"))
+        assert _scores(calculator.betweenness_centrality())["b"] == 0.0
+        graph.add_node(sna.SocialNode("d"))
+        assert calculator.compact.node_count == 4
+
+    @pytest.mark.parametrize("name", ["_settle", "_dependencies", "_betweenness_partial",
+                                      "_distance_sums", "_pivot_count"])
+    def test_kernels_match_graph_algorithms_copy(self, name):
+        """Test the shortest-path kernels copied from the graph algorithms skill have not drifted."""
+        copied = inspect.getsource(getattr(sna, name)).replace("CompactGraph", "CSRGraph")
+        assert copied == inspect.getsource(getattr(ga, name))
+
+
+class TestInfluence:
+    """Tests for batched live-edge spread estimation and CELF seed selection."""
+
+    def test_spread_matches_exact_expectation(self):
+        """Test the live-edge estimate converges to the enumerated expected reach."""
+        propagator = sna.InfluencePropagator(_tiny_graph())
+        for seeds in (["a"], ["d", "f"]):
+            estimate = propagator.estimate_spread(seeds, probability=0.4, n_simulations=40_000, seed=0)
+            assert estimate.mean == pytest.approx(_exact_spread(seeds, 0.4), abs=4 * estimate.std_error)
+
+    def test_live_edge_celf_matches_plain_greedy(self):
+        """Test lazy evaluation picks the same seeds and gains as re-scoring every candidate each round."""
+        graph, _ = _random_graphs(2, n=40, p=0.08)
+        selection = sna.InfluencePropagator(graph).celf_seed_selection(
+            5, probability=0.2, estimator=sna.SpreadEstimator.LIVE_EDGE, n_samples=100, seed=3)
+        compact = graph.to_compact()
+        salt = int(np.random.default_rng(3).integers(1 << 62, size=2)[0])
+        samples = np.arange(100)
+
+        def spread(sources):
+            job = {"graph": compact, "sources": np.array(sources, dtype=np.int64),
+                   "probability": 0.2, "max_rounds": None, "salt": salt}
+            return sna._spread_counts(job, samples).sum()
+
+        chosen, gains, current = [], [], 0
+        for _ in range(5):
+            totals = [spread(chosen + [v]) if v not in chosen else -1 for v in range(compact.node_count)]
+            best = int(np.argmax(totals))
+            chosen.append(best)
+            gains.append((totals[best] - current) / 100)
+            current = totals[best]
+        assert selection.seeds == [compact.labels[v] for v in chosen]
+        assert selection.marginal_gains == pytest.approx(gains)
+        assert selection.spread == pytest.approx(current / 100)
+        assert selection.evaluations < 5 * compact.node_count
+
+    def test_reverse_reachable_celf_is_near_exact_greedy(self):
+        """Test seeds chosen from RR sets are nearly as good as greedy on the exact spread."""
+        chosen = []
+        for _ in range(2):
+            chosen.append(max((v for v in "abcdef" if v not in chosen),
+                              key=lambda v: _exact_spread(chosen + [v], 0.4)))
+        selection = sna.InfluencePropagator(_tiny_graph()).celf_seed_selection(
+            2, probability=0.4, n_samples=40_000, seed=4)
+        best = _exact_spread(chosen, 0.4)
+        assert _exact_spread(selection.seeds, 0.4) >= 0.98 * best
+        assert selection.spread == pytest.approx(_exact_spread(selection.seeds, 0.4), rel=0.03)
+
+    @pytest.mark.parametrize("estimator", list(sna.SpreadEstimator))
+    def test_results_independent_of_jobs(self, estimator):
+        """Test worker processes select the same seeds and estimate the same spread."""
+        propagator = sna.InfluencePropagator(_random_graphs(5, n=60)[0])
+        runs = [propagator.celf_seed_selection(4, probability=0.1, estimator=estimator,
+                                               n_samples=2000, n_jobs=n_jobs, seed=6)
+                for n_jobs in (1, 2)]
+        assert runs[0] == runs[1]
+        spreads = [propagator.estimate_spread(runs[0].seeds, n_simulations=500, n_jobs=n_jobs, seed=7)
+                   for n_jobs in (1, 3)]
+        assert spreads[0] == spreads[1]
@@ -0,0 +1,131 @@
+"""
+Tests for the statistical analysis skill (skills/data-science/statistical-analysis).
+"""
+
+import itertools
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "data-science" / "statistical-analysis"
+sys.path.insert(0, str(SKILL_DIR))
+
+import statistical_analysis as sa  # noqa: E402
+
+
+def _exact_permutation_p_value(group1, group2):
+    """Two-sided p-value of the difference of means over every relabelling."""
+    combined = np.concatenate([group1, group2])
+    observed = abs(group1.mean() - group2.mean())
+    hits = total = 0
+    for chosen in itertools.combinations(range(len(combined)), len(group1)):
+        mask = np.zeros(len(combined), dtype=bool)
+        mask[list(chosen)] = True
+        hits += abs(combined[mask].mean() - combined[~mask].mean()) >= observed - 1e-12
+        total += 1
+    return hits / total
+
+
+class TestResamplingEngine:
+    """Tests for block-wise bootstrap, permutation and jackknife resampling."""
+
+    def test_vectorized_matches_row_by_row(self):
+        """Test a VectorizedStatistic gives the same resamples as a plain callable."""
+        data = np.random.default_rng(0).normal(size=40)
+        for vectorized, plain in [
+            (sa.VectorizedStatistic.mean(), lambda x: float(np.mean(x))),
+            (sa.VectorizedStatistic.quantile(0.3), lambda x: float(np.quantile(x, 0.3))),
+            (sa.VectorizedStatistic.variance(ddof=1), lambda x: float(np.var(x, ddof=1))),
+        ]:
+            fast = sa.ResamplingEngine(np.random.default_rng(1), block_bytes=4096).bootstrap(data, vectorized, 500)
+            slow = sa.ResamplingEngine(np.random.default_rng(1), block_bytes=4096).bootstrap(data, plain, 500)
+            np.testing.assert_allclose(fast, slow)
+
+    def test_jackknife_formulas_match_deletion(self):
+        """Test leave-one-out formulas equal recomputing on each deleted sample."""
+        data = np.random.default_rng(2).normal(size=25) + 1e6
+        engine = sa.ResamplingEngine()
+        for statistic in [
+            sa.VectorizedStatistic.mean(),
+            sa.VectorizedStatistic.median(),
+            sa.VectorizedStatistic.quantile(0.9),
+            sa.VectorizedStatistic.variance(ddof=1),
+        ]:
+            expected = [statistic.func(np.delete(data, i)) for i in range(len(data))]
+            np.testing.assert_allclose(engine.jackknife(data, statistic), expected, rtol=1e-10)
+
+    def test_result_independent_of_blocks_and_jobs(self):
+        """Test n_jobs does not change the resamples for a fixed seed and block size."""
+        data = np.random.default_rng(3).exponential(size=60)
+        runs = [
+            sa.ResamplingEngine(np.random.default_rng(4), block_bytes=8 * 60 * 100, n_jobs=n_jobs).bootstrap(
+                data, np.median, 1000
+            )
+            for n_jobs in (1, 2, 3)
+        ]
+        np.testing.assert_array_equal(runs[0], runs[1])
+        np.testing.assert_array_equal(runs[0], runs[2])
+
+    def test_concurrent_engines_do_not_share_jobs(self):
+        """Test engines running in threads at once each resample their own data."""
+        rng = np.random.default_rng(5)
+        datasets = [rng.normal(loc, size=50) for loc in (0.0, 100.0, -100.0, 1000.0)]
+
+        def run(data, n_jobs):
+            engine = sa.ResamplingEngine(np.random.default_rng(6), block_bytes=8 * 50 * 50, n_jobs=n_jobs)
+            return engine.bootstrap(data, lambda x: float(np.mean(x)), 400)
+
+        expected = [run(data, 1) for data in datasets]
+        with ThreadPoolExecutor(len(datasets)) as threads:
+            results = list(threads.map(lambda data: run(data, 2), datasets))
+        for got, want in zip(results, expected):
+            np.testing.assert_array_equal(got, want)
+
+    def test_permutation_p_value_matches_exact_test(self):
+        """Test the sampled p-value converges to full enumeration on small groups."""
+        rng = np.random.default_rng(7)
+        group1, group2 = rng.normal(0.8, size=7), rng.normal(size=7)
+        result = sa.HypothesisTesting(random_state=8).permutation_test(group1, group2, n_permutations=40_000)
+        assert result.p_value == pytest.approx(_exact_permutation_p_value(group1, group2), abs=0.01)
+
+    def test_bootstrap_interval_matches_reference(self):
+        """Test the percentile interval agrees with a direct bootstrap of the mean."""
+        data = np.random.default_rng(9).normal(10.0, 2.0, size=200)
+        result = sa.Bootstrap(n_resamples=20_000, random_state=10).confidence_interval(data)
+        reference_rng = np.random.default_rng(11)
+        reference = data[reference_rng.integers(0, len(data), size=(20_000, len(data)))].mean(axis=1)
+        lower, upper = np.percentile(reference, [2.5, 97.5])
+        assert result.point_estimate == pytest.approx(data.mean())
+        assert result.ci_lower == pytest.approx(lower, abs=0.05)
+        assert result.ci_upper == pytest.approx(upper, abs=0.05)
+        assert result.std_error == pytest.approx(reference.std(ddof=1), rel=0.05)
+
+
+def _normal_sf(z):
+    return 0.5 * (1 - math.erf(z / math.sqrt(2)))
+
+
+class TestNormalApproximations:
+    """Tests for p-values from the normal approximation, which must not need np.math."""
+
+    def test_mann_whitney_p_value(self):
+        """Test the two-sided p-value is twice the normal tail of the U statistic's z-score."""
+        rng = np.random.default_rng(12)
+        group1, group2 = rng.normal(0.5, size=30), rng.normal(size=40)
+        result = sa.HypothesisTesting().mann_whitney_u(group1, group2)
+        z = (result.statistic - 30 * 40 / 2) / math.sqrt(30 * 40 * 71 / 12)
+        assert result.p_value == pytest.approx(2 * _normal_sf(abs(z)))
+
+    def test_log_rank_p_value(self):
+        """Test the log-rank p-value is the upper normal tail at the root of its statistic."""
+        rng = np.random.default_rng(13)
+        survival = sa.SurvivalAnalysis()
+        curves = [survival.kaplan_meier(rng.exponential(scale, 60), (rng.random(60) < 0.8).astype(int))
+                  for scale in (1.0, 2.0)]
+        result = survival.log_rank_test(*curves)
+        assert result.p_value == pytest.approx(_normal_sf(math.sqrt(result.statistic)))
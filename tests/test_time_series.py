@@ -0,0 +1,331 @@
+"""
+Tests for the time series skill (skills/data-science/time-series).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+SKILL_DIR = Path(__file__).parent.parent / "skills" / "data-science" / "time-series"
+sys.path.insert(0, str(SKILL_DIR))
+
+import time_series as ts  # noqa: E402
+
+
+def _piecewise(seed, means=(0.0, 3.0, -1.0, 2.0), length=300, scales=None):
+    rng = np.random.default_rng(seed)
+    scales = scales or [1.0] * len(means)
+    return np.concatenate([rng.normal(m, s, length) for m, s in zip(means, scales)])
+
+
+def _optimal_partition(data, model, penalty, min_size=2, jump=1):
+    """Unpruned O(n^2) optimal partitioning over the same costs and constraints."""
+    n = len(data)
+    cost = ts.SegmentCost(data, model)
+    candidates = [t for t in range(min_size, n + 1) if t % jump == 0 or t == n]
+    best = {0: -penalty}
+    last = {0: 0}
+    for t in candidates:
+        options = [(best[s] + float(cost.cost(np.array([s]), t)[0]) + penalty, s)
+                   for s in best if t - s >= min_size]
+        if options:
+            best[t], last[t] = min(options)
+    cps, t = [], n
+    while t > 0:
+        t = last[t]
+        if t > 0:
+            cps.append(t)
+    return sorted(cps), best[n]
+
+
+def _objective(data, model, penalty, cps):
+    cost = ts.SegmentCost(data, model)
+    bounds = [0] + list(cps) + [len(data)]
+    return sum(float(cost.cost(np.array([a]), b)[0]) for a, b in zip(bounds, bounds[1:])) + penalty * len(cps)
+
+
+class TestPELT:
+    """Tests for exact pruned PELT."""
+
+    @pytest.mark.parametrize("model", ["l2", "variance", "normal", "poisson"])
+    def test_matches_optimal_partitioning(self, model):
+        """Test pruning and blocking never lose the optimal segmentation."""
+        rng = np.random.default_rng(11)
+        if model == "poisson":
+            data = np.concatenate([rng.poisson(lam, 80) for lam in (2, 9, 4)]).astype(float)
+        else:
+            data = _piecewise(11, length=80, scales=[1.0, 3.0, 0.5, 1.0])
+        penalty = 3 * np.log(len(data))
+        result = ts.ChangePointDetector().pelt(data, cost_function=model, penalty=penalty)
+        expected, optimum = _optimal_partition(data, model, penalty)
+        assert result.change_point_indices == expected
+        assert _objective(data, model, penalty, expected) == pytest.approx(optimum)
+
+    def test_min_size_and_jump(self):
+        """Test the constrained search still finds the constrained optimum."""
+        data = _piecewise(12, length=90)
+        penalty = 2 * np.log(len(data))
+        result = ts.ChangePointDetector().pelt(data, penalty=penalty, min_size=7, jump=5)
+        expected, _ = _optimal_partition(data, "l2", penalty, min_size=7, jump=5)
+        assert result.change_point_indices == expected
+        assert all(cp % 5 == 0 for cp in expected)
+
+    def test_recovers_known_changes(self):
+        """Test the default penalty finds the planted mean shifts and nothing else."""
+        result = ts.ChangePointDetector().pelt(_piecewise(13))
+        assert result.change_point_indices == pytest.approx([300, 600, 900], abs=3)
+        assert result.n_segments == 4
+
+    def test_constant_series_has_no_changes(self):
+        """Test a flat series is one segment."""
+        assert ts.ChangePointDetector().pelt(np.ones(500)).change_point_indices == []
+
+
+def _reference_run_lengths(data, hazard, mu0, kappa0, alpha0, beta0):
+    """Direct Adams & MacKay recursion with per-run Normal-Gamma posteriors, no truncation."""
+    import math
+
+    probs = np.array([1.0])
+    params = [(mu0, kappa0, alpha0, beta0)]
+    for x in data:
+        pred = []
+        for mu, kappa, alpha, beta in params:
+            scale2 = beta * (kappa + 1) / (alpha * kappa)
+            nu = 2 * alpha
+            pred.append(math.exp(
+                math.lgamma(alpha + 0.5) - math.lgamma(alpha) - 0.5 * math.log(nu * math.pi * scale2)
+                - (alpha + 0.5) * math.log1p((x - mu) ** 2 / (nu * scale2))
+            ))
+        joint = probs * np.array(pred)
+        probs = np.concatenate([[joint.sum() * hazard], joint * (1 - hazard)])
+        probs /= probs.sum()
+        params = [(mu0, kappa0, alpha0, beta0)] + [
+            ((kappa * mu + x) / (kappa + 1), kappa + 1, alpha + 0.5, beta + kappa * (x - mu) ** 2 / (2 * (kappa + 1)))
+            for mu, kappa, alpha, beta in params
+        ]
+    return probs
+
+
+class TestBayesianOnline:
+    """Tests for the vectorised BOCPD recursion and its change point rule."""
+
+    def test_run_length_posterior_matches_reference(self):
+        """Test the vectorised update reproduces the direct recursion."""
+        data = _piecewise(14, length=60)
+        detector = ts.OnlineChangePointDetector(hazard_rate=0.02, mu0=0.5, kappa0=0.3, truncation=0.0)
+        for x in data:
+            detector.update(x)
+        run_lengths, probs = detector.run_length_distribution()
+        expected = _reference_run_lengths(data, 0.02, 0.5, 0.3, 1.0, 1.0)
+        assert run_lengths.tolist() == list(range(len(data) + 1))
+        np.testing.assert_allclose(probs, expected, rtol=1e-8, atol=1e-300)
+
+    def test_truncation_keeps_the_posterior_mass(self):
+        """Test dropped run lengths carry negligible probability."""
+        data = _piecewise(15, length=200)
+        exact = ts.OnlineChangePointDetector(truncation=0.0)
+        pruned = ts.OnlineChangePointDetector(truncation=1e-8)
+        for x in data:
+            exact.update(x)
+            pruned.update(x)
+        kept, probs = pruned.run_length_distribution()
+        assert len(kept) < 250  # about the length of the current segment
+        np.testing.assert_allclose(probs, exact.run_length_distribution()[1][kept], atol=1e-6)
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_detects_each_planted_change_once(self, seed):
+        """Test every planted change is reported once, near its true index."""
+        result = ts.ChangePointDetector().bayesian_online(_piecewise(seed))
+        assert result.change_point_indices == pytest.approx([300, 600, 900], abs=5)
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_stationary_noise_has_no_changes(self, seed):
+        """Test a long stationary series raises no change points."""
+        data = np.random.default_rng(100 + seed).normal(size=5000)
+        assert ts.ChangePointDetector().bayesian_online(data).change_point_indices == []
+
+    def test_streaming_matches_batch(self):
+        """Test feeding points one at a time reports what the batch call reports."""
+        data = _piecewise(16)
+        batch = ts.ChangePointDetector().bayesian_online(data)
+        detector = ts.OnlineChangePointDetector(
+            mu0=float(np.median(data)), kappa0=0.1,
+            beta0=(1.4826 * np.median(np.abs(np.diff(data) - np.median(np.diff(data))))) ** 2 / 2,
+        )
+        streamed = [cp.index for cp in map(detector.update, data) if cp is not None]
+        assert streamed == batch.change_point_indices
+
+
+def _reference_kalman(y, F, H, Q, R, x0, P0):
+    """Textbook per-step filter followed by an RTS backward pass."""
+    x, P = x0, P0
+    filtered, predicted, P_filt, P_pred = [], [], [], []
+    for obs in y:
+        xp, Pp = F @ x, F @ P @ F.T + Q
+        S = H @ Pp @ H.T + R
+        K = Pp @ H.T @ np.linalg.inv(S)
+        x, P = xp + K @ (obs - H @ xp), (np.eye(len(x0)) - K @ H) @ Pp
+        filtered.append(x)
+        predicted.append(xp)
+        P_filt.append(P)
+        P_pred.append(Pp)
+    smoothed = list(filtered)
+    for t in range(len(y) - 2, -1, -1):
+        J = P_filt[t] @ F.T @ np.linalg.inv(P_pred[t + 1])
+        smoothed[t] = filtered[t] + J @ (smoothed[t + 1] - predicted[t + 1])
+    return np.array(filtered), np.array(smoothed)
+
+
+def _local_linear_trend():
+    F = np.array([[1.0, 1.0], [0.0, 1.0]])
+    H = np.array([[1.0, 0.0]])
+    Q = np.diag([0.2, 0.01])
+    R = np.array([[0.5]])
+    x0, P0 = np.array([0.0, 0.0]), np.eye(2) * 10
+    return F, H, Q, R, x0, P0
+
+
+class TestKalmanFilter:
+    """Tests for the batched Kalman filter and RTS smoother."""
+
+    def test_matches_textbook_filter_and_smoother(self):
+        """Test filtered and smoothed states against the per-step recursion."""
+        F, H, Q, R, x0, P0 = _local_linear_trend()
+        y = np.cumsum(np.random.default_rng(17).normal(0.3, 1.0, 120))
+        kf = ts.KalmanFilter(F, H, Q, R, x0, P0)
+        result = kf.filter(y, steady_state_tol=0.0)
+        filtered, smoothed = _reference_kalman(y[:, None], F, H, Q, R, x0, P0)
+        np.testing.assert_allclose(result.filtered_state, filtered, rtol=1e-9, atol=1e-9)
+        np.testing.assert_allclose(result.smoothed_state, smoothed, rtol=1e-9, atol=1e-9)
+
+    def test_log_likelihood_matches_joint_gaussian(self):
+        """Test the innovations likelihood equals the exact joint density of a local level model."""
+        q, r, p0, n = 0.3, 0.8, 2.0, 40
+        y = np.random.default_rng(18).normal(size=n).cumsum()
+        steps = np.arange(1, n + 1)
+        cov = p0 + q * np.minimum.outer(steps, steps) + r * np.eye(n)
+        _, log_det = np.linalg.slogdet(cov)
+        expected = -0.5 * (n * np.log(2 * np.pi) + log_det + y @ np.linalg.solve(cov, y))
+        kf = ts.KalmanFilter([[1.0]], [[1.0]], [[q]], [[r]], [0.0], [[p0]])
+        assert kf.filter(y).log_likelihood == pytest.approx(expected, rel=1e-9)
+
+    def test_batch_matches_single_series(self):
+        """Test filtering a batch equals filtering each series on its own."""
+        F, H, Q, R, x0, P0 = _local_linear_trend()
+        batch = np.random.default_rng(19).normal(size=(5, 80)).cumsum(axis=1)
+        kf = ts.KalmanFilter(F, H, Q, R, x0, P0)
+        result = kf.filter_batch(batch)
+        for i, series in enumerate(batch):
+            single = kf.filter(series)
+            np.testing.assert_allclose(result.smoothed_state[i], single.smoothed_state)
+            assert result.series_log_likelihood[i] == pytest.approx(single.log_likelihood)
+
+    def test_steady_state_shortcut_is_exact(self):
+        """Test reusing the converged gain changes nothing measurable."""
+        F, H, Q, R, x0, P0 = _local_linear_trend()
+        y = np.random.default_rng(20).normal(size=500).cumsum()
+        kf = ts.KalmanFilter(F, H, Q, R, x0, P0)
+        fast = kf.filter(y)
+        full = kf.filter(y, steady_state_tol=0.0)
+        assert fast.steady_state_index is not None and full.steady_state_index is None
+        np.testing.assert_allclose(fast.smoothed_state, full.smoothed_state, rtol=1e-7, atol=1e-7)
+        assert fast.log_likelihood == pytest.approx(full.log_likelihood, rel=1e-9)
+
+    def test_degenerate_default_model_raises(self):
+        """Test a model with no observation or process noise fails with a clear error."""
+        with pytest.raises(ValueError, match="Innovation covariance is singular"):
+            ts.KalmanFilter().filter(np.arange(10.0))
+
+    def test_negative_observation_noise_raises(self):
+        """Test an indefinite observation noise matrix is rejected up front."""
+        with pytest.raises(ValueError, match="positive semi-definite"):
+            ts.KalmanFilter(observation_noise=[[-1.0]]).filter(np.arange(10.0))
+
+
+def _ar2(seed, n=600, phi=(0.6, -0.3)):
+    rng = np.random.default_rng(seed)
+    noise = rng.normal(size=n)
+    x = np.zeros(n)
+    for t in range(2, n):
+        x[t] = phi[0] * x[t - 1] + phi[1] * x[t - 2] + noise[t]
+    return x
+
+
+class TestAutoARIMA:
+    """Tests for the cached ARIMA order search."""
+
+    @pytest.mark.parametrize(
+        "order, seasonal_order",
+        [((1, 0, 0), (0, 0, 0, 0)), ((2, 1, 1), (0, 0, 0, 0)), ((1, 0, 2), (1, 1, 0, 12))],
+    )
+    def test_cached_criteria_match_the_fit(self, order, seasonal_order):
+        """Test the search scores a candidate exactly as fitting it does."""
+        data = _ar2(21).cumsum()
+        model = ts.ARIMAModel(order, seasonal_order).fit(data)
+        cache = ts._DifferencedSeriesCache(data)
+        assert cache.criteria(order, seasonal_order) == pytest.approx((model.aic, model.bic, model.aicc))
+
+    def test_likelihood_depends_on_the_fit(self):
+        """Test a model closer to the generating process scores a higher likelihood."""
+        data = _ar2(22)
+        white = ts.ARIMAModel((0, 0, 1)).fit(data)
+        ar2 = ts.ARIMAModel((2, 0, 0)).fit(data)
+        assert ar2.log_likelihood > white.log_likelihood
+        assert ar2.sigma2 == pytest.approx(1.0, abs=0.15)
+
+    @pytest.mark.parametrize("stepwise", [True, False])
+    def test_selects_the_generating_order(self, stepwise):
+        """Test BIC picks AR(2) on AR(2) data rather than the smallest model."""
+        for seed in range(20, 25):
+            model = ts.ARIMAForecaster().auto_arima(_ar2(seed), d=0, stepwise=stepwise, information_criterion="bic")
+            assert model.order == (2, 0, 0)
+
+    def test_aic_does_not_underfit(self):
+        """Test AIC keeps at least the true AR order."""
+        for seed in range(20, 25):
+            assert ts.ARIMAForecaster().auto_arima(_ar2(seed), d=0).order[0] >= 2
+
+    def test_candidates_scored_on_a_common_window(self):
+        """Test seasonal and non-seasonal candidates are scored on the same number of points."""
+        data = _ar2(25, n=200)
+        forecaster = ts.ARIMAForecaster()
+        cache = ts._DifferencedSeriesCache(data)
+        window = forecaster._common_window(cache, 12, seasonal=True)
+        assert window == 200 - 12
+        for order, seasonal_order in [((2, 0, 0), (0, 0, 0, 0)), ((2, 0, 1), (1, 1, 1, 12))]:
+            aic, bic, _ = cache.criteria(order, seasonal_order, window)
+            n_params = order[0] + order[2] + 1
+            assert bic - aic == pytest.approx(n_params * (np.log(window) - 2))
+
+    def test_dropped_seasonal_points_do_not_favour_seasonal(self):
+        """Test a seasonal difference cannot win by skipping noisy leading points."""
+        for seed in range(20, 24):
+            data = _ar2(seed, n=200)
+            data[:12] *= 10
+            model = ts.ARIMAForecaster().auto_arima(data, d=0, D=0, seasonal=True, m=12, max_p=3, max_q=2)
+            assert model.seasonal_order == (0, 0, 0, 0)
+
+    @pytest.mark.parametrize("stepwise", [True, False])
+    def test_candidate_pool_matches_serial(self, stepwise):
+        """Test fitting candidates in worker processes selects the same model."""
+        data = _ar2(26, n=240) + 2 * np.sin(np.arange(240) * np.pi / 6)
+        options = dict(seasonal=True, m=12, max_p=2, max_q=2, max_P=1, max_Q=1, stepwise=stepwise)
+        serial = ts.ARIMAForecaster().auto_arima(data, **options)
+        pooled = ts.ARIMAForecaster().auto_arima(data, n_jobs=2, **options)
+        assert (pooled.order, pooled.seasonal_order, pooled.aic) == (serial.order, serial.seasonal_order, serial.aic)
+
+    def test_many_matches_one_at_a_time(self):
+        """Test the process pool returns the same models, in input order."""
+        series = [_ar2(seed, n=300) for seed in range(4)]
+        forecaster = ts.ARIMAForecaster()
+        pooled = forecaster.auto_arima_many(series, n_jobs=2, d=0, max_p=3, max_q=2)
+        single = [forecaster.auto_arima(s, d=0, max_p=3, max_q=2) for s in series]
+        assert [(m.order, m.aic) for m in pooled] == [(m.order, m.aic) for m in single]
+
+    def test_unknown_criterion_raises(self):
+        """Test an unsupported information criterion is rejected."""
+        with pytest.raises(ValueError, match="Unknown information criterion"):
+            ts.ARIMAForecaster().auto_arima(_ar2(24), information_criterion="hqic")